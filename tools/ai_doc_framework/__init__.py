@@ -0,0 +1,70 @@
+"""
+📦 AI Documentation Framework - Library API
+Importable versions of the framework tools, so health checks, tests and
+orchestration can run in-process instead of spawning a new interpreter.
+
+Usage:
+    import sys; sys.path.insert(0, "ai-doc-framework/tools")
+    from ai_doc_framework import AIDocConflictDetector
+
+    report = AIDocConflictDetector(project_root=".").detect_all_conflicts(docs_only=True)
+
+Submodules are imported on first attribute access, so importing the package
+stays as cheap as the --version fast paths of the scripts.
+"""
+
+__version__ = "2.0.0"
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "AIDocConflictDetector": "conflict_detector",
+    "ConflictItem": "conflict_detector",
+    "ConflictReport": "conflict_detector",
+    "ConfigError": "conflict_detector",
+    "StructuredExtractor": "conflict_detector",
+    "register_structured_extractor": "conflict_detector",
+    "run_health_check": "conflict_detector",
+    "health_check_installation": "conflict_detector",
+    "filter_report_by_severity": "conflict_detector",
+    "scan_fleet": "fleet",
+    "discover_projects": "fleet",
+    "FleetReport": "fleet",
+    "snapshot_tree": "snapshot",
+    "BackupStore": "backup_store",
+    "write_backup_archive": "backup_archive",
+    "restore_backup_archive": "backup_archive",
+    "verify_backup_archive": "backup_archive",
+    "FrameworkDelta": "delta",
+    "build_manifest": "delta",
+    "compute_delta": "delta",
+    "apply_delta": "delta",
+    "ArtifactCache": "artifact_cache",
+    "VersionCheckClient": "version_check",
+    "MigrationPlan": "migration_plan",
+    "MigrationStep": "migration_plan",
+    "plan_migration": "migration_plan",
+    "register_migration_step": "migration_plan",
+    "ErrorSearchIndex": "error_search",
+    "search_errors": "error_search",
+    "update_master_index": "error_stats",
+    "IssueIndex": "issue_index",
+    "FrameworkUpdater": "updater",
+    "VersionManager": "version_manager",
+    "V1ToV2Migrator": "migrator",
+}
+
+__all__ = ["__version__"] + list(_EXPORTS)
+
+def __getattr__(name):
+    """Import the defining submodule on first access"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
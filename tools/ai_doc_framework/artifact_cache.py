@@ -0,0 +1,205 @@
+"""
+📥 AI Documentation Framework - Release Artifact Cache
+Host-wide cache of downloaded framework archives, so many projects on one
+machine update from a single download.
+
+Layout (default: ~/.ai-doc-framework-cache/artifacts/):
+    <sha256>.zip   Each downloaded archive, named by its content hash
+    index.json     Framework version -> hash, source URL -> hash, and the
+                   ETag/Last-Modified each source URL was served with
+
+Every artifact is re-hashed before it is used and evicted if it no longer
+matches its name. A source URL given without a version or sha256 may move
+(e.g. the main branch archive), so its cached copy is revalidated with a
+conditional request and reused only on 304 Not Modified. Downloads are streamed to a temp file, checked (length,
+optional expected sha256, zip structure) and only then renamed into the
+cache, so concurrent updates never see a partial file.
+"""
+
+import os
+import json
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from .backup_store import hash_file
+
+ARTIFACT_CACHE_DIR = Path.home() / ".ai-doc-framework-cache" / "artifacts"
+DEFAULT_NETWORK_TIMEOUT = 30.0
+READ_SIZE = 1024 * 1024
+
+class ArtifactIntegrityError(Exception):
+    """Raised when a downloaded or cached artifact fails its integrity checks"""
+
+def network_timeout() -> float:
+    """Network timeout in seconds (AI_DOC_FRAMEWORK_TIMEOUT, default 30)"""
+    try:
+        return float(os.environ.get('AI_DOC_FRAMEWORK_TIMEOUT', DEFAULT_NETWORK_TIMEOUT))
+    except ValueError:
+        return DEFAULT_NETWORK_TIMEOUT
+
+def is_url(source: str) -> bool:
+    return source.startswith(('http://', 'https://', 'file://'))
+
+def verify_artifact(path: Path, expected_sha256: Optional[str] = None) -> str:
+    """Check a zip artifact (structure and optional checksum); returns its sha256"""
+    import zipfile
+
+    digest = hash_file(path)
+    if expected_sha256 and digest != expected_sha256.lower():
+        raise ArtifactIntegrityError(f"Checksum mismatch for {path.name}: expected {expected_sha256}, got {digest}")
+    if not zipfile.is_zipfile(path):
+        raise ArtifactIntegrityError(f"Not a zip archive: {path}")
+    return digest
+
+class ArtifactCache:
+    """Content-addressed cache of framework release archives"""
+
+    def __init__(self, cache_dir: Union[str, Path, None] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else ARTIFACT_CACHE_DIR
+        self.index_file = self.cache_dir / "index.json"
+        self.stats = {'hits': 0, 'downloads': 0, 'bytes_downloaded': 0}
+
+    # ----- index ------------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            index = {}
+        index.setdefault('versions', {})
+        index.setdefault('sources', {})
+        index.setdefault('validators', {})
+        return index
+
+    def _update_index(self, **entries: Dict[str, str]):
+        """Merge entries into the index (re-read first: other projects may share the cache)"""
+        index = self._load_index()
+        for section, values in entries.items():
+            index[section].update(values)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".index-")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(temp_path, self.index_file)
+
+    def artifact_path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.zip"
+
+    # ----- lookup -----------------------------------------------------------
+
+    def _verified(self, digest: Optional[str]) -> Optional[Path]:
+        """Cached artifact for a hash, re-verified; corrupt entries are evicted"""
+        if not digest:
+            return None
+        path = self.artifact_path(digest)
+        if not path.exists():
+            return None
+        try:
+            verify_artifact(path, digest)
+        except ArtifactIntegrityError as e:
+            print(f"⚠️  Warning: Evicting corrupt cached artifact: {e}")
+            path.unlink()
+            return None
+        return path
+
+    def lookup(self, version: Optional[str] = None, sha256: Optional[str] = None) -> Optional[Path]:
+        """Cached artifact matching an expected hash, else a release version"""
+        if sha256:
+            return self._verified(sha256.lower())
+        if version:
+            return self._verified(self._load_index()['versions'].get(version))
+        return None
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since from the validators url was last served with"""
+        validators = self._load_index()['validators'].get(url, {})
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def remember_version(self, digest: str, version: str):
+        """Record which framework version an artifact contains"""
+        self._update_index(versions={version: digest})
+
+    # ----- download ---------------------------------------------------------
+
+    def download(self, url: str, version: Optional[str] = None, sha256: Optional[str] = None,
+                 timeout: Optional[float] = None, cached: Optional[Path] = None) -> Path:
+        """Stream url into the cache, verify it and return the cached path
+
+        With cached (the verified artifact url served last time), the request
+        is conditional and a 304 Not Modified returns cached without a body.
+        """
+        import urllib.error
+        import urllib.request
+
+        timeout = network_timeout() if timeout is None else timeout
+        headers = self._conditional_headers(url) if cached else {}
+        try:
+            response = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout)
+        except urllib.error.HTTPError as e:
+            # 304 Not Modified arrives as an exception
+            if e.code == 304 and headers:
+                return cached
+            raise
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".download-")
+        try:
+            received = 0
+            with response, os.fdopen(fd, 'wb') as f:
+                expected_length = response.headers.get('Content-Length')
+                validators = {'etag': response.headers.get('ETag'),
+                              'last_modified': response.headers.get('Last-Modified')}
+                for chunk in iter(lambda: response.read(READ_SIZE), b''):
+                    f.write(chunk)
+                    received += len(chunk)
+            if expected_length is not None and int(expected_length) != received:
+                raise ArtifactIntegrityError(f"Truncated download: {received} of {expected_length} bytes")
+
+            digest = verify_artifact(Path(temp_path), sha256)
+            target = self.artifact_path(digest)
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        self.stats['downloads'] += 1
+        self.stats['bytes_downloaded'] += received
+        entries = {'sources': {url: digest}, 'validators': {url: validators}}
+        if version:
+            entries['versions'] = {version: digest}
+        self._update_index(**entries)
+        return target
+
+    def fetch(self, url: str, version: Optional[str] = None, sha256: Optional[str] = None,
+              refresh: bool = False, timeout: Optional[float] = None) -> Path:
+        """Cached artifact for sha256/version if present, otherwise download url
+
+        Without a sha256 or version, the artifact url served last time is only
+        reused after the server confirms it is unchanged (304 Not Modified).
+        """
+        cached = None
+        if not refresh:
+            cached = self.lookup(version=version, sha256=sha256)
+            if cached:
+                self.stats['hits'] += 1
+                print(f"♻️  Using cached artifact: {cached.name}")
+                return cached
+            if not (version or sha256):
+                cached = self._verified(self._load_index()['sources'].get(url))
+
+        print(f"{'🔄 Revalidating' if cached else '📥 Downloading from'}: {url}")
+        path = self.download(url, version=version, sha256=sha256, timeout=timeout, cached=cached)
+        if path == cached:
+            self.stats['hits'] += 1
+            print(f"♻️  Not modified, using cached artifact: {path.name}")
+        else:
+            print(f"✅ Cached {path.stat().st_size / 1024 / 1024:.1f} MB artifact: {path.name}")
+        return path
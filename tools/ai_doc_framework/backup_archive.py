@@ -0,0 +1,363 @@
+"""
+📼 AI Documentation Framework - Streaming Backup Archives
+Single-file tar backups (gzip or xz) for backups that must leave the machine.
+
+The archive is written as a stream: files go straight from the project into
+the tar stream, which is cut into fixed-size chunks and compressed on a
+thread pool. Each chunk becomes an independent gzip member / xz stream, and
+concatenated members are valid .tar.gz / .tar.xz files, so any tar can read
+them. At most a few chunks are in flight, so memory stays bounded.
+
+The first member, AI_DOC_BACKUP_MANIFEST.json, records the sha256, size and
+mode of every file. Restores read the manifest, work out which files differ
+from the working tree, then stream through the archive extracting only those
+members and verifying each checksum before the file is moved into place.
+"""
+
+import os
+import io
+import json
+import tarfile
+import tempfile
+import hashlib
+import shutil
+from collections import deque
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Iterable, Union
+
+from .backup_store import hash_file, walk_backup_root
+from .delta import check_parent_directories, link_stays_inside
+
+MANIFEST_NAME = "AI_DOC_BACKUP_MANIFEST.json"
+ARCHIVE_FORMATS = ['gz', 'xz']
+CHUNK_SIZES = {'gz': 1024 * 1024, 'xz': 4 * 1024 * 1024}
+READ_SIZE = 1024 * 1024
+
+class BackupArchiveError(Exception):
+    """Raised when an archive is unreadable or does not match its manifest"""
+
+def _check_member_path(relative_path: str, link: Optional[str] = None):
+    """Refuse manifest paths, and symlink targets, that would escape the project root"""
+    parts = Path(relative_path).parts
+    if not parts or Path(relative_path).is_absolute() or '..' in parts:
+        raise BackupArchiveError(f"Unsafe path in archive manifest: {relative_path}")
+    if link is not None and not link_stays_inside(relative_path, link):
+        raise BackupArchiveError(f"Unsafe symlink in archive manifest: {relative_path} -> {link}")
+
+def _check_parents(project_root: Path, relative_path: str):
+    """Refuse to restore below a symlinked directory (checksums come from the same archive)"""
+    try:
+        check_parent_directories(project_root, relative_path)
+    except ValueError as e:
+        raise BackupArchiveError(str(e))
+
+def _compress_chunk(data: bytes, fmt: str, level: Optional[int]) -> bytes:
+    """Compress one chunk into a self-contained gzip member or xz stream"""
+    if fmt == 'gz':
+        import zlib
+        compressor = zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+
+    import lzma
+    return lzma.compress(data, format=lzma.FORMAT_XZ, preset=6 if level is None else level)
+
+class ParallelCompressWriter(io.RawIOBase):
+    """Write-only stream that compresses fixed-size chunks on a thread pool, in order"""
+
+    def __init__(self, fileobj, fmt: str = 'gz', level: Optional[int] = None,
+                 jobs: Optional[int] = None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        super().__init__()
+        self.fileobj = fileobj
+        self.fmt = fmt
+        self.level = level
+        self.chunk_size = CHUNK_SIZES[fmt]
+        self.jobs = jobs or min(8, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.jobs)
+        self._pending = deque()
+        self._buffer = bytearray()
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self.bytes_in += len(data)
+        while len(self._buffer) >= self.chunk_size:
+            self._submit(bytes(self._buffer[:self.chunk_size]))
+            del self._buffer[:self.chunk_size]
+        return len(data)
+
+    def _submit(self, chunk: bytes):
+        # zlib and lzma release the GIL, so chunks really compress in parallel
+        self._pending.append(self._executor.submit(_compress_chunk, chunk, self.fmt, self.level))
+        while len(self._pending) > self.jobs * 2:
+            self._drain_one()
+
+    def _drain_one(self):
+        compressed = self._pending.popleft().result()
+        self.fileobj.write(compressed)
+        self.bytes_out += len(compressed)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._drain_one()
+            self.fileobj.flush()
+        finally:
+            self._executor.shutdown()
+            super().close()
+
+def _open_compressed(archive_path: Path):
+    """Open a .tar.gz / .tar.xz for reading, handling concatenated members"""
+    name = archive_path.name
+    if name.endswith(('.xz', '.txz')):
+        import lzma
+        return lzma.open(archive_path, 'rb')
+    import gzip
+    return gzip.open(archive_path, 'rb')
+
+def _archive_format(archive_path: Path) -> str:
+    return 'xz' if archive_path.name.endswith(('.xz', '.txz')) else 'gz'
+
+def _file_info(project_root: Path, relative_path: str) -> Dict[str, Any]:
+    path = project_root / relative_path
+    if path.is_symlink():
+        return {"link": os.readlink(path)}
+    st = path.stat()
+    return {"hash": hash_file(path), "size": st.st_size, "mode": st.st_mode & 0o777}
+
+def write_backup_archive(project_root: Union[str, Path], paths: Iterable[str],
+                         archive_path: Union[str, Path], fmt: Optional[str] = None,
+                         level: Optional[int] = None, jobs: Optional[int] = None,
+                         metadata: Optional[Dict[str, Any]] = None,
+                         exclude: Iterable[Path] = ()) -> Dict[str, Any]:
+    """Stream the given project paths into a compressed tar with a checksum manifest"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    project_root = Path(project_root).resolve()
+    archive_path = Path(archive_path)
+    fmt = fmt or _archive_format(archive_path)
+
+    roots = [p for p in dict.fromkeys(paths) if os.path.lexists(project_root / p)]
+    files = [f for root in roots for f in walk_backup_root(project_root, root, exclude)]
+
+    # Checksums first, so the manifest can lead the archive
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        infos = list(executor.map(lambda f: _file_info(project_root, f), files))
+
+    manifest = {
+        "created": datetime.now().isoformat(),
+        "project_root": str(project_root),
+        "roots": roots,
+        "files": dict(zip(files, infos))
+    }
+    manifest.update(metadata or {})
+    manifest_bytes = json.dumps(manifest, indent=2).encode('utf-8')
+
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=archive_path.parent, prefix=f".{archive_path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as raw:
+            writer = ParallelCompressWriter(raw, fmt, level, jobs)
+            with tarfile.open(fileobj=writer, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+                info = tarfile.TarInfo(MANIFEST_NAME)
+                info.size = len(manifest_bytes)
+                info.mtime = int(datetime.now().timestamp())
+                tar.addfile(info, io.BytesIO(manifest_bytes))
+
+                for relative_path, entry in manifest["files"].items():
+                    path = project_root / relative_path
+                    if "link" in entry:
+                        info = tarfile.TarInfo(relative_path)
+                        info.type = tarfile.SYMTYPE
+                        info.linkname = entry["link"]
+                        tar.addfile(info)
+                        continue
+
+                    info = tar.gettarinfo(str(path), arcname=relative_path)
+                    info.size = entry["size"]
+                    with open(path, 'rb') as f:
+                        digest = _HashingReader(f)
+                        tar.addfile(info, digest)
+                    if digest.hexdigest() != entry["hash"]:
+                        raise BackupArchiveError(f"{relative_path} changed while it was being archived")
+            writer.close()
+        os.replace(temp_path, archive_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return {
+        "archive": str(archive_path),
+        "files": len(files),
+        "bytes_in": writer.bytes_in,
+        "bytes_out": writer.bytes_out
+    }
+
+class _HashingReader:
+    """File wrapper that hashes everything read through it"""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self._digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self._digest.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+def read_archive_manifest(archive_path: Union[str, Path]) -> Dict[str, Any]:
+    """Read only the leading manifest member of a backup archive"""
+    archive_path = Path(archive_path)
+    with _open_compressed(archive_path) as stream, tarfile.open(fileobj=stream, mode='r|') as tar:
+        member = tar.next()
+        if member is None or member.name != MANIFEST_NAME:
+            raise BackupArchiveError(f"{archive_path} has no {MANIFEST_NAME}")
+        return json.load(tar.extractfile(member))
+
+def _extract_verified(tar: tarfile.TarFile, member: tarfile.TarInfo, target: Path, entry: Dict[str, Any]):
+    """Extract one member next to its target, verify the checksum, then rename into place"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.is_dir() and not target.is_symlink():
+        shutil.rmtree(target)
+
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        digest = hashlib.sha256()
+        source = tar.extractfile(member)
+        with os.fdopen(fd, 'wb') as dst:
+            for chunk in iter(lambda: source.read(READ_SIZE), b''):
+                digest.update(chunk)
+                dst.write(chunk)
+        if digest.hexdigest() != entry["hash"]:
+            raise BackupArchiveError(f"Checksum mismatch for {member.name}")
+        os.chmod(temp_path, entry["mode"])
+        os.replace(temp_path, target)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+def restore_backup_archive(archive_path: Union[str, Path], project_root: Union[str, Path],
+                           roots: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Restore backup roots from an archive, extracting only files that differ"""
+    archive_path = Path(archive_path)
+    project_root = Path(project_root).resolve()
+    manifest = read_archive_manifest(archive_path)
+    selected = [r for r in manifest["roots"] if roots is None or r in set(roots)]
+    stats = {'restored': 0, 'unchanged': 0, 'removed': 0}
+
+    def in_root(relative_path: str, root: str) -> bool:
+        return relative_path == root or relative_path.startswith(root.rstrip('/') + '/')
+
+    expected = {path: entry for path, entry in manifest["files"].items()
+                if any(in_root(path, root) for root in selected)}
+    for relative_path in selected:
+        _check_member_path(relative_path)
+    for relative_path, entry in expected.items():
+        _check_member_path(relative_path, entry.get("link"))
+
+    # Remove files that did not exist at backup time
+    for root in selected:
+        root_path = project_root / root
+        if root_path.is_dir() and not root_path.is_symlink():
+            for relative_path in list(walk_backup_root(project_root, root)):
+                if relative_path not in expected:
+                    (project_root / relative_path).unlink()
+                    stats['removed'] += 1
+
+    # Work out what actually differs before touching the archive body
+    needed = {}
+    for relative_path, entry in expected.items():
+        target = project_root / relative_path
+        if "link" in entry:
+            if target.is_symlink() and os.readlink(target) == entry["link"]:
+                stats['unchanged'] += 1
+                continue
+        elif target.is_file() and not target.is_symlink() and hash_file(target) == entry["hash"]:
+            if (target.stat().st_mode & 0o777) != entry["mode"]:
+                os.chmod(target, entry["mode"])
+            stats['unchanged'] += 1
+            continue
+        needed[relative_path] = entry
+
+    # Symlinks need no archive data
+    for relative_path, entry in list(needed.items()):
+        if "link" in entry:
+            target = project_root / relative_path
+            _check_parents(project_root, relative_path)
+            if os.path.lexists(target):
+                target.unlink()
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.symlink(entry["link"], target)
+            stats['restored'] += 1
+            del needed[relative_path]
+
+    if needed:
+        with _open_compressed(archive_path) as stream, tarfile.open(fileobj=stream, mode='r|') as tar:
+            for member in tar:
+                entry = needed.pop(member.name, None)
+                if entry is None:
+                    continue
+                _check_parents(project_root, member.name)
+                _extract_verified(tar, member, project_root / member.name, entry)
+                stats['restored'] += 1
+                if not needed:
+                    # Everything required is restored; skip decompressing the rest
+                    break
+        if needed:
+            raise BackupArchiveError(f"Archive is missing {len(needed)} files, e.g. {next(iter(needed))}")
+
+    # Prune directories left empty by removals
+    for root in selected:
+        root_path = project_root / root
+        if root_path.is_dir() and not root_path.is_symlink():
+            for dirpath, _, _ in os.walk(root_path, topdown=False):
+                if dirpath != str(root_path) and not os.listdir(dirpath):
+                    os.rmdir(dirpath)
+
+    return stats
+
+def verify_backup_archive(archive_path: Union[str, Path]) -> List[str]:
+    """Stream the whole archive and check every member against the manifest"""
+    archive_path = Path(archive_path)
+    problems = []
+    try:
+        with _open_compressed(archive_path) as stream, tarfile.open(fileobj=stream, mode='r|') as tar:
+            first = tar.next()
+            if first is None or first.name != MANIFEST_NAME:
+                return [f"{archive_path} has no {MANIFEST_NAME}"]
+            files = json.load(tar.extractfile(first))["files"]
+            seen = set()
+            for member in tar:
+                if member.name == MANIFEST_NAME:
+                    continue
+                entry = files.get(member.name)
+                seen.add(member.name)
+                if entry is None:
+                    problems.append(f"Unexpected member: {member.name}")
+                elif member.isfile():
+                    digest = hashlib.sha256()
+                    source = tar.extractfile(member)
+                    for chunk in iter(lambda: source.read(READ_SIZE), b''):
+                        digest.update(chunk)
+                    if digest.hexdigest() != entry.get("hash"):
+                        problems.append(f"Checksum mismatch: {member.name}")
+            problems.extend(f"Missing member: {name}" for name in files if name not in seen)
+    except (OSError, EOFError, tarfile.TarError, ValueError) as e:
+        problems.append(f"Could not read {archive_path}: {e}")
+    return problems
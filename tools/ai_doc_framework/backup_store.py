@@ -0,0 +1,361 @@
+"""
+🗄️ AI Documentation Framework - Content-Addressed Backup Store
+Deduplicated backups for updates and migrations.
+
+Layout (default: <project>/.ai-doc-backups/):
+    objects/<sha256>           Each unique file content, stored once (read-only)
+    manifests/<backup-id>.json Path -> hash/size/mode map for one backup
+    index.json                 Stat cache (size, mtime, inode -> hash), so unchanged
+                               files are not re-read on the next backup
+
+Successive backups only store contents that changed, and restores only
+rewrite files whose hash differs from the manifest, so backup and restore
+time scale with the size of the change rather than the size of the project.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Iterable, Union
+
+BACKUP_STORE_DIRNAME = ".ai-doc-backups"
+BACKUP_MODES = ['store', 'snapshot', 'copy', 'archive']
+DEFAULT_KEEP_BACKUPS = 10
+
+# Files modified this recently are re-hashed next time (mtime granularity)
+RACY_WINDOW_NS = 2_000_000_000
+
+def hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file, read in bounded chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def walk_backup_root(project_root: Path, relative_root: str,
+                     exclude: Iterable[Path] = ()) -> Iterable[str]:
+    """Project-relative paths of every file below a backup root (files yield themselves)
+
+    Directory symlinks are yielded as entries rather than followed.
+    """
+    root = project_root / relative_root
+    if root.is_symlink() or root.is_file():
+        yield relative_root
+        return
+
+    excluded = {Path(p).resolve() for p in exclude}
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        dirnames[:] = [d for d in dirnames if (current / d).resolve() not in excluded]
+        for dirname in list(dirnames):
+            if (current / dirname).is_symlink():
+                dirnames.remove(dirname)
+                filenames.append(dirname)
+        for filename in filenames:
+            yield (current / filename).relative_to(project_root).as_posix()
+
+class BackupStore:
+    """Content-addressed store of file objects plus one manifest per backup"""
+
+    def __init__(self, store_dir: Union[str, Path], jobs: Optional[int] = None):
+        self.store_dir = Path(store_dir)
+        self.objects_dir = self.store_dir / "objects"
+        self.manifests_dir = self.store_dir / "manifests"
+        self.index_file = self.store_dir / "index.json"
+        self.jobs = jobs
+        self._index: Optional[Dict[str, List]] = None
+        self._lock = threading.Lock()
+        self.stats = {'files': 0, 'hashed': 0, 'stored': 0, 'bytes_stored': 0,
+                      'restored': 0, 'unchanged': 0, 'removed': 0}
+
+    def _reset_stats(self):
+        self.stats = dict.fromkeys(self.stats, 0)
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    # ----- stat cache -------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, List]:
+        if self._index is None:
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        if self._index is None:
+            return
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.store_dir, prefix=".index-")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(temp_path, self.index_file)
+
+    def file_hash(self, path: Path) -> str:
+        """Hash a file, reusing the cached hash while size, mtime and inode match"""
+        index = self._load_index()
+        key = str(path)
+        st = path.stat()
+        signature = [st.st_size, st.st_mtime_ns, st.st_ino]
+
+        cached = index.get(key)
+        if cached and cached[:3] == signature:
+            return cached[3]
+
+        digest = hash_file(path)
+        self._count('hashed')
+        if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS:
+            with self._lock:
+                index[key] = signature + [digest]
+        return digest
+
+    # ----- objects ----------------------------------------------------------
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest
+
+    def _store_object(self, path: Path, digest: str):
+        """Copy a file into the object store unless its content is already there"""
+        target = self.object_path(digest)
+        if target.exists():
+            return
+
+        fd, temp_path = tempfile.mkstemp(dir=self.objects_dir, prefix=".tmp-")
+        try:
+            with open(path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.chmod(temp_path, 0o444)
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        self._count('stored')
+        self._count('bytes_stored', target.stat().st_size)
+
+    # ----- backup -----------------------------------------------------------
+
+    def _walk(self, project_root: Path, relative_root: str) -> Iterable[str]:
+        """Relative paths of every file below a backup root, never entering the store"""
+        return walk_backup_root(project_root, relative_root, exclude=[self.store_dir])
+
+    def _capture(self, project_root: Path, relative_path: str) -> Dict[str, Any]:
+        path = project_root / relative_path
+        self._count('files')
+        if path.is_symlink():
+            return {"link": os.readlink(path)}
+
+        digest = self.file_hash(path)
+        self._store_object(path, digest)
+        st = path.stat()
+        return {"hash": digest, "size": st.st_size, "mode": st.st_mode & 0o777}
+
+    def create_backup(self, project_root: Union[str, Path], paths: Iterable[str],
+                      kind: str = "update", metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """Back up the given project-relative files and directories; returns the manifest path"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        project_root = Path(project_root).resolve()
+        self._reset_stats()
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+
+        roots = [p for p in dict.fromkeys(paths) if os.path.lexists(project_root / p)]
+        files = [f for root in roots for f in self._walk(project_root, root)]
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            entries = list(executor.map(lambda f: self._capture(project_root, f), files))
+
+        backup_id = f"{kind}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        manifest_path = self.manifests_dir / f"{backup_id}.json"
+        suffix = 1
+        while manifest_path.exists():
+            suffix += 1
+            manifest_path = self.manifests_dir / f"{backup_id}-{suffix}.json"
+
+        manifest = {
+            "id": manifest_path.stem,
+            "kind": kind,
+            "created": datetime.now().isoformat(),
+            "project_root": str(project_root),
+            "roots": roots,
+            "files": dict(zip(files, entries))
+        }
+        manifest.update(metadata or {})
+
+        fd, temp_path = tempfile.mkstemp(dir=self.manifests_dir, prefix=".tmp-")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, manifest_path)
+
+        self._save_index()
+        return manifest_path
+
+    # ----- restore ----------------------------------------------------------
+
+    def load_manifest(self, manifest: Union[str, Path]) -> Dict[str, Any]:
+        """Load a manifest by path or backup id"""
+        manifest_path = Path(manifest)
+        if not manifest_path.suffix == '.json' or not manifest_path.exists():
+            manifest_path = self.manifests_dir / f"{manifest}.json"
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _restore_file(self, project_root: Path, relative_path: str, entry: Dict[str, Any]) -> bool:
+        """Bring one file back to its manifest state; False if it already matched"""
+        from .delta import check_parent_directories
+
+        # Never follow a symlinked directory out of the project
+        check_parent_directories(project_root, relative_path)
+        target = project_root / relative_path
+        if "link" in entry:
+            if target.is_symlink() and os.readlink(target) == entry["link"]:
+                return False
+            if os.path.lexists(target):
+                target.unlink()
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.symlink(entry["link"], target)
+            return True
+
+        if target.is_file() and not target.is_symlink():
+            if self.file_hash(target) == entry["hash"]:
+                if (target.stat().st_mode & 0o777) != entry["mode"]:
+                    os.chmod(target, entry["mode"])
+                return False
+        elif os.path.lexists(target):
+            if target.is_dir() and not target.is_symlink():
+                shutil.rmtree(target)
+            else:
+                target.unlink()
+
+        # Write next to the target and rename, so readers never see a partial file
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+        try:
+            with open(self.object_path(entry["hash"]), 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.chmod(temp_path, entry["mode"])
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return True
+
+    def restore(self, manifest: Union[str, Path, Dict[str, Any]], project_root: Union[str, Path],
+                roots: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Restore backup roots, touching only files whose content differs
+
+        Files under a restored directory root that are not in the manifest are
+        removed. Roots not present in the backup are left untouched.
+        Symlinks pointing outside the project, and writes below a symlinked
+        directory, are refused with ValueError.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from .delta import link_stays_inside
+
+        if not isinstance(manifest, dict):
+            manifest = self.load_manifest(manifest)
+        project_root = Path(project_root).resolve()
+        self._reset_stats()
+        selected = [r for r in manifest["roots"] if roots is None or r in set(roots)]
+        files = manifest["files"]
+
+        def in_root(relative_path: str, root: str) -> bool:
+            return relative_path == root or relative_path.startswith(root.rstrip('/') + '/')
+
+        expected = {path: entry for path, entry in files.items()
+                    if any(in_root(path, root) for root in selected)}
+        for relative_path, entry in expected.items():
+            if "link" in entry and not link_stays_inside(relative_path, entry["link"]):
+                raise ValueError(f"Refusing to restore symlink outside the project: {relative_path} -> {entry['link']}")
+
+        # Remove files that did not exist at backup time
+        for root in selected:
+            root_path = project_root / root
+            if root_path.is_dir() and not root_path.is_symlink():
+                for relative_path in list(self._walk(project_root, root)):
+                    if relative_path not in expected:
+                        (project_root / relative_path).unlink()
+                        self._count('removed')
+
+        def restore_one(item):
+            relative_path, entry = item
+            changed = self._restore_file(project_root, relative_path, entry)
+            self._count('restored' if changed else 'unchanged')
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            list(executor.map(restore_one, expected.items()))
+
+        # Prune directories left empty by removals
+        for root in selected:
+            root_path = project_root / root
+            if root_path.is_dir() and not root_path.is_symlink():
+                for dirpath, dirnames, filenames in os.walk(root_path, topdown=False):
+                    if dirpath != str(root_path) and not os.listdir(dirpath):
+                        os.rmdir(dirpath)
+
+        self._save_index()
+        return self.stats
+
+    # ----- housekeeping -----------------------------------------------------
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """Summaries of every manifest, oldest first"""
+        backups = []
+        if not self.manifests_dir.exists():
+            return backups
+        for manifest_path in sorted(self.manifests_dir.glob("*.json")):
+            try:
+                manifest = self.load_manifest(manifest_path)
+            except (OSError, json.JSONDecodeError):
+                continue
+            backups.append({
+                "id": manifest["id"],
+                "kind": manifest.get("kind"),
+                "created": manifest.get("created"),
+                "version": manifest.get("version"),
+                "files": len(manifest.get("files", {})),
+                "path": str(manifest_path)
+            })
+        return sorted(backups, key=lambda b: b["created"] or "")
+
+    def prune(self, keep: int = DEFAULT_KEEP_BACKUPS) -> Dict[str, int]:
+        """Drop all but the newest `keep` manifests and any objects no manifest references"""
+        backups = self.list_backups()
+        removed_manifests = 0
+        for backup in backups[:max(0, len(backups) - keep)]:
+            Path(backup["path"]).unlink()
+            removed_manifests += 1
+
+        referenced = set()
+        for backup in self.list_backups():
+            for entry in self.load_manifest(backup["path"])["files"].values():
+                if "hash" in entry:
+                    referenced.add(entry["hash"])
+
+        removed_objects = 0
+        if self.objects_dir.exists():
+            for object_path in self.objects_dir.iterdir():
+                if object_path.name not in referenced:
+                    object_path.unlink()
+                    removed_objects += 1
+
+        return {"manifests": removed_manifests, "objects": removed_objects}
+
+    def summary(self) -> str:
+        """Human-readable counts for the last backup or restore"""
+        stats = self.stats
+        return (f"{stats['files']} files, {stats['hashed']} re-hashed, {stats['stored']} new objects "
+                f"({stats['bytes_stored'] / 1024 / 1024:.1f} MB)")
@@ -0,0 +1,1987 @@
+"""
+📊 AI Documentation Framework - Conflict Detection System
+Conflict detection engine behind tools/conflict-detector.py, importable as
+`ai_doc_framework.conflict_detector`. See the script for command-line usage.
+
+Heavier modules (argparse, hashlib, difflib, datetime, numpy, yaml) are imported
+where they are used, so --help, --version and --health-check start quickly.
+"""
+
+import os
+import sys
+import json
+import re
+import abc
+import time
+from typing import Dict, List, Tuple, Optional, Any
+from pathlib import Path
+from dataclasses import dataclass, asdict, field
+
+__version__ = "2.0.0"
+
+class ConfigError(Exception):
+    """Raised when ai-doc-config.json is missing or invalid"""
+    
+    def __init__(self, message: str, hint: Optional[str] = None):
+        super().__init__(message)
+        self.hint = hint
+
+class ScanTimeout(Exception):
+    """Raised when a scan runs past its deadline"""
+
+# Most MinHash signatures kept in the shared on-disk cache (least recently used dropped)
+SIGNATURE_CACHE_LIMIT = 20000
+
+# Rule patterns compiled once per process and shared by every detector
+_COMPILED_PATTERNS: Dict[str, "re.Pattern"] = {}
+
+def compiled_pattern(pattern: str) -> "re.Pattern":
+    """Return the case-insensitive compiled form of a rule pattern"""
+    compiled = _COMPILED_PATTERNS.get(pattern)
+    if compiled is None:
+        compiled = _COMPILED_PATTERNS[pattern] = re.compile(pattern, re.IGNORECASE)
+    return compiled
+
+@dataclass
+class ConflictItem:
+    """Represents a single conflict detected in the system"""
+    id: str
+    type: str  # 'rule_conflict', 'doc_conflict', 'implementation_conflict', 'drift', 'numeric_outlier'
+    category: str  # 'performance', 'security', 'implementation', 'architecture'
+    severity: str  # 'low', 'medium', 'high', 'critical'
+    title: str
+    description: str
+    applications: List[str]
+    conflicting_content: List[Dict[str, Any]]
+    resolution_suggestion: str
+    manage_rules_command: str
+
+@dataclass
+class ConflictReport:
+    """Complete conflict detection report"""
+    timestamp: str
+    project_name: str
+    project_path: str
+    total_conflicts: int
+    conflicts_by_severity: Dict[str, int]
+    conflicts_by_category: Dict[str, int]
+    conflicts: List[ConflictItem]
+    recommendations: List[str]
+    summary: str
+    scan_statistics: Dict[str, Any] = field(default_factory=dict)
+
+class StructuredExtractor(abc.ABC):
+    """Base class for extractors that read exact values from configuration files
+    
+    Extractors return parameter -> values, where parameters are the names in
+    STRUCTURED_PARAMETERS (port, container_name, network, volume, environment,
+    database, framework). Register new formats with register_structured_extractor().
+    """
+    
+    name = 'base'
+    filenames: Tuple[str, ...] = ()
+    suffixes: Tuple[str, ...] = ()
+    
+    def matches(self, file_path: Path) -> bool:
+        """Check whether this extractor handles the given file"""
+        name = file_path.name.lower()
+        return name in self.filenames or any(name.endswith(suffix) for suffix in self.suffixes)
+        
+    @abc.abstractmethod
+    def extract(self, content: str) -> Dict[str, set]:
+        """Extract parameter values from file content"""
+        
+    @staticmethod
+    def _add(values: Dict[str, set], parameter: str, value: Any):
+        if value is None or value == '':
+            return
+        values.setdefault(parameter, set()).add(str(value).strip().lower())
+        
+    @staticmethod
+    def _database_from(text: str) -> Optional[str]:
+        match = re.search(r'(postgres|mysql|mariadb|sqlite)', str(text), re.IGNORECASE)
+        if not match:
+            return None
+        database = match.group(1).lower()
+        return 'mysql' if database == 'mariadb' else database
+        
+    def _walk(self, data: Any, values: Dict[str, set]):
+        """Collect well-known keys from arbitrary nested JSON/YAML data"""
+        if isinstance(data, dict):
+            for key, value in data.items():
+                key_name = str(key).lower()
+                if isinstance(value, (dict, list)):
+                    self._walk(value, values)
+                elif 'port' in key_name and re.fullmatch(r'\d{2,5}', str(value)):
+                    self._add(values, 'port', value)
+                elif key_name == 'container_name':
+                    self._add(values, 'container_name', value)
+                elif key_name in ('database', 'db', 'engine', 'database_url', 'dialect'):
+                    self._add(values, 'database', self._database_from(value))
+        elif isinstance(data, list):
+            for item in data:
+                self._walk(item, values)
+
+class ComposeExtractor(StructuredExtractor):
+    """docker-compose.yml / compose.yaml services, networks and volumes"""
+    
+    name = 'compose'
+    filenames = ('docker-compose.yml', 'docker-compose.yaml', 'compose.yml', 'compose.yaml')
+    suffixes = ('.compose.yml', '.compose.yaml')
+    
+    def extract(self, content: str) -> Dict[str, set]:
+        import yaml
+        
+        data = yaml.safe_load(content) or {}
+        values: Dict[str, set] = {}
+        
+        for service in (data.get('services') or {}).values():
+            service = service or {}
+            
+            for port in service.get('ports') or []:
+                if isinstance(port, dict):
+                    self._add(values, 'port', port.get('published') or port.get('target'))
+                else:
+                    # [host_ip:]host_port:container_port[/protocol] or container_port
+                    parts = str(port).split('/')[0].split(':')
+                    self._add(values, 'port', parts[-2] if len(parts) > 1 else parts[0])
+                    
+            self._add(values, 'container_name', service.get('container_name'))
+            
+            networks = service.get('networks') or []
+            for network in (networks.keys() if isinstance(networks, dict) else networks):
+                self._add(values, 'network', network)
+                
+            for volume in service.get('volumes') or []:
+                source = volume.get('source') if isinstance(volume, dict) else str(volume).split(':')[0]
+                self._add(values, 'volume', source)
+                
+            environment = service.get('environment') or []
+            names = environment.keys() if isinstance(environment, dict) else [str(e).split('=')[0] for e in environment]
+            for name in names:
+                self._add(values, 'environment', name)
+                
+            if service.get('image'):
+                self._add(values, 'database', self._database_from(service['image']))
+                
+        for network in (data.get('networks') or {}):
+            self._add(values, 'network', network)
+        for volume in (data.get('volumes') or {}):
+            self._add(values, 'volume', volume)
+            
+        return values
+
+class EnvFileExtractor(StructuredExtractor):
+    """.env files: variable names, *PORT values and database URLs (values are never reported)"""
+    
+    name = 'env'
+    filenames = ('.env',)
+    suffixes = ('.env',)
+    
+    def matches(self, file_path: Path) -> bool:
+        return super().matches(file_path) or file_path.name.lower().startswith('.env.')
+        
+    def extract(self, content: str) -> Dict[str, set]:
+        values: Dict[str, set] = {}
+        
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            name, value = line.split('=', 1)
+            name = name.replace('export ', '', 1).strip()
+            value = value.strip().strip('"\'')
+            
+            self._add(values, 'environment', name)
+            if name.upper().endswith('PORT') and re.fullmatch(r'\d{2,5}', value):
+                self._add(values, 'port', value)
+            elif name.upper() in ('DATABASE_URL', 'DB_ENGINE', 'DB_TYPE', 'DATABASE_ENGINE'):
+                self._add(values, 'database', self._database_from(value))
+                
+        return values
+
+class PackageJsonExtractor(StructuredExtractor):
+    """package.json dependencies, config and script ports"""
+    
+    name = 'package-json'
+    filenames = ('package.json',)
+    
+    DATABASE_PACKAGES = {
+        'pg': 'postgres', 'postgres': 'postgres', 'mysql': 'mysql', 'mysql2': 'mysql',
+        'sqlite3': 'sqlite', 'better-sqlite3': 'sqlite'
+    }
+    
+    def extract(self, content: str) -> Dict[str, set]:
+        data = json.loads(content)
+        values: Dict[str, set] = {}
+        
+        for section in ('dependencies', 'devDependencies'):
+            for package in (data.get(section) or {}):
+                self._add(values, 'database', self.DATABASE_PACKAGES.get(package))
+                
+        for script in (data.get('scripts') or {}).values():
+            for port in re.findall(r'(?:--port[= ]|PORT=)(\d{2,5})', str(script)):
+                self._add(values, 'port', port)
+                
+        self._walk(data.get('config') or {}, values)
+        return values
+
+class JsonConfigExtractor(StructuredExtractor):
+    """Generic JSON configuration files"""
+    
+    name = 'json'
+    suffixes = ('.json',)
+    
+    def extract(self, content: str) -> Dict[str, set]:
+        values: Dict[str, set] = {}
+        self._walk(json.loads(content), values)
+        return values
+
+class YamlConfigExtractor(StructuredExtractor):
+    """Generic YAML configuration files"""
+    
+    name = 'yaml'
+    suffixes = ('.yml', '.yaml')
+    
+    def extract(self, content: str) -> Dict[str, set]:
+        import yaml
+        
+        values: Dict[str, set] = {}
+        for document in yaml.safe_load_all(content):
+            self._walk(document, values)
+        return values
+
+# Checked in order; the first matching extractor handles a file
+STRUCTURED_EXTRACTORS: List[StructuredExtractor] = [
+    ComposeExtractor(),
+    EnvFileExtractor(),
+    PackageJsonExtractor(),
+    JsonConfigExtractor(),
+    YamlConfigExtractor()
+]
+
+# Files an application contributes when its config has no "structured_sources"
+DEFAULT_STRUCTURED_SOURCES = [
+    'docker-compose.yml', 'docker-compose.yaml', 'compose.yml', 'compose.yaml',
+    '.env', 'package.json'
+]
+
+def register_structured_extractor(extractor: StructuredExtractor):
+    """Register a custom extractor ahead of the built-in ones"""
+    STRUCTURED_EXTRACTORS.insert(0, extractor)
+
+class MinHasher:
+    """MinHash signatures and LSH banding for near-duplicate document detection"""
+    
+    _MERSENNE_PRIME = (1 << 61) - 1
+    _MAX_HASH = (1 << 32) - 1
+    
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, threshold: float = 0.8, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        
+        import random
+        
+        # Deterministic permutations so signatures can be cached across runs
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randint(1, self._MERSENNE_PRIME - 1), rng.randint(0, self._MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+        self.bands, self.rows = self._optimal_banding(num_perm, threshold)
+        
+    @staticmethod
+    def _optimal_banding(num_perm: int, threshold: float) -> Tuple[int, int]:
+        """Pick bands x rows whose LSH threshold (1/b)^(1/r) is closest to the target"""
+        best = (num_perm, 1)
+        best_error = float('inf')
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            error = abs((1 / bands) ** (1 / rows) - threshold)
+            if error < best_error:
+                best, best_error = (bands, rows), error
+        return best
+        
+    def shingles(self, content: str) -> set:
+        """Split markdown content into hashed word shingles"""
+        import hashlib
+        
+        tokens = re.findall(r'[a-z0-9]+', content.lower())
+        size = self.shingle_size
+        if len(tokens) < size:
+            size = max(len(tokens), 1)
+            
+        shingles = set()
+        for i in range(max(len(tokens) - size + 1, 1)):
+            shingle = ' '.join(tokens[i:i + size])
+            digest = hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest()
+            shingles.add(int.from_bytes(digest, 'little'))
+        return shingles
+        
+    def signature(self, content: str) -> List[int]:
+        """Compute the MinHash signature of a document"""
+        shingles = self.shingles(content)
+        prime, max_hash = self._MERSENNE_PRIME, self._MAX_HASH
+        return [
+            min(((a * x + b) % prime) & max_hash for x in shingles)
+            for a, b in self._permutations
+        ]
+        
+    def similarity(self, sig1: List[int], sig2: List[int]) -> float:
+        """Estimate Jaccard similarity from two signatures"""
+        return sum(1 for h1, h2 in zip(sig1, sig2) if h1 == h2) / self.num_perm
+        
+    def candidate_pairs(self, signatures: Dict[Any, List[int]]) -> set:
+        """Find candidate pairs that share at least one LSH band bucket"""
+        candidates = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets: Dict[Tuple[int, ...], List[Any]] = {}
+            for key, sig in signatures.items():
+                buckets.setdefault(tuple(sig[start:start + self.rows]), []).append(key)
+            for members in buckets.values():
+                for i, key1 in enumerate(members):
+                    for key2 in members[i + 1:]:
+                        candidates.add((key1, key2) if key1 < key2 else (key2, key1))
+        return candidates
+
+class AIDocConflictDetector:
+    """Main conflict detection system"""
+    
+    def __init__(self, project_root: str = ".", config_path: Optional[str] = None):
+        self.project_root = Path(project_root).resolve()
+        self.config_path = config_path or self.project_root / "ai-doc-config.json"
+        
+        # Config and applications are loaded on first use, so constructing the
+        # detector (e.g. for --health-check) never touches the project tree
+        self._config: Optional[Dict[str, Any]] = None
+        self._applications: Optional[Dict[str, Path]] = None
+        
+        # Optional time.monotonic() deadline; scans past it raise ScanTimeout
+        self.deadline: Optional[float] = None
+        
+        # MinHash signatures keyed by file content hash
+        self.signature_cache_file = Path.home() / ".ai-doc-framework-cache" / "minhash-signatures.json"
+        self._signature_cache: Optional[Dict[str, List[int]]] = None
+        self._signatures_used: Dict[str, None] = {}  # Ordered set of keys used by this detector
+        self.signature_cache_limit = SIGNATURE_CACHE_LIMIT
+        
+        # Content-addressed caches: identical files are parsed and scanned once
+        self._parsed_rules: Dict[str, Dict[str, List[str]]] = {}
+        self._rule_matches: Dict[Tuple[Tuple[Tuple[str, str], ...], str], List] = {}
+        self._structured_extractions: Dict[Tuple[str, str], Dict[str, set]] = {}
+        self._reset_scan_state()
+        
+        # Architecture values are only taken from key/value syntax ("**Network**: x",
+        # "network: x", "NETWORK=x"), so prose that merely mentions the word does not match
+        separator = r'[*_`\s]*[:=][*`"\'\s\[]*'
+        port_pattern = r'(?<![a-z])ports?(?![a-z])[*_`"\'\s:=]*(\d{4,5})\b'
+        
+        # Conflict detection patterns
+        self.rule_patterns = {
+            'performance': [
+                r'timeout.*?(\d+).*?(second|minute|ms)',
+                r'response.*?time.*?(\d+).*?(ms|second)',
+                r'memory.*?limit.*?(\d+).*?(mb|gb)',
+                r'max.*?connections.*?(\d+)',
+                r'cache.*?ttl.*?(\d+)'
+            ],
+            'security': [
+                r'jwt.*?expir.*?(\d+).*?(hour|minute|day)',
+                r'password.*?length.*?(\d+)',
+                r'ssl.*?version.*?(1\.\d|2\.\d|3\.\d)',
+                r'rate.*?limit.*?(\d+)',
+                r'session.*?timeout.*?(\d+)'
+            ],
+            'implementation': [
+                r'use.*?(css grid|flexbox)',
+                r'database.*?(postgres|mysql|sqlite)',
+                r'framework.*?(django|fastapi|flask)',
+                port_pattern,
+                r'coding.*?style.*?(pep8|google|airbnb)'
+            ],
+            'architecture': [
+                port_pattern,
+                r'(?<![a-z])container[_ ]name' + separator + r'([a-z0-9][a-z0-9_.\-]*)',
+                r'(?<![a-z])networks?(?![a-z])' + separator + r'([a-z0-9][a-z0-9_.\-]*)',
+                r'(?<![a-z])volumes?(?![a-z])' + separator + r'([a-z0-9_.~/][a-z0-9_.~/\-]*)',
+                # Variable names are upper case even though the patterns are case-insensitive
+                r'(?<![a-z])environment(?:[_ ]variables?)?' + separator + r'(?-i:([A-Z][A-Z0-9]*(?:_[A-Z0-9]+)*))\b'
+            ]
+        }
+        
+        # Numeric rule parameters for outlier analysis: pattern and unit family
+        self.numeric_parameters = {
+            'timeout': ('performance', self.rule_patterns['performance'][0], 'time'),
+            'response_time': ('performance', self.rule_patterns['performance'][1], 'time'),
+            'memory_limit': ('performance', self.rule_patterns['performance'][2], 'memory'),
+            'max_connections': ('performance', self.rule_patterns['performance'][3], None),
+            'cache_ttl': ('performance', self.rule_patterns['performance'][4], None),
+            'jwt_expiry': ('security', self.rule_patterns['security'][0], 'time'),
+            'password_length': ('security', self.rule_patterns['security'][1], None),
+            'rate_limit': ('security', self.rule_patterns['security'][3], None),
+            'session_timeout': ('security', self.rule_patterns['security'][4], None)
+        }
+        
+        # Structured config parameters and the value index keys they feed
+        self.structured_parameters = {
+            'port': [('implementation', self.rule_patterns['implementation'][3]),
+                     ('architecture', self.rule_patterns['architecture'][0])],
+            'container_name': [('architecture', self.rule_patterns['architecture'][1])],
+            'network': [('architecture', self.rule_patterns['architecture'][2])],
+            'volume': [('architecture', self.rule_patterns['architecture'][3])],
+            'environment': [('architecture', self.rule_patterns['architecture'][4])],
+            'database': [('implementation', self.rule_patterns['implementation'][1])],
+            'framework': [('implementation', self.rule_patterns['implementation'][2])]
+        }
+        
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Project configuration, loaded on first access"""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+        
+    @property
+    def applications(self) -> Dict[str, Path]:
+        """Discovered applications, resolved on first access"""
+        if self._applications is None:
+            self._applications = self._discover_applications()
+        return self._applications
+        
+    def health_check(self) -> List[str]:
+        """Check that patterns and extractors are usable without reading the project"""
+        problems = []
+        
+        for category, patterns in self.rule_patterns.items():
+            for pattern in patterns:
+                try:
+                    compiled_pattern(pattern)
+                except re.error as e:
+                    problems.append(f"Invalid {category} pattern {pattern!r}: {e}")
+                    
+        for parameter, keys in self.structured_parameters.items():
+            for category, pattern in keys:
+                if pattern not in self.rule_patterns.get(category, []):
+                    problems.append(f"Structured parameter {parameter} maps to unknown pattern {pattern!r}")
+                    
+        if not STRUCTURED_EXTRACTORS:
+            problems.append("No structured extractors registered")
+            
+        return problems
+        
+    def _load_config(self) -> Dict[str, Any]:
+        """Load ai-doc-config.json"""
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise ConfigError(f"Config file not found at {self.config_path}",
+                              hint="Please run the setup wizard first: python tools/setup-wizard.py")
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"Invalid JSON in config file: {e}")
+            
+    def _discover_applications(self) -> Dict[str, Path]:
+        """Discover all applications in the project"""
+        apps = {}
+        
+        # Add root as an application
+        if (self.project_root / "AI_RULES.md").exists():
+            apps['root'] = self.project_root
+            
+        # Add configured applications
+        if 'applications' in self.config:
+            for app_config in self.config['applications']:
+                app_name = app_config['name']
+                app_path = self.project_root / app_name
+                
+                if app_path.exists() and (app_path / "AI_RULES.md").exists():
+                    apps[app_name] = app_path
+                    
+        return apps
+        
+    def detect_all_conflicts(self, rules_only: bool = False, docs_only: bool = False,
+                             cross_app_docs: bool = False, drift: bool = False,
+                             drift_threshold: float = 0.8,
+                             structured_configs: bool = False, numeric_outliers: bool = False,
+                             tolerance: float = 0.5) -> ConflictReport:
+        """Detect all conflicts in the project"""
+        conflicts = []
+        self._reset_scan_state()
+        
+        if not docs_only:
+            # 1. AI_RULES conflicts across applications
+            if numeric_outliers:
+                # Numeric parameters the outlier pass covered are compared across all apps at
+                # once; the rest (no numpy, or fewer than three apps) stay pairwise
+                outlier_conflicts, covered_patterns = self._detect_numeric_outliers(tolerance)
+                conflicts.extend(self._detect_ai_rules_conflicts(skip_patterns=covered_patterns))
+                conflicts.extend(outlier_conflicts)
+            else:
+                rule_conflicts = self._detect_ai_rules_conflicts()
+                conflicts.extend(rule_conflicts)
+            
+        if not rules_only:
+            # 2. Documentation conflicts within each application
+            doc_conflicts = self._detect_documentation_conflicts()
+            conflicts.extend(doc_conflicts)
+            
+            # 2b. Documentation and config-file conflicts via the value index (opt-in)
+            if cross_app_docs or structured_configs:
+                conflicts.extend(self._detect_value_index_conflicts(cross_app_docs, structured_configs))
+                
+            # 2c. Near-duplicate documents that drifted between applications (opt-in)
+            if drift:
+                conflicts.extend(self._detect_document_drift(drift_threshold))
+            
+        # 3. Generate comprehensive report
+        report = self._generate_report(conflicts)
+        return report
+        
+    def _reset_scan_state(self):
+        """Forget file contents and per-run statistics so each run sees the current tree"""
+        self._file_contents: Dict[Path, Tuple[str, str]] = {}
+        self._seen_digests: set = set()
+        self._pattern_scans: Dict[str, Dict[Tuple[str, str], List]] = {}
+        # (kind, file) and (kind, digest) pairs served this run, for reuse statistics
+        self._served_files: set = set()
+        self._served_digests: set = set()
+        self.scan_stats = {
+            'files_loaded': 0,
+            'unique_contents': 0,
+            'duplicate_bytes': 0,
+            'parses_reused': 0,
+            'scans_reused': 0,
+            'signatures_reused': 0
+        }
+        
+    def _record_served(self, stat: str, kind: str, file_path: Path, digest: str):
+        """Count a reuse only when a new file gets the result of an identical file from this run"""
+        if (kind, file_path) in self._served_files:
+            return
+        self._served_files.add((kind, file_path))
+        if (kind, digest) in self._served_digests:
+            self.scan_stats[stat] += 1
+        self._served_digests.add((kind, digest))
+            
+    def _load_rules_data(self) -> Dict[str, Dict[str, List[str]]]:
+        """Load and parse all AI_RULES files"""
+        rules_data = {}
+        
+        for app_name, app_path in self.applications.items():
+            rules_file = app_path / "AI_RULES.md"
+            if rules_file.exists():
+                rules_data[app_name] = self._parse_ai_rules_file(rules_file)
+                
+        return rules_data
+        
+    def _detect_ai_rules_conflicts(self, skip_patterns: Optional[set] = None) -> List[ConflictItem]:
+        """Detect conflicts between AI_RULES files across applications"""
+        conflicts = []
+        
+        # Load all AI_RULES files
+        rules_data = self._load_rules_data()
+                
+        # Compare rules across applications
+        app_names = list(rules_data.keys())
+        for i, app1 in enumerate(app_names):
+            self._check_deadline()
+            for app2 in app_names[i+1:]:
+                app_conflicts = self._compare_ai_rules(app1, rules_data[app1], app2, rules_data[app2],
+                                                       skip_patterns)
+                conflicts.extend(app_conflicts)
+                
+        return conflicts
+        
+    def _check_deadline(self):
+        """Abort the scan once the deadline has passed"""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise ScanTimeout(f"Scan of {self.project_root} exceeded its time limit")
+            
+    def _load_file(self, file_path: Path) -> Tuple[str, str]:
+        """Read a file once and return its (content hash, content)"""
+        if file_path in self._file_contents:
+            return self._file_contents[file_path]
+            
+        self._check_deadline()
+
+        import hashlib
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+            
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        self.scan_stats['files_loaded'] += 1
+        if digest in self._seen_digests:
+            self.scan_stats['duplicate_bytes'] += len(content.encode('utf-8'))
+        else:
+            self._seen_digests.add(digest)
+            self.scan_stats['unique_contents'] += 1
+            
+        self._file_contents[file_path] = (digest, content)
+        return digest, content
+        
+    def _parse_ai_rules_file(self, rules_file: Path) -> Dict[str, List[str]]:
+        """Parse AI_RULES.md file and extract rules by category"""
+        rules_by_category = {}
+        
+        try:
+            digest, content = self._load_file(rules_file)
+            self._record_served('parses_reused', 'rules', rules_file, digest)
+            if digest in self._parsed_rules:
+                return self._parsed_rules[digest]
+                
+            # Find all rule sections
+            sections = re.findall(r'##\s*([^#\n]+)\s*Rules?\s*\n(.*?)(?=##|$)', content, re.DOTALL | re.IGNORECASE)
+            
+            for section_name, section_content in sections:
+                # "## Custom Security Rules" (the MANAGE_RULES.md convention) is the security category
+                category = re.sub(r'^custom\s+', '', section_name.strip().lower())
+                rules = re.findall(r'-\s*\*\*([^*]+)\*\*[:\s]*([^\n]+)', section_content)
+                rules_by_category[category] = rules
+                
+            self._parsed_rules[digest] = rules_by_category
+                
+        except ScanTimeout:
+            raise
+        except Exception as e:
+            print(f"⚠️  Warning: Could not parse {rules_file}: {e}")
+            
+        return rules_by_category
+        
+    def _compare_ai_rules(self, app1: str, rules1: Dict, app2: str, rules2: Dict,
+                          skip_patterns: Optional[set] = None) -> List[ConflictItem]:
+        """Compare AI_RULES between two applications"""
+        conflicts = []
+        
+        # Find common categories
+        common_categories = set(rules1.keys()) & set(rules2.keys())
+        
+        for category in common_categories:
+            category_conflicts = self._detect_category_conflicts(
+                app1, rules1[category], app2, rules2[category], category, skip_patterns
+            )
+            conflicts.extend(category_conflicts)
+            
+        return conflicts
+        
+    def _detect_category_conflicts(self, app1: str, rules1: List, app2: str, rules2: List, category: str,
+                                   skip_patterns: Optional[set] = None) -> List[ConflictItem]:
+        """Detect conflicts within a specific rule category"""
+        conflicts = []
+        
+        # Check for pattern-based conflicts
+        for pattern_type, patterns in self.rule_patterns.items():
+            if pattern_type == category or category in pattern_type:
+                for pattern in patterns:
+                    if skip_patterns and pattern in skip_patterns:
+                        continue
+                        
+                    # Find matches in app1 and app2 rules
+                    app1_matches = self._match_rules(rules1, pattern)
+                    app2_matches = self._match_rules(rules2, pattern)
+                            
+                    # Compare matches for conflicts
+                    if app1_matches and app2_matches:
+                        conflict = self._analyze_pattern_conflict(
+                            app1, app1_matches, app2, app2_matches, category, pattern
+                        )
+                        if conflict:
+                            conflicts.append(conflict)
+                            
+        return conflicts
+        
+    def _match_rules(self, rules: List, pattern: str) -> List:
+        """Match a pattern against parsed rules, sharing results between identical rule lists"""
+        cache_key = (tuple(rules), pattern)
+        if cache_key in self._rule_matches:
+            return self._rule_matches[cache_key]
+            
+        rule_matches = []
+        for rule_name, rule_desc in rules:
+            matches = compiled_pattern(pattern).findall(f"{rule_name} {rule_desc}")
+            if matches:
+                rule_matches.append((rule_name, rule_desc, matches))
+                
+        self._rule_matches[cache_key] = rule_matches
+        return rule_matches
+        
+    def _analyze_pattern_conflict(self, app1: str, matches1: List, app2: str, matches2: List, 
+                                category: str, pattern: str) -> Optional[ConflictItem]:
+        """Analyze pattern matches to determine if there's a conflict"""
+        
+        # Extract values from matches
+        values1 = set()
+        values2 = set()
+        
+        for _, _, matches in matches1:
+            for match in matches:
+                if isinstance(match, tuple):
+                    values1.add(match[0])  # First capturing group
+                else:
+                    values1.add(match)
+                    
+        for _, _, matches in matches2:
+            for match in matches:
+                if isinstance(match, tuple):
+                    values2.add(match[0])  # First capturing group
+                else:
+                    values2.add(match)
+                    
+        # Check if values conflict (different non-empty values)
+        if values1 and values2 and values1 != values2:
+            conflict_id = f"{category}_{app1}_{app2}_{hash(pattern)}"
+            severity = self._determine_severity(category, values1, values2)
+            
+            # Create conflict description
+            title = f"{category.title()} Configuration Conflict: {app1} vs {app2}"
+            description = f"Different {category} configurations detected between {app1} and {app2}"
+            
+            conflicting_content = [
+                {
+                    "application": app1,
+                    "values": list(values1),
+                    "rules": [{"name": name, "description": desc} for name, desc, _ in matches1]
+                },
+                {
+                    "application": app2,
+                    "values": list(values2),
+                    "rules": [{"name": name, "description": desc} for name, desc, _ in matches2]
+                }
+            ]
+            
+            resolution_suggestion = self._generate_resolution_suggestion(category, app1, app2, values1, values2)
+            manage_rules_command = self._generate_manage_rules_command(category, app1, app2, values1, values2)
+            
+            return ConflictItem(
+                id=conflict_id,
+                type='rule_conflict',
+                category=category,
+                severity=severity,
+                title=title,
+                description=description,
+                applications=[app1, app2],
+                conflicting_content=conflicting_content,
+                resolution_suggestion=resolution_suggestion,
+                manage_rules_command=manage_rules_command
+            )
+            
+        return None
+        
+    # Unit conversion factors to seconds / megabytes
+    TIME_UNITS = {'ms': 0.001, 'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+    MEMORY_UNITS = {'mb': 1, 'gb': 1024}
+    
+    def _normalize_numeric_value(self, match: Any, unit_family: Optional[str]) -> Optional[float]:
+        """Convert a pattern match such as ('30', 'minute') to a base unit"""
+        number, unit = (match[0], match[1].lower()) if isinstance(match, tuple) else (match, None)
+        try:
+            value = float(number)
+        except ValueError:
+            return None
+            
+        if unit_family == 'time' and unit:
+            return value * self.TIME_UNITS.get(unit, 1)
+        if unit_family == 'memory' and unit:
+            return value * self.MEMORY_UNITS.get(unit, 1)
+        return value
+        
+    def _detect_numeric_outliers(self, tolerance: float = 0.5) -> Tuple[List[ConflictItem], set]:
+        """Flag applications whose numeric rule values deviate from the cross-app median
+        
+        Values are normalized to base units and loaded into an apps x parameters
+        matrix (NaN where an app does not set a parameter). Medians, spread and
+        relative deviations for every parameter are computed in one vectorised
+        pass, so cost grows linearly with the number of applications.
+        
+        Returns the conflicts and the rule patterns of the parameters compared
+        this way; every other parameter still needs the pairwise comparison.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            print("⚠️  Warning: numeric outlier analysis requires numpy (pip install numpy); "
+                  "comparing numeric rules pairwise")
+            return [], set()
+            
+        rules_data = self._load_rules_data()
+        app_names = sorted(rules_data)
+        parameters = list(self.numeric_parameters)
+        values = np.full((len(app_names), len(parameters)), np.nan)
+        sources: Dict[Tuple[int, int], Tuple[str, str]] = {}
+        
+        for i, app_name in enumerate(app_names):
+            self._check_deadline()
+            for j, parameter in enumerate(parameters):
+                _, pattern, unit_family = self.numeric_parameters[parameter]
+                # Same per-category lists as the pairwise comparison, so matches are shared
+                rule_matches = []
+                for rules in rules_data[app_name].values():
+                    rule_matches = self._match_rules(rules, pattern)
+                    if rule_matches:
+                        break
+                if not rule_matches:
+                    continue
+                    
+                # First matching rule defines the app's value for this parameter
+                rule_name, rule_desc, matches = rule_matches[0]
+                normalized = self._normalize_numeric_value(matches[0], unit_family)
+                if normalized is not None:
+                    values[i, j] = normalized
+                    sources[(i, j)] = (rule_name, rule_desc)
+                    
+        present = ~np.isnan(values)
+        counts = present.sum(axis=0)
+        # Medians need at least three apps to identify a single outlier
+        usable = counts >= 3
+        if not usable.any():
+            return [], set()
+        covered_patterns = {self.numeric_parameters[p][1] for p, ok in zip(parameters, usable) if ok}
+            
+        with np.errstate(all='ignore'):
+            masked = values[:, usable]
+            medians = np.nanmedian(masked, axis=0)
+            minimums = np.nanmin(masked, axis=0)
+            maximums = np.nanmax(masked, axis=0)
+            deviations = np.abs(masked - medians) / np.where(medians == 0, 1, medians)
+        outliers = present[:, usable] & (deviations > tolerance)
+        
+        conflicts = []
+        usable_parameters = [p for p, ok in zip(parameters, usable) if ok]
+        usable_columns = np.flatnonzero(usable)
+        for k, parameter in enumerate(usable_parameters):
+            outlier_rows = np.flatnonzero(outliers[:, k])
+            if outlier_rows.size == 0:
+                continue
+                
+            j = usable_columns[k]
+            stats = {
+                "median": float(medians[k]),
+                "min": float(minimums[k]),
+                "max": float(maximums[k]),
+                "spread": float(maximums[k] - minimums[k]),
+                "applications_compared": int(counts[j])
+            }
+            outlier_apps = [
+                {
+                    "application": app_names[i],
+                    "value": float(values[i, j]),
+                    "deviation": round(float(deviations[i, k]), 3),
+                    "rule": {"name": sources[(i, j)][0], "description": sources[(i, j)][1]}
+                }
+                for i in outlier_rows
+            ]
+            conflicts.append(self._create_numeric_outlier_conflict(parameter, outlier_apps, stats, tolerance))
+            
+        return conflicts, covered_patterns
+        
+    def _create_numeric_outlier_conflict(self, parameter: str, outlier_apps: List[Dict[str, Any]],
+                                         stats: Dict[str, Any], tolerance: float) -> ConflictItem:
+        """Create a conflict item for apps whose numeric value is an outlier"""
+        category, _, unit_family = self.numeric_parameters[parameter]
+        unit = {'time': 's', 'memory': 'MB'}.get(unit_family, '')
+        applications = [item["application"] for item in outlier_apps]
+        label = parameter.replace('_', ' ')
+        
+        title = f"{label.title()} Outlier: {', '.join(applications)}"
+        description = (
+            f"{label.capitalize()} deviates more than {tolerance:.0%} from the median "
+            f"({stats['median']:g}{unit}) across {stats['applications_compared']} applications"
+        )
+        
+        resolution_suggestion = (
+            f"Review {label} in {', '.join(applications)}. Most applications use about "
+            f"{stats['median']:g}{unit} (range {stats['min']:g}-{stats['max']:g}{unit}).\n"
+            f"Use MANAGE_RULES.md to update the conflicting rules."
+        )
+        
+        manage_rules_command = (
+            f'Update {applications[0]} {category} rule: '
+            f'Align {label} with the project median ({stats["median"]:g}{unit})'
+        )
+        
+        return ConflictItem(
+            id=f"outlier_{parameter}_{'_'.join(applications)}",
+            type='numeric_outlier',
+            category=category,
+            severity=self._determine_severity(category, set(), set()),
+            title=title,
+            description=description,
+            applications=applications,
+            conflicting_content=outlier_apps + [{"statistics": stats}],
+            resolution_suggestion=resolution_suggestion,
+            manage_rules_command=manage_rules_command
+        )
+        
+    def _detect_documentation_conflicts(self) -> List[ConflictItem]:
+        """Detect conflicts within documentation of each application"""
+        conflicts = []
+        
+        for app_name, app_path in self.applications.items():
+            if app_name == 'root':
+                continue
+                
+            app_conflicts = self._detect_app_documentation_conflicts(app_name, app_path)
+            conflicts.extend(app_conflicts)
+            
+        return conflicts
+        
+    def _detect_app_documentation_conflicts(self, app_name: str, app_path: Path) -> List[ConflictItem]:
+        """Detect documentation conflicts within a specific application"""
+        conflicts = []
+        
+        # Find all documentation files
+        docs_dir = app_path / "docs"
+        if not docs_dir.exists():
+            return conflicts
+            
+        doc_files = list(docs_dir.glob("**/*.md"))
+        
+        # Check for conflicting information across documentation files
+        for i, doc1 in enumerate(doc_files):
+            for doc2 in doc_files[i+1:]:
+                # Pairs of already-loaded files never reach _load_file's check
+                self._check_deadline()
+                file_conflicts = self._compare_documentation_files(app_name, doc1, doc2)
+                conflicts.extend(file_conflicts)
+                
+        return conflicts
+        
+    def _compare_documentation_files(self, app_name: str, doc1: Path, doc2: Path) -> List[ConflictItem]:
+        """Compare two documentation files for conflicts"""
+        conflicts = []
+        
+        try:
+            scan1 = self._scan_document(doc1)
+            scan2 = self._scan_document(doc2)
+                
+            # Look for conflicting technical specifications
+            for category, patterns in self.rule_patterns.items():
+                for pattern in patterns:
+                    matches1 = scan1.get((category, pattern), [])
+                    matches2 = scan2.get((category, pattern), [])
+                    
+                    if matches1 and matches2 and set(matches1) != set(matches2):
+                        conflict = self._create_doc_conflict(
+                            app_name, doc1, doc2, category, matches1, matches2, pattern
+                        )
+                        if conflict:
+                            conflicts.append(conflict)
+                            
+        except ScanTimeout:
+            raise
+        except Exception as e:
+            print(f"⚠️  Warning: Could not compare {doc1} and {doc2}: {e}")
+            
+        return conflicts
+        
+    def _create_doc_conflict(self, app_name: str, doc1: Path, doc2: Path, category: str,
+                           matches1: List, matches2: List, pattern: str) -> Optional[ConflictItem]:
+        """Create a documentation conflict item"""
+        
+        conflict_id = f"doc_{app_name}_{category}_{hash(str(doc1) + str(doc2) + pattern)}"
+        severity = "medium"  # Documentation conflicts are generally medium severity
+        
+        title = f"Documentation Conflict in {app_name}: {doc1.name} vs {doc2.name}"
+        description = f"Conflicting {category} information found in documentation files"
+        
+        conflicting_content = [
+            {
+                "file": str(doc1.relative_to(self.project_root)),
+                "values": matches1
+            },
+            {
+                "file": str(doc2.relative_to(self.project_root)),
+                "values": matches2
+            }
+        ]
+        
+        resolution_suggestion = (
+            f"Review {category} configurations in {doc1.name} and {doc2.name}. "
+            f"Ensure consistent values across all documentation."
+        )
+        
+        manage_rules_command = (
+            f'Update {app_name} {category} documentation: '
+            f'Standardize conflicting values between {doc1.name} and {doc2.name}'
+        )
+        
+        return ConflictItem(
+            id=conflict_id,
+            type='doc_conflict',
+            category=category,
+            severity=severity,
+            title=title,
+            description=description,
+            applications=[app_name],
+            conflicting_content=conflicting_content,
+            resolution_suggestion=resolution_suggestion,
+            manage_rules_command=manage_rules_command
+        )
+        
+    def _scan_document(self, doc_file: Path) -> Dict[Tuple[str, str], List]:
+        """Run all rule patterns over a document once per unique content"""
+        digest, content = self._load_file(doc_file)
+        self._record_served('scans_reused', 'doc', doc_file, digest)
+        if digest in self._pattern_scans:
+            return self._pattern_scans[digest]
+            
+        scan = {}
+        for category, patterns in self.rule_patterns.items():
+            for pattern in patterns:
+                matches = compiled_pattern(pattern).findall(content)
+                if matches:
+                    scan[(category, pattern)] = matches
+                    
+        self._pattern_scans[digest] = scan
+        return scan
+        
+    def _extract_pattern_values(self, doc_file: Path) -> Dict[Tuple[str, str], set]:
+        """Extract normalized values for every (category, pattern) found in a document"""
+        values = {}
+        
+        for key, matches in self._scan_document(doc_file).items():
+            found = set()
+            for match in matches:
+                value = match[0] if isinstance(match, tuple) else match
+                found.add(value.strip().lower())
+            values[key] = found
+                
+        return values
+        
+    def _collect_documentation_files(self) -> Dict[str, List[Path]]:
+        """Collect documentation files for every application, including root"""
+        doc_files = {}
+        
+        for app_name, app_path in self.applications.items():
+            docs_dir = app_path / "docs"
+            if docs_dir.exists():
+                doc_files[app_name] = sorted(docs_dir.glob("**/*.md"))
+                
+        return doc_files
+        
+    def _collect_structured_sources(self) -> Dict[str, List[Path]]:
+        """Collect configuration files each application contributes to the value index
+        
+        Applications select files with a "structured_sources" list of glob
+        patterns (root uses the top-level key); DEFAULT_STRUCTURED_SOURCES
+        is used when none is configured.
+        """
+        app_sources = {
+            app_config['name']: app_config.get('structured_sources')
+            for app_config in self.config.get('applications', [])
+        }
+        app_sources['root'] = self.config.get('structured_sources')
+        
+        sources = {}
+        for app_name, app_path in self.applications.items():
+            patterns = app_sources.get(app_name) or DEFAULT_STRUCTURED_SOURCES
+            files = set()
+            for pattern in patterns:
+                files.update(f for f in app_path.glob(pattern) if f.is_file())
+            if files:
+                sources[app_name] = sorted(files)
+                
+        return sources
+        
+    def _extract_structured_values(self, config_file: Path) -> Dict[Tuple[str, str], set]:
+        """Parse a config file with the first matching extractor and map values to index keys"""
+        extractor = next((e for e in STRUCTURED_EXTRACTORS if e.matches(config_file)), None)
+        if extractor is None:
+            return {}
+            
+        digest, content = self._load_file(config_file)
+        cache_key = (extractor.name, digest)
+        self._record_served('scans_reused', extractor.name, config_file, digest)
+        if cache_key in self._structured_extractions:
+            parameters = self._structured_extractions[cache_key]
+        else:
+            parameters = extractor.extract(content)
+            self._structured_extractions[cache_key] = parameters
+            
+        values = {}
+        for parameter, parameter_values in parameters.items():
+            for key in self.structured_parameters.get(parameter, []):
+                values.setdefault(key, set()).update(parameter_values)
+        return values
+        
+    def _build_value_index(self, include_docs: bool, include_structured: bool
+                           ) -> Dict[Tuple[str, str], Dict[str, List[Tuple[str, Path, str]]]]:
+        """Build the inverted index (category, pattern) -> value -> [(app, file, source)]"""
+        value_index: Dict[Tuple[str, str], Dict[str, List[Tuple[str, Path, str]]]] = {}
+        
+        sources = []
+        if include_docs:
+            sources.append(('doc', self._collect_documentation_files(), self._extract_pattern_values))
+        if include_structured:
+            sources.append(('config', self._collect_structured_sources(), self._extract_structured_values))
+            
+        for source, files_by_app, extract in sources:
+            for app_name, files in files_by_app.items():
+                for source_file in files:
+                    try:
+                        file_values = extract(source_file)
+                    except ScanTimeout:
+                        raise
+                    except Exception as e:
+                        print(f"⚠️  Warning: Could not read {source_file}: {e}")
+                        continue
+                        
+                    for key, values in file_values.items():
+                        key_index = value_index.setdefault(key, {})
+                        for value in values:
+                            key_index.setdefault(value, []).append((app_name, source_file, source))
+                            
+        return value_index
+        
+    def _detect_value_index_conflicts(self, cross_app_docs: bool = True,
+                                      structured_configs: bool = False) -> List[ConflictItem]:
+        """Detect conflicts across applications using a project-wide value index
+        
+        Every documentation and configuration file is read and scanned once.
+        Extracted values are stored in an inverted index, so conflicting files
+        are found by index lookup instead of comparing every pair of files.
+        With structured configs, each application's docs are also checked
+        against the exact values in its own configuration files.
+        """
+        conflicts = []
+        
+        # Docs are indexed for config checks too, but only compared across apps when asked
+        value_index = self._build_value_index(cross_app_docs or structured_configs, structured_configs)
+        cross_app_sources = {s for s, enabled in (('doc', cross_app_docs), ('config', structured_configs)) if enabled}
+        
+        for (category, pattern), full_index in value_index.items():
+            # Look up conflicting values across applications
+            key_index = {}
+            for value, entries in full_index.items():
+                selected = [entry for entry in entries if entry[2] in cross_app_sources]
+                if selected:
+                    key_index[value] = selected
+                    
+            apps_by_value = {value: {app for app, _, _ in entries} for value, entries in key_index.items()}
+            involved_apps = set().union(*apps_by_value.values()) if apps_by_value else set()
+            
+            # Same-app differences are reported by the per-app check; values
+            # shared by every involved application are not conflicts
+            if (len(key_index) > 1 and len(involved_apps) > 1
+                    and not all(apps == involved_apps for apps in apps_by_value.values())):
+                conflicts.append(
+                    self._create_cross_app_doc_conflict(category, pattern, key_index, sorted(involved_apps))
+                )
+                
+            if structured_configs:
+                conflicts.extend(self._detect_config_doc_mismatches(category, pattern, full_index))
+                
+        return conflicts
+        
+    def _detect_config_doc_mismatches(self, category: str, pattern: str,
+                                      key_index: Dict[str, List[Tuple[str, Path, str]]]) -> List[ConflictItem]:
+        """Report documented values that an application's own config files do not contain"""
+        conflicts = []
+        by_app: Dict[str, Dict[str, Dict[str, List[Path]]]] = {}
+        
+        for value, entries in key_index.items():
+            for app_name, source_file, source in entries:
+                by_app.setdefault(app_name, {}).setdefault(source, {}).setdefault(value, []).append(source_file)
+                
+        for app_name in sorted(by_app):
+            config_values = by_app[app_name].get('config', {})
+            doc_values = by_app[app_name].get('doc', {})
+            mismatched = {v: files for v, files in doc_values.items() if v not in config_values}
+            if not config_values or not mismatched:
+                continue
+                
+            conflict = self._create_config_doc_conflict(
+                app_name, category, pattern, config_values, mismatched
+            )
+            conflicts.append(conflict)
+            
+        return conflicts
+        
+    def _create_config_doc_conflict(self, app_name: str, category: str, pattern: str,
+                                    config_values: Dict[str, List[Path]],
+                                    doc_values: Dict[str, List[Path]]) -> ConflictItem:
+        """Create a conflict item for docs that disagree with the app's config files"""
+        
+        conflict_id = f"cfg_{app_name}_{category}_{hash(pattern)}"
+        configured = ', '.join(sorted(config_values))
+        
+        title = f"Documentation vs Config Conflict in {app_name}: {category.title()}"
+        description = (
+            f"Documentation in {app_name} states {category} values "
+            f"({', '.join(sorted(doc_values))}) not found in its configuration files"
+        )
+        
+        conflicting_content = []
+        for source, values in (('config', config_values), ('doc', doc_values)):
+            for value in sorted(values):
+                for source_file in values[value]:
+                    conflicting_content.append({
+                        "application": app_name,
+                        "file": str(source_file.relative_to(self.project_root)),
+                        "source": source,
+                        "values": [value]
+                    })
+                    
+        resolution_suggestion = (
+            f"Configuration files are authoritative: update {app_name} documentation "
+            f"to match ({configured}) or fix the configuration."
+        )
+        
+        manage_rules_command = (
+            f'Update {app_name} {category} documentation: '
+            f'Match configured values ({configured})'
+        )
+        
+        return ConflictItem(
+            id=conflict_id,
+            type='doc_conflict',
+            category=category,
+            severity='medium',
+            title=title,
+            description=description,
+            applications=[app_name],
+            conflicting_content=conflicting_content,
+            resolution_suggestion=resolution_suggestion,
+            manage_rules_command=manage_rules_command
+        )
+        
+    def _create_cross_app_doc_conflict(self, category: str, pattern: str,
+                                       key_index: Dict[str, List[Tuple[str, Path, str]]],
+                                       applications: List[str]) -> ConflictItem:
+        """Create a cross-application documentation conflict item"""
+        
+        conflict_id = f"xdoc_{category}_{hash(pattern)}"
+        
+        sources = {source for entries in key_index.values() for _, _, source in entries}
+        kind = 'Documentation' if sources == {'doc'} else 'Configuration'
+        title = f"Cross-Application {kind} Conflict: {category.title()} ({', '.join(applications)})"
+        description = f"Conflicting {category} information found in {kind.lower()} of different applications"
+        
+        conflicting_content = []
+        for value in sorted(key_index):
+            for app_name, source_file, source in key_index[value]:
+                conflicting_content.append({
+                    "application": app_name,
+                    "file": str(source_file.relative_to(self.project_root)),
+                    "source": source,
+                    "values": [value]
+                })
+                
+        resolution_suggestion = (
+            f"Review {category} values documented in {', '.join(applications)}. "
+            f"Ensure shared settings are documented consistently, or clarify app-specific values."
+        )
+        
+        manage_rules_command = (
+            f'Add {category} rule to root: '
+            f'Standardize documented values ({", ".join(sorted(key_index))}) across {", ".join(applications)}'
+        )
+        
+        return ConflictItem(
+            id=conflict_id,
+            type='doc_conflict',
+            category=category,
+            severity='medium',
+            title=title,
+            description=description,
+            applications=applications,
+            conflicting_content=conflicting_content,
+            resolution_suggestion=resolution_suggestion,
+            manage_rules_command=manage_rules_command
+        )
+        
+    def _load_signature_cache(self) -> Dict[str, List[int]]:
+        """Load cached MinHash signatures (persisted when AI_DOC_FRAMEWORK_CACHE=1)"""
+        if self._signature_cache is None:
+            self._signature_cache = {}
+            if os.environ.get('AI_DOC_FRAMEWORK_CACHE') == '1' and self.signature_cache_file.exists():
+                try:
+                    with open(self.signature_cache_file, 'r', encoding='utf-8') as f:
+                        self._signature_cache = json.load(f)
+                except Exception as e:
+                    print(f"⚠️  Warning: Could not read signature cache: {e}")
+        return self._signature_cache
+        
+    def _save_signature_cache(self):
+        """Persist MinHash signatures when caching is enabled
+        
+        The cache file is shared by every project and process, so entries
+        saved by others since it was loaded are merged in, the newest
+        signature_cache_limit entries are kept, and the file is replaced
+        atomically.
+        """
+        if os.environ.get('AI_DOC_FRAMEWORK_CACHE') != '1' or self._signature_cache is None:
+            return
+            
+        import tempfile
+        
+        temp_path = None
+        try:
+            cache_dir = self.signature_cache_file.parent
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                with open(self.signature_cache_file, 'r', encoding='utf-8') as f:
+                    on_disk = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                on_disk = {}
+            if not isinstance(on_disk, dict):
+                on_disk = {}
+                
+            # Oldest first: entries nobody here used, then the ones this run used
+            merged = {key: value for key, value in on_disk.items() if key not in self._signatures_used}
+            merged.update((key, self._signature_cache[key]) for key in self._signatures_used
+                          if key in self._signature_cache)
+            if len(merged) > self.signature_cache_limit:
+                merged = dict(list(merged.items())[-self.signature_cache_limit:])
+                
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, prefix=".minhash-signatures-")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(merged, f)
+            os.replace(temp_path, self.signature_cache_file)
+            temp_path = None
+        except Exception as e:
+            print(f"⚠️  Warning: Could not write signature cache: {e}")
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
+            
+    def _detect_document_drift(self, threshold: float = 0.8) -> List[ConflictItem]:
+        """Detect near-duplicate documents across applications that have drifted apart
+        
+        Each document gets a MinHash signature; LSH banding proposes candidate
+        pairs, and only those candidates are compared precisely with difflib.
+        """
+        import difflib
+        
+        conflicts = []
+        hasher = MinHasher(threshold=threshold)
+        cache = self._load_signature_cache()
+        cache_prefix = f"{hasher.num_perm}:{hasher.shingle_size}:"
+        
+        documents: Dict[Tuple[str, str], Tuple[Path, str]] = {}
+        signatures: Dict[Tuple[str, str], List[int]] = {}
+        
+        for app_name, doc_files in self._collect_documentation_files().items():
+            for doc_file in doc_files:
+                self._check_deadline()
+                try:
+                    digest, content = self._load_file(doc_file)
+                except ScanTimeout:
+                    raise
+                except Exception as e:
+                    print(f"⚠️  Warning: Could not read {doc_file}: {e}")
+                    continue
+                    
+                key = (app_name, str(doc_file.relative_to(self.project_root)))
+                cache_key = cache_prefix + digest
+                if cache_key in cache:
+                    self.scan_stats['signatures_reused'] += 1
+                else:
+                    cache[cache_key] = hasher.signature(content)
+                    
+                self._signatures_used[cache_key] = None
+                documents[key] = (doc_file, content)
+                signatures[key] = cache[cache_key]
+                
+        self._save_signature_cache()
+        
+        for key1, key2 in sorted(hasher.candidate_pairs(signatures)):
+            self._check_deadline()
+            if key1[0] == key2[0]:
+                continue  # Drift is only reported between applications
+                
+            if hasher.similarity(signatures[key1], signatures[key2]) < threshold:
+                continue
+                
+            doc1, content1 = documents[key1]
+            doc2, content2 = documents[key2]
+            if content1 == content2:
+                continue  # Identical copies have not drifted
+                
+            lines1 = content1.splitlines()
+            lines2 = content2.splitlines()
+            ratio = difflib.SequenceMatcher(None, lines1, lines2).ratio()
+            if ratio < threshold:
+                continue
+                
+            conflicts.append(self._create_drift_conflict(key1, key2, lines1, lines2, ratio))
+            
+        return conflicts
+        
+    def _create_drift_conflict(self, key1: Tuple[str, str], key2: Tuple[str, str],
+                               lines1: List[str], lines2: List[str], ratio: float) -> ConflictItem:
+        """Create a drift conflict item for two near-duplicate documents"""
+        import difflib
+        
+        (app1, file1), (app2, file2) = key1, key2
+        
+        diff = list(difflib.unified_diff(lines1, lines2, fromfile=file1, tofile=file2, lineterm='', n=1))
+        
+        conflict_id = f"drift_{app1}_{app2}_{hash(file1 + file2)}"
+        title = f"Documentation Drift: {file1} vs {file2}"
+        description = (
+            f"Near-duplicate documents in {app1} and {app2} have drifted apart "
+            f"({ratio:.0%} similar)"
+        )
+        
+        conflicting_content = [
+            {"application": app1, "file": file1},
+            {"application": app2, "file": file2},
+            {"similarity": round(ratio, 3), "diff": diff[:50]}
+        ]
+        
+        resolution_suggestion = (
+            f"Reconcile {file1} and {file2}. If the guide is shared, keep one source "
+            f"in root docs/ and reference it from both applications."
+        )
+        
+        manage_rules_command = (
+            f'Add documentation rule to root: '
+            f'Keep shared guides in sync between {app1} and {app2}'
+        )
+        
+        return ConflictItem(
+            id=conflict_id,
+            type='drift',
+            category='documentation',
+            severity='medium',
+            title=title,
+            description=description,
+            applications=[app1, app2],
+            conflicting_content=conflicting_content,
+            resolution_suggestion=resolution_suggestion,
+            manage_rules_command=manage_rules_command
+        )
+        
+    def _determine_severity(self, category: str, values1: set, values2: set) -> str:
+        """Determine the severity of a conflict"""
+        
+        # Critical conflicts
+        critical_categories = ['security', 'safety']
+        if category in critical_categories:
+            return 'critical'
+            
+        # High severity conflicts
+        high_impact_patterns = ['port', 'ssl', 'jwt', 'password', 'timeout']
+        if any(pattern in category for pattern in high_impact_patterns):
+            return 'high'
+            
+        # Performance conflicts are typically medium
+        if category == 'performance':
+            return 'medium'
+            
+        # Default to low for implementation differences
+        return 'low'
+        
+    def _generate_resolution_suggestion(self, category: str, app1: str, app2: str, 
+                                      values1: set, values2: set) -> str:
+        """Generate a resolution suggestion for the conflict"""
+        
+        suggestions = {
+            'performance': f'Standardize {category} settings. Consider using the more restrictive value for consistency.',
+            'security': f'Use the most secure configuration. Review security requirements for both {app1} and {app2}.',
+            'implementation': f'Choose one implementation approach and apply consistently across both applications.',
+            'architecture': f'Ensure unique values where required (e.g., ports) or standardize where appropriate.'
+        }
+        
+        base_suggestion = suggestions.get(category, 'Review and standardize the conflicting configurations.')
+        
+        return (
+            f"{base_suggestion}\n"
+            f"Current values: {app1}: {values1}, {app2}: {values2}\n"
+            f"Use MANAGE_RULES.md to update the conflicting rules."
+        )
+        
+    def _generate_manage_rules_command(self, category: str, app1: str, app2: str,
+                                     values1: set, values2: set) -> str:
+        """Generate MANAGE_RULES.md command to resolve the conflict"""
+        
+        # Choose the target application based on priority (root > specific apps)
+        target_app = 'root' if 'root' in [app1, app2] else app1
+        
+        # Generate command based on conflict type
+        if category == 'security' or category == 'performance':
+            return (
+                f'Update {target_app} {category} rule: '
+                f'Standardize conflicting values from {app1} ({list(values1)}) and {app2} ({list(values2)})'
+            )
+        else:
+            return (
+                f'Add {category} rule to {target_app}: '
+                f'Standardize implementation between {app1} and {app2}'
+            )
+            
+    def _generate_report(self, conflicts: List[ConflictItem]) -> ConflictReport:
+        """Generate comprehensive conflict report"""
+        from datetime import datetime
+        
+        timestamp = datetime.now().isoformat()
+        project_name = self.config.get('project', {}).get('name', 'Unknown Project')
+        
+        # Count conflicts by severity and category
+        conflicts_by_severity = {'low': 0, 'medium': 0, 'high': 0, 'critical': 0}
+        conflicts_by_category = {}
+        
+        for conflict in conflicts:
+            conflicts_by_severity[conflict.severity] += 1
+            if conflict.category not in conflicts_by_category:
+                conflicts_by_category[conflict.category] = 0
+            conflicts_by_category[conflict.category] += 1
+            
+        # Generate recommendations
+        recommendations = self._generate_recommendations(conflicts)
+        
+        # Generate summary
+        total_conflicts = len(conflicts)
+        critical_count = conflicts_by_severity['critical']
+        high_count = conflicts_by_severity['high']
+        
+        if total_conflicts == 0:
+            summary = "✅ No conflicts detected! Your documentation system is consistent."
+        elif critical_count > 0:
+            summary = f"🚨 CRITICAL: {critical_count} critical conflicts require immediate attention!"
+        elif high_count > 0:
+            summary = f"⚠️ HIGH: {high_count} high-priority conflicts found."
+        else:
+            summary = f"📋 {total_conflicts} minor conflicts detected."
+            
+        return ConflictReport(
+            timestamp=timestamp,
+            project_name=project_name,
+            project_path=str(self.project_root),
+            total_conflicts=total_conflicts,
+            conflicts_by_severity=conflicts_by_severity,
+            conflicts_by_category=conflicts_by_category,
+            conflicts=conflicts,
+            recommendations=recommendations,
+            summary=summary,
+            scan_statistics=dict(self.scan_stats)
+        )
+        
+    def _generate_recommendations(self, conflicts: List[ConflictItem]) -> List[str]:
+        """Generate actionable recommendations based on conflicts"""
+        recommendations = []
+        
+        if not conflicts:
+            recommendations.append("✅ Your documentation system is well-maintained!")
+            return recommendations
+            
+        # General recommendations
+        recommendations.append("📋 Use MANAGE_RULES.md to resolve rule conflicts systematically.")
+        recommendations.append("🔄 Run conflict detection regularly to prevent issues.")
+        
+        # Severity-based recommendations
+        critical_conflicts = [c for c in conflicts if c.severity == 'critical']
+        high_conflicts = [c for c in conflicts if c.severity == 'high']
+        
+        if critical_conflicts:
+            recommendations.append(f"🚨 Address {len(critical_conflicts)} critical conflicts immediately!")
+            
+        if high_conflicts:
+            recommendations.append(f"⚠️ Prioritize resolving {len(high_conflicts)} high-priority conflicts.")
+            
+        # Category-based recommendations
+        categories = set(c.category for c in conflicts)
+        
+        if 'security' in categories:
+            recommendations.append("🔒 Security conflicts detected - review authentication and authorization rules.")
+            
+        if 'performance' in categories:
+            recommendations.append("⚡ Performance conflicts found - standardize timeout and resource settings.")
+            
+        if 'implementation' in categories:
+            recommendations.append("🛠 Implementation conflicts detected - choose consistent coding standards.")
+            
+        if any(c.type == 'drift' for c in conflicts):
+            recommendations.append("📄 Drifted documentation copies found - consolidate shared guides in root docs/.")
+            
+        return recommendations
+        
+    def export_report(self, report: ConflictReport, format: str = 'console', output_file: Optional[str] = None):
+        """Export conflict report in specified format"""
+        
+        if format == 'console':
+            self._print_console_report(report)
+        elif format == 'json':
+            self._export_json_report(report, output_file)
+        elif format == 'html':
+            self._export_html_report(report, output_file)
+        else:
+            print(f"❌ Unknown output format: {format}")
+            
+    def _print_console_report(self, report: ConflictReport):
+        """Print report to console with colored output"""
+        print("\n" + "=" * 80)
+        print(f"📊 AI DOCUMENTATION CONFLICT DETECTION REPORT")
+        print("=" * 80)
+        print(f"🏗️  Project: {report.project_name}")
+        print(f"📅 Date: {report.timestamp}")
+        print(f"📁 Path: {report.project_path}")
+        print(f"📋 Total Conflicts: {report.total_conflicts}")
+        
+        print(f"\n📊 SEVERITY BREAKDOWN:")
+        severity_colors = {'critical': '🚨', 'high': '⚠️ ', 'medium': '📋', 'low': '💡'}
+        for severity, count in report.conflicts_by_severity.items():
+            if count > 0:
+                icon = severity_colors.get(severity, '📋')
+                print(f"   {icon} {severity.title()}: {count}")
+                
+        print(f"\n📂 CATEGORY BREAKDOWN:")
+        for category, count in report.conflicts_by_category.items():
+            print(f"   🔹 {category.title()}: {count}")
+            
+        print(f"\n📝 SUMMARY:")
+        print(f"   {report.summary}")
+        
+        stats = report.scan_statistics
+        if stats.get('files_loaded'):
+            duplicates = stats['files_loaded'] - stats['unique_contents']
+            reused = stats['parses_reused'] + stats['scans_reused'] + stats['signatures_reused']
+            print(f"   ♻️  Dedup: {stats['files_loaded']} files, {stats['unique_contents']} unique contents "
+                  f"({duplicates} duplicates, {stats['duplicate_bytes'] / 1024:.1f} KB not re-processed)")
+            print(f"   ♻️  Reused results: {stats['parses_reused']} parses, {stats['scans_reused']} scans, "
+                  f"{stats['signatures_reused']} signatures ({reused} total)")
+        
+        if report.conflicts:
+            print(f"\n🔍 DETAILED CONFLICTS:")
+            for i, conflict in enumerate(report.conflicts, 1):
+                severity_icon = severity_colors.get(conflict.severity, '📋')
+                print(f"\n   {i}. {severity_icon} {conflict.title}")
+                print(f"      📂 Category: {conflict.category}")
+                print(f"      🎯 Applications: {', '.join(conflict.applications)}")
+                print(f"      📝 Description: {conflict.description}")
+                print(f"      💡 Resolution: {conflict.resolution_suggestion}")
+                print(f"      🛠️  MANAGE_RULES Command:")
+                print(f"         {conflict.manage_rules_command}")
+                
+        print(f"\n💡 RECOMMENDATIONS:")
+        for i, rec in enumerate(report.recommendations, 1):
+            print(f"   {i}. {rec}")
+            
+        print(f"\n🛠️  NEXT STEPS:")
+        print(f"   1. Use MANAGE_RULES.md to resolve conflicts")
+        print(f"   2. Re-run conflict detection to verify fixes")
+        print(f"   3. Update documentation standards to prevent future conflicts")
+        
+        print("\n" + "=" * 80 + "\n")
+        
+    def _export_json_report(self, report: ConflictReport, output_file: Optional[str]):
+        """Export report as JSON"""
+        from datetime import datetime
+        
+        output_path = output_file or f"conflict-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(report), f, indent=2, ensure_ascii=False)
+            
+        print(f"📄 JSON report exported to: {output_path}")
+        
+    def _export_html_report(self, report: ConflictReport, output_file: Optional[str]):
+        """Export report as HTML"""
+        from datetime import datetime
+        
+        output_path = output_file or f"conflict-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.html"
+        
+        html_template = self._generate_html_template(report)
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(html_template)
+            
+        print(f"📄 HTML report exported to: {output_path}")
+        
+    def _generate_html_template(self, report: ConflictReport) -> str:
+        """Generate HTML template for the report"""
+        
+        conflicts_html = ""
+        severity_colors = {'critical': '#dc2626', 'high': '#ea580c', 'medium': '#d97706', 'low': '#65a30d'}
+        
+        for i, conflict in enumerate(report.conflicts, 1):
+            color = severity_colors.get(conflict.severity, '#6b7280')
+            conflicts_html += f"""
+            <div class="conflict-item" style="border-left: 4px solid {color};">
+                <h3 style="color: {color};">{i}. {conflict.title}</h3>
+                <p><strong>Category:</strong> {conflict.category}</p>
+                <p><strong>Severity:</strong> {conflict.severity}</p>
+                <p><strong>Applications:</strong> {', '.join(conflict.applications)}</p>
+                <p><strong>Description:</strong> {conflict.description}</p>
+                <p><strong>Resolution:</strong> {conflict.resolution_suggestion}</p>
+                <div class="manage-rules-command">
+                    <strong>MANAGE_RULES Command:</strong>
+                    <code>{conflict.manage_rules_command}</code>
+                </div>
+            </div>
+            """
+            
+        recommendations_html = ""
+        for i, rec in enumerate(report.recommendations, 1):
+            recommendations_html += f"<li>{rec}</li>"
+            
+        return f"""
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>AI Documentation Conflict Report - {report.project_name}</title>
+            <style>
+                body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background-color: #f8fafc; }}
+                .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); overflow: hidden; }}
+                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; }}
+                .content {{ padding: 30px; }}
+                .summary-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
+                .summary-card {{ background: #f8fafc; padding: 20px; border-radius: 8px; text-align: center; }}
+                .conflict-item {{ background: #f9fafb; padding: 20px; margin: 15px 0; border-radius: 8px; }}
+                .manage-rules-command {{ background: #1f2937; color: #e5e7eb; padding: 15px; border-radius: 4px; margin-top: 10px; }}
+                code {{ background: #374151; color: #f3f4f6; padding: 2px 6px; border-radius: 3px; }}
+                .recommendations {{ background: #ecfdf5; padding: 20px; border-radius: 8px; border-left: 4px solid #10b981; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>📊 AI Documentation Conflict Report</h1>
+                    <p>{report.project_name}</p>
+                    <p>Generated: {report.timestamp}</p>
+                </div>
+                <div class="content">
+                    <h2>📋 Summary</h2>
+                    <p><strong>{report.summary}</strong></p>
+                    
+                    <div class="summary-grid">
+                        <div class="summary-card">
+                            <h3>Total Conflicts</h3>
+                            <h2 style="color: #dc2626;">{report.total_conflicts}</h2>
+                        </div>
+                        <div class="summary-card">
+                            <h3>Critical</h3>
+                            <h2 style="color: #dc2626;">{report.conflicts_by_severity['critical']}</h2>
+                        </div>
+                        <div class="summary-card">
+                            <h3>High</h3>
+                            <h2 style="color: #ea580c;">{report.conflicts_by_severity['high']}</h2>
+                        </div>
+                        <div class="summary-card">
+                            <h3>Medium</h3>
+                            <h2 style="color: #d97706;">{report.conflicts_by_severity['medium']}</h2>
+                        </div>
+                        <div class="summary-card">
+                            <h3>Low</h3>
+                            <h2 style="color: #65a30d;">{report.conflicts_by_severity['low']}</h2>
+                        </div>
+                    </div>
+                    
+                    <h2>🔍 Detailed Conflicts</h2>
+                    {conflicts_html or "<p>✅ No conflicts detected!</p>"}
+                    
+                    <div class="recommendations">
+                        <h2>💡 Recommendations</h2>
+                        <ul>{recommendations_html}</ul>
+                    </div>
+                    
+                    <h2>🛠️ Next Steps</h2>
+                    <ol>
+                        <li>Use MANAGE_RULES.md to resolve conflicts</li>
+                        <li>Re-run conflict detection to verify fixes</li>
+                        <li>Update documentation standards to prevent future conflicts</li>
+                    </ol>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+def filter_report_by_severity(report: ConflictReport, min_severity: str) -> ConflictReport:
+    """Drop conflicts below min_severity and recalculate the report statistics"""
+    severity_levels = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+    min_severity_level = severity_levels[min_severity]
+    
+    filtered_conflicts = [
+        c for c in report.conflicts 
+        if severity_levels[c.severity] >= min_severity_level
+    ]
+    
+    # Update report with filtered conflicts
+    report.conflicts = filtered_conflicts
+    report.total_conflicts = len(filtered_conflicts)
+    
+    # Recalculate statistics
+    conflicts_by_severity = {'low': 0, 'medium': 0, 'high': 0, 'critical': 0}
+    conflicts_by_category = {}
+    
+    for conflict in filtered_conflicts:
+        conflicts_by_severity[conflict.severity] += 1
+        if conflict.category not in conflicts_by_category:
+            conflicts_by_category[conflict.category] = 0
+        conflicts_by_category[conflict.category] += 1
+        
+    report.conflicts_by_severity = conflicts_by_severity
+    report.conflicts_by_category = conflicts_by_category
+    return report
+
+def run_health_check() -> int:
+    """Verify the detector loads; never reads config or scans the project"""
+    problems = AIDocConflictDetector().health_check()
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+        
+    print(f"✅ conflict-detector {__version__} OK")
+    return 0
+
+def health_check_installation(framework_dir) -> List[str]:
+    """Health-check the detector installed in framework_dir without spawning an interpreter"""
+    framework_dir = Path(framework_dir)
+    module_path = framework_dir / "tools" / "ai_doc_framework" / "conflict_detector.py"
+    
+    if module_path.exists():
+        if module_path.resolve() == Path(__file__).resolve():
+            return AIDocConflictDetector().health_check()
+            
+        # A different installation: load its module under a private name
+        import importlib.util
+        module_name = f"_ai_doc_installed_detector_{abs(hash(str(module_path.resolve())))}"
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+            return module.AIDocConflictDetector().health_check()
+        except Exception as e:
+            return [f"Installed conflict detector failed to load: {e}"]
+        finally:
+            sys.modules.pop(module_name, None)
+            
+    # Installations that predate the package only ship the script
+    script = framework_dir / "tools" / "conflict-detector.py"
+    if not script.exists():
+        return [f"Conflict detector not found in {framework_dir}"]
+        
+    import subprocess
+    result = subprocess.run([sys.executable, str(script), "--health-check"],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return [line for line in result.stdout.splitlines() if line.strip()] or ["Health check failed"]
+    return []
+
+def main():
+    """Main entry point for the conflict detector"""
+    # Fast path for agents and health checks: skip argparse and the project tree
+    if sys.argv[1:] == ['--version']:
+        print(f"conflict-detector {__version__}")
+        sys.exit(0)
+    if sys.argv[1:] == ['--health-check']:
+        sys.exit(run_health_check())
+        
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='📊 AI Documentation Framework - Conflict Detection System'
+    )
+    
+    parser.add_argument('--rules-only', action='store_true',
+                      help='Check only AI_RULES conflicts')
+    parser.add_argument('--docs-only', action='store_true',
+                      help='Check only documentation conflicts')
+    parser.add_argument('--app', type=str,
+                      help='Check specific application only')
+    parser.add_argument('--output', type=str, default='console',
+                      choices=['console', 'json', 'html'],
+                      help='Output format (default: console)')
+    parser.add_argument('--config', type=str,
+                      help='Path to ai-doc-config.json')
+    parser.add_argument('--severity', type=str, default='medium',
+                      choices=['low', 'medium', 'high', 'critical'],
+                      help='Minimum severity level (default: medium)')
+    parser.add_argument('--output-file', type=str,
+                      help='Output file path (for json/html formats)')
+    parser.add_argument('--cross-app-docs', action='store_true',
+                      help='Also compare documentation across applications (incl. root)')
+    parser.add_argument('--structured-configs', action='store_true',
+                      help='Check docker-compose, .env, package.json and YAML/JSON config files')
+    parser.add_argument('--numeric-outliers', action='store_true',
+                      help='Flag apps whose numeric rule values are outliers across all apps')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                      help='Relative deviation from the median allowed (default: 0.5)')
+    parser.add_argument('--drift', action='store_true',
+                      help='Detect near-duplicate docs that drifted between applications')
+    parser.add_argument('--drift-threshold', type=float, default=0.8,
+                      help='Minimum similarity (0-1) for drift candidates (default: 0.8)')
+    parser.add_argument('--fleet', nargs='+', metavar='PATH',
+                      help='Scan every project (ai-doc-config.json) under these roots in one run')
+    parser.add_argument('--jobs', type=int,
+                      help='Worker threads for --fleet (default: CPU count + 4, max 32)')
+    parser.add_argument('--project-timeout', type=float, default=300.0,
+                      help='Per-project time limit in seconds for --fleet (default: 300)')
+    parser.add_argument('--health-check', action='store_true',
+                      help='Verify the tool loads correctly (does not read the project)')
+    parser.add_argument('--version', action='version', version=f'conflict-detector {__version__}')
+    
+    args = parser.parse_args()
+    
+    if args.health_check:
+        sys.exit(run_health_check())
+        
+    detect_options = dict(
+        rules_only=args.rules_only,
+        docs_only=args.docs_only,
+        cross_app_docs=args.cross_app_docs,
+        drift=args.drift,
+        drift_threshold=args.drift_threshold,
+        structured_configs=args.structured_configs,
+        numeric_outliers=args.numeric_outliers,
+        tolerance=args.tolerance
+    )
+    
+    if args.fleet:
+        if args.output == 'html':
+            print("❌ Fleet mode supports console and json output")
+            sys.exit(1)
+            
+        from .fleet import scan_fleet, export_fleet_report
+        
+        print("🔍 Starting AI Documentation Fleet Conflict Detection...")
+        fleet = scan_fleet(args.fleet, jobs=args.jobs, project_timeout=args.project_timeout,
+                           min_severity=args.severity, progress=True, **detect_options)
+        export_fleet_report(fleet, args.output, args.output_file)
+        sys.exit(1 if fleet.has_failures else 0)
+    
+    try:
+        print("🔍 Starting AI Documentation Conflict Detection...")
+        
+        # Initialize detector
+        detector = AIDocConflictDetector(
+            project_root=".",
+            config_path=args.config
+        )
+        
+        # Run detection
+        report = detector.detect_all_conflicts(**detect_options)
+        
+        # Filter by severity
+        filter_report_by_severity(report, args.severity)
+        
+        # Export report
+        detector.export_report(report, args.output, args.output_file)
+        
+        # Exit with appropriate code
+        if any(c.severity in ['critical', 'high'] for c in report.conflicts):
+            sys.exit(1)  # Exit with error for critical/high conflicts
+        else:
+            sys.exit(0)  # Success
+            
+    except ConfigError as e:
+        print(f"❌ ERROR: {e}")
+        if e.hint:
+            print(f"🔧 {e.hint}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error during conflict detection: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""
+🔀 AI Documentation Framework - Delta Updates
+Per-file hash manifests for the installed framework and a new source tree,
+so an update only touches files that were added, changed or removed.
+
+The installed framework keeps its hashes in a stat cache
+(ai-doc-framework/.ai-doc-manifest.json: path -> size, mtime, inode, sha256),
+so building its manifest re-reads only files modified since the last update.
+Files are written to a temp name and renamed into place, never edited in
+place, so hardlinked snapshots of the old tree keep their content.
+
+A release zip is never extracted as a whole: members are hashed straight from
+the archive, and only those in the delta are streamed into the staging
+directory (zipfile checks each member's CRC as it is read). Manifests can be
+limited to an include list, so files outside it are neither hashed, written
+nor removed. Symlinks may only point inside the tree, and nothing is written
+or removed through a symlinked directory.
+"""
+
+import os
+import json
+import stat
+import posixpath
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union, Iterable
+
+from .backup_store import hash_file, RACY_WINDOW_NS
+
+MANIFEST_FILENAME = ".ai-doc-manifest.json"
+
+# Never part of a framework manifest
+DELTA_EXCLUDE = {'.git', '__pycache__', MANIFEST_FILENAME}
+READ_SIZE = 1024 * 1024
+
+@dataclass
+class FrameworkDelta:
+    """Files to add, change and remove to turn one framework tree into another"""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    # Expected sha256 of every added/changed file once applied
+    expected: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def summary(self) -> str:
+        return (f"{len(self.added)} added, {len(self.changed)} changed, "
+                f"{len(self.removed)} removed, {self.unchanged} unchanged")
+
+    def print_delta(self):
+        """Print every path in the delta"""
+        print(f"📋 Framework delta: {self.summary()}")
+        for path in self.added:
+            print(f"   ➕ {path}")
+        for path in self.changed:
+            print(f"   ✏️  {path}")
+        for path in self.removed:
+            print(f"   ➖ {path}")
+
+def in_scope(path: str, include: Optional[Iterable[str]]) -> bool:
+    """True when a relative path is one of, or below one of, the include entries"""
+    if any(part in DELTA_EXCLUDE for part in path.split('/')):
+        return False
+    if include is None:
+        return True
+    return any(path == entry or path.startswith(entry + '/') for entry in include)
+
+def hash_entry(path: Path) -> str:
+    """sha256 of a file, or of the target of a symlink (links are not followed)"""
+    if path.is_symlink():
+        return hashlib.sha256(os.fsencode(os.readlink(path))).hexdigest()
+    return hash_file(path)
+
+def walk_framework(root: Path, include: Optional[Iterable[str]] = None) -> List[str]:
+    """Relative paths of every file in a framework tree within include"""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in DELTA_EXCLUDE]
+        relative = Path(dirpath).relative_to(root)
+        for dirname in list(dirnames):
+            # Directory symlinks are entries, not followed
+            if (Path(dirpath) / dirname).is_symlink():
+                dirnames.remove(dirname)
+                filenames.append(dirname)
+        paths.extend(path for path in ((relative / name).as_posix() for name in filenames)
+                     if in_scope(path, include))
+    return sorted(paths)
+
+def load_manifest_cache(root: Path) -> Dict[str, List]:
+    """Stat cache stored in an installed framework (empty if missing or unreadable)"""
+    try:
+        with open(root / MANIFEST_FILENAME, 'r', encoding='utf-8') as f:
+            return json.load(f).get('files', {})
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+        return {}
+
+def build_manifest(root: Union[str, Path], cache: Optional[Dict[str, List]] = None,
+                   jobs: Optional[int] = None, include: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Map each file below root to its sha256, reusing cache entries whose stat matches"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    root = Path(root)
+    cache = cache or {}
+    manifest = {}
+    to_hash = []
+    for path in walk_framework(root, include):
+        st = (root / path).lstat()
+        cached = cache.get(path)
+        if cached and cached[:3] == [st.st_size, st.st_mtime_ns, st.st_ino]:
+            manifest[path] = cached[3]
+        else:
+            to_hash.append(path)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for path, digest in zip(to_hash, executor.map(lambda p: hash_entry(root / p), to_hash)):
+            manifest[path] = digest
+
+    return dict(sorted(manifest.items()))
+
+def save_manifest_cache(root: Path, manifest: Dict[str, str]):
+    """Record stat signatures for a tree whose hashes are known (no file is read)"""
+    import time
+
+    files = {}
+    now = time.time_ns()
+    for path, digest in manifest.items():
+        st = (root / path).lstat()
+        # Files modified within the mtime granularity are re-hashed next time
+        if now - st.st_mtime_ns > RACY_WINDOW_NS:
+            files[path] = [st.st_size, st.st_mtime_ns, st.st_ino, digest]
+
+    fd, temp_path = tempfile.mkstemp(dir=root, prefix=".manifest-")
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'files': files}, f)
+    os.replace(temp_path, root / MANIFEST_FILENAME)
+
+def compute_delta(installed: Dict[str, str], source: Dict[str, str]) -> FrameworkDelta:
+    """Compare the installed manifest against the source manifest"""
+    delta = FrameworkDelta()
+    for path, digest in source.items():
+        if path not in installed:
+            delta.added.append(path)
+        elif installed[path] != digest:
+            delta.changed.append(path)
+        else:
+            delta.unchanged += 1
+            continue
+        delta.expected[path] = digest
+    delta.removed = [path for path in installed if path not in source]
+    return delta
+
+def replace_file(source: Path, target: Path):
+    """Copy source over target via a temp file and rename (target inode is never edited)"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with open(source, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        shutil.copystat(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+def link_stays_inside(path: str, link_target: str) -> bool:
+    """True when a symlink at path (relative to the tree root) points inside the tree"""
+    if not link_target or link_target.startswith('/') or '\\' in link_target or os.path.isabs(link_target):
+        return False
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(path), link_target))
+    return resolved != '..' and not resolved.startswith('../')
+
+def check_parent_directories(target_root: Path, path: str):
+    """Refuse a path below a symlinked directory, whose writes would land outside the tree"""
+    parent = target_root
+    for part in path.split('/')[:-1]:
+        parent = parent / part
+        if parent.is_symlink():
+            raise ValueError(f"Refusing to write through symlinked directory: {parent}")
+
+def _temp_path(target: Path) -> str:
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    os.close(fd)
+    return temp_path
+
+class DirectorySource:
+    """Framework release as a directory tree (a checkout or an unpacked archive)"""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def __str__(self) -> str:
+        return str(self.root)
+
+    def manifest(self, include: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        return build_manifest(self.root, include=include)
+
+    def read_text(self, path: str) -> Optional[str]:
+        source = self.root / path
+        return source.read_text(encoding='utf-8') if source.is_file() else None
+
+    def copy_to(self, path: str, target: Path):
+        source = self.root / path
+        if source.is_symlink():
+            link_target = os.readlink(source)
+            if not link_stays_inside(path, link_target):
+                raise ValueError(f"Symlink points outside the framework: {path} -> {link_target}")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = _temp_path(target)
+            os.unlink(temp_path)
+            os.symlink(link_target, temp_path)
+            os.replace(temp_path, target)
+        else:
+            replace_file(source, target)
+
+    def close(self):
+        pass
+
+class ZipSource:
+    """Framework release read member by member from its zip, without extracting it"""
+
+    def __init__(self, zip_path: Union[str, Path]):
+        import zipfile
+
+        self.zip_path = Path(zip_path)
+        self.zip = zipfile.ZipFile(self.zip_path, 'r')
+        self.members = self._index_members()
+
+    def __str__(self) -> str:
+        return str(self.zip_path)
+
+    def _index_members(self) -> Dict[str, "zipfile.ZipInfo"]:
+        """Map framework-relative paths to members, dropping a GitHub-style top directory"""
+        import zipfile
+
+        infos = [info for info in self.zip.infolist() if not info.is_dir()]
+        names = [info.filename for info in infos]
+        prefix = ''
+        top_level = {name.split('/', 1)[0] for name in names}
+        if "VERSION" not in names and not any(name.startswith('tools/') for name in names):
+            if len(top_level) == 1 and all('/' in name for name in names):
+                prefix = top_level.pop() + '/'
+
+        members = {}
+        for info in infos:
+            relative = info.filename[len(prefix):]
+            parts = relative.split('/')
+            if relative.startswith('/') or '..' in parts or '\\' in relative:
+                raise zipfile.BadZipFile(f"Unsafe path in archive: {info.filename}")
+            if self._is_symlink(info):
+                link_target = self.zip.read(info).decode('utf-8')
+                if not link_stays_inside(relative, link_target):
+                    raise zipfile.BadZipFile(f"Unsafe symlink in archive: {info.filename} -> {link_target}")
+            members[relative] = info
+        return members
+
+    def _is_symlink(self, info) -> bool:
+        return stat.S_ISLNK(info.external_attr >> 16)
+
+    def manifest(self, include: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Hash members straight from the archive (CRC checked as each is read)"""
+        manifest = {}
+        for path in sorted(self.members):
+            if not in_scope(path, include):
+                continue
+            digest = hashlib.sha256()
+            with self.zip.open(self.members[path]) as member:
+                for chunk in iter(lambda: member.read(READ_SIZE), b''):
+                    digest.update(chunk)
+            manifest[path] = digest.hexdigest()
+        return manifest
+
+    def read_text(self, path: str) -> Optional[str]:
+        info = self.members.get(path)
+        return self.zip.read(info).decode('utf-8') if info else None
+
+    def copy_to(self, path: str, target: Path):
+        """Stream one member into place via a temp file and rename"""
+        import time
+
+        info = self.members[path]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _temp_path(target)
+        try:
+            if self._is_symlink(info):
+                os.unlink(temp_path)
+                os.symlink(self.zip.read(info).decode('utf-8'), temp_path)
+            else:
+                with self.zip.open(info) as member, open(temp_path, 'wb') as dst:
+                    shutil.copyfileobj(member, dst, READ_SIZE)
+                mode = (info.external_attr >> 16) & 0o777
+                os.chmod(temp_path, mode or 0o644)
+                mtime = time.mktime(info.date_time + (0, 0, -1))
+                os.utime(temp_path, (mtime, mtime))
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.lexists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def close(self):
+        self.zip.close()
+
+def text_digest(content: str) -> str:
+    """sha256 of text as write_file_atomic stores it"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def write_file_atomic(target: Path, content: str):
+    """Write text via a temp file and rename"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    with os.fdopen(fd, 'wb') as f:
+        f.write(content.encode('utf-8'))
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, target)
+
+def apply_delta(delta: FrameworkDelta, source: Union[DirectorySource, ZipSource], target_root: Path,
+                overrides: Optional[Dict[str, str]] = None):
+    """Apply a delta to target_root, leaving unchanged files untouched
+
+    overrides maps paths to text written instead of the source file (e.g. VERSION).
+    """
+    overrides = overrides or {}
+    for path in delta.added + delta.changed:
+        # Checked per file: an earlier member may itself have created the link
+        check_parent_directories(target_root, path)
+        if path in overrides:
+            write_file_atomic(target_root / path, overrides[path])
+        else:
+            source.copy_to(path, target_root / path)
+
+    for path in delta.removed:
+        check_parent_directories(target_root, path)
+        target = target_root / path
+        if target.exists() or target.is_symlink():
+            target.unlink()
+        # Prune directories the removal left empty
+        parent = target.parent
+        while parent != target_root:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+
+def verify_delta(delta: FrameworkDelta, target_root: Path) -> List[str]:
+    """Re-hash only the files the delta wrote; returns a list of problems"""
+    problems = []
+    for path, digest in delta.expected.items():
+        target = target_root / path
+        if not os.path.lexists(target):
+            problems.append(f"{path}: missing")
+        elif hash_entry(target) != digest:
+            problems.append(f"{path}: checksum mismatch")
+    for path in delta.removed:
+        if (target_root / path).exists():
+            problems.append(f"{path}: should have been removed")
+    return problems
@@ -0,0 +1,537 @@
+"""
+🔎 AI Documentation Framework - Error Search
+Ranked full-text search over documented errors, so agents query the error
+history instead of reading error-management/ folders file by file.
+
+Error files are the Markdown entries under <project>/error-management/ and
+<app>/error-management/ (index and template files excluded). Each entry is
+split along the ERROR_TEMPLATE.md structure: front matter (error_id,
+category, severity, status, tags, ...), title, and the "##" sections
+(description, details, impact, root cause, resolution, ...).
+
+The index is a SQLite file, <project>/.ai-doc-error-index.sqlite:
+    docs      One row per error file: path, mtime/size/sha256, metadata, length
+    sections  Section texts, used for snippets
+    terms     Term -> id
+    postings  (term, doc) -> field-weighted frequency and a bitmask of the
+              sections containing the term
+
+Refreshing stats every error file and re-reads only files whose mtime or
+size changed (and re-indexes only those whose content hash changed), so an
+up-to-date index costs one directory walk. Ranking is BM25 over the
+field-weighted term frequencies: title and front matter count more than
+body text.
+"""
+
+import os
+import re
+import json
+import math
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+ERROR_SEARCH_INDEX_FILENAME = ".ai-doc-error-index.sqlite"
+ERROR_DIRECTORY = "error-management"
+SCHEMA_VERSION = "1"
+
+# Framework files in error-management/ that are not error entries
+NON_ERROR_FILES = {'ERROR_TEMPLATE.md', 'MASTER_ERROR_INDEX.md', 'ERROR_INDEX.md', 'README.md'}
+
+# Front matter fields whose values are searchable
+SEARCHABLE_METADATA = ['error_id', 'category', 'subcategory', 'tags', 'affected_components',
+                       'pattern_signatures', 'related_errors']
+
+# ERROR_TEMPLATE.md "##" sections, matched by the words of their heading
+SECTION_HEADINGS = {
+    'description': ('error', 'description'),
+    'details': ('error', 'details'),
+    'impact': ('impact',),
+    'root_cause': ('root', 'cause'),
+    'resolution': ('resolution',),
+    'verification': ('verification',),
+    'prevention': ('prevention',),
+    'cross_references': ('cross', 'references'),
+    'timeline': ('timeline',),
+    'tags': ('tags',),
+}
+
+# Searchable fields; position is the bit in postings.fields
+FIELDS = ['title', 'metadata'] + list(SECTION_HEADINGS) + ['other']
+FIELD_WEIGHTS = {'title': 3.0, 'metadata': 2.5, 'description': 2.0, 'details': 1.5,
+                 'root_cause': 1.2, 'resolution': 1.2, 'tags': 2.0}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+SNIPPET_LENGTH = 160
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'in', 'is', 'it',
+    'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'were', 'when', 'with',
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER, size INTEGER, sha256 TEXT,
+    length REAL,
+    error_id TEXT, title TEXT, category TEXT, app TEXT, severity TEXT, status TEXT
+);
+CREATE TABLE IF NOT EXISTS sections (
+    doc_id INTEGER, position INTEGER, field TEXT, heading TEXT, text TEXT,
+    PRIMARY KEY (doc_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, term TEXT UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER, doc_id INTEGER, tf REAL, fields INTEGER,
+    PRIMARY KEY (term_id, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_doc ON postings (doc_id);
+"""
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, stop words removed and plurals folded"""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOP_WORDS:
+            continue
+        if len(token) > 4 and token.endswith('ies'):
+            token = token[:-3] + 'y'
+        elif len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+def parse_front_matter_value(value: str):
+    """Front matter values are JSON-like: "text", [..], numbers; anything else is kept as text"""
+    value = value.strip()
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        pass
+    if value.startswith('[') and value.endswith(']'):
+        return [item.strip().strip('"\'') for item in value[1:-1].split(',') if item.strip()]
+    return value.strip('"\'')
+
+def read_front_matter(lines: Iterable[str]) -> Dict[str, object]:
+    """Front matter fields from the leading '---' block; stops reading at its end"""
+    metadata = {}
+    lines = iter(lines)
+    for line in lines:
+        if line.strip():
+            if line.strip() != '---':
+                return metadata
+            break
+    for line in lines:
+        stripped = line.strip()
+        if stripped == '---':
+            break
+        key, separator, value = stripped.partition(':')
+        if separator and key and not key.startswith('#'):
+            metadata[key.strip()] = parse_front_matter_value(value)
+    return metadata
+
+def section_field(heading: str) -> str:
+    """Index field for a '##' heading (emoji and wording variations ignored)"""
+    words = set(TOKEN_PATTERN.findall(heading.lower()))
+    for field, keywords in SECTION_HEADINGS.items():
+        if all(keyword in words for keyword in keywords):
+            return field
+    return 'other'
+
+@dataclass
+class ErrorDocument:
+    """One error entry split along the ERROR_TEMPLATE.md structure"""
+    metadata: Dict[str, object]
+    title: str
+    sections: List[Tuple[str, str, str]]  # (field, heading, text)
+
+def parse_error_document(text: str) -> ErrorDocument:
+    lines = text.splitlines()
+    metadata = read_front_matter(lines)
+
+    # Skip past the front matter block
+    body_start = 0
+    if metadata or (lines and lines[0].strip() == '---'):
+        closing_lines = [n for n, line in enumerate(lines) if line.strip() == '---']
+        if len(closing_lines) >= 2:
+            body_start = closing_lines[1] + 1
+
+    title = ''
+    sections = []
+    field, heading, buffer = 'description', '', []
+    in_code = False
+    for line in lines[body_start:]:
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+        if not in_code and line.startswith('# ') and not title:
+            title = line[2:].strip()
+            continue
+        if not in_code and line.startswith('## '):
+            if buffer and ''.join(buffer).strip():
+                sections.append((field, heading, '\n'.join(buffer).strip()))
+            heading = line[3:].strip()
+            field, buffer = section_field(heading), []
+            continue
+        buffer.append(line)
+    if buffer and ''.join(buffer).strip():
+        sections.append((field, heading, '\n'.join(buffer).strip()))
+
+    return ErrorDocument(metadata=metadata, title=title, sections=sections)
+
+def metadata_text(metadata: Dict[str, object]) -> str:
+    parts = []
+    for key in SEARCHABLE_METADATA:
+        value = metadata.get(key)
+        if isinstance(value, list):
+            parts.extend(str(item) for item in value)
+        elif value:
+            parts.append(str(value))
+    return ' '.join(parts)
+
+def error_directories(project_root: Path) -> List[Tuple[Optional[str], Path]]:
+    """(application, directory) for the project and every configured application"""
+    from .migration_plan import configured_applications
+
+    directories = [(None, project_root / ERROR_DIRECTORY)]
+    directories += [(app, project_root / app / ERROR_DIRECTORY) for app in configured_applications(project_root)]
+    return [(app, directory) for app, directory in directories if directory.is_dir()]
+
+def discover_error_files(project_root: Path) -> Iterator[Tuple[str, Optional[str], os.stat_result]]:
+    """(relative path, application, stat) of every error entry"""
+    for app, directory in error_directories(project_root):
+        pending = [directory.relative_to(project_root).as_posix()]
+        while pending:
+            relative = pending.pop()
+            with os.scandir(project_root / relative) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(f"{relative}/{entry.name}")
+                    elif entry.name.endswith('.md') and entry.name not in NON_ERROR_FILES:
+                        yield f"{relative}/{entry.name}", app, entry.stat()
+
+@dataclass
+class SearchHit:
+    """One ranked error entry"""
+    path: str
+    score: float
+    error_id: Optional[str]
+    title: str
+    category: Optional[str]
+    app: Optional[str]
+    severity: Optional[str]
+    status: Optional[str]
+    section: Optional[str]
+    snippet: str
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+class ErrorSearchIndex:
+    """On-disk inverted index of a project's error entries"""
+
+    def __init__(self, project_root, index_path: Optional[Path] = None):
+        self.project_root = Path(project_root).resolve()
+        self.index_path = Path(index_path) if index_path else self.project_root / ERROR_SEARCH_INDEX_FILENAME
+        self.conn = self._open()
+        self._lengths = None  # doc id -> length, loaded on the first search
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        version = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if version is None or version[0] != SCHEMA_VERSION:
+            conn.executescript("DELETE FROM postings; DELETE FROM terms; DELETE FROM sections; DELETE FROM docs;")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (SCHEMA_VERSION,))
+            conn.commit()
+        return conn
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----- indexing ---------------------------------------------------------
+
+    def refresh(self, rebuild: bool = False) -> Dict[str, int]:
+        """Bring the index up to date with the error files on disk"""
+        conn = self.conn
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        known = {path: (doc_id, mtime_ns, size, sha256) for doc_id, path, mtime_ns, size, sha256
+                 in conn.execute("SELECT id, path, mtime_ns, size, sha256 FROM docs")}
+
+        with conn:
+            if rebuild:
+                conn.executescript("DELETE FROM postings; DELETE FROM terms; DELETE FROM sections; DELETE FROM docs;")
+                known = {}
+            term_ids = {}
+            seen = set()
+            for path, app, stat in discover_error_files(self.project_root):
+                seen.add(path)
+                previous = known.get(path)
+                if previous and previous[1:3] == (stat.st_mtime_ns, stat.st_size):
+                    counts['unchanged'] += 1
+                    continue
+
+                try:
+                    text = (self.project_root / path).read_text(encoding='utf-8')
+                except (OSError, UnicodeDecodeError):
+                    continue
+                digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+                if previous and previous[3] == digest:
+                    # Touched but not edited
+                    conn.execute("UPDATE docs SET mtime_ns = ?, size = ? WHERE id = ?",
+                                 (stat.st_mtime_ns, stat.st_size, previous[0]))
+                    counts['unchanged'] += 1
+                    continue
+
+                if previous:
+                    self._remove(previous[0])
+                self._add(path, app, stat, digest, parse_error_document(text), term_ids)
+                counts['updated' if previous else 'added'] += 1
+
+            for path in set(known) - seen:
+                self._remove(known[path][0])
+                counts['removed'] += 1
+        if counts['added'] or counts['updated'] or counts['removed']:
+            self._lengths = None
+        return counts
+
+    def _term_ids(self, terms: Iterable[str], cache: Dict[str, int]) -> Dict[str, int]:
+        missing = [term for term in terms if term not in cache]
+        if missing:
+            self.conn.executemany("INSERT OR IGNORE INTO terms (term) VALUES (?)", ((term,) for term in missing))
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cache.update(self.conn.execute(
+                    f"SELECT term, id FROM terms WHERE term IN ({placeholders})", chunk).fetchall())
+        return cache
+
+    def _add(self, path: str, app: Optional[str], stat: os.stat_result, digest: str,
+             document: ErrorDocument, term_ids: Dict[str, int]):
+        fields = [('title', document.title), ('metadata', metadata_text(document.metadata))]
+        fields += [(field, f"{heading}\n{text}") for field, heading, text in document.sections]
+
+        frequencies = {}  # term -> [weighted tf, field bitmask]
+        length = 0.0
+        for field, text in fields:
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            bit = 1 << FIELDS.index(field)
+            for token in tokenize(text):
+                entry = frequencies.setdefault(token, [0.0, 0])
+                entry[0] += weight
+                entry[1] |= bit
+                length += weight
+
+        def meta(key):
+            value = document.metadata.get(key)
+            return str(value) if value not in (None, '') else None
+
+        cursor = self.conn.execute(
+            "INSERT INTO docs (path, mtime_ns, size, sha256, length, error_id, title, category, app, severity, status) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size, digest, length, meta('error_id'),
+             document.title or Path(path).stem, meta('category'), app, meta('severity'), meta('status')))
+        doc_id = cursor.lastrowid
+
+        self.conn.executemany("INSERT INTO sections VALUES (?, ?, ?, ?, ?)",
+                              [(doc_id, n, field, heading, text)
+                               for n, (field, heading, text) in enumerate(document.sections)])
+        ids = self._term_ids(list(frequencies), term_ids)
+        self.conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?)",
+                              [(ids[term], doc_id, tf, mask) for term, (tf, mask) in frequencies.items()])
+
+    def _remove(self, doc_id: int):
+        self.conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self.conn.execute("DELETE FROM sections WHERE doc_id = ?", (doc_id,))
+        self.conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    # ----- searching --------------------------------------------------------
+
+    def search(self, query: str, limit: int = 10, section: Optional[str] = None,
+               category: Optional[str] = None, app: Optional[str] = None,
+               severity: Optional[str] = None, status: Optional[str] = None) -> List[SearchHit]:
+        """Error entries ranked by BM25, optionally restricted to one section or metadata value"""
+        if section is not None and section not in FIELDS:
+            raise ValueError(f"Unknown section '{section}' (choose from: {', '.join(FIELDS)})")
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        if self._lengths is None:
+            self._lengths = dict(self.conn.execute("SELECT id, length FROM docs"))
+        lengths = self._lengths
+        if not lengths:
+            return []
+        total_docs = len(lengths)
+        average_length = sum(lengths.values()) / total_docs
+        section_bit = 1 << FIELDS.index(section) if section else 0
+
+        # Metadata filters and the section restriction are applied by SQLite while
+        # reading postings, so only matching documents are ever scored
+        filters = {'category': category, 'app': app, 'severity': severity, 'status': status}
+        conditions = [f"d.{column} = ? COLLATE NOCASE" for column, value in filters.items() if value is not None]
+        parameters = [value for value in filters.values() if value is not None]
+        if section_bit:
+            conditions.append("p.fields & ? != 0")
+            parameters.append(section_bit)
+        join = " JOIN docs d ON d.id = p.doc_id" if any(value is not None for value in filters.values()) else ""
+        postings_query = (f"SELECT p.doc_id, p.tf FROM postings p{join} WHERE p.term_id = ?"
+                          + "".join(f" AND {condition}" for condition in conditions))
+
+        placeholders = ', '.join('?' * len(terms))
+        term_ids = dict(self.conn.execute(f"SELECT term, id FROM terms WHERE term IN ({placeholders})", terms))
+        scores = {}
+        for term in terms:
+            term_id = term_ids.get(term)
+            if term_id is None:
+                continue
+            # IDF uses the unfiltered document frequency, so filters never change a score
+            frequency = self.conn.execute("SELECT COUNT(*) FROM postings WHERE term_id = ?", (term_id,)).fetchone()[0]
+            idf = math.log(1 + (total_docs - frequency + 0.5) / (frequency + 0.5))
+            for doc_id, tf in self.conn.execute(postings_query, [term_id] + parameters):
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        if not ranked:
+            return []
+        columns = ('path', 'error_id', 'title', 'category', 'app', 'severity', 'status')
+        metadata = {row[0]: dict(zip(columns, row[1:])) for row in self.conn.execute(
+            f"SELECT id, {', '.join(columns)} FROM docs WHERE id IN ({', '.join('?' * len(ranked))})",
+            [doc_id for doc_id, _ in ranked])}
+
+        hits = []
+        for doc_id, score in ranked:
+            snippet_section, snippet = self._snippet(doc_id, terms, section)
+            hits.append(SearchHit(score=round(score, 4), section=snippet_section, snippet=snippet,
+                                  **metadata[doc_id]))
+        return hits
+
+    def _snippet(self, doc_id: int, terms: List[str], section: Optional[str]) -> Tuple[Optional[str], str]:
+        """Text around the first match in the section with the most query terms"""
+        rows = self.conn.execute("SELECT field, text FROM sections WHERE doc_id = ? ORDER BY position",
+                                 (doc_id,)).fetchall()
+        if section:
+            rows = [row for row in rows if row[0] == section]
+        if not rows:
+            return None, ''
+
+        wanted = set(terms)
+        field, text = max(rows, key=lambda row: len(wanted & set(tokenize(row[1]))))
+        text = ' '.join(text.split())
+        match = None
+        for token in TOKEN_PATTERN.finditer(text.lower()):
+            if tokenize(token.group()) and tokenize(token.group())[0] in wanted:
+                match = token
+                break
+        start = max(0, match.start() - SNIPPET_LENGTH // 3) if match else 0
+        snippet = text[start:start + SNIPPET_LENGTH]
+        return field, f"{'…' if start else ''}{snippet}{'…' if start + SNIPPET_LENGTH < len(text) else ''}"
+
+    def stats(self) -> Dict[str, int]:
+        docs, terms, postings = (self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                                 for table in ('docs', 'terms', 'postings'))
+        return {'documents': docs, 'terms': terms, 'postings': postings}
+
+def search_errors(project_root, query: str, refresh: bool = True, **filters) -> List[SearchHit]:
+    """Refresh the project's error index (unless refresh is False) and search it"""
+    with ErrorSearchIndex(project_root) as index:
+        if refresh:
+            index.refresh()
+        return index.search(query, **filters)
+
+def main():
+    """Main entry point"""
+    import sys
+    import argparse
+    from . import __version__
+
+    parser = argparse.ArgumentParser(
+        description='🔎 AI Documentation Framework - Error Search'
+    )
+
+    parser.add_argument('query', nargs='*',
+                      help='Words to search for (error messages, components, tags)')
+    parser.add_argument('--project-path', type=str, default=".",
+                      help='Path to project root')
+    parser.add_argument('--category', type=str,
+                      help='Only errors with this front matter category')
+    parser.add_argument('--app', type=str,
+                      help="Only errors documented in this application's error-management/")
+    parser.add_argument('--severity', type=str,
+                      help='Only errors with this severity')
+    parser.add_argument('--status', type=str,
+                      help='Only errors with this status')
+    parser.add_argument('--section', type=str, choices=FIELDS,
+                      help='Only match terms in this ERROR_TEMPLATE.md section')
+    parser.add_argument('--limit', type=int, default=10,
+                      help='Maximum results (default: 10)')
+    parser.add_argument('--format', choices=['console', 'json'], default='console',
+                      help='Output format')
+    parser.add_argument('--no-refresh', action='store_true',
+                      help='Search the index as it is, without checking for changed error files')
+    parser.add_argument('--rebuild', action='store_true',
+                      help='Re-index every error file from scratch')
+    parser.add_argument('--version', action='version', version=f'error-search {__version__}')
+
+    args = parser.parse_args()
+
+    with ErrorSearchIndex(args.project_path) as index:
+        if not args.no_refresh or args.rebuild:
+            started = time.perf_counter()
+            counts = index.refresh(rebuild=args.rebuild)
+            if args.format == 'console' and (counts['added'] or counts['updated'] or counts['removed']):
+                print(f"🔄 Indexed {counts['added']} new, {counts['updated']} changed, "
+                      f"{counts['removed']} removed error files ({time.perf_counter() - started:.2f}s)")
+
+        if not args.query:
+            stats = index.stats()
+            if args.format == 'json':
+                print(json.dumps(stats, indent=2))
+            else:
+                print(f"📚 {stats['documents']} error files indexed ({stats['terms']} terms)")
+            return
+
+        started = time.perf_counter()
+        hits = index.search(' '.join(args.query), limit=args.limit, section=args.section,
+                            category=args.category, app=args.app, severity=args.severity, status=args.status)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.format == 'json':
+        print(json.dumps([hit.to_dict() for hit in hits], indent=2, ensure_ascii=False))
+        return
+
+    if not hits:
+        print(f"🔍 No documented errors match '{' '.join(args.query)}' ({elapsed_ms:.1f}ms)")
+        sys.exit(1)
+
+    print(f"🔍 {len(hits)} documented errors match '{' '.join(args.query)}' ({elapsed_ms:.1f}ms)\n")
+    for rank, hit in enumerate(hits, 1):
+        labels = ' | '.join(value for value in (hit.error_id, hit.category, hit.app, hit.severity, hit.status) if value)
+        print(f"{rank}. {hit.title}  [{hit.score:.2f}]")
+        print(f"   📍 {hit.path}")
+        if labels:
+            print(f"   🏷️  {labels}")
+        if hit.snippet:
+            print(f"   💬 {hit.section}: {hit.snippet}")
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""
+📈 AI Documentation Framework - Error Statistics
+Regenerates the "ERROR STATISTICS" and "PERFORMANCE METRICS" sections of
+error-management/MASTER_ERROR_INDEX.md from the documented errors, so the
+numbers are never maintained by hand.
+
+Only the front matter of each error entry is parsed (the fields defined by
+ERROR_TEMPLATE.md: category, severity, status, occurrence and resolution
+dates, resolution_time_hours, ...). Parsed headers are cached per file in
+<project>/.ai-doc-error-stats.json together with the file's mtime, size and
+sha256: a file is only read again when its mtime or size changed, and only
+re-parsed when its content hash changed. After documenting one new error,
+regeneration reads that one file.
+"""
+
+import json
+import statistics
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .error_search import ERROR_DIRECTORY, discover_error_files, read_front_matter
+from .project_files import content_digest, record_regenerated_file, write_text_atomic
+
+ERROR_STATS_CACHE_FILENAME = ".ai-doc-error-stats.json"
+MASTER_ERROR_INDEX = f"{ERROR_DIRECTORY}/MASTER_ERROR_INDEX.md"
+CACHE_VERSION = 1
+
+# Categories listed in the template, shown even when they have no errors yet
+DEFAULT_CATEGORIES = ['backend', 'frontend', 'infrastructure', 'security', 'database', 'deployment']
+SEVERITIES = ['critical', 'high', 'medium', 'low']
+STATUSES = ['active', 'investigating', 'resolved', 'recurring']
+RESOLVED_STATUSES = {'resolved'}
+
+# Front matter fields kept in the cache
+HEADER_FIELDS = ['error_id', 'category', 'subcategory', 'severity', 'status', 'first_occurrence',
+                 'resolution_date', 'resolution_time_hours', 'ai_confidence_score', 'pattern_signatures']
+
+# MASTER_ERROR_INDEX.md sections rewritten by this module, matched by heading words
+GENERATED_SECTIONS = {
+    'statistics': ('error', 'statistics'),
+    'performance': ('performance', 'metrics'),
+}
+GENERATED_NOTE = "<!-- Generated by tools/error-stats.py from the error entries; manual edits are overwritten -->"
+
+DATE_FORMATS = ['%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d']
+
+def is_placeholder(value) -> bool:
+    """Template placeholders like "[critical|high|medium|low]" are not values"""
+    return value in (None, '', []) or (isinstance(value, str) and value.startswith('[') and value.endswith(']'))
+
+def parse_timestamp(value) -> Optional[datetime]:
+    if is_placeholder(value) or not isinstance(value, str):
+        return None
+    text = value.strip()
+    for suffix in ('UTC', 'Z'):
+        if text.endswith(suffix):
+            text = text[:-len(suffix)].strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+    return None
+
+def error_record(path: str, app: Optional[str], header: Dict[str, object]) -> Dict[str, object]:
+    """The cached, normalised header of one error entry"""
+    record = {key: header.get(key) for key in HEADER_FIELDS if not is_placeholder(header.get(key))}
+    for key in ('category', 'subcategory', 'severity', 'status'):
+        if isinstance(record.get(key), str):
+            record[key] = record[key].strip().lower()
+
+    if 'category' not in record:
+        # error-management/<category>/<entry>.md
+        parts = path.split('/')
+        position = parts.index(ERROR_DIRECTORY)
+        if len(parts) > position + 2:
+            record['category'] = parts[position + 1].lower()
+
+    hours = record.pop('resolution_time_hours', None)
+    if not isinstance(hours, (int, float)):
+        started = parse_timestamp(record.get('first_occurrence'))
+        resolved = parse_timestamp(record.get('resolution_date'))
+        hours = (resolved - started).total_seconds() / 3600 if started and resolved and resolved >= started else None
+    if hours is not None:
+        record['resolution_hours'] = round(float(hours), 3)
+
+    record['app'] = app
+    return record
+
+class ErrorStatsCache:
+    """Per-file header cache, keyed by path and validated by mtime, size and sha256"""
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root)
+        self.path = self.project_root / ERROR_STATS_CACHE_FILENAME
+        self.files = self._load()
+        self.changed = False
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return cache.get('files', {}) if cache.get('version') == CACHE_VERSION else {}
+
+    def save(self):
+        if not self.changed:
+            return
+        write_text_atomic(self.path, json.dumps({'version': CACHE_VERSION, 'files': self.files},
+                                                sort_keys=True, separators=(',', ':')))
+        self.changed = False
+
+    def scan(self) -> Tuple[List[Dict[str, object]], Dict[str, int]]:
+        """Records for every error entry, reading only files that changed"""
+        counts = {'read': 0, 'parsed': 0, 'cached': 0, 'removed': 0}
+        records = []
+        seen = set()
+        for path, app, stat in discover_error_files(self.project_root):
+            seen.add(path)
+            entry = self.files.get(path)
+            if entry and (entry['mtime_ns'], entry['size']) == (stat.st_mtime_ns, stat.st_size) \
+                    and entry['record'].get('app') == app:
+                counts['cached'] += 1
+                records.append(entry['record'])
+                continue
+
+            try:
+                text = (self.project_root / path).read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            counts['read'] += 1
+            digest = content_digest(text)
+            if not entry or entry['sha256'] != digest or entry['record'].get('app') != app:
+                # Only the front matter block is parsed
+                record = error_record(path, app, read_front_matter(iter(text.splitlines())))
+                counts['parsed'] += 1
+            else:
+                record = entry['record']
+            self.files[path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                                'sha256': digest, 'record': record}
+            self.changed = True
+            records.append(record)
+
+        for path in set(self.files) - seen:
+            del self.files[path]
+            counts['removed'] += 1
+            self.changed = True
+        return records, counts
+
+@dataclass
+class Breakdown:
+    """Counts and resolution times for one group of errors"""
+    total: int = 0
+    resolved: int = 0
+    hours: List[float] = field(default_factory=list)
+
+    def add(self, record: Dict[str, object]):
+        self.total += 1
+        if record.get('status') in RESOLVED_STATUSES:
+            self.resolved += 1
+        if 'resolution_hours' in record:
+            self.hours.append(record['resolution_hours'])
+
+    @property
+    def open(self) -> int:
+        return self.total - self.resolved
+
+    @property
+    def rate(self) -> str:
+        return f"{self.resolved / self.total:.0%}" if self.total else "0%"
+
+    @property
+    def average(self) -> str:
+        return format_hours(statistics.mean(self.hours)) if self.hours else "N/A"
+
+def format_hours(hours: float) -> str:
+    if hours < 48:
+        return f"{hours:.1f}h"
+    return f"{hours / 24:.1f}d"
+
+def group(records: List[Dict[str, object]], key: str, order: List[str]) -> Dict[str, Breakdown]:
+    """Breakdown per value of key: listed values first, then the rest alphabetically"""
+    groups = {value: Breakdown() for value in order}
+    extra = {}
+    for record in records:
+        value = record.get(key) or 'unspecified'
+        (groups if value in groups else extra).setdefault(value, Breakdown()).add(record)
+    groups.update(sorted(extra.items()))
+    return groups
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def render_statistics(records: List[Dict[str, object]], categories: List[str],
+                      applications: List[str]) -> Dict[str, str]:
+    """Body of each generated section (after its heading line)"""
+    overall = Breakdown()
+    for record in records:
+        overall.add(record)
+    by_category = group(records, 'category', categories)
+    by_severity = group(records, 'severity', SEVERITIES)
+    by_status = Counter(record.get('status') or 'unspecified' for record in records)
+    by_app = {app: Breakdown() for app in applications}
+    for record in records:
+        if record.get('app'):
+            by_app.setdefault(record['app'], Breakdown()).add(record)
+
+    def most_common(key: str) -> str:
+        counts = Counter(record[key] for record in records if record.get(key))
+        if not counts:
+            return "N/A"
+        value, count = counts.most_common(1)[0]
+        return f"{value} ({count})"
+
+    lines = [
+        GENERATED_NOTE,
+        "",
+        "### Overall Error Metrics",
+        f"- **Total Errors Documented**: {overall.total}",
+        f"- **Errors Resolved**: {overall.resolved}",
+        f"- **Resolution Rate**: {overall.rate}",
+        f"- **Average Resolution Time**: {overall.average}",
+        f"- **Most Common Error Type**: {most_common('subcategory')}",
+        f"- **Most Common Error Category**: {most_common('category')}",
+        "",
+        "### Category-Specific Metrics",
+        "| Category | Total | Resolved | Resolution Rate | Avg Resolution Time |",
+        "|----------|-------|----------|-----------------|-------------------|",
+    ]
+    lines += [f"| {name.title()} | {b.total} | {b.resolved} | {b.rate} | {b.average} |"
+              for name, b in by_category.items()]
+
+    if by_app:
+        lines += ["", "### Application-Specific Metrics",
+                  "| Application | Total | Open | Resolved | Resolution Rate | Avg Resolution Time |",
+                  "|-------------|-------|------|----------|-----------------|-------------------|"]
+        lines += [f"| {name} | {b.total} | {b.open} | {b.resolved} | {b.rate} | {b.average} |"
+                  for name, b in by_app.items()]
+
+    lines += ["", "### Severity Breakdown",
+              "| Severity | Total | Open | Resolved | Avg Resolution Time |",
+              "|----------|-------|------|----------|-------------------|"]
+    lines += [f"| {name.title()} | {b.total} | {b.open} | {b.resolved} | {b.average} |"
+              for name, b in by_severity.items()]
+
+    lines += ["", "### Status Breakdown",
+              "| Status | Count | Share |",
+              "|--------|-------|-------|"]
+    statuses = STATUSES + sorted(set(by_status) - set(STATUSES))
+    lines += [f"| {name.title()} | {by_status[name]} | "
+              f"{by_status[name] / overall.total if overall.total else 0:.0%} |" for name in statuses]
+
+    hours = overall.hours
+    confidence = [record['ai_confidence_score'] for record in records
+                  if isinstance(record.get('ai_confidence_score'), (int, float))]
+    open_urgent = sum(b.open for name, b in by_severity.items() if name in ('critical', 'high'))
+    recurring = by_status['recurring']
+    with_signatures = sum(1 for record in records if record.get('pattern_signatures'))
+
+    performance = [
+        GENERATED_NOTE,
+        "",
+        "### Error Management Efficiency",
+        f"- **Errors With Resolution Time**: {len(hours)} of {overall.total}",
+        f"- **Median Resolution Time**: {format_hours(statistics.median(hours)) if hours else 'N/A'}",
+        f"- **90th Percentile Resolution Time**: {format_hours(percentile(hours, 0.9)) if hours else 'N/A'}",
+        f"- **Fastest / Slowest Resolution**: "
+        f"{f'{format_hours(min(hours))} / {format_hours(max(hours))}' if hours else 'N/A'}",
+        f"- **Open Critical/High Errors**: {open_urgent}",
+        f"- **Recurring Errors**: {recurring} ({recurring / overall.total if overall.total else 0:.0%})",
+        "",
+        "### AI Integration Metrics",
+        f"- **Average AI Confidence Score**: "
+        f"{f'{statistics.mean(confidence):.2f} (over {len(confidence)} errors)' if confidence else 'N/A'}",
+        f"- **Errors With Detection Signatures**: {with_signatures}",
+    ]
+    return {'statistics': "\n".join(lines), 'performance': "\n".join(performance)}
+
+def replace_sections(document: str, bodies: Dict[str, str]) -> str:
+    """Swap the bodies of the generated "##" sections, leaving the rest of the file untouched"""
+    lines = document.split("\n")
+    output = []
+    n = 0
+    while n < len(lines):
+        line = lines[n]
+        output.append(line)
+        n += 1
+        if not line.startswith('## '):
+            continue
+        words = set(line.lower().split())
+        name = next((name for name, keywords in GENERATED_SECTIONS.items()
+                     if all(keyword in words for keyword in keywords)), None)
+        if name is None or name not in bodies:
+            continue
+        # The section runs to the next heading or the closing "---" rule
+        end = n
+        while end < len(lines) and not lines[end].startswith('## ') and lines[end].strip() != '---':
+            end += 1
+        output += ["", bodies[name], ""]
+        n = end
+    return "\n".join(output)
+
+def project_categories(project_root: Path) -> List[str]:
+    """Configured error categories plus the template's, in that order"""
+    try:
+        with open(project_root / "ai-doc-config.json", 'r', encoding='utf-8') as f:
+            configured = json.load(f).get('error_categories', [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        configured = []
+    return list(dict.fromkeys([category.lower() for category in configured] + DEFAULT_CATEGORIES))
+
+def update_master_index(project_root, check: bool = False) -> Dict[str, object]:
+    """Regenerate the statistics sections of MASTER_ERROR_INDEX.md (check: report only)"""
+    from .migration_plan import configured_applications
+
+    project_root = Path(project_root).resolve()
+    index_path = project_root / MASTER_ERROR_INDEX
+    if not index_path.exists():
+        raise FileNotFoundError(f"{MASTER_ERROR_INDEX} not found in {project_root}")
+
+    cache = ErrorStatsCache(project_root)
+    records, counts = cache.scan()
+    bodies = render_statistics(records, project_categories(project_root), configured_applications(project_root))
+
+    current = index_path.read_text(encoding='utf-8')
+    updated = replace_sections(current, bodies)
+    changed = updated != current
+    if changed and not check:
+        write_text_atomic(index_path, updated)
+        record_regenerated_file(project_root, MASTER_ERROR_INDEX, current, updated)
+    if not check:
+        cache.save()
+    return {'errors': len(records), 'changed': changed, 'records': records, **counts}
+
+def main():
+    """Main entry point"""
+    import sys
+    import time
+    import argparse
+    from . import __version__
+
+    parser = argparse.ArgumentParser(
+        description='📈 AI Documentation Framework - Error Statistics'
+    )
+
+    parser.add_argument('--project-path', type=str, default=".",
+                      help='Path to project root')
+    parser.add_argument('--check', action='store_true',
+                      help='Exit 1 if MASTER_ERROR_INDEX.md statistics are out of date (no changes made)')
+    parser.add_argument('--format', choices=['console', 'json'], default='console',
+                      help='Output format')
+    parser.add_argument('--version', action='version', version=f'error-stats {__version__}')
+
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        result = update_master_index(args.project_path, check=args.check)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    if args.format == 'json':
+        summary = {key: value for key, value in result.items() if key != 'records'}
+        print(json.dumps({**summary, 'seconds': round(elapsed, 3)}, indent=2))
+    elif args.check:
+        if result['changed']:
+            print(f"⚠️  Warning: {MASTER_ERROR_INDEX} statistics are out of date ({result['errors']} errors documented)")
+        else:
+            print(f"✅ {MASTER_ERROR_INDEX} statistics are up to date ({result['errors']} errors)")
+    else:
+        status = "Updated" if result['changed'] else "Already up to date:"
+        print(f"✅ {status} {MASTER_ERROR_INDEX} ({result['errors']} errors, "
+              f"{result['read']} files read, {result['cached']} from cache, {elapsed:.2f}s)")
+
+    sys.exit(1 if args.check and result['changed'] else 0)
+
+if __name__ == "__main__":
+    main()
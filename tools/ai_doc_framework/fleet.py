@@ -0,0 +1,253 @@
+"""
+🗂️ AI Documentation Framework - Fleet Conflict Detection
+Scans many projects in one process, behind `conflict-detector.py --fleet`.
+
+Projects are discovered from a list of project roots or parent directories
+(any directory containing ai-doc-config.json) and scanned by a shared thread
+pool. All detectors share the process-wide compiled rule patterns, so pattern
+set-up and interpreter start-up are paid once per batch instead of once per
+repository. Each project gets its own deadline, checked between files, so one
+huge repository cannot stall the batch.
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Optional, Iterable
+
+from .conflict_detector import (
+    AIDocConflictDetector, ConflictReport, ConfigError, ScanTimeout,
+    filter_report_by_severity, _COMPILED_PATTERNS
+)
+
+CONFIG_FILENAME = "ai-doc-config.json"
+DEFAULT_PROJECT_TIMEOUT = 300.0
+DEFAULT_DISCOVERY_DEPTH = 3
+
+# Directories never searched for project configs
+SKIP_DIRECTORIES = {'node_modules', 'venv', '__pycache__', 'dist', 'build'}
+
+@dataclass
+class FleetProjectResult:
+    """Outcome of scanning one project in the fleet"""
+    path: str
+    name: str
+    status: str  # 'ok', 'timeout', 'error'
+    elapsed: float
+    total_conflicts: int = 0
+    conflicts_by_severity: Dict[str, int] = field(default_factory=dict)
+    report: Optional[ConflictReport] = None
+    error: Optional[str] = None
+
+@dataclass
+class FleetReport:
+    """Aggregate conflict report across many projects"""
+    timestamp: str
+    roots: List[str]
+    total_projects: int
+    projects_ok: int
+    projects_timed_out: int
+    projects_failed: int
+    total_conflicts: int
+    conflicts_by_severity: Dict[str, int]
+    conflicts_by_category: Dict[str, int]
+    elapsed: float
+    projects: List[FleetProjectResult]
+
+    @property
+    def has_failures(self) -> bool:
+        """True when any project failed, timed out or has critical/high conflicts"""
+        return bool(self.projects_timed_out or self.projects_failed
+                    or self.conflicts_by_severity.get('critical')
+                    or self.conflicts_by_severity.get('high'))
+
+def discover_projects(roots: Iterable[str], max_depth: int = DEFAULT_DISCOVERY_DEPTH) -> List[Path]:
+    """Find every project root (directory with ai-doc-config.json) under the given paths"""
+    projects = set()
+
+    for root in roots:
+        root_path = Path(root).resolve()
+        if not root_path.is_dir():
+            print(f"⚠️  Warning: Fleet root not found: {root}")
+            continue
+
+        base_depth = len(root_path.parts)
+        for dirpath, dirnames, filenames in os.walk(root_path):
+            current = Path(dirpath)
+            if CONFIG_FILENAME in filenames:
+                # A project's own applications are scanned by its detector
+                projects.add(current)
+                dirnames[:] = []
+                continue
+
+            if len(current.parts) - base_depth >= max_depth:
+                dirnames[:] = []
+                continue
+
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith('.') and d not in SKIP_DIRECTORIES
+                # The framework itself, plus its staging/previous copies
+                and not d.startswith('ai-doc-framework')
+            ]
+
+    return sorted(projects)
+
+def scan_project(project_root: Path, project_timeout: Optional[float] = DEFAULT_PROJECT_TIMEOUT,
+                 min_severity: str = 'low', **detect_options) -> FleetProjectResult:
+    """Scan one project with its own deadline; never raises"""
+    started = time.monotonic()
+    detector = AIDocConflictDetector(project_root=str(project_root))
+    if project_timeout:
+        detector.deadline = started + project_timeout
+
+    try:
+        report = detector.detect_all_conflicts(**detect_options)
+        filter_report_by_severity(report, min_severity)
+        return FleetProjectResult(
+            path=str(project_root),
+            name=report.project_name,
+            status='ok',
+            elapsed=time.monotonic() - started,
+            total_conflicts=report.total_conflicts,
+            conflicts_by_severity=report.conflicts_by_severity,
+            report=report
+        )
+    except ScanTimeout:
+        status, error = 'timeout', f"Timed out after {project_timeout:g}s"
+    except ConfigError as e:
+        status, error = 'error', str(e)
+    except Exception as e:
+        status, error = 'error', f"{type(e).__name__}: {e}"
+
+    return FleetProjectResult(
+        path=str(project_root),
+        name=project_root.name,
+        status=status,
+        elapsed=time.monotonic() - started,
+        error=error
+    )
+
+def scan_fleet(roots: Iterable[str], jobs: Optional[int] = None,
+               project_timeout: Optional[float] = DEFAULT_PROJECT_TIMEOUT,
+               min_severity: str = 'low', max_depth: int = DEFAULT_DISCOVERY_DEPTH,
+               progress: bool = False, **detect_options) -> FleetReport:
+    """Discover projects under roots and scan them with a shared worker pool"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from datetime import datetime
+
+    roots = [str(root) for root in roots]
+    projects = discover_projects(roots, max_depth)
+    if progress:
+        print(f"🗂️  Found {len(projects)} projects")
+
+    started = time.monotonic()
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(scan_project, project, project_timeout, min_severity, **detect_options)
+            for project in projects
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results.append(result)
+            if progress:
+                icon = {'ok': '✅', 'timeout': '⏱️ '}.get(result.status, '❌')
+                print(f"   {icon} [{done}/{len(projects)}] {result.name} ({result.elapsed:.1f}s)")
+
+    # Deterministic order regardless of completion order
+    results.sort(key=lambda r: r.path)
+
+    conflicts_by_severity = {'low': 0, 'medium': 0, 'high': 0, 'critical': 0}
+    conflicts_by_category = {}
+    for result in results:
+        if result.report is None:
+            continue
+        for severity, count in result.report.conflicts_by_severity.items():
+            conflicts_by_severity[severity] = conflicts_by_severity.get(severity, 0) + count
+        for category, count in result.report.conflicts_by_category.items():
+            conflicts_by_category[category] = conflicts_by_category.get(category, 0) + count
+
+    return FleetReport(
+        timestamp=datetime.now().isoformat(),
+        roots=roots,
+        total_projects=len(results),
+        projects_ok=sum(1 for r in results if r.status == 'ok'),
+        projects_timed_out=sum(1 for r in results if r.status == 'timeout'),
+        projects_failed=sum(1 for r in results if r.status == 'error'),
+        total_conflicts=sum(r.total_conflicts for r in results),
+        conflicts_by_severity=conflicts_by_severity,
+        conflicts_by_category=conflicts_by_category,
+        elapsed=time.monotonic() - started,
+        projects=results
+    )
+
+def export_fleet_report(fleet: FleetReport, format: str = 'console', output_file: Optional[str] = None):
+    """Export a fleet report in the specified format"""
+    if format == 'console':
+        _print_fleet_report(fleet)
+    elif format == 'json':
+        _export_fleet_json(fleet, output_file)
+    else:
+        print(f"❌ Fleet mode supports console and json output, not {format}")
+
+def _print_fleet_report(fleet: FleetReport):
+    """Print the aggregate report with one section per project"""
+    severity_colors = {'critical': '🚨', 'high': '⚠️ ', 'medium': '📋', 'low': '💡'}
+
+    print("\n" + "=" * 80)
+    print(f"📊 AI DOCUMENTATION FLEET CONFLICT REPORT")
+    print("=" * 80)
+    print(f"📅 Date: {fleet.timestamp}")
+    print(f"📁 Roots: {', '.join(fleet.roots)}")
+    print(f"🏗️  Projects: {fleet.total_projects} ({fleet.projects_ok} scanned, "
+          f"{fleet.projects_timed_out} timed out, {fleet.projects_failed} failed) in {fleet.elapsed:.1f}s")
+    print(f"📋 Total Conflicts: {fleet.total_conflicts}")
+    print(f"♻️  Shared compiled patterns: {len(_COMPILED_PATTERNS)}")
+
+    print(f"\n📊 SEVERITY BREAKDOWN:")
+    for severity, count in fleet.conflicts_by_severity.items():
+        if count > 0:
+            print(f"   {severity_colors.get(severity, '📋')} {severity.title()}: {count}")
+
+    print(f"\n📂 CATEGORY BREAKDOWN:")
+    for category, count in fleet.conflicts_by_category.items():
+        print(f"   🔹 {category.title()}: {count}")
+
+    print(f"\n🗂️  PROJECTS:")
+    for result in fleet.projects:
+        if result.status == 'timeout':
+            print(f"\n   ⏱️  {result.name} ({result.path})")
+            print(f"      {result.error}")
+            continue
+        if result.status == 'error':
+            print(f"\n   ❌ {result.name} ({result.path})")
+            print(f"      {result.error}")
+            continue
+
+        icon = '✅' if result.total_conflicts == 0 else '📋'
+        print(f"\n   {icon} {result.name} ({result.path}) - "
+              f"{result.total_conflicts} conflicts in {result.elapsed:.1f}s")
+        for conflict in result.report.conflicts:
+            severity_icon = severity_colors.get(conflict.severity, '📋')
+            print(f"      {severity_icon} {conflict.title} [{', '.join(conflict.applications)}]")
+
+    print(f"\n🛠️  NEXT STEPS:")
+    print(f"   1. Run conflict-detector.py inside a project for full resolution suggestions")
+    print(f"   2. Use MANAGE_RULES.md to resolve conflicts")
+    print(f"   3. Re-run fleet detection to verify fixes")
+
+    print("\n" + "=" * 80 + "\n")
+
+def _export_fleet_json(fleet: FleetReport, output_file: Optional[str]):
+    """Export the fleet report as JSON"""
+    from datetime import datetime
+
+    output_path = output_file or f"fleet-conflict-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(asdict(fleet), f, indent=2, ensure_ascii=False)
+
+    print(f"📄 JSON fleet report exported to: {output_path}")
@@ -0,0 +1,521 @@
+"""
+🗂️ AI Documentation Framework - Issue Index
+Small index of every issue file under issues/open/ and issues/closed/ (project
+and applications), so "open issues for app X / category Y" is a lookup
+instead of a directory walk, and ISSUE_TRACKER.md tables are regenerated
+from it.
+
+The index is a SQLite file, <project>/.ai-doc-issue-index.sqlite:
+    dirs     Every directory under the open/closed roots, with its mtime
+    issues   One row per issue file: path, mtime/size, app, open/closed,
+             category, and the parsed issue_id, title, status, priority,
+             tags, created and closed dates
+
+Issues are created, deleted and closed by adding, removing and moving files,
+which changes the mtime of the directories involved. A refresh therefore
+stats the known directories and lists only those whose mtime changed; with
+100k issue files and nothing changed that is a few hundred stat calls.
+Edits inside an existing issue file do not touch its directory: refresh
+with verify=True (--verify) to stat every file as well. update-tracker
+always does, since it writes the counts back into the trackers.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .error_search import parse_front_matter_value, read_front_matter
+from .error_stats import format_hours, is_placeholder, parse_timestamp
+from .project_files import record_regenerated_file, write_text_atomic
+
+ISSUE_INDEX_FILENAME = ".ai-doc-issue-index.sqlite"
+ISSUE_TRACKER = "issues/ISSUE_TRACKER.md"
+ISSUE_STATES = ['open', 'closed']
+SCHEMA_VERSION = "1"
+
+# Directory mtimes this close to the scan are not trusted: a file added in
+# the same timestamp tick would not change them again
+RACY_WINDOW_NS = 2_000_000_000
+
+PRIORITIES = ['critical', 'high', 'medium', 'low']
+CORE_CATEGORIES = ['incomplete-tasks', 'unresolved-errors', 'system-issues']
+NON_ISSUE_FILES = {'README.md', 'ISSUE_TRACKER.md'}
+TAG_PLACEHOLDER = ['tags', 'for', 'categorization']
+RECENT_ACTIVITY = 10
+TITLE_DECORATION = re.compile(r"^[^\w\[(]+")
+
+GENERATED_NOTE = "<!-- Generated by tools/issue-tracker.py from issues/open and issues/closed; manual edits are overwritten -->"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER, app TEXT, state TEXT
+);
+CREATE INDEX IF NOT EXISTS dirs_by_parent ON dirs (parent);
+CREATE TABLE IF NOT EXISTS issues (
+    path TEXT PRIMARY KEY, dir TEXT, mtime_ns INTEGER, size INTEGER,
+    app TEXT, state TEXT, category TEXT,
+    issue_id TEXT, title TEXT, status TEXT, priority TEXT, tags TEXT,
+    created TEXT, closed TEXT
+);
+CREATE INDEX IF NOT EXISTS issues_by_dir ON issues (dir);
+CREATE INDEX IF NOT EXISTS issues_by_scope ON issues (state, app, category);
+"""
+
+@dataclass
+class IssueRecord:
+    """One issue file as recorded in the index"""
+    path: str
+    app: Optional[str]
+    state: str
+    category: str
+    issue_id: Optional[str]
+    title: str
+    status: Optional[str]
+    priority: Optional[str]
+    tags: List[str]
+    created: Optional[str]
+    closed: Optional[str]
+    mtime_ns: int
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+ISSUE_COLUMNS = ['path', 'app', 'state', 'category', 'issue_id', 'title', 'status', 'priority',
+                 'tags', 'created', 'closed', 'mtime_ns']
+
+def parse_issue(text: str) -> Dict[str, object]:
+    """Front matter fields, title and tags of an issue file"""
+    lines = text.splitlines()
+    header = read_front_matter(iter(lines))
+
+    def value(*keys) -> Optional[str]:
+        for key in keys:
+            if not is_placeholder(header.get(key)):
+                return str(header[key]).strip()
+        return None
+
+    title, tags = '', None
+    in_front_matter = bool(lines) and lines[0].strip() == '---'
+    in_tags = False
+    for n, line in enumerate(lines):
+        if in_front_matter:
+            in_front_matter = n == 0 or line.strip() != '---'
+            continue
+        if line.startswith('# ') and not title:
+            # "🚧 Incomplete Task: Title" -> "Incomplete Task: Title"
+            title = TITLE_DECORATION.sub('', line[2:].strip())
+        elif line.startswith('## '):
+            in_tags = 'tags' in line.lower().split()
+        elif in_tags and line.strip() and tags is None:
+            tags = line.strip()
+
+    header_tags = header.get('tags')
+    if isinstance(header_tags, list):
+        tag_list = header_tags
+    elif tags:
+        tag_list = parse_front_matter_value(tags if tags.startswith('[') else f"[{tags}]")
+        tag_list = tag_list if isinstance(tag_list, list) else []
+    else:
+        tag_list = []
+    tag_list = [str(tag).strip().lower() for tag in tag_list if str(tag).strip()]
+    if tag_list == TAG_PLACEHOLDER:
+        tag_list = []
+
+    priority = value('priority', 'severity')
+    status = value('status')
+    return {
+        'issue_id': value('issue_id'),
+        'title': title,
+        'status': status.lower() if status else None,
+        'priority': priority.lower() if priority else None,
+        'tags': tag_list,
+        'created': value('created_date', 'created'),
+        'closed': value('closed_date', 'resolved_date', 'resolution_date'),
+    }
+
+def replace_generated_section(document: str, heading_level: int, keywords: Iterable[str], body: str) -> str:
+    """Swap the body of the first heading of this level containing every keyword"""
+    prefix = '#' * heading_level + ' '
+    keywords = list(keywords)
+    lines = document.split("\n")
+    for n, line in enumerate(lines):
+        if line.startswith(prefix) and all(keyword in line.lower().split() for keyword in keywords):
+            end = n + 1
+            while end < len(lines):
+                candidate = lines[end]
+                level = len(candidate) - len(candidate.lstrip('#'))
+                if (0 < level <= heading_level and candidate[level:level + 1] == ' ') or candidate.strip() == '---':
+                    break
+                end += 1
+            return "\n".join(lines[:n + 1] + ["", body, ""] + lines[end:])
+    return document
+
+class IssueIndex:
+    """Incrementally maintained index of a project's issue files"""
+
+    def __init__(self, project_root, index_path: Optional[Path] = None):
+        self.project_root = Path(project_root).resolve()
+        self.index_path = Path(index_path) if index_path else self.project_root / ISSUE_INDEX_FILENAME
+        self.conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        version = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if version is None or version[0] != SCHEMA_VERSION:
+            conn.executescript("DELETE FROM issues; DELETE FROM dirs;")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (SCHEMA_VERSION,))
+            conn.commit()
+        return conn
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----- indexing ---------------------------------------------------------
+
+    def roots(self) -> List[Tuple[Optional[str], str, str]]:
+        """(application, state, root directory) for the project and every configured application"""
+        from .migration_plan import configured_applications
+
+        scopes = [(None, "issues")] + [(app, f"{app}/issues") for app in configured_applications(self.project_root)]
+        return [(app, state, f"{base}/{state}") for app, base in scopes for state in ISSUE_STATES]
+
+    def refresh(self, verify: bool = False) -> Dict[str, int]:
+        """Bring the index up to date; verify also stats every file to catch in-place edits"""
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'directories_listed': 0}
+        self._scan_started_ns = time.time_ns()
+        roots = self.roots()
+        with self.conn:
+            root_paths = {root for _, _, root in roots}
+            for (path,) in self.conn.execute("SELECT path FROM dirs WHERE parent IS NULL").fetchall():
+                if path not in root_paths:
+                    self._forget_directory(path, counts)
+            for app, state, root in roots:
+                if (self.project_root / root).is_dir():
+                    self._visit(root, None, app, state, verify, counts)
+                else:
+                    self._forget_directory(root, counts)
+        return counts
+
+    def _visit(self, relative: str, parent: Optional[str], app: Optional[str], state: str,
+               verify: bool, counts: Dict[str, int]):
+        try:
+            mtime_ns = os.stat(self.project_root / relative).st_mtime_ns
+        except FileNotFoundError:
+            self._forget_directory(relative, counts)
+            return
+        known = self.conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (relative,)).fetchone()
+        children = [path for (path,) in self.conn.execute("SELECT path FROM dirs WHERE parent = ?", (relative,))]
+
+        if known and known[0] == mtime_ns and not verify:
+            # Same listing as last time; subdirectories may still have changed
+            for child in children:
+                self._visit(child, relative, app, state, verify, counts)
+            return
+
+        counts['directories_listed'] += 1
+        indexed = {path: (file_mtime, size) for path, file_mtime, size in self.conn.execute(
+            "SELECT path, mtime_ns, size FROM issues WHERE dir = ?", (relative,))}
+        subdirectories = []
+        present = set()
+        with os.scandir(self.project_root / relative) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                path = f"{relative}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(path)
+                    continue
+                if not entry.name.endswith('.md') or entry.name in NON_ISSUE_FILES:
+                    continue
+                present.add(path)
+                stat = entry.stat()
+                if path in indexed and indexed[path] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                self._index_file(path, relative, app, state, stat)
+                counts['updated' if path in indexed else 'added'] += 1
+
+        for path in set(indexed) - present:
+            self.conn.execute("DELETE FROM issues WHERE path = ?", (path,))
+            counts['removed'] += 1
+        for child in set(children) - set(subdirectories):
+            self._forget_directory(child, counts)
+
+        # A listing taken in the same timestamp tick as a change cannot be trusted
+        trusted = mtime_ns if mtime_ns < self._scan_started_ns - RACY_WINDOW_NS else -1
+        self.conn.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?)",
+                          (relative, parent, trusted, app, state))
+        for child in sorted(subdirectories):
+            self._visit(child, relative, app, state, verify, counts)
+
+    def _index_file(self, path: str, directory: str, app: Optional[str], state: str, stat: os.stat_result):
+        try:
+            text = (self.project_root / path).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            text = ''
+        issue = parse_issue(text)
+
+        # <root>/<category>/... ; files directly in the root are uncategorized
+        root = f"{app}/issues/{state}" if app else f"issues/{state}"
+        parts = path[len(root) + 1:].split('/')
+        category = parts[0] if len(parts) > 1 else 'uncategorized'
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, directory, stat.st_mtime_ns, stat.st_size, app, state, category, issue['issue_id'],
+             issue['title'] or Path(path).stem, issue['status'], issue['priority'],
+             json.dumps(issue['tags']), issue['created'], issue['closed']))
+
+    def _forget_directory(self, relative: str, counts: Dict[str, int]):
+        """Drop a directory that no longer exists, with everything below it"""
+        pattern = relative.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '/%'
+        cursor = self.conn.execute("DELETE FROM issues WHERE dir = ? OR dir LIKE ? ESCAPE '\\'", (relative, pattern))
+        counts['removed'] += cursor.rowcount
+        self.conn.execute("DELETE FROM dirs WHERE path = ? OR path LIKE ? ESCAPE '\\'", (relative, pattern))
+
+    # ----- queries ----------------------------------------------------------
+
+    def query(self, state: Optional[str] = 'open', app: Optional[str] = None, category: Optional[str] = None,
+              priority: Optional[str] = None, tag: Optional[str] = None, project_only: bool = False,
+              limit: Optional[int] = None) -> List[IssueRecord]:
+        """Issues matching every given filter, highest priority first"""
+        clauses, parameters = [], []
+        for column, value in (('state', state), ('app', app), ('category', category), ('priority', priority)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        if project_only:
+            clauses.append("app IS NULL")
+        if tag is not None:
+            clauses.append("EXISTS (SELECT 1 FROM json_each(issues.tags) WHERE json_each.value = ?)")
+            parameters.append(tag.lower())
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "CASE priority " + " ".join(f"WHEN '{name}' THEN {n}" for n, name in enumerate(PRIORITIES)) + \
+                f" ELSE {len(PRIORITIES)} END, path"
+        sql = f"SELECT {', '.join(ISSUE_COLUMNS)} FROM issues {where} ORDER BY {order}"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+
+        records = []
+        for row in self.conn.execute(sql, parameters):
+            values = dict(zip(ISSUE_COLUMNS, row))
+            values['tags'] = json.loads(values['tags'] or '[]')
+            records.append(IssueRecord(**values))
+        return records
+
+    def counts(self, app: Optional[str] = None) -> Dict[Tuple[str, str], Dict[str, int]]:
+        """(state, category) -> issue count per priority, for one application or all"""
+        clause, parameters = ("WHERE app = ?", [app]) if app is not None else ("", [])
+        result = {}
+        for state, category, priority, count in self.conn.execute(
+                f"SELECT state, category, COALESCE(priority, '-'), COUNT(*) FROM issues {clause} "
+                f"GROUP BY state, category, priority", parameters):
+            result.setdefault((state, category), {})[priority] = count
+        return result
+
+    # ----- ISSUE_TRACKER.md -------------------------------------------------
+
+    def render_tracker_sections(self, app: Optional[str], categories: List[str]) -> Dict[str, str]:
+        """Generated SUMMARY section and Issue Resolution Stats subsection"""
+        counts = self.counts(app)
+        scope_clause, scope_parameters = ("WHERE app = ?", [app]) if app is not None else ("", [])
+
+        def total(state: str, category: Optional[str] = None) -> int:
+            return sum(sum(by_priority.values()) for (s, c), by_priority in counts.items()
+                       if s == state and (category is None or c == category))
+
+        listed = list(dict.fromkeys(CORE_CATEGORIES + categories +
+                                    sorted(category for _, category in counts)))
+        lines = [GENERATED_NOTE, "", "### Open Issues Overview",
+                 "| Category | Open | Highest Priority | Closed |",
+                 "|----------|------|------------------|--------|"]
+        for category in listed:
+            by_priority = counts.get(('open', category), {})
+            highest = next((name for name in PRIORITIES if by_priority.get(name)), '-')
+            if highest != '-':
+                highest = f"{highest} ({by_priority[highest]})"
+            lines.append(f"| **{category.replace('-', ' ').title()}** | {total('open', category)} | "
+                         f"{highest} | {total('closed', category)} |")
+
+        if app is None:
+            by_app = self.conn.execute(
+                "SELECT COALESCE(app, '(project)'), "
+                "SUM(state = 'open'), SUM(state = 'open' AND priority IN ('critical', 'high')), SUM(state = 'closed') "
+                "FROM issues GROUP BY app ORDER BY app IS NOT NULL, app").fetchall()
+            if by_app:
+                lines += ["", "### Open Issues by Application",
+                          "| Application | Open | Critical/High Open | Closed |",
+                          "|-------------|------|--------------------|--------|"]
+                lines += [f"| {name} | {open_count} | {urgent} | {closed} |" for name, open_count, urgent, closed in by_app]
+
+        lines += ["", "### Recent Activity"]
+        recent = self.conn.execute(
+            f"SELECT path, state, title, app, category FROM issues {scope_clause} "
+            f"ORDER BY mtime_ns DESC, path LIMIT {RECENT_ACTIVITY}", scope_parameters).fetchall()
+        if recent:
+            base = f"{app}/" if app is not None else ""
+            for path, state, title, issue_app, category in recent:
+                location = f"{issue_app} / {category}" if issue_app and app is None else category
+                lines.append(f"- {'Closed' if state == 'closed' else 'Open'}: [{title}]({path[len(base):]}) ({location})")
+        else:
+            lines.append("- No recent activity")
+
+        hours = []
+        for created, closed in self.conn.execute(
+                f"SELECT created, closed FROM issues {scope_clause}{' AND' if scope_clause else ' WHERE'} state = 'closed'",
+                scope_parameters):
+            started, finished = parse_timestamp(created), parse_timestamp(closed)
+            if started and finished and finished >= started:
+                hours.append((finished - started).total_seconds() / 3600)
+
+        open_total, closed_total = total('open'), total('closed')
+        created_total = open_total + closed_total
+        critical_open = sum(by_priority.get('critical', 0) for (state, _), by_priority in counts.items() if state == 'open')
+        stats = [
+            GENERATED_NOTE,
+            "",
+            f"- **Total Issues Created**: {created_total}",
+            f"- **Issues Resolved**: {closed_total}",
+            f"- **Resolution Rate**: {closed_total / created_total if created_total else 0:.0%}",
+            f"- **Average Resolution Time**: {format_hours(sum(hours) / len(hours)) if hours else 'N/A'}",
+            f"- **Open Issues**: {open_total}",
+            f"- **Critical Issues**: {critical_open}",
+        ]
+        return {'summary': "\n".join(lines), 'resolution': "\n".join(stats)}
+
+    def update_trackers(self, categories: Optional[List[str]] = None, check: bool = False) -> List[str]:
+        """Regenerate the project and application ISSUE_TRACKER.md tables; returns the changed files"""
+        categories = categories or []
+        trackers = [(None, ISSUE_TRACKER)] + [(app, f"{app}/{ISSUE_TRACKER}") for app, state, _ in self.roots()
+                                              if app is not None and state == 'open']
+        changed = []
+        for app, relative in trackers:
+            path = self.project_root / relative
+            if not path.exists():
+                continue
+            sections = self.render_tracker_sections(app, categories)
+            current = path.read_text(encoding='utf-8')
+            updated = replace_generated_section(current, 2, ['summary'], sections['summary'])
+            updated = replace_generated_section(updated, 3, ['issue', 'resolution', 'stats'], sections['resolution'])
+            if updated != current:
+                changed.append(relative)
+                if not check:
+                    write_text_atomic(path, updated)
+                    record_regenerated_file(self.project_root, relative, current, updated)
+        return changed
+
+def configured_issue_categories(project_root: Path) -> List[str]:
+    try:
+        with open(Path(project_root) / "ai-doc-config.json", 'r', encoding='utf-8') as f:
+            return list(json.load(f).get('issue_categories', []))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+def main():
+    """Main entry point"""
+    import sys
+    import argparse
+    from . import __version__
+
+    parser = argparse.ArgumentParser(
+        description='🗂️ AI Documentation Framework - Issue Tracker'
+    )
+    parser.add_argument('--project-path', type=str, default=".",
+                      help='Path to project root')
+    parser.add_argument('--verify', action='store_true',
+                      help='Also stat every issue file (catches edits inside existing issues; '
+                           'always on for update-tracker)')
+    parser.add_argument('--no-refresh', action='store_true',
+                      help='Answer from the index as it is')
+    parser.add_argument('--version', action='version', version=f'issue-tracker {__version__}')
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    list_parser = subparsers.add_parser('list', help='List issues (default: open issues)')
+    list_parser.add_argument('--app', type=str, help='Only issues of this application')
+    list_parser.add_argument('--project-only', action='store_true', help='Only project-level issues')
+    list_parser.add_argument('--category', type=str, help='Only issues in this category (e.g. incomplete-tasks)')
+    list_parser.add_argument('--priority', type=str, choices=PRIORITIES, help='Only issues with this priority')
+    list_parser.add_argument('--tag', type=str, help='Only issues with this tag')
+    list_parser.add_argument('--state', choices=ISSUE_STATES + ['all'], default='open',
+                           help='open, closed or all (default: open)')
+    list_parser.add_argument('--limit', type=int, help='Maximum issues to list')
+    list_parser.add_argument('--format', choices=['console', 'json'], default='console',
+                           help='Output format')
+
+    update_parser = subparsers.add_parser('update-tracker', help='Regenerate the ISSUE_TRACKER.md tables')
+    update_parser.add_argument('--check', action='store_true',
+                             help='Exit 1 if any tracker is out of date (no changes made)')
+
+    args = parser.parse_args()
+
+    with IssueIndex(args.project_path) as index:
+        if not args.no_refresh:
+            started = time.perf_counter()
+            # Tracker counts are written to disk, so they must include in-place edits
+            counts = index.refresh(verify=args.verify or args.command == 'update-tracker')
+            elapsed = time.perf_counter() - started
+            changes = counts['added'] + counts['updated'] + counts['removed']
+            if changes and getattr(args, 'format', 'console') == 'console':
+                print(f"🔄 Indexed {counts['added']} new, {counts['updated']} changed, "
+                      f"{counts['removed']} removed issue files ({elapsed:.2f}s)")
+
+        if args.command == 'list':
+            issues = index.query(state=None if args.state == 'all' else args.state, app=args.app,
+                                 category=args.category, priority=args.priority, tag=args.tag,
+                                 project_only=args.project_only, limit=args.limit)
+            if args.format == 'json':
+                print(json.dumps([issue.to_dict() for issue in issues], indent=2, ensure_ascii=False))
+                return
+            if not issues:
+                print(f"✅ No {args.state if args.state != 'all' else ''} issues found".replace('  ', ' '))
+                return
+            print(f"📋 {len(issues)} issues\n")
+            for issue in issues:
+                scope = ' / '.join(part for part in (issue.app, issue.category) if part)
+                tags = f"  🏷️  {', '.join(issue.tags)}" if issue.tags else ""
+                print(f"{'🔴' if issue.state == 'open' else '✅'} [{issue.priority or '-'}] {issue.title}  ({scope}){tags}")
+                print(f"   📍 {issue.path}")
+            return
+
+        if args.command == 'update-tracker':
+            changed = index.update_trackers(configured_issue_categories(index.project_root), check=args.check)
+            if args.check:
+                for path in changed:
+                    print(f"⚠️  Warning: {path} is out of date")
+                if not changed:
+                    print(f"✅ Issue trackers are up to date")
+                sys.exit(1 if changed else 0)
+            for path in changed:
+                print(f"✅ Updated: {path}")
+            if not changed:
+                print(f"✅ Issue trackers are up to date")
+            return
+
+        # No command: overview of open issues per scope
+        overview = {}
+        for (state, category), by_priority in index.counts().items():
+            overview.setdefault(category, {}).setdefault(state, 0)
+            overview[category][state] += sum(by_priority.values())
+        print(f"🗂️  Issues: {sum(v.get('open', 0) for v in overview.values())} open, "
+              f"{sum(v.get('closed', 0) for v in overview.values())} closed")
+        for category, states in sorted(overview.items()):
+            print(f"   {category}: {states.get('open', 0)} open, {states.get('closed', 0)} closed")
+
+if __name__ == "__main__":
+    main()
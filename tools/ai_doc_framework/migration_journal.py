@@ -0,0 +1,136 @@
+"""
+📓 AI Documentation Framework - Migration Journal
+Append-only record of completed migration work, so an interrupted migration
+resumes where it stopped instead of starting over.
+
+One JSON record per line in <project>/.ai-doc-migration-journal.jsonl:
+    start     Plan (from/to version) and the applications being migrated
+    backup    Backup taken before the first write (reused on resume)
+    file      Project file finished, with the sha256 of its migrated content
+    app       Application finished, with the hashes of all its files
+    complete  Migration validated; the next migration starts a new journal
+
+Each record is flushed and fsynced before the next operation, and a torn
+last line from a crash is ignored. Completed work is only skipped when the
+file on disk still hashes to the recorded value; anything else is redone,
+which is safe because every migration transform is idempotent.
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+
+from .project_files import content_digest
+
+MIGRATION_JOURNAL_FILENAME = ".ai-doc-migration-journal.jsonl"
+
+@dataclass
+class JournalState:
+    """What an existing journal says has already been done"""
+    started: Optional[Dict[str, Any]] = None
+    backup: Optional[str] = None
+    files: Dict[str, str] = field(default_factory=dict)
+    apps: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    complete: bool = False
+
+    @property
+    def resumable(self) -> bool:
+        return self.started is not None and not self.complete
+
+class MigrationJournal:
+    """Append-only journal of one project's migration"""
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root)
+        self.path = self.project_root / MIGRATION_JOURNAL_FILENAME
+        self.state = self.load()
+        self._lock = threading.Lock()  # Applications may be migrated in parallel
+
+    def load(self) -> JournalState:
+        state = JournalState()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return state
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn write from a crash
+            op = record.get('op')
+            if op == 'start':
+                state = JournalState(started=record)
+            elif op == 'backup':
+                state.backup = record['path']
+            elif op == 'file':
+                state.files[record['path']] = record['sha256']
+            elif op == 'app':
+                state.apps[record['name']] = record['files']
+            elif op == 'complete':
+                state.complete = True
+        return state
+
+    def _append(self, record: Dict[str, Any]):
+        record['at'] = datetime.now().isoformat()
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ----- recording --------------------------------------------------------
+
+    def begin(self, from_version: Optional[str], to_version: str, applications: List[str]):
+        """Start a new journal (any finished or abandoned one is replaced)"""
+        if self.path.exists():
+            self.path.unlink()
+        self._append({'op': 'start', 'from_version': from_version,
+                      'to_version': to_version, 'applications': applications})
+        self.state = self.load()
+
+    def record_backup(self, backup_path: Path):
+        self._append({'op': 'backup', 'path': str(backup_path)})
+        self.state.backup = str(backup_path)
+
+    def record_file(self, path: str, content: str):
+        digest = content_digest(content)
+        self._append({'op': 'file', 'path': path, 'sha256': digest})
+        self.state.files[path] = digest
+
+    def record_app(self, name: str, paths: List[str]):
+        files = {path: self.state.files[path] for path in paths if path in self.state.files}
+        self._append({'op': 'app', 'name': name, 'files': files})
+        self.state.apps[name] = files
+
+    def complete(self):
+        self._append({'op': 'complete'})
+        self.state.complete = True
+
+    # ----- verification -----------------------------------------------------
+
+    def file_done(self, path: str) -> bool:
+        """File was migrated and still has the content that was written"""
+        expected = self.state.files.get(path)
+        if expected is None:
+            return False
+        target = self.project_root / path
+        try:
+            return content_digest(target.read_text(encoding='utf-8')) == expected
+        except (FileNotFoundError, UnicodeDecodeError):
+            return False
+
+    def app_done(self, name: str) -> bool:
+        """Application was finished and none of its migrated files changed since"""
+        files = self.state.apps.get(name)
+        return files is not None and all(self.file_done(path) for path in files)
+
+    def backup_available(self) -> Optional[Path]:
+        """Backup recorded by the interrupted run, if it still exists"""
+        if self.state.backup and Path(self.state.backup).exists():
+            return Path(self.state.backup)
+        return None
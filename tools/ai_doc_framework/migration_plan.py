@@ -0,0 +1,494 @@
+"""
+🧭 AI Documentation Framework - Migration Planner
+Multi-hop project migrations (e.g. 1.0.0 → 1.1.0 → 1.2.0 → 2.0.0) applied in
+a single pass over the project.
+
+Each registered MigrationStep maps project-relative paths (glob patterns, or
+"{app}/..." for every application) to per-file transforms: fn(content, context) -> new content, where content
+is None for a missing file and returning None leaves the file as it is. The
+planner finds the shortest path between two versions through registered
+steps and the compatibility matrix (compatible versions are joined by
+no-op hops), composes every step's transforms per file in path order, then
+reads each file once, runs its transform chain in memory and writes it
+once, via a temp file and rename.
+
+A final stamp step always records the target version (config
+framework_version and the project VERSION file). A version the graph does
+not know (e.g. a 2.0.1 patch release) is planned as the highest known
+version at or below it, then stamped with the real version.
+"""
+
+import os
+import json
+import fnmatch
+from pathlib import Path
+from datetime import datetime
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Any, Iterable
+
+from .project_files import write_text_atomic
+
+@dataclass
+class MigrationContext:
+    """What transforms know about the migration they are part of"""
+    project_root: Path
+    from_version: Optional[str]
+    to_version: str
+    framework_dir: Path
+    applications: List[str] = field(default_factory=list)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def date(self) -> str:
+        return self.timestamp[:10]
+
+FileTransform = Callable[[Optional[str], MigrationContext], Optional[str]]
+
+@dataclass
+class MigrationStep:
+    """One registered hop between two framework versions"""
+    from_version: str
+    to_version: str
+    description: str
+    transforms: Dict[str, FileTransform] = field(default_factory=dict)
+
+class MigrationPlanError(Exception):
+    """Raised when no migration path exists between two versions, or a version
+    is below every known one"""
+
+MIGRATION_STEPS: List[MigrationStep] = []
+
+# Expanded to each application's directory ("{app}/AI_RULES.md")
+APP_PLACEHOLDER = "{app}"
+ROOT_UNIT = "."
+
+# Never searched when a step uses a glob pattern
+SKIP_DIRECTORIES = {'.git', 'node_modules', 'venv', '__pycache__', '.ai-doc-backups'}
+
+def register_migration_step(step: MigrationStep) -> MigrationStep:
+    """Make a step available to the planner"""
+    MIGRATION_STEPS.append(step)
+    return step
+
+def json_transform(fn: Callable[[Dict[str, Any], MigrationContext], None]) -> FileTransform:
+    """Adapt an in-place dict edit into a file transform (missing files stay missing)"""
+    def transform(content: Optional[str], context: MigrationContext) -> Optional[str]:
+        if content is None:
+            return None
+        data = json.loads(content)
+        fn(data, context)
+        return json.dumps(data, indent=2)
+    transform.__name__ = fn.__name__
+    return transform
+
+# ----- planning --------------------------------------------------------------
+
+class MigrationPlan:
+    """Ordered steps from one version to another, applied as one composed pass"""
+
+    def __init__(self, from_version: Optional[str], to_version: str, steps: List[MigrationStep],
+                 resolved_from: Optional[str] = None, resolved_to: Optional[str] = None):
+        self.from_version = from_version
+        self.to_version = to_version
+        self.steps = steps
+        # Known versions the path was planned between, when they differ from the real ones
+        self.resolved_from = resolved_from or from_version
+        self.resolved_to = resolved_to or to_version
+
+    @property
+    def versions(self) -> List[str]:
+        """Versions visited, e.g. ['1.0.0', '1.1.0', '1.2.0', '2.0.0']"""
+        if self.from_version is None:
+            return [self.to_version]
+        versions = [self.from_version]
+        for step in self.steps:
+            versions.append(step.to_version)
+        if versions[-1] != self.to_version:
+            versions.append(self.to_version)
+        return versions
+
+    def describe(self) -> str:
+        return " → ".join(self.versions)
+
+    def resolution_notes(self) -> List[str]:
+        """How versions outside the known graph were mapped onto it"""
+        notes = []
+        if self.from_version is not None and self.resolved_from != self.from_version:
+            notes.append(f"{self.from_version} is not a known version; migrating as {self.resolved_from}")
+        if self.resolved_to != self.to_version:
+            notes.append(f"{self.to_version} has no registered migration steps; "
+                         f"migrating to {self.resolved_to}, then stamping {self.to_version}")
+        return notes
+
+    def _transform_chain(self, applications: List[str]) -> List[tuple]:
+        """(pattern, transform) pairs in execution order, stamp step last
+
+        Patterns starting with {app}/ are expanded once per application.
+        """
+        chain = []
+        for step in self.steps + [STAMP_STEP]:
+            for pattern, transform in step.transforms.items():
+                if pattern.startswith(APP_PLACEHOLDER):
+                    chain.extend((pattern.replace(APP_PLACEHOLDER, app, 1), transform) for app in applications)
+                else:
+                    chain.append((pattern, transform))
+        return chain
+
+    def _target_paths(self, project_root: Path, chain: List[tuple]) -> List[str]:
+        """Exact paths plus, with one walk of the tree, everything glob patterns match"""
+        patterns = [pattern for pattern, _ in chain if is_glob_pattern(pattern)]
+        paths = {pattern for pattern, _ in chain if not is_glob_pattern(pattern)}
+
+        if patterns:
+            for dirpath, dirnames, filenames in os.walk(project_root):
+                dirnames[:] = [d for d in dirnames
+                               if d not in SKIP_DIRECTORIES and not d.startswith('ai-doc-framework')]
+                relative = Path(dirpath).relative_to(project_root)
+                for filename in filenames:
+                    path = (relative / filename).as_posix()
+                    if any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns):
+                        paths.add(path)
+        return sorted(paths)
+
+    def _migrate_file(self, path: str, chain: List[tuple], context: MigrationContext) -> tuple:
+        """(original, migrated) content of one file; None stands for a missing file"""
+        target = context.project_root / path
+        original = target.read_text(encoding='utf-8') if target.is_file() else None
+
+        content = original
+        for pattern, transform in chain:
+            if pattern == path or fnmatch.fnmatchcase(path, pattern):
+                new_content = transform(content, context)
+                if new_content is not None:
+                    content = new_content
+        return original, content
+
+    def apply(self, project_root: Path, framework_dir: Optional[Path] = None,
+              dry_run: bool = False, applications: Optional[List[str]] = None,
+              journal=None, jobs: Optional[int] = None) -> Dict[str, List[str]]:
+        """Read, transform and write every affected file once; returns what changed
+
+        With a MigrationJournal, each finished file and application is
+        recorded, and work the journal shows as done (with matching hashes)
+        is skipped and reported as 'resumed'. Applications are migrated on
+        up to jobs worker threads; results keep the serial order.
+        """
+        project_root = Path(project_root)
+        if applications is None:
+            applications = configured_applications(project_root)
+        context = MigrationContext(
+            project_root=project_root,
+            from_version=self.from_version,
+            to_version=self.to_version,
+            framework_dir=framework_dir or project_root / "ai-doc-framework",
+            applications=applications
+        )
+        chain = self._transform_chain(applications)
+        result = {'created': [], 'updated': [], 'unchanged': [], 'resumed': []}
+
+        # Project-level files first, then one unit of work per application
+        units: Dict[str, List[str]] = {ROOT_UNIT: []}
+        for app in applications:
+            units[app] = []
+        for path in self._target_paths(project_root, chain):
+            head = path.split('/', 1)[0]
+            units[head if '/' in path and head in units else ROOT_UNIT].append(path)
+
+        root_paths = units.pop(ROOT_UNIT)
+        partials = [self._migrate_unit(ROOT_UNIT, root_paths, chain, context, dry_run, journal)]
+        if units:
+            # Applications are independent: migrate them on a worker pool, merge in order
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                partials.extend(executor.map(
+                    lambda unit: self._migrate_unit(unit[0], unit[1], chain, context, dry_run, journal),
+                    units.items()))
+
+        for partial in partials:
+            for key, paths in partial.items():
+                result[key].extend(paths)
+        return result
+
+    def _migrate_unit(self, unit: str, paths: List[str], chain: List[tuple], context: MigrationContext,
+                      dry_run: bool, journal) -> Dict[str, List[str]]:
+        """Migrate the project-level files or one application's files"""
+        result = {'created': [], 'updated': [], 'unchanged': [], 'resumed': []}
+        if journal and unit != ROOT_UNIT and journal.app_done(unit):
+            result['resumed'].extend(paths)
+            return result
+
+        for path in paths:
+            if journal and journal.file_done(path):
+                result['resumed'].append(path)
+                continue
+
+            original, content = self._migrate_file(path, chain, context)
+            if content == original:
+                result['unchanged'].append(path)
+            else:
+                result['created' if original is None else 'updated'].append(path)
+                if not dry_run:
+                    target = context.project_root / path
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    write_text_atomic(target, content)
+            if journal and not dry_run and content is not None:
+                journal.record_file(path, content)
+
+        if journal and not dry_run and unit != ROOT_UNIT:
+            journal.record_app(unit, paths)
+        return result
+
+def configured_applications(project_root: Path) -> List[str]:
+    """Applications listed in ai-doc-config.json that exist on disk"""
+    try:
+        with open(project_root / "ai-doc-config.json", 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+    return [app['name'] for app in config.get('applications', [])
+            if app.get('name') and (project_root / app['name']).is_dir()]
+
+def is_glob_pattern(pattern: str) -> bool:
+    return any(char in pattern for char in '*?[')
+
+def _version_key(version: str) -> tuple:
+    parts = []
+    for part in version.split('.'):
+        try:
+            parts.append(int(part))
+        except ValueError:
+            continue
+    return tuple(parts)
+
+def _resolve_known_version(version: str, known: Iterable[str]) -> str:
+    """version itself if known, else the highest known version at or below it"""
+    if version in known:
+        return version
+    candidates = [v for v in known if _version_key(v) <= _version_key(version)]
+    if not candidates:
+        raise MigrationPlanError(f"Unknown version {version}: no known version at or below it")
+    return max(candidates, key=_version_key)
+
+def plan_migration(from_version: Optional[str], to_version: str,
+                   compatibility_matrix: Dict[str, Dict[str, Any]],
+                   steps: Optional[Iterable[MigrationStep]] = None) -> MigrationPlan:
+    """Shortest path from from_version to to_version (ties prefer registered steps)
+
+    Versions outside the known graph are planned as the highest known version
+    at or below them (see MigrationPlan.resolution_notes); MigrationPlanError
+    when there is none, or no path between the two.
+    """
+    steps = list(MIGRATION_STEPS if steps is None else steps)
+    if from_version is None or from_version == to_version:
+        return MigrationPlan(from_version, to_version, [])
+
+    # Adjacency: registered steps first, then no-op hops between compatible versions
+    edges: Dict[str, List[tuple]] = {}
+    for step in steps:
+        edges.setdefault(step.from_version, []).append((step.to_version, step))
+    for version, info in compatibility_matrix.items():
+        for compatible in info.get("compatible_with", []):
+            if compatible != version:
+                edges.setdefault(version, []).append((compatible, None))
+
+    known = set(edges) | {target for targets in edges.values() for target, _ in targets}
+    resolved_from = _resolve_known_version(from_version, known)
+    resolved_to = _resolve_known_version(to_version, known)
+
+    previous: Dict[str, tuple] = {resolved_from: (None, None)}
+    queue = deque([resolved_from])
+    while queue:
+        version = queue.popleft()
+        if version == resolved_to:
+            break
+        for target, step in edges.get(version, []):
+            if target not in previous:
+                previous[target] = (version, step)
+                queue.append(target)
+
+    if resolved_to not in previous:
+        raise MigrationPlanError(f"No migration path from {from_version} to {to_version}")
+
+    path_steps = []
+    version = resolved_to
+    while version != resolved_from:
+        version, step = previous[version]
+        if step is not None:
+            path_steps.append(step)
+    path_steps.reverse()
+    return MigrationPlan(from_version, to_version, path_steps, resolved_from, resolved_to)
+
+# ----- registered steps ------------------------------------------------------
+
+@json_transform
+def _add_issue_categories(config: Dict[str, Any], context: MigrationContext):
+    config.setdefault('issue_categories', ["incomplete-tasks", "unresolved-errors", "system-issues"])
+
+@json_transform
+def _add_error_categories(config: Dict[str, Any], context: MigrationContext):
+    config.setdefault('error_categories', ["backend", "frontend", "infrastructure",
+                                           "security", "testing", "deployment"])
+
+@json_transform
+def _stamp_config(config: Dict[str, Any], context: MigrationContext):
+    config['framework_version'] = context.to_version
+    config['last_updated'] = context.timestamp
+    config.setdefault('created_date', context.timestamp)
+    if 'project' in config and 'root_path' not in config['project']:
+        config['project']['root_path'] = str(context.project_root)
+
+def _stamp_version_file(content: Optional[str], context: MigrationContext) -> str:
+    return context.to_version
+
+def _add_conflict_detection_rules(content: Optional[str], context: MigrationContext) -> Optional[str]:
+    if content is None or "conflict detection" in content.lower():
+        return None
+    return content + f"""
+
+## 🔍 Conflict Detection Rules (v2.0)
+
+### Rule Management Integration
+- **MANAGE_RULES.md Usage**: Use MANAGE_RULES.md for all rule modifications
+- **Conflict Prevention**: Check for rule conflicts before adding new rules
+- **Cross-Application Consistency**: Ensure rules are consistent across applications
+
+### Version Control
+- **Version Tracking**: All rule changes must update version information
+- **Change Documentation**: Document all rule modifications in CHANGELOG.md
+- **Backup Before Changes**: Create backup before major rule modifications
+
+---
+
+**🔄 Updated for v2.0**: {context.date} | **Conflict Detection**: Enabled
+"""
+
+def _add_conflict_detection_step(content: Optional[str], context: MigrationContext) -> Optional[str]:
+    if content is None or "conflict detection" in content.lower():
+        return None
+    conflict_step = """
+
+### Step 0.5: Run Conflict Detection (v2.0 Feature)
+```python
+# NEW: Check for documentation conflicts before starting
+def check_conflicts_before_task():
+    conflict_result = run_conflict_detection()
+    
+    if conflict_result.total_conflicts > 0:
+        alert_user("Conflicts detected - review before proceeding")
+        return conflict_result
+    
+    return None
+```
+
+"""
+    # Insert after first step
+    return content.replace("### Step 1:", conflict_step + "### Step 1:")
+
+def _add_changelog(content: Optional[str], context: MigrationContext) -> Optional[str]:
+    if content is not None:
+        return None
+    return f"""# Changelog - {context.project_root.name}
+
+## [2.0.0] - {context.date}
+
+### 🔄 Migrated from v1.x
+
+#### New Features Added
+- **🔍 Conflict Detection**: Automatic detection of documentation conflicts
+- **🛠️ Rule Management**: Direct AI rule management via MANAGE_RULES.md
+- **📊 Enhanced Reporting**: HTML and JSON report generation
+- **🔄 Version Management**: Semantic versioning and update system
+
+#### Migration Notes
+- Migrated from v1.x installation
+- All existing configuration and customizations preserved
+- New features available immediately
+
+---
+
+## Previous Versions
+
+Previous version history was not tracked in v1.x installations.
+"""
+
+def _add_manage_rules(content: Optional[str], context: MigrationContext) -> Optional[str]:
+    if content is not None:
+        return None
+    # Prefer the framework template
+    template_file = context.framework_dir / "templates" / "core-files" / "MANAGE_RULES.md"
+    if template_file.exists():
+        from .templating import render_project_template
+        return render_project_template(context.framework_dir, context.project_root, "core-files/MANAGE_RULES.md",
+                                       current_date=context.date)
+    return f"""# 🛠️ MANAGE RULES - AI Rules Management System
+> **Add, Update, Remove AI Rules | Direct System Modification**
+
+## 🎯 AI INSTRUCTIONS - RULES MANAGEMENT PROTOCOL
+
+**When to use this file**: 
+- To add new rules to any application or root
+- To update existing rules
+- To remove outdated rules
+- To reorganize rule categories
+
+## 📋 RULE MANAGEMENT EXAMPLES
+
+### Add Rules Command Format
+```bash
+"Add [category] rule to [target]: [rule content]"
+
+Examples:
+✅ "Add security rule to root: All APIs must use HTTPS"
+✅ "Add performance rule to website: Page load time under 2 seconds"
+```
+
+### Update Rules Command Format
+```bash
+"Update [target] [category] rule: [old rule] → [new rule]"
+
+Examples:
+✅ "Update root security rule: JWT expiration from 24h to 1h"
+```
+
+### Remove Rules Command Format
+```bash
+"Remove [category] rule from [target]: [rule description]"
+
+Examples:
+✅ "Remove outdated authentication rule from api: Legacy OAuth method"
+```
+
+---
+
+**🔄 Last Updated**: {context.date} | **Rule Management**: Production Ready
+"""
+
+register_migration_step(MigrationStep(
+    "1.0.0", "1.1.0", "Issue management categories",
+    {"ai-doc-config.json": _add_issue_categories}
+))
+
+register_migration_step(MigrationStep(
+    "1.1.0", "1.2.0", "Error categories for the enhanced templates",
+    {"ai-doc-config.json": _add_error_categories}
+))
+
+register_migration_step(MigrationStep(
+    "1.2.0", "2.0.0", "Conflict detection, rule management and changelog",
+    {
+        "ai-doc-config.json": _add_error_categories,
+        "AI_RULES.md": _add_conflict_detection_rules,
+        "START_TASK.md": _add_conflict_detection_step,
+        "{app}/AI_RULES.md": _add_conflict_detection_rules,
+        "{app}/START_TASK.md": _add_conflict_detection_step,
+        "CHANGELOG.md": _add_changelog,
+        "MANAGE_RULES.md": _add_manage_rules,
+    }
+))
+
+# Always runs last: records the target version
+STAMP_STEP = MigrationStep(
+    "*", "*", "Record the target version",
+    {"ai-doc-config.json": _stamp_config, "VERSION": _stamp_version_file}
+)
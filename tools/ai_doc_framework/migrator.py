@@ -0,0 +1,590 @@
+"""
+🔄 AI Documentation Framework - v1.x to v2.0 Migration Tool
+v1.x to v2.0 migration engine behind tools/migrate-from-v1.py, importable as
+`ai_doc_framework.migrator`. See the script for command-line usage.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+
+from .snapshot import SnapshotCopier
+from .backup_store import BackupStore, BACKUP_MODES, BACKUP_STORE_DIRNAME, DEFAULT_KEEP_BACKUPS
+from .migration_journal import MigrationJournal
+
+__version__ = "2.0.0"
+
+class V1ToV2Migrator:
+    """Migration tool for v1.x to v2.0 upgrade"""
+    
+    def __init__(self, project_root: str = ".", backup_mode: str = "store",
+                 keep_backups: int = DEFAULT_KEEP_BACKUPS, jobs: Optional[int] = None):
+        self.project_root = Path(project_root).resolve()
+        self.jobs = jobs  # Worker threads for per-application detection, rewriting and validation
+        self.backup_dir = None
+        self.backup_mode = backup_mode  # 'store' (deduplicated), 'snapshot' or 'copy'
+        self.keep_backups = keep_backups
+        self.backup_manifest = None
+        
+        # v1.x file patterns
+        self.v1_files = [
+            "ai-doc-config.json",
+            "AI_RULES.md",
+            "START_TASK.md", 
+            "COMPLETE_TASK.md"
+        ]
+        
+        # v1.x application structure
+        self.v1_app_files = [
+            "AI_RULES.md",
+            "START_TASK.md",
+            "COMPLETE_TASK.md",
+            "docs/AI_APP_GUIDE.md"
+        ]
+        
+    def detect_v1_installation(self) -> Dict[str, Any]:
+        """Detect v1.x installation and analyze structure"""
+        detection_result = {
+            "is_v1": False,
+            "version": None,
+            "files_found": [],
+            "applications": [],
+            "issues": []
+        }
+        
+        # Check for v1.x indicators
+        v1_indicators = 0
+        for file_name in self.v1_files:
+            file_path = self.project_root / file_name
+            if file_path.exists():
+                detection_result["files_found"].append(file_name)
+                v1_indicators += 1
+        
+        # Check for VERSION file (v2.0 indicator)
+        version_file = self.project_root / "VERSION"
+        if version_file.exists():
+            try:
+                version = version_file.read_text().strip()
+                if version.startswith("2."):
+                    detection_result["issues"].append("Already v2.0 - no migration needed")
+                    return detection_result
+                else:
+                    detection_result["version"] = version
+            except Exception:
+                pass
+        
+        # Check configuration for applications
+        config_file = self.project_root / "ai-doc-config.json"
+        if config_file.exists():
+            try:
+                with open(config_file, 'r') as f:
+                    config = json.load(f)
+                    
+                # Check if it's v1.x format (missing v2.0 fields)
+                if 'framework_version' not in config:
+                    detection_result["is_v1"] = True
+                    detection_result["version"] = "1.0.0"  # Default v1 version
+                
+                # Find applications (each checked on the worker pool, kept in config order)
+                from concurrent.futures import ThreadPoolExecutor
+                app_names = [app['name'] for app in config.get('applications', [])]
+                with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                    for app_info in executor.map(self._detect_application, app_names):
+                        if app_info:
+                            detection_result["applications"].append(app_info)
+                        
+            except Exception as e:
+                detection_result["issues"].append(f"Could not read config: {e}")
+        
+        # Determine if this is v1.x
+        if v1_indicators >= 2 and not detection_result.get("version", "").startswith("2."):
+            detection_result["is_v1"] = True
+            if not detection_result["version"]:
+                detection_result["version"] = "1.0.0"
+        
+        return detection_result
+        
+    def _detect_application(self, app_name: str) -> Optional[Dict[str, Any]]:
+        """v1.x files present in one application directory"""
+        app_dir = self.project_root / app_name
+        if not app_dir.exists():
+            return None
+        
+        return {
+            "name": app_name,
+            "path": str(app_dir),
+            "files": [file_name for file_name in self.v1_app_files if (app_dir / file_name).exists()]
+        }
+        
+    def create_migration_backup(self) -> Path:
+        """Create backup before migration"""
+        if self.backup_mode == 'store':
+            return self._create_store_backup()
+        if self.backup_mode == 'archive':
+            return self._create_archive_backup()
+            
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        backup_path = self.project_root / f"v1-backup-{timestamp}"
+        backup_path.mkdir(exist_ok=True)
+        
+        print(f"📦 Creating v1.x backup at: {backup_path}")
+        started = time.monotonic()
+        # Migration rewrites files in place, so snapshots use reflinks or copies, never hardlinks
+        copier = SnapshotCopier() if self.backup_mode == 'snapshot' else None
+        
+        # Backup root files
+        for file_name in self.v1_files:
+            source = self.project_root / file_name
+            if source.exists():
+                if copier:
+                    copier.snapshot_file(source, backup_path / file_name)
+                else:
+                    shutil.copy2(source, backup_path / file_name)
+                print(f"✅ Backed up: {file_name}")
+        
+        # Backup framework directory if exists
+        framework_dir = self.project_root / "ai-doc-framework"
+        if framework_dir.exists():
+            framework_backup = backup_path / "ai-doc-framework"
+            if copier:
+                copier.snapshot_tree(framework_dir, framework_backup)
+            else:
+                shutil.copytree(framework_dir, framework_backup)
+            print(f"✅ Backed up: ai-doc-framework/")
+        
+        # Backup application directories
+        config_file = self.project_root / "ai-doc-config.json"
+        if config_file.exists():
+            try:
+                with open(config_file, 'r') as f:
+                    config = json.load(f)
+                    
+                for app in config.get('applications', []):
+                    app_name = app['name']
+                    app_dir = self.project_root / app_name
+                    if app_dir.exists():
+                        app_backup = backup_path / app_name
+                        if copier:
+                            copier.snapshot_tree(app_dir, app_backup)
+                        else:
+                            shutil.copytree(app_dir, app_backup)
+                        print(f"✅ Backed up: {app_name}/")
+            except Exception as e:
+                print(f"⚠️  Warning: Could not backup applications: {e}")
+        
+        self.backup_dir = backup_path
+        print(f"✅ Backup completed: {backup_path} ({time.monotonic() - started:.1f}s)")
+        if copier:
+            print(f"   📸 {copier.summary()}")
+        return backup_path
+        
+    def _application_paths(self) -> List[str]:
+        """Configured application directory names (for backups)"""
+        config_file = self.project_root / "ai-doc-config.json"
+        if not config_file.exists():
+            return []
+        try:
+            with open(config_file, 'r') as f:
+                config = json.load(f)
+            return [app['name'] for app in config.get('applications', [])]
+        except Exception as e:
+            print(f"⚠️  Warning: Could not backup applications: {e}")
+            return []
+            
+    def _create_archive_backup(self) -> Path:
+        """Stream v1.x files into a compressed tar with a checksum manifest"""
+        from .backup_archive import write_backup_archive
+        
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        archive_path = self.project_root / f"v1-backup-{timestamp}.tar.gz"
+        print(f"📦 Creating v1.x backup archive: {archive_path}")
+        started = time.monotonic()
+        
+        paths = list(self.v1_files) + ["ai-doc-framework"] + self._application_paths()
+        stats = write_backup_archive(self.project_root, paths, archive_path,
+                                     metadata={"kind": "migration", "version": "1.x"},
+                                     exclude=[self.project_root / BACKUP_STORE_DIRNAME])
+        self.backup_dir = archive_path
+        print(f"✅ Backup completed: {archive_path.name} ({time.monotonic() - started:.1f}s)")
+        print(f"   📼 {stats['files']} files, {stats['bytes_out'] / 1024 / 1024:.1f} MB compressed")
+        return archive_path
+        
+    def _create_store_backup(self) -> Path:
+        """Back up v1.x files into the content-addressed store"""
+        store = BackupStore(self.project_root / BACKUP_STORE_DIRNAME)
+        print(f"📦 Creating v1.x backup in store: {store.store_dir}")
+        started = time.monotonic()
+        
+        paths = list(self.v1_files) + ["ai-doc-framework"] + self._application_paths()
+        manifest_path = store.create_backup(self.project_root, paths, kind="migration",
+                                            metadata={"version": "1.x"})
+        self.backup_manifest = manifest_path
+        self.backup_dir = manifest_path
+        print(f"✅ Backup completed: {manifest_path.stem} ({time.monotonic() - started:.1f}s)")
+        print(f"   🗄️  {store.summary()}")
+        
+        pruned = store.prune(self.keep_backups)
+        if pruned["manifests"]:
+            print(f"   🧹 Pruned {pruned['manifests']} old backups ({pruned['objects']} unreferenced objects)")
+        return manifest_path
+        
+    def plan_migration(self, from_version: Optional[str]):
+        """Migration plan from the detected v1.x version to v2.0.0"""
+        from .version_manager import VersionManager
+        
+        version_manager = VersionManager(str(self.project_root))
+        if from_version not in version_manager.compatibility_matrix:
+            # Every step is idempotent, so the full chain is safe for unknown 1.x versions
+            print(f"⚠️  Warning: Unknown v1.x version {from_version}, migrating from 1.0.0")
+            from_version = "1.0.0"
+        return version_manager.plan_migration(from_version, "2.0.0")
+        
+    def apply_migration_plan(self, plan, dry_run: bool = False, applications: Optional[List[str]] = None,
+                             journal=None) -> bool:
+        """Apply every step's file changes in one pass (each file read and written once)"""
+        config_file = self.project_root / "ai-doc-config.json"
+        
+        if not config_file.exists():
+            print(f"❌ Configuration file not found: {config_file}")
+            return False
+        
+        print(f"🔄 Migrating {plan.describe()} ({len(plan.steps)} steps)...")
+        for step in plan.steps:
+            print(f"   - {step.from_version} → {step.to_version}: {step.description}")
+        
+        try:
+            result = plan.apply(self.project_root, dry_run=dry_run, applications=applications,
+                                journal=journal, jobs=self.jobs)
+        except Exception as e:
+            print(f"❌ Error applying migration: {e}")
+            return False
+        
+        if result['resumed']:
+            print(f"♻️  Skipped {len(result['resumed'])} files already migrated (hashes verified)")
+        for path in result['created']:
+            print(f"   + {path}" if dry_run else f"✅ Added {path}")
+        for path in result['updated']:
+            print(f"   ~ {path}" if dry_run else f"✅ Migrated {path}")
+        return True
+            
+    def setup_conflict_detection(self) -> bool:
+        """Set up conflict detection for migrated project"""
+        print(f"🔍 Setting up conflict detection...")
+        
+        try:
+            # Ensure framework directory exists
+            framework_dir = self.project_root / "ai-doc-framework"
+            if not framework_dir.exists():
+                print(f"⚠️  Framework directory not found - conflict detection may not work")
+                return False
+            
+            # Check if conflict detector exists
+            conflict_detector = framework_dir / "tools" / "conflict-detector.py"
+            if conflict_detector.exists():
+                # Make executable
+                conflict_detector.chmod(0o755)
+                print(f"✅ Conflict detector ready")
+                
+                # Test conflict detection in-process (does not scan the project)
+                try:
+                    from .conflict_detector import health_check_installation
+                    problems = health_check_installation(framework_dir)
+                    
+                    if not problems:
+                        print(f"✅ Conflict detection tested successfully")
+                    else:
+                        print(f"⚠️  Warning: Conflict detection test failed")
+                        
+                except Exception as e:
+                    print(f"⚠️  Warning: Could not test conflict detection: {e}")
+            else:
+                print(f"⚠️  Conflict detector not found in framework")
+                return False
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error setting up conflict detection: {e}")
+            return False
+            
+    def validate_migration(self) -> Dict[str, Any]:
+        """Validate that migration was successful"""
+        print(f"🔍 Validating migration...")
+        
+        validation_result = {
+            "success": True,
+            "checks": [],
+            "warnings": [],
+            "errors": []
+        }
+        
+        # Check VERSION file
+        version_file = self.project_root / "VERSION"
+        if version_file.exists():
+            try:
+                version = version_file.read_text().strip()
+                if version == "2.0.0":
+                    validation_result["checks"].append("VERSION file: OK")
+                else:
+                    validation_result["errors"].append(f"VERSION file has wrong version: {version}")
+                    validation_result["success"] = False
+            except Exception as e:
+                validation_result["errors"].append(f"Could not read VERSION file: {e}")
+                validation_result["success"] = False
+        else:
+            validation_result["errors"].append("VERSION file missing")
+            validation_result["success"] = False
+        
+        # Check configuration
+        config_file = self.project_root / "ai-doc-config.json"
+        if config_file.exists():
+            try:
+                with open(config_file, 'r') as f:
+                    config = json.load(f)
+                    
+                if config.get('framework_version') == "2.0.0":
+                    validation_result["checks"].append("Configuration version: OK")
+                else:
+                    validation_result["errors"].append("Configuration version not updated")
+                    validation_result["success"] = False
+                    
+                if 'last_updated' in config:
+                    validation_result["checks"].append("Configuration timestamp: OK")
+                else:
+                    validation_result["warnings"].append("Configuration missing timestamp")
+                    
+            except Exception as e:
+                validation_result["errors"].append(f"Could not validate configuration: {e}")
+                validation_result["success"] = False
+        else:
+            validation_result["errors"].append("Configuration file missing")
+            validation_result["success"] = False
+        
+        # Check MANAGE_RULES.md
+        manage_rules_file = self.project_root / "MANAGE_RULES.md"
+        if manage_rules_file.exists():
+            validation_result["checks"].append("MANAGE_RULES.md: OK")
+        else:
+            validation_result["warnings"].append("MANAGE_RULES.md missing")
+        
+        # Check applications (each on the worker pool, merged in config order)
+        from concurrent.futures import ThreadPoolExecutor
+        from .migration_plan import configured_applications
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            for app_result in executor.map(self._validate_application, configured_applications(self.project_root)):
+                for key in ("checks", "warnings", "errors"):
+                    validation_result[key].extend(app_result[key])
+                if app_result["errors"]:
+                    validation_result["success"] = False
+        
+        # Check conflict detection
+        framework_dir = self.project_root / "ai-doc-framework"
+        conflict_detector = framework_dir / "tools" / "conflict-detector.py"
+        if conflict_detector.exists():
+            validation_result["checks"].append("Conflict detector: OK")
+        else:
+            validation_result["warnings"].append("Conflict detector not found")
+        
+        return validation_result
+        
+    def _validate_application(self, app_name: str) -> Dict[str, List[str]]:
+        """Check one application's migrated files"""
+        result = {"checks": [], "warnings": [], "errors": []}
+        app_dir = self.project_root / app_name
+        
+        ai_rules_file = app_dir / "AI_RULES.md"
+        if ai_rules_file.exists():
+            try:
+                if "conflict detection" in ai_rules_file.read_text(encoding='utf-8').lower():
+                    result["checks"].append(f"{app_name}/AI_RULES.md: OK")
+                else:
+                    result["warnings"].append(f"{app_name}/AI_RULES.md missing conflict detection rules")
+            except Exception as e:
+                result["errors"].append(f"Could not read {app_name}/AI_RULES.md: {e}")
+        
+        start_task_file = app_dir / "START_TASK.md"
+        if start_task_file.exists():
+            try:
+                if "conflict detection" not in start_task_file.read_text(encoding='utf-8').lower():
+                    result["warnings"].append(f"{app_name}/START_TASK.md has no conflict detection step")
+            except Exception as e:
+                result["errors"].append(f"Could not read {app_name}/START_TASK.md: {e}")
+        
+        return result
+        
+    def migrate(self, interactive: bool = True, dry_run: bool = False) -> bool:
+        """Main migration process"""
+        print(f"🔄 AI Documentation Framework v1.x → v2.0 Migration")
+        print(f"=" * 60)
+        
+        # An interrupted migration resumes from its journal (the project may already look like v2.0)
+        journal = MigrationJournal(self.project_root)
+        resuming = journal.state.resumable
+        if resuming:
+            started = journal.state.started
+            print(f"♻️  Resuming interrupted migration from {started['at']}")
+            detection = {
+                "is_v1": True,
+                "version": started["from_version"],
+                "files_found": [name for name in self.v1_files if (self.project_root / name).exists()],
+                "applications": [{"name": name, "path": str(self.project_root / name), "files": []}
+                                 for name in started["applications"]],
+                "issues": []
+            }
+        else:
+            # Detect v1.x installation
+            detection = self.detect_v1_installation()
+        
+        if not detection["is_v1"]:
+            if detection["issues"]:
+                for issue in detection["issues"]:
+                    print(f"❌ {issue}")
+            else:
+                print(f"❌ No v1.x installation detected")
+            return False
+        
+        print(f"✅ Detected v1.x installation")
+        print(f"📋 Version: {detection['version']}")
+        print(f"📋 Files found: {len(detection['files_found'])}")
+        print(f"📋 Applications: {len(detection['applications'])}")
+        
+        plan = self.plan_migration(detection['version'])
+        applications = [app['name'] for app in detection['applications']]
+        
+        if dry_run:
+            print(f"\n🔍 DRY RUN - No changes will be made")
+            print(f"Would migrate:")
+            for file_name in detection["files_found"]:
+                print(f"   - {file_name}")
+            for app in detection["applications"]:
+                print(f"   - {app['name']}/ ({len(app['files'])} files)")
+            return self.apply_migration_plan(plan, dry_run=True, applications=applications,
+                                             journal=journal if resuming else None)
+        
+        if interactive:
+            print(f"\n🤔 Proceed with migration to v2.0?")
+            print(f"   - Backup will be created automatically")
+            print(f"   - All existing files will be preserved")
+            print(f"   - New v2.0 features will be added")
+            
+            response = input(f"Continue? (y/N): ").strip().lower()
+            if response != 'y':
+                print(f"❌ Migration cancelled by user")
+                return False
+        
+        try:
+            if not resuming:
+                journal.begin(plan.from_version, plan.to_version, applications)
+            
+            # Create backup (once: a resumed migration keeps the original one)
+            backup_path = journal.backup_available()
+            if backup_path:
+                print(f"♻️  Reusing backup from interrupted migration: {backup_path}")
+            else:
+                backup_path = self.create_migration_backup()
+                journal.record_backup(backup_path)
+            
+            # Migrate configuration, add v2.0 files and update existing files
+            if not self.apply_migration_plan(plan, applications=applications, journal=journal):
+                print(f"❌ Configuration migration failed")
+                return False
+            
+            # Setup conflict detection
+            if not self.setup_conflict_detection():
+                print(f"⚠️  Warning: Conflict detection setup incomplete")
+            
+            # Validate migration
+            validation = self.validate_migration()
+            
+            if not validation["success"]:
+                print(f"❌ Migration validation failed:")
+                for error in validation["errors"]:
+                    print(f"   - {error}")
+                return False
+            journal.complete()
+            
+            # Show results
+            print(f"\n✅ Migration completed successfully!")
+            print(f"📋 Migrated from v{detection['version']} to v2.0.0")
+            print(f"📦 Backup available at: {backup_path}")
+            
+            print(f"\n✅ Validation Results:")
+            for check in validation["checks"]:
+                print(f"   ✅ {check}")
+            
+            if validation["warnings"]:
+                print(f"\n⚠️  Warnings:")
+                for warning in validation["warnings"]:
+                    print(f"   ⚠️  {warning}")
+            
+            print(f"\n🎯 Next Steps:")
+            print(f"   1. Test conflict detection: python3 ai-doc-framework/tools/conflict-detector.py")
+            print(f"   2. Review MANAGE_RULES.md for rule management")
+            print(f"   3. Check CHANGELOG.md for new features")
+            print(f"   4. Update your team on new v2.0 capabilities")
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ Migration failed: {e}")
+            return False
+
+def main():
+    """Main entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='🔄 AI Documentation Framework v1.x → v2.0 Migration'
+    )
+    
+    parser.add_argument('--interactive', action='store_true',
+                      help='Interactive migration with prompts')
+    parser.add_argument('--auto', action='store_true',
+                      help='Automatic migration without prompts')
+    parser.add_argument('--backup-dir', type=str,
+                      help='Custom backup directory')
+    parser.add_argument('--backup-mode', type=str, default='store', choices=BACKUP_MODES,
+                      help='store: deduplicated backup store; snapshot: reflinks/parallel copy; '
+                           'copy: full copy; archive: streaming .tar.gz (default: store)')
+    parser.add_argument('--keep-backups', type=int, default=DEFAULT_KEEP_BACKUPS,
+                      help=f'Backups kept in the store (default: {DEFAULT_KEEP_BACKUPS})')
+    parser.add_argument('--dry-run', action='store_true',
+                      help='Show what would be migrated without making changes')
+    parser.add_argument('--project-path', type=str, default=".",
+                      help='Path to project root')
+    parser.add_argument('--jobs', type=int,
+                      help='Worker threads for per-application work (default: CPU count + 4, max 32)')
+    parser.add_argument('--version', action='version', version=f'migrate-from-v1 {__version__}')
+    
+    args = parser.parse_args()
+    
+    try:
+        # Initialize migrator
+        migrator = V1ToV2Migrator(project_root=args.project_path, backup_mode=args.backup_mode,
+                                  keep_backups=args.keep_backups, jobs=args.jobs)
+        
+        # Determine interaction mode
+        interactive = args.interactive or not args.auto
+        
+        # Run migration
+        success = migrator.migrate(
+            interactive=interactive,
+            dry_run=args.dry_run
+        )
+        
+        sys.exit(0 if success else 1)
+        
+    except KeyboardInterrupt:
+        print(f"\n⚠️  Migration cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Migration error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
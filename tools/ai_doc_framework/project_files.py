@@ -0,0 +1,69 @@
+"""
+📝 AI Documentation Framework - Project File Writes
+Helpers shared by the tools that write framework files into a project:
+content hashes, atomic writes, and the template state file that lets
+sync-templates tell framework output from local edits.
+
+The template state (<project>/.ai-doc-templates.json) holds:
+    render_date   Date the templates were first rendered with
+    files         Target -> sha256 of what the setup wizard last rendered
+    regenerated   Target -> sha256 of the same file after error-stats or
+                  issue-tracker rewrote its generated sections
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+TEMPLATE_STATE_FILE = ".ai-doc-templates.json"
+
+def content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def write_text_atomic(target: Path, content: str):
+    """Write via a temp file and rename, so readers never see a partial file
+
+    An existing file keeps its mode; a new one gets 0644 rather than mkstemp's 0600.
+    """
+    mode = target.stat().st_mode & 0o777 if target.exists() else 0o644
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, target)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+def load_template_state(project_root: Path) -> Dict:
+    """Hashes and render date recorded by the last scaffold, sync or regeneration"""
+    try:
+        with open(Path(project_root) / TEMPLATE_STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        state = {}
+    state.setdefault('render_date', None)
+    state.setdefault('files', {})
+    state.setdefault('regenerated', {})
+    return state
+
+def record_regenerated_file(project_root: Path, target: str, previous: str, content: str):
+    """Record that a tool rewrote a rendered file from `previous` to `content`
+
+    Only files the template state already tracks are recorded, and only when
+    `previous` was framework output (as rendered or as last regenerated); a
+    locally edited file stays a local edit for sync-templates.
+    """
+    project_root = Path(project_root)
+    state = load_template_state(project_root)
+    digest = content_digest(previous)
+    if target not in state['files'] or digest not in (state['files'][target], state['regenerated'].get(target)):
+        return
+    state['regenerated'][target] = content_digest(content)
+    state['regenerated'] = dict(sorted(state['regenerated'].items()))
+    write_text_atomic(project_root / TEMPLATE_STATE_FILE, json.dumps(state, indent=2))
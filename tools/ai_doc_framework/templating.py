@@ -0,0 +1,81 @@
+"""
+🧩 AI Documentation Framework - Template Rendering
+The Jinja2 environment and template variables shared by the setup wizard
+(scaffold and sync-templates), the updater and project migrations, so a file
+added by an update renders exactly as a fresh scaffold would.
+
+Undefined variables raise instead of rendering as empty strings, so a
+template that uses a variable its context lacks fails loudly.
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
+
+from .project_files import load_template_state
+
+# Compiled templates, shared by every run on this machine
+TEMPLATE_CACHE_DIR = Path.home() / ".ai-doc-framework-cache" / "jinja"
+
+DEFAULT_ERROR_CATEGORIES = ['backend', 'frontend', 'infrastructure', 'security', 'performance']
+DEFAULT_ISSUE_CATEGORIES = ['incomplete-tasks', 'unresolved-errors', 'system-issues']
+
+def create_template_environment(templates_dir: Path, cache_dir: Optional[Path] = TEMPLATE_CACHE_DIR) -> Environment:
+    """Jinja2 environment for the framework templates, with a filesystem bytecode cache"""
+    bytecode_cache = None
+    if cache_dir:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        except OSError:
+            pass  # Compile in memory only
+    return Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        bytecode_cache=bytecode_cache,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        undefined=StrictUndefined,
+        auto_reload=False  # Templates do not change during a run
+    )
+
+def template_context(config: Dict, project_root: Path, current_date: str) -> Dict:
+    """Variables available to every project-level template"""
+    project = config['project']
+    applications = [dict({'type': 'fullstack', 'framework': 'generic', 'description': ''}, **app)
+                    for app in config.get('applications', [])]
+    return {
+        'project_name': project['name'],
+        'project_type': project.get('type', 'multi'),
+        'project_root': str(project_root),
+        'project_path': str(project_root),
+        'current_date': current_date,
+        'applications': applications,
+        'error_categories': config.get('error_categories', DEFAULT_ERROR_CATEGORIES),
+        'issue_categories': config.get('issue_categories', DEFAULT_ISSUE_CATEGORIES)
+    }
+
+def _read_json(path: Path) -> Dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def render_project_template(framework_dir: Path, project_root: Path, template_name: str,
+                            config_path: Optional[Path] = None, current_date: Optional[str] = None) -> str:
+    """Render templates/<template_name> for an existing project, as a scaffold would
+
+    Variables come from the project's ai-doc-config.json; the date is the one
+    recorded by the last scaffold or sync, so sync-templates sees the file as
+    unchanged.
+    """
+    config = _read_json(Path(config_path) if config_path else project_root / "ai-doc-config.json")
+    config['project'] = dict({'name': project_root.name}, **config.get('project', {}))
+    render_date = (load_template_state(project_root)['render_date'] or current_date
+                   or datetime.now().strftime("%Y-%m-%d"))
+    template = create_template_environment(framework_dir / "templates").get_template(template_name)
+    return template.render(template_context(config, project_root, render_date))
@@ -0,0 +1,960 @@
+"""
+🔄 AI Documentation Framework - Update System
+Framework update engine behind tools/update-framework.py, importable as
+`ai_doc_framework.updater`. See the script for command-line usage.
+
+New framework versions are staged next to the live install, validated there
+and swapped in with a rename, so an interrupted update never leaves a
+half-copied framework behind.
+
+Network, archive and subprocess modules are imported where they are used, so
+--help and --version start quickly.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .snapshot import SnapshotCopier
+from .backup_store import BackupStore, BACKUP_MODES, BACKUP_STORE_DIRNAME, DEFAULT_KEEP_BACKUPS
+from .backup_archive import ARCHIVE_FORMATS
+
+# Release paths installed projects use; the rest (docs site, examples) is not updated
+UPDATE_INCLUDE = ('tools', 'templates', 'VERSION', 'CHANGELOG.md')
+
+# Version information
+CURRENT_VERSION = "2.0.0"
+SUPPORTED_VERSIONS = ["1.0.0", "1.1.0", "1.2.0", "2.0.0"]
+GITHUB_REPO = "https://github.com/zsarir/ai-doc-framework"
+GITHUB_API = "https://api.github.com/repos/zsarir/ai-doc-framework"
+
+def exchange_paths(first: Path, second: Path):
+    """Swap two directories, atomically where the OS allows it
+
+    Linux renameat2(RENAME_EXCHANGE) swaps both names in one step. Elsewhere
+    three renames are used, leaving a window of microseconds rather than the
+    length of a full copy.
+    """
+    if sys.platform.startswith('linux'):
+        import ctypes
+        import errno
+        
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            renameat2 = libc.renameat2
+        except (OSError, AttributeError):
+            renameat2 = None
+            
+        if renameat2 is not None:
+            AT_FDCWD, RENAME_EXCHANGE = -100, 2
+            if renameat2(AT_FDCWD, os.fsencode(str(first)), AT_FDCWD, os.fsencode(str(second)),
+                         RENAME_EXCHANGE) == 0:
+                return
+            err = ctypes.get_errno()
+            if err not in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise OSError(err, os.strerror(err), str(first))
+                
+    temp = first.with_name(f"{first.name}.swap-{os.getpid()}")
+    os.rename(first, temp)
+    os.rename(second, first)
+    os.rename(temp, second)
+
+class FrameworkUpdater:
+    """Main framework update system"""
+    
+    def __init__(self, project_root: str = ".", config_path: Optional[str] = None,
+                 backup_mode: str = "store", keep_backups: int = DEFAULT_KEEP_BACKUPS,
+                 archive_format: str = "gz"):
+        self.project_root = Path(project_root).resolve()
+        self.config_path = config_path or self.project_root / "ai-doc-config.json"
+        self.framework_dir = self.project_root / "ai-doc-framework"
+        self.previous_framework_dir = self.project_root / "ai-doc-framework.previous"
+        self.framework_swapped = False
+        self.backup_dir = None
+        self.backup_mode = backup_mode  # 'store' (deduplicated), 'snapshot', 'copy' or 'archive'
+        self.backup_location = None
+        self.keep_backups = keep_backups
+        self.archive_format = archive_format
+        self.backup_store = None
+        self.backup_manifest = None
+        self.backup_archive = None
+        self.source = None  # Local framework directory or zip instead of GitHub
+        self.framework_source = None  # Open ZipSource, closed by cleanup_source()
+        self.update_include = UPDATE_INCLUDE  # None: update the whole release tree
+        self.source_sha256 = None  # Expected sha256 of a zip source (--sha256)
+        self.artifact_cache_dir = None  # Default: ~/.ai-doc-framework-cache/artifacts
+        self.refresh_cache = False
+        self.release_version = None  # Latest release reported by GitHub
+        self.version_client = None  # Default: the shared VersionCheckClient
+        self.framework_delta = None  # FrameworkDelta of the staged update
+        
+        # Project files backed up (and restored on rollback) alongside the framework
+        self.critical_files = [
+            "ai-doc-config.json",
+            "AI_RULES.md", 
+            "START_TASK.md",
+            "COMPLETE_TASK.md",
+            "MANAGE_RULES.md",
+            "VERSION"
+        ]
+        self.current_version = None
+        self.target_version = CURRENT_VERSION
+        
+    def detect_current_version(self) -> Optional[str]:
+        """Detect current framework version"""
+        
+        # Check VERSION file
+        version_file = self.framework_dir / "VERSION"
+        if version_file.exists():
+            try:
+                version = version_file.read_text().strip()
+                print(f"✅ Detected version from VERSION file: {version}")
+                return version
+            except Exception as e:
+                print(f"⚠️  Warning: Could not read VERSION file: {e}")
+        
+        # Check ai-doc-config.json
+        if self.config_path.exists():
+            try:
+                with open(self.config_path, 'r') as f:
+                    config = json.load(f)
+                    version = config.get('framework_version')
+                    if version:
+                        print(f"✅ Detected version from config: {version}")
+                        return version
+            except Exception as e:
+                print(f"⚠️  Warning: Could not read config file: {e}")
+        
+        # Check for v1.x indicators
+        v1_indicators = [
+            self.project_root / "START_TASK.md",
+            self.project_root / "AI_RULES.md",
+            self.project_root / "COMPLETE_TASK.md"
+        ]
+        
+        if any(f.exists() for f in v1_indicators):
+            print("📋 Detected v1.x installation (no VERSION file)")
+            return "1.0.0"
+        
+        print("❓ Could not detect current version")
+        return None
+        
+    def check_for_updates(self) -> Tuple[bool, str]:
+        """Check if updates are available"""
+        from .version_check import default_version_client
+        
+        # Shared with version-manager.py: TTL-cached, conditional, timeout-bounded
+        latest_version = (self.version_client or default_version_client()).latest_version()
+        if not latest_version:
+            print(f"⚠️  Warning: Could not check for updates: GitHub releases API unreachable")
+            return False, CURRENT_VERSION
+            
+        self.release_version = latest_version
+        if self.current_version:
+            needs_update = self._compare_versions(latest_version, self.current_version) > 0
+            return needs_update, latest_version
+        else:
+            return True, latest_version
+            
+    def _compare_versions(self, v1: str, v2: str) -> int:
+        """Compare two version strings (semantic versioning)"""
+        def version_tuple(v):
+            return tuple(map(int, v.split('.')))
+        
+        v1_tuple = version_tuple(v1)
+        v2_tuple = version_tuple(v2)
+        
+        if v1_tuple > v2_tuple:
+            return 1
+        elif v1_tuple < v2_tuple:
+            return -1
+        else:
+            return 0
+            
+    def _application_names(self) -> List[str]:
+        """Names of the configured application directories that exist"""
+        if not self.config_path.exists():
+            return []
+        try:
+            with open(self.config_path, 'r') as f:
+                config = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not read applications from config: {e}")
+            return []
+        return [app['name'] for app in config.get('applications', [])
+                if (self.project_root / app['name']).exists()]
+        
+    def create_backup(self, backup_dir: Optional[str] = None) -> Path:
+        """Create backup of current installation"""
+        if self.backup_mode == 'store':
+            return self._create_store_backup(backup_dir)
+        if self.backup_mode == 'archive':
+            return self._create_archive_backup(backup_dir)
+            
+        if backup_dir:
+            backup_path = Path(backup_dir)
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            backup_path = self.project_root / f"backup-{timestamp}"
+        
+        backup_path.mkdir(exist_ok=True)
+        
+        print(f"📦 Creating backup at: {backup_path}")
+        started = time.monotonic()
+        copier = SnapshotCopier() if self.backup_mode == 'snapshot' else None
+        
+        # Backup critical files (edited in place, so never hardlinked)
+        for file_name in self.critical_files:
+            source = self.project_root / file_name
+            if source.exists():
+                if copier:
+                    copier.snapshot_file(source, backup_path / file_name)
+                else:
+                    shutil.copy2(source, backup_path / file_name)
+                print(f"✅ Backed up: {file_name}")
+        
+        # Backup framework directory; updates replace it wholesale, so hardlinks are safe
+        if self.framework_dir.exists():
+            framework_backup = backup_path / "ai-doc-framework"
+            if copier:
+                copier.snapshot_tree(self.framework_dir, framework_backup, hardlink=True)
+            else:
+                shutil.copytree(self.framework_dir, framework_backup)
+            print(f"✅ Backed up: ai-doc-framework/")
+        
+        # Backup application directories
+        if self.config_path.exists():
+            try:
+                with open(self.config_path, 'r') as f:
+                    config = json.load(f)
+                    
+                for app in config.get('applications', []):
+                    app_name = app['name']
+                    app_dir = self.project_root / app_name
+                    if app_dir.exists():
+                        app_backup = backup_path / app_name
+                        if copier:
+                            copier.snapshot_tree(app_dir, app_backup)
+                        else:
+                            shutil.copytree(app_dir, app_backup)
+                        print(f"✅ Backed up: {app_name}/")
+            except Exception as e:
+                print(f"⚠️  Warning: Could not backup applications: {e}")
+        
+        self.backup_dir = backup_path
+        print(f"✅ Backup completed: {backup_path} ({time.monotonic() - started:.1f}s)")
+        if copier:
+            print(f"   📸 {copier.summary()}")
+        return backup_path
+        
+    def _create_store_backup(self, store_dir: Optional[str] = None) -> Path:
+        """Back up into the content-addressed store; only new contents are written"""
+        store = BackupStore(store_dir or self.project_root / BACKUP_STORE_DIRNAME)
+        print(f"📦 Creating backup in store: {store.store_dir}")
+        started = time.monotonic()
+        
+        paths = self.critical_files + ["ai-doc-framework"] + self._application_names()
+        manifest_path = store.create_backup(self.project_root, paths, kind="update",
+                                            metadata={"version": self.current_version})
+        
+        self.backup_store = store
+        self.backup_manifest = manifest_path
+        self.backup_dir = manifest_path
+        print(f"✅ Backup completed: {manifest_path.stem} ({time.monotonic() - started:.1f}s)")
+        print(f"   🗄️  {store.summary()}")
+        
+        pruned = store.prune(self.keep_backups)
+        if pruned["manifests"]:
+            print(f"   🧹 Pruned {pruned['manifests']} old backups ({pruned['objects']} unreferenced objects)")
+        return manifest_path
+        
+    def download_latest_framework(self) -> "ZipSource":
+        """Download latest framework version (or reuse the host-wide cached artifact)"""
+        print(f"📥 Downloading latest framework version...")
+        
+        # The main branch archive is cached under the release version it was fetched for;
+        # without a known release version it is always downloaded fresh
+        download_url = f"{GITHUB_REPO}/archive/refs/heads/main.zip"
+        return self._fetch_url_source(download_url, version=self.release_version,
+                                      refresh=self.release_version is None)
+        
+    def fetch_framework_source(self):
+        """Framework source: --source directory, zip or mirror URL, else GitHub
+
+        Zips are read in place (see ZipSource); nothing is extracted to a temp dir.
+        """
+        from .artifact_cache import is_url, verify_artifact
+        from .delta import DirectorySource
+        
+        if not self.source:
+            return self.download_latest_framework()
+        if is_url(self.source):
+            return self._fetch_url_source(self.source)
+            
+        source = Path(self.source).expanduser()
+        if source.is_dir():
+            framework_source = DirectorySource(self._find_framework_root(source))
+        elif source.is_file():
+            # Checksum (with --sha256) and zip structure are checked before reading
+            verify_artifact(source, self.source_sha256)
+            framework_source = self._open_framework_zip(source)
+        else:
+            raise Exception(f"Framework source not found: {source}")
+            
+        print(f"✅ Using local framework source: {framework_source}")
+        return framework_source
+        
+    def _fetch_url_source(self, url: str, version: Optional[str] = None, refresh: bool = False) -> "ZipSource":
+        """Fetch a framework zip through the artifact cache and open it"""
+        from .artifact_cache import ArtifactCache
+        
+        cache = ArtifactCache(self.artifact_cache_dir)
+        try:
+            zip_path = cache.fetch(url, version=version, sha256=self.source_sha256,
+                                   refresh=refresh or self.refresh_cache)
+            framework_source = self._open_framework_zip(zip_path)
+        except Exception as e:
+            print(f"❌ Error downloading framework: {e}")
+            raise
+            
+        # Later updates to this version (from any project on this host) reuse the artifact
+        source_version = self._source_version(framework_source)
+        if source_version:
+            cache.remember_version(zip_path.stem, source_version)
+            
+        return framework_source
+        
+    def _open_framework_zip(self, zip_path: Path) -> "ZipSource":
+        """Open a framework zip for member-by-member reads (closed by cleanup_source)"""
+        from .delta import ZipSource
+        
+        self.framework_source = ZipSource(zip_path)
+        return self.framework_source
+        
+    def _find_framework_root(self, directory: Path) -> Path:
+        """The framework tree itself, or the single ai-doc-framework* directory inside an archive"""
+        if (directory / "VERSION").exists() or (directory / "tools").is_dir():
+            return directory
+            
+        extracted_dirs = [d for d in directory.iterdir() if d.is_dir() and d.name.startswith('ai-doc-framework')]
+        if not extracted_dirs:
+            raise Exception("Could not find extracted framework directory")
+        return extracted_dirs[0]
+        
+    def _source_version(self, source) -> Optional[str]:
+        """Version declared by a framework source"""
+        version = (source.read_text("VERSION") or "").strip()
+        return version or None
+        
+    def cleanup_source(self):
+        """Close the zip a downloaded or local archive source is read from"""
+        if self.framework_source:
+            self.framework_source.close()
+            self.framework_source = None
+            
+    def compute_framework_delta(self, source) -> Tuple["FrameworkDelta", Dict[str, str]]:
+        """Delta from the installed framework to source, plus the resulting manifest"""
+        from .delta import build_manifest, load_manifest_cache, compute_delta, text_digest
+        
+        source_manifest = source.manifest(self.update_include)
+        # VERSION is written from the target version, not copied
+        source_manifest["VERSION"] = text_digest(self.target_version)
+        
+        installed = {}
+        if self.framework_dir.exists():
+            installed = build_manifest(self.framework_dir, load_manifest_cache(self.framework_dir),
+                                       include=self.update_include)
+            
+        return compute_delta(installed, source_manifest), source_manifest
+        
+    def update_framework_files(self, source):
+        """Update framework files from source: stage, validate, then swap in"""
+        print(f"🔄 Updating framework files...")
+        
+        # The live framework stays untouched until the staged copy validates
+        staging_dir = self.stage_framework(source)
+        if not self.validate_update(framework_dir=staging_dir, framework_only=True):
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise Exception("Staged framework failed validation; current installation left untouched")
+            
+        self.activate_framework(staging_dir)
+        
+    def stage_framework(self, source) -> Path:
+        """Stage the new framework in a sibling directory, writing only the delta"""
+        from .delta import apply_delta, save_manifest_cache
+        
+        # Leftovers from an interrupted update
+        for stale in self.project_root.glob(f"{self.framework_dir.name}.staging-*"):
+            shutil.rmtree(stale, ignore_errors=True)
+            
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        staging_dir = self.project_root / f"{self.framework_dir.name}.staging-{timestamp}"
+        
+        delta, source_manifest = self.compute_framework_delta(source)
+        if self.framework_dir.exists():
+            # Safe to hardlink: the delta replaces files by rename, never in place
+            SnapshotCopier().snapshot_tree(self.framework_dir, staging_dir, hardlink=True)
+            for cache_dir in list(staging_dir.rglob("__pycache__")):
+                shutil.rmtree(cache_dir, ignore_errors=True)
+        else:
+            staging_dir.mkdir()
+            
+        # Only delta files are written, streamed straight from the source into staging
+        apply_delta(delta, source, staging_dir, overrides={"VERSION": self.target_version})
+        save_manifest_cache(staging_dir, source_manifest)
+        self.framework_delta = delta
+        
+        print(f"✅ Staged new framework (v{self.target_version}) in: {staging_dir.name}")
+        print(f"   🔀 {delta.summary()}")
+        return staging_dir
+        
+    def activate_framework(self, staging_dir: Path):
+        """Swap the staged framework in; the old one is kept for O(1) rollback"""
+        # Only one previous version is kept
+        if self.previous_framework_dir.exists():
+            shutil.rmtree(self.previous_framework_dir)
+            
+        if self.framework_dir.exists():
+            exchange_paths(staging_dir, self.framework_dir)
+            os.rename(staging_dir, self.previous_framework_dir)
+            print(f"✅ Activated new framework (previous version kept in {self.previous_framework_dir.name})")
+        else:
+            os.rename(staging_dir, self.framework_dir)
+            print(f"✅ Activated new framework: {self.framework_dir}")
+            
+        self.framework_swapped = True
+        
+    def rollback_framework(self) -> bool:
+        """Swap the previous framework version back in with a rename"""
+        if not self.previous_framework_dir.exists():
+            print(f"❌ No previous framework version in {self.previous_framework_dir.name}")
+            return False
+            
+        if self.framework_dir.exists():
+            # The replaced version becomes 'previous', so the swap can be undone too
+            exchange_paths(self.previous_framework_dir, self.framework_dir)
+        else:
+            os.rename(self.previous_framework_dir, self.framework_dir)
+            
+        self.framework_swapped = False
+        print(f"✅ Restored previous framework directory")
+        return True
+        
+    def migrate_configuration(self):
+        """Migrate project files to the target version in one composed pass"""
+        from .version_manager import VersionManager
+        
+        plan = VersionManager(str(self.project_root)).plan_migration(self.current_version, self.target_version)
+        for note in plan.resolution_notes():
+            print(f"⚠️  Warning: {note}")
+        print(f"🔄 Migrating project: {plan.describe()}")
+        
+        try:
+            result = plan.apply(self.project_root, framework_dir=self.framework_dir)
+        except Exception as e:
+            print(f"❌ Error migrating configuration: {e}")
+            raise
+        
+        for path in result['created']:
+            print(f"✅ Added {path}")
+        for path in result['updated']:
+            print(f"✅ Migrated {path}")
+        print(f"✅ Configuration migrated successfully")
+            
+    def update_project_files(self):
+        """Update project-level files"""
+        print(f"🔄 Updating project files...")
+        
+        # Update MANAGE_RULES.md if it doesn't exist
+        manage_rules_file = self.project_root / "MANAGE_RULES.md"
+        if not manage_rules_file.exists():
+            template_file = self.framework_dir / "templates" / "core-files" / "MANAGE_RULES.md"
+            if template_file.exists():
+                # Rendered like a scaffold would, not copied with its Jinja tags
+                from .templating import render_project_template
+                manage_rules_file.write_text(render_project_template(
+                    self.framework_dir, self.project_root, "core-files/MANAGE_RULES.md", self.config_path),
+                    encoding='utf-8')
+                print(f"✅ Added MANAGE_RULES.md")
+        
+        # Update CHANGELOG.md if it doesn't exist
+        changelog_file = self.project_root / "CHANGELOG.md"
+        if not changelog_file.exists():
+            framework_changelog = self.framework_dir / "CHANGELOG.md"
+            if framework_changelog.exists():
+                shutil.copy2(framework_changelog, changelog_file)
+                print(f"✅ Added CHANGELOG.md")
+        
+    def validate_update(self, framework_dir: Optional[Path] = None, framework_only: bool = False) -> bool:
+        """Validate that update was successful (or that a staged framework is usable)"""
+        framework_dir = Path(framework_dir) if framework_dir else self.framework_dir
+        print(f"🔍 Validating {'staged framework' if framework_only else 'update'}...")
+        
+        validation_checks = []
+        
+        # Check VERSION file
+        version_file = framework_dir / "VERSION"
+        if version_file.exists():
+            version = version_file.read_text().strip()
+            if version == self.target_version:
+                validation_checks.append(("VERSION file", True))
+            else:
+                validation_checks.append(("VERSION file", False, f"Expected {self.target_version}, got {version}"))
+        else:
+            validation_checks.append(("VERSION file", False, "File not found"))
+        
+        # Check conflict detector
+        conflict_detector = framework_dir / "tools" / "conflict-detector.py"
+        if conflict_detector.exists():
+            validation_checks.append(("Conflict detector", True))
+        else:
+            validation_checks.append(("Conflict detector", False, "Tool not found"))
+            
+        if framework_only:
+            # Only the files the delta wrote are re-hashed
+            if self.framework_delta:
+                from .delta import verify_delta
+                problems = verify_delta(self.framework_delta, framework_dir)
+                if problems:
+                    validation_checks.append(("Delta integrity", False, "; ".join(problems[:5])))
+                else:
+                    validation_checks.append(("Delta integrity", True))
+                    
+            # Load the staged detector in-process before it goes live
+            if conflict_detector.exists():
+                from .conflict_detector import health_check_installation
+                problems = health_check_installation(framework_dir)
+                if problems:
+                    validation_checks.append(("Conflict detector health", False, "; ".join(problems)))
+                else:
+                    validation_checks.append(("Conflict detector health", True))
+            return self._report_validation(validation_checks)
+        
+        # Check configuration
+        if self.config_path.exists():
+            try:
+                with open(self.config_path, 'r') as f:
+                    config = json.load(f)
+                    
+                if config.get('framework_version') == self.target_version:
+                    validation_checks.append(("Configuration version", True))
+                else:
+                    validation_checks.append(("Configuration version", False, "Version not updated"))
+                    
+            except Exception as e:
+                validation_checks.append(("Configuration file", False, str(e)))
+        else:
+            validation_checks.append(("Configuration file", False, "File not found"))
+        
+        # Check MANAGE_RULES.md
+        manage_rules = self.project_root / "MANAGE_RULES.md"
+        if manage_rules.exists():
+            validation_checks.append(("MANAGE_RULES.md", True))
+        else:
+            validation_checks.append(("MANAGE_RULES.md", False, "File not found"))
+        
+        return self._report_validation(validation_checks)
+        
+    def _report_validation(self, validation_checks: List[Tuple]) -> bool:
+        """Print validation results"""
+        all_passed = True
+        for check in validation_checks:
+            if check[1]:  # Success
+                print(f"✅ {check[0]}: OK")
+            else:  # Failure
+                print(f"❌ {check[0]}: FAILED - {check[2] if len(check) > 2 else 'Unknown error'}")
+                all_passed = False
+        
+        return all_passed
+        
+    def run_post_update_tasks(self):
+        """Run post-update tasks"""
+        print(f"🔄 Running post-update tasks...")
+        
+        # Test conflict detection in-process (--health-check equivalent, no project scan)
+        try:
+            from .conflict_detector import health_check_installation
+            
+            if (self.framework_dir / "tools" / "conflict-detector.py").exists():
+                problems = health_check_installation(self.framework_dir)
+                
+                if not problems:
+                    print(f"✅ Conflict detection tool working")
+                else:
+                    print(f"⚠️  Warning: Conflict detection tool may have issues")
+                    for problem in problems:
+                        print(f"   - {problem}")
+            
+        except Exception as e:
+            print(f"⚠️  Warning: Could not test conflict detection: {e}")
+        
+        # Update file permissions
+        try:
+            tools_dir = self.framework_dir / "tools"
+            for tool_file in tools_dir.glob("*.py"):
+                tool_file.chmod(0o755)
+            print(f"✅ Updated tool permissions")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not update permissions: {e}")
+        
+    def _create_archive_backup(self, destination: Optional[str] = None) -> Path:
+        """Stream a compressed tar backup with an embedded checksum manifest"""
+        from .backup_archive import write_backup_archive
+        
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        archive_name = f"backup-{timestamp}.tar.{self.archive_format}"
+        if destination and destination.endswith(tuple(f".tar.{fmt}" for fmt in ARCHIVE_FORMATS)):
+            archive_path = Path(destination)
+        else:
+            archive_path = Path(destination or self.project_root) / archive_name
+            
+        print(f"📦 Creating backup archive: {archive_path}")
+        started = time.monotonic()
+        
+        paths = self.critical_files + ["ai-doc-framework"] + self._application_names()
+        stats = write_backup_archive(self.project_root, paths, archive_path,
+                                     metadata={"kind": "update", "version": self.current_version},
+                                     exclude=[self.project_root / BACKUP_STORE_DIRNAME])
+        
+        self.backup_archive = archive_path
+        self.backup_dir = archive_path
+        print(f"✅ Backup completed: {archive_path.name} ({time.monotonic() - started:.1f}s)")
+        print(f"   📼 {stats['files']} files, {stats['bytes_in'] / 1024 / 1024:.1f} MB -> "
+              f"{stats['bytes_out'] / 1024 / 1024:.1f} MB compressed")
+        return archive_path
+        
+    def rollback_update(self):
+        """Rollback to previous version"""
+        # A swapped-in framework is rolled back by swapping the kept version back (O(1))
+        framework_restored = self.framework_swapped and self.rollback_framework()
+        
+        if self.backup_manifest:
+            return self._rollback_from_store(framework_restored)
+        if self.backup_archive:
+            return self._rollback_from_archive(framework_restored)
+            
+        if not self.backup_dir or not self.backup_dir.exists():
+            if framework_restored:
+                print(f"⚠️  No backup found: framework restored, project files left as they are")
+                return True
+            print(f"❌ No backup found, cannot rollback")
+            return False
+        
+        print(f"🔄 Rolling back to previous version...")
+        
+        try:
+            # Restore framework directory
+            framework_backup = self.backup_dir / "ai-doc-framework"
+            if not framework_restored and framework_backup.exists():
+                if self.framework_dir.exists():
+                    shutil.rmtree(self.framework_dir)
+                    
+                # Never hardlink back: the backup must survive edits to the restored tree
+                SnapshotCopier().snapshot_tree(framework_backup, self.framework_dir)
+                print(f"✅ Restored framework directory")
+            
+            # Restore configuration
+            config_backup = self.backup_dir / "ai-doc-config.json"
+            if config_backup.exists():
+                shutil.copy2(config_backup, self.config_path)
+                print(f"✅ Restored configuration")
+            
+            # Restore other files
+            for file_name in ["AI_RULES.md", "START_TASK.md", "COMPLETE_TASK.md"]:
+                backup_file = self.backup_dir / file_name
+                target_file = self.project_root / file_name
+                if backup_file.exists():
+                    shutil.copy2(backup_file, target_file)
+                    print(f"✅ Restored {file_name}")
+            
+            print(f"✅ Rollback completed successfully")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error during rollback: {e}")
+            return False
+            
+    def _rollback_roots(self, framework_restored: bool) -> List[str]:
+        """Backup roots to restore; the framework is skipped if it was swapped back"""
+        return self.critical_files + ([] if framework_restored else ["ai-doc-framework"])
+        
+    def _rollback_from_store(self, framework_restored: bool = False) -> bool:
+        """Restore the framework and project files from a backup manifest"""
+        print(f"🔄 Rolling back to backup {Path(self.backup_manifest).stem}...")
+        
+        try:
+            # Only files whose content differs from the manifest are rewritten
+            stats = self.backup_store.restore(self.backup_manifest, self.project_root,
+                                              roots=self._rollback_roots(framework_restored))
+            print(f"✅ Restored {stats['restored']} files, removed {stats['removed']}, "
+                  f"{stats['unchanged']} already matched")
+            print(f"✅ Rollback completed successfully")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error during rollback: {e}")
+            return False
+            
+    def _rollback_from_archive(self, framework_restored: bool = False) -> bool:
+        """Restore the framework and project files from a backup archive"""
+        from .backup_archive import restore_backup_archive
+        
+        print(f"🔄 Rolling back from archive {Path(self.backup_archive).name}...")
+        
+        try:
+            # Only differing files are extracted, each verified against its checksum
+            stats = restore_backup_archive(self.backup_archive, self.project_root,
+                                           roots=self._rollback_roots(framework_restored))
+            print(f"✅ Restored {stats['restored']} files, removed {stats['removed']}, "
+                  f"{stats['unchanged']} already matched")
+            print(f"✅ Rollback completed successfully")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error during rollback: {e}")
+            return False
+            
+    def list_backups(self, store_dir: Optional[str] = None):
+        """Print the backups held in the store"""
+        store = BackupStore(store_dir or self.project_root / BACKUP_STORE_DIRNAME)
+        backups = store.list_backups()
+        if not backups:
+            print(f"📭 No backups in {store.store_dir}")
+            return
+            
+        print(f"🗄️  Backups in {store.store_dir}:")
+        for backup in backups:
+            print(f"   📦 {backup['id']:<28} v{backup['version'] or '?':<8} {backup['files']:>6} files  {backup['created']}")
+            
+    def restore_backup(self, backup_id: str, store_dir: Optional[str] = None) -> bool:
+        """Roll back to a specific backup in the store, or to a backup archive file"""
+        if backup_id.endswith(tuple(f".tar.{fmt}" for fmt in ARCHIVE_FORMATS)):
+            self.backup_archive = Path(backup_id)
+            if not self.backup_archive.exists():
+                print(f"❌ Backup archive not found: {backup_id}")
+                return False
+            return self.rollback_update()
+            
+        self.backup_store = BackupStore(store_dir or self.project_root / BACKUP_STORE_DIRNAME)
+        self.backup_manifest = self.backup_store.manifests_dir / f"{backup_id}.json"
+        if not self.backup_manifest.exists():
+            print(f"❌ Backup not found: {backup_id}")
+            return False
+        return self.rollback_update()
+        
+    def update(self, auto: bool = False, dry_run: bool = False, force: bool = False) -> bool:
+        """Main update process"""
+        try:
+            return self._update(auto, dry_run, force)
+        finally:
+            self.cleanup_source()
+            
+    def _update(self, auto: bool, dry_run: bool, force: bool) -> bool:
+        """Update steps; update() closes the framework source afterwards"""
+        print(f"🔄 AI Documentation Framework Update System")
+        print(f"=" * 50)
+        
+        # Detect current version
+        self.current_version = self.detect_current_version()
+        
+        framework_source = None
+        if self.source:
+            # A --source tree declares its own version; GitHub is not queried
+            try:
+                framework_source = self.fetch_framework_source()
+            except Exception as e:
+                print(f"❌ Update failed: {e}")
+                return False
+            self.target_version = self._source_version(framework_source) or self.target_version
+            
+        if not force:
+            # Check if update is needed
+            if framework_source:
+                needs_update = (not self.current_version or
+                                self._compare_versions(self.target_version, self.current_version) > 0)
+            else:
+                needs_update, latest_version = self.check_for_updates()
+                self.target_version = latest_version
+            
+            if not needs_update and self.current_version:
+                print(f"✅ Already up to date (v{self.current_version})")
+                return True
+        
+        print(f"📋 Current version: {self.current_version or 'Unknown'}")
+        print(f"📋 Target version: {self.target_version}")
+        
+        if dry_run:
+            print(f"🔍 DRY RUN - No changes will be made")
+            print(f"Would update from {self.current_version} to {self.target_version}")
+            try:
+                from .version_manager import VersionManager
+                plan = VersionManager(str(self.project_root)).plan_migration(self.current_version, self.target_version)
+                changes = plan.apply(self.project_root, framework_dir=self.framework_dir, dry_run=True)
+                for note in plan.resolution_notes():
+                    print(f"⚠️  Warning: {note}")
+                print(f"Would migrate project: {plan.describe()}")
+                for path in changes['created'] + changes['updated']:
+                    print(f"  ~ {path}")
+            except Exception as e:
+                print(f"⚠️  Warning: Could not plan project migration: {e}")
+            try:
+                framework_source = framework_source or self.fetch_framework_source()
+                self.compute_framework_delta(framework_source)[0].print_delta()
+            except Exception as e:
+                print(f"⚠️  Warning: Could not compute framework delta: {e}")
+            return True
+        
+        if not auto:
+            response = input(f"\n🤔 Proceed with update? (y/N): ").strip().lower()
+            if response != 'y':
+                print(f"❌ Update cancelled by user")
+                return False
+        
+        try:
+            # Create backup
+            backup_path = self.create_backup(self.backup_location)
+            
+            # Download latest framework (unless a local source was given)
+            framework_source = framework_source or self.fetch_framework_source()
+            
+            # Update framework files
+            self.update_framework_files(framework_source)
+            
+            # Migrate configuration
+            self.migrate_configuration()
+            
+            # Update project files
+            self.update_project_files()
+            
+            # Validate update
+            if not self.validate_update():
+                print(f"❌ Update validation failed")
+                if not auto:
+                    response = input(f"🤔 Rollback to previous version? (Y/n): ").strip().lower()
+                    if response != 'n':
+                        return self.rollback_update()
+                return False
+            
+            # Run post-update tasks
+            self.run_post_update_tasks()
+            
+            print(f"\n✅ Update completed successfully!")
+            print(f"📋 Updated from {self.current_version} to {self.target_version}")
+            print(f"📦 Backup available at: {backup_path}")
+            print(f"\n🎯 Next steps:")
+            print(f"   1. Review CHANGELOG.md for new features")
+            print(f"   2. Test conflict detection: python3 ai-doc-framework/tools/conflict-detector.py")
+            print(f"   3. Try rule management with MANAGE_RULES.md")
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ Update failed: {e}")
+            
+            if not auto:
+                response = input(f"🤔 Rollback to previous version? (Y/n): ").strip().lower()
+                if response != 'n':
+                    return self.rollback_update()
+            
+            return False
+
+def main():
+    """Main entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='🔄 AI Documentation Framework Update System'
+    )
+    
+    parser.add_argument('--auto', action='store_true',
+                      help='Automatic update without prompts')
+    parser.add_argument('--from-version', type=str,
+                      help='Specify current version for migration')
+    parser.add_argument('--backup-dir', type=str,
+                      help='Custom backup directory')
+    parser.add_argument('--backup-mode', type=str, default='store', choices=BACKUP_MODES,
+                      help='store: deduplicated backup store; snapshot: hardlinks/reflinks/parallel copy; '
+                           'copy: full copy; archive: streaming .tar.gz/.tar.xz (default: store)')
+    parser.add_argument('--archive-format', type=str, default='gz', choices=ARCHIVE_FORMATS,
+                      help='Compression for --backup-mode archive (default: gz)')
+    parser.add_argument('--keep-backups', type=int, default=DEFAULT_KEEP_BACKUPS,
+                      help=f'Backups kept in the store (default: {DEFAULT_KEEP_BACKUPS})')
+    parser.add_argument('--list-backups', action='store_true',
+                      help='List backups in the store and exit')
+    parser.add_argument('--restore-backup', type=str, metavar='ID|ARCHIVE',
+                      help='Roll back to a backup from the store (or a backup archive) and exit')
+    parser.add_argument('--rollback', action='store_true',
+                      help='Swap the previous framework version (ai-doc-framework.previous) back in and exit')
+    parser.add_argument('--source', type=str, metavar='PATH|URL',
+                      help='Update from a local framework directory, zip or mirror URL instead of GitHub')
+    parser.add_argument('--sha256', type=str, metavar='HEX',
+                      help='Expected sha256 of the framework zip (verified before use)')
+    parser.add_argument('--cache-dir', type=str,
+                      help='Release artifact cache shared by projects on this host '
+                           '(default: ~/.ai-doc-framework-cache/artifacts)')
+    parser.add_argument('--refresh-cache', action='store_true',
+                      help='Download again even if the artifact is cached')
+    parser.add_argument('--all-files', action='store_true',
+                      help='Update the whole release tree, not just tools/, templates/, VERSION and CHANGELOG.md')
+    parser.add_argument('--dry-run', action='store_true',
+                      help='Show the files that would be added, changed or removed without making changes')
+    parser.add_argument('--force', action='store_true',
+                      help='Force update even if versions match')
+    parser.add_argument('--config', type=str,
+                      help='Path to ai-doc-config.json')
+    parser.add_argument('--version', action='version', version=f'update-framework {CURRENT_VERSION}')
+    
+    args = parser.parse_args()
+    
+    try:
+        # Initialize updater
+        updater = FrameworkUpdater(
+            project_root=".",
+            config_path=args.config,
+            backup_mode=args.backup_mode,
+            keep_backups=args.keep_backups,
+            archive_format=args.archive_format
+        )
+        updater.backup_location = args.backup_dir
+        updater.source = args.source
+        updater.source_sha256 = args.sha256
+        updater.artifact_cache_dir = args.cache_dir
+        updater.refresh_cache = args.refresh_cache
+        if args.all_files:
+            updater.update_include = None
+        
+        if args.list_backups:
+            updater.list_backups(args.backup_dir)
+            sys.exit(0)
+        if args.restore_backup:
+            sys.exit(0 if updater.restore_backup(args.restore_backup, args.backup_dir) else 1)
+        if args.rollback:
+            sys.exit(0 if updater.rollback_framework() else 1)
+        
+        # Override detected version if specified
+        if args.from_version:
+            updater.current_version = args.from_version
+        
+        # Run update
+        success = updater.update(
+            auto=args.auto,
+            dry_run=args.dry_run,
+            force=args.force
+        )
+        
+        sys.exit(0 if success else 1)
+        
+    except KeyboardInterrupt:
+        print(f"\n⚠️  Update cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Update system error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
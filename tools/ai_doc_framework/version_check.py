@@ -0,0 +1,214 @@
+"""
+🛰️ AI Documentation Framework - Latest Release Checks
+One client for "what is the latest release?", shared by version-manager.py
+and update-framework.py.
+
+Answers come from, in order:
+    memory      Earlier answer in the same process
+    disk cache  ~/.ai-doc-framework-cache/latest-release.json while younger than
+                the TTL (AI_DOC_FRAMEWORK_VERSION_TTL, default 1 hour)
+    network     GitHub releases API with If-None-Match, so an unchanged
+                release costs a 304 with no body
+
+Requests go through urllib, so HTTP(S)_PROXY and redirects work as for any
+other download. Connect and read timeouts are separate and strict. When the
+network fails, the last known (stale) answer is used. With background=True a
+stale cache answers immediately while a thread refreshes it; the process
+waits up to BACKGROUND_JOIN_TIMEOUT for that refresh at exit.
+"""
+
+import os
+import json
+import time
+import atexit
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+RELEASES_API = "https://api.github.com/repos/zsarir/ai-doc-framework/releases/latest"
+VERSION_CACHE_FILE = Path.home() / ".ai-doc-framework-cache" / "latest-release.json"
+DEFAULT_TTL = 3600.0
+DEFAULT_CONNECT_TIMEOUT = 3.0
+BACKGROUND_JOIN_TIMEOUT = 2.0
+
+def version_check_ttl() -> float:
+    """Cache lifetime in seconds (AI_DOC_FRAMEWORK_VERSION_TTL, default 1 hour)"""
+    try:
+        return float(os.environ.get('AI_DOC_FRAMEWORK_VERSION_TTL', DEFAULT_TTL))
+    except ValueError:
+        return DEFAULT_TTL
+
+class VersionCheckClient:
+    """Latest-release lookups with a TTL cache and conditional requests"""
+
+    def __init__(self, url: str = RELEASES_API, cache_file: Optional[Path] = None,
+                 ttl: Optional[float] = None, connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: Optional[float] = None):
+        from .artifact_cache import network_timeout
+
+        self.url = url
+        self.cache_file = Path(cache_file) if cache_file else VERSION_CACHE_FILE
+        self.ttl = version_check_ttl() if ttl is None else ttl
+        self.connect_timeout = connect_timeout
+        self.read_timeout = network_timeout() if read_timeout is None else read_timeout
+        self.stats = {'requests': 0, 'not_modified': 0, 'cache_hits': 0, 'errors': 0}
+        self._memo: Optional[str] = None
+        self._answered = False  # Memo is set (possibly None: unknown and unreachable)
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._exit_wait_registered = False
+
+    # ----- disk cache -------------------------------------------------------
+
+    def _load_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        # One cache file may be shared by clients for different URLs
+        return entry if isinstance(entry, dict) and entry.get('url') == self.url else {}
+
+    def _save_cache(self, entry: Dict[str, Any]):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_file.parent, prefix=".latest-release-")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(temp_path, self.cache_file)
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return bool(entry.get('version')) and time.time() - entry.get('checked_at', 0) < self.ttl
+
+    # ----- network ----------------------------------------------------------
+
+    def _opener(self):
+        """urllib opener (environment proxies, redirects) whose connections switch to
+        the read timeout once connected"""
+        import http.client
+        import urllib.request
+
+        read_timeout = self.read_timeout
+
+        def with_read_timeout(connection_class):
+            class Connection(connection_class):
+                def connect(self):
+                    super().connect()
+                    self.sock.settimeout(read_timeout)
+            return Connection
+
+        http_connection = with_read_timeout(http.client.HTTPConnection)
+        https_connection = with_read_timeout(http.client.HTTPSConnection)
+
+        class HTTPHandler(urllib.request.HTTPHandler):
+            def http_open(self, req):
+                return self.do_open(http_connection, req)
+
+        class HTTPSHandler(urllib.request.HTTPSHandler):
+            def https_open(self, req):
+                return self.do_open(https_connection, req, context=self._context)
+
+        return urllib.request.build_opener(HTTPHandler, HTTPSHandler)
+
+    def _request(self, etag: Optional[str]):
+        """GET the releases endpoint; returns (status, etag, body)"""
+        import urllib.error
+        import urllib.request
+
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'ai-doc-framework-version-check'
+        }
+        if etag:
+            headers['If-None-Match'] = etag
+        request = urllib.request.Request(self.url, headers=headers)
+        try:
+            with self._opener().open(request, timeout=self.connect_timeout) as response:
+                return response.status, response.headers.get('ETag'), response.read()
+        except urllib.error.HTTPError as e:
+            # 304 Not Modified (and any error status) arrives as an exception; its body is unused
+            e.close()
+            return e.code, e.headers.get('ETag'), b''
+
+    def _fetch(self, entry: Dict[str, Any]) -> Optional[str]:
+        """Revalidate against the API and update the cache; None on failure"""
+        import http.client
+
+        self.stats['requests'] += 1
+        try:
+            status, etag, body = self._request(entry.get('etag') if entry.get('version') else None)
+            if status == 304:
+                self.stats['not_modified'] += 1
+                version = entry['version']
+            elif status == 200:
+                version = json.loads(body.decode('utf-8'))['tag_name'].lstrip('v')
+                entry = {'url': self.url, 'version': version, 'etag': etag}
+            else:
+                raise http.client.HTTPException(f"HTTP {status}")
+        except (OSError, http.client.HTTPException, ValueError, KeyError):
+            self.stats['errors'] += 1
+            return None
+
+        entry['checked_at'] = time.time()
+        try:
+            self._save_cache(entry)
+        except OSError:
+            pass
+        return version
+
+    # ----- lookup -----------------------------------------------------------
+
+    def latest_version(self, refresh: bool = False, background: bool = False,
+                       offline: bool = False) -> Optional[str]:
+        """Latest release version, or None when unknown and unreachable
+
+        refresh forces a (conditional) request; background answers a stale
+        cache immediately and refreshes it on a thread; offline never
+        touches the network and accepts a stale cache.
+        """
+        with self._lock:
+            # Ask at most once per process, even when the answer was "unreachable"
+            if self._answered and not refresh:
+                self.stats['cache_hits'] += 1
+                return self._memo
+
+            entry = self._load_cache()
+            if offline:
+                return entry.get('version')
+            if not refresh and self._is_fresh(entry):
+                self.stats['cache_hits'] += 1
+                self._memo, self._answered = entry['version'], True
+                return self._memo
+
+            if background and entry.get('version') and not refresh:
+                self.stats['cache_hits'] += 1
+                self._start_background_refresh(entry)
+                return entry['version']
+
+            version = self._fetch(entry) or entry.get('version')
+            self._memo, self._answered = version, True
+            return version
+
+    def _start_background_refresh(self, entry: Dict[str, Any]):
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(target=self._fetch, args=(dict(entry),), daemon=True)
+        self._refresh_thread.start()
+        # Daemon, so a hung request cannot block exit, but a quick one still lands in the cache
+        if not self._exit_wait_registered:
+            atexit.register(self.wait_for_refresh, BACKGROUND_JOIN_TIMEOUT)
+            self._exit_wait_registered = True
+
+    def wait_for_refresh(self, timeout: Optional[float] = None):
+        """Wait for a background refresh started by latest_version(background=True)"""
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout)
+
+_default_client: Optional[VersionCheckClient] = None
+
+def default_version_client() -> VersionCheckClient:
+    """Process-wide client, so every caller shares one answer and one request"""
+    global _default_client
+    if _default_client is None:
+        _default_client = VersionCheckClient()
+    return _default_client
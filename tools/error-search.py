@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+🔎 AI Documentation Framework - Error Search
+Ranked search over documented errors (project and application
+error-management/ folders), backed by an incrementally updated index
+
+Usage:
+    python tools/error-search.py "connection refused" [options]
+    python tools/error-search.py                     # Update the index, show its size
+
+Options:
+    --category CAT      Only errors with this category
+    --app NAME          Only errors documented by this application
+    --severity LEVEL    Only errors with this severity
+    --status STATUS     Only errors with this status
+    --section NAME      Only match terms in one ERROR_TEMPLATE.md section (e.g. resolution)
+    --limit N           Maximum results (default: 10)
+    --format FORMAT     Output format (console, json)
+    --no-refresh        Do not check for changed error files first
+    --rebuild           Re-index every error file
+"""
+
+import os
+import sys
+
+# The implementation lives in the importable ai_doc_framework package
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from ai_doc_framework.error_search import *  # noqa: F401,F403
+from ai_doc_framework.error_search import main
+
+if __name__ == "__main__":
+    main()
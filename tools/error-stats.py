@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+📈 AI Documentation Framework - Error Statistics
+Regenerates the ERROR STATISTICS and PERFORMANCE METRICS sections of
+error-management/MASTER_ERROR_INDEX.md from the error entries' front matter
+
+Usage:
+    python tools/error-stats.py [options]
+
+Options:
+    --project-path PATH Path to project root
+    --check             Exit 1 if the statistics are out of date (no changes made)
+    --format FORMAT     Output format (console, json)
+"""
+
+import os
+import sys
+
+# The implementation lives in the importable ai_doc_framework package
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from ai_doc_framework.error_stats import *  # noqa: F401,F403
+from ai_doc_framework.error_stats import main
+
+if __name__ == "__main__":
+    main()
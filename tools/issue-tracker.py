@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+🗂️ AI Documentation Framework - Issue Tracker
+Answers issue queries from an incrementally updated index of issues/open and
+issues/closed (project and applications) and regenerates ISSUE_TRACKER.md
+
+Usage:
+    python tools/issue-tracker.py                                # Open/closed counts per category
+    python tools/issue-tracker.py list --app api --category incomplete-tasks
+    python tools/issue-tracker.py update-tracker [--check]
+
+Options:
+    --project-path PATH Path to project root
+    --verify            Also stat every issue file (catches edits inside existing issues)
+    --no-refresh        Answer from the index as it is
+"""
+
+import os
+import sys
+
+# The implementation lives in the importable ai_doc_framework package
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from ai_doc_framework.issue_index import *  # noqa: F401,F403
+from ai_doc_framework.issue_index import main
+
+if __name__ == "__main__":
+    main()
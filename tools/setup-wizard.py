@@ -2,25 +2,74 @@
 """
 AI Documentation Framework Setup Wizard
 Interactive setup tool for configuring the AI Documentation Framework
+
+Usage:
+    python tools/setup-wizard.py                          # Interactive prompts
+    python tools/setup-wizard.py --from-config FILE       # No prompts: scaffold every
+                                                          # application in FILE
+    python tools/setup-wizard.py --from-config FILE --jobs 16
+    python tools/setup-wizard.py --from-config FILE --force
+                                                          # Also replace locally
+                                                          # edited files
+    python tools/setup-wizard.py sync-templates [--check] [--force]
+                                                          # Re-render, write only
+                                                          # files that changed
 """
 
 import os
 import sys
 import json
-import shutil
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 import click
 from colorama import init, Fore, Style
+from jinja2 import Environment
+
+# Shared implementation lives in the importable ai_doc_framework package
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from ai_doc_framework.project_files import (TEMPLATE_STATE_FILE, content_digest, load_template_state,
+                                             write_text_atomic)
+from ai_doc_framework.templating import (create_template_environment, template_context,
+                                         DEFAULT_ERROR_CATEGORIES, DEFAULT_ISSUE_CATEGORIES)
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+# templates/<dir> -> project directory ('' for the project root)
+TEMPLATE_TARGETS = [
+    ('core-files', ''),
+    ('documentation', 'docs'),
+    ('error-management', 'error-management'),
+    ('issue-management', 'issues'),
+]
+
+# Rendered once per application from templates/application/
+APP_TEMPLATES = ['AI_RULES.md', 'START_TASK.md', 'COMPLETE_TASK.md', 'CREATE_ISSUE_DIRECTORIES.md']
+
+def read_text_if_exists(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding='utf-8')
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+
+def default_jobs() -> int:
+    """Bounded writer pool size (same default as ThreadPoolExecutor: CPU count + 4, max 32)"""
+    return min(32, (os.cpu_count() or 1) + 4)
+
 class SetupWizard:
     def __init__(self):
         self.config = {}
         self.project_root = Path.cwd()
         self.framework_root = Path(__file__).parent.parent
+        self._template_env = None
+        self.render_date = None  # Pinned from the template state so re-renders are stable across days
+        self.rendered = {}  # Target -> sha256 of the content last written or confirmed
+        self._rendered_lock = threading.Lock()
         
     def print_banner(self):
         """Display the setup wizard banner"""
@@ -90,7 +139,7 @@ class SetupWizard:
         print(f"\n{Fore.YELLOW}🚨 Error Management Categories{Style.RESET_ALL}")
         print("=" * 50)
         
-        default_categories = ['backend', 'frontend', 'infrastructure', 'security', 'performance']
+        default_categories = DEFAULT_ERROR_CATEGORIES
         categories = click.prompt(
             "Error categories (comma-separated)",
             default=",".join(default_categories)
@@ -103,7 +152,7 @@ class SetupWizard:
         print(f"\n{Fore.YELLOW}📋 Issue Tracking Categories{Style.RESET_ALL}")
         print("=" * 50)
         
-        default_categories = ['incomplete-tasks', 'unresolved-errors', 'system-issues']
+        default_categories = DEFAULT_ISSUE_CATEGORIES
         categories = click.prompt(
             "Issue categories (comma-separated)",
             default=",".join(default_categories)
@@ -123,12 +172,8 @@ class SetupWizard:
             'debug_mode': click.confirm("Enable debug mode", default=False)
         }
     
-    def create_directory_structure(self):
-        """Create the directory structure"""
-        print(f"\n{Fore.YELLOW}📁 Creating Directory Structure{Style.RESET_ALL}")
-        print("=" * 50)
-        
-        # Create main directories
+    def plan_directories(self) -> List[str]:
+        """Every directory the scaffold needs, relative to the project root"""
         directories = [
             'docs',
             'error-management',
@@ -139,508 +184,198 @@ class SetupWizard:
             'issues/ai-session-logs'
         ]
         
-        for directory in directories:
-            dir_path = self.project_root / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Created: {directory}")
-        
-        # Create error management categories
+        # Error management categories
         for category in self.config['error_categories']:
-            error_dir = self.project_root / 'error-management' / category
-            error_dir.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Created: error-management/{category}")
+            directories.append(f"error-management/{category}")
         
-        # Create issue categories
+        # Issue categories
         for category in self.config['issue_categories']:
-            open_dir = self.project_root / 'issues' / 'open' / category
-            closed_dir = self.project_root / 'issues' / 'closed' / category
-            open_dir.mkdir(parents=True, exist_ok=True)
-            closed_dir.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Created: issues/open/{category}")
-            print(f"✅ Created: issues/closed/{category}")
-        
-        # Create application directories
+            directories.append(f"issues/open/{category}")
+            directories.append(f"issues/closed/{category}")
+        
+        # Application directories
         for app in self.config['applications']:
-            app_dir = self.project_root / app['name']
-            app_dirs = [
-                app_dir,
-                app_dir / 'docs',
-                app_dir / 'error-management',
-                app_dir / 'issues'
-            ]
-            
-            for directory in app_dirs:
-                directory.mkdir(parents=True, exist_ok=True)
-            
-            print(f"✅ Created: {app['name']}/")
+            for subdirectory in ('', '/docs', '/error-management', '/issues'):
+                directories.append(f"{app['name']}{subdirectory}")
+        
+        return directories
+    
+    @property
+    def template_env(self) -> Environment:
+        """One Jinja2 environment per wizard, so each template is compiled once"""
+        if self._template_env is None:
+            self._template_env = create_template_environment(self.framework_root / 'templates')
+        return self._template_env
+    
+    def template_context(self) -> Dict:
+        """Variables available to every template"""
+        return template_context(self.config, self.project_root, self.render_date or self.get_current_date())
+    
+    def plan_template_files(self) -> List[Tuple[str, Callable[[], str]]]:
+        """(target, renderer) for every framework template rendered into the project"""
+        templates_dir = self.framework_root / 'templates'
+        context = self.template_context()
+        files = []
+        for template_dir, target_dir in TEMPLATE_TARGETS:
+            source_dir = templates_dir / template_dir
+            if source_dir.exists():
+                for file in sorted(source_dir.glob('*.md')):
+                    template = self.template_env.get_template(f"{template_dir}/{file.name}")
+                    target = f"{target_dir}/{file.name}" if target_dir else file.name
+                    files.append((target, partial(template.render, context)))
+        return files
+    
+    def plan_app_files(self) -> List[Tuple[str, Callable[[], str]]]:
+        """(target, renderer) for every generated application file"""
+        context = self.template_context()
+        templates = {name: self.template_env.get_template(f"application/{name}") for name in APP_TEMPLATES}
+        files = []
+        for app in self.config['applications']:
+            app_context = dict(context, app=app, app_name=app['name'],
+                               app_dir=str(self.project_root / app['name']))
+            for name, template in templates.items():
+                files.append((f"{app['name']}/{name}", partial(template.render, app_context)))
+        return files
+    
+    def write_planned_file(self, target: str, render: Callable[[], str], state: Dict,
+                           force: bool = False, check: bool = False) -> str:
+        """Render one planned file and write it if needed; returns its sync status
+        
+        A file that differs both from the new rendering and from the hashes in
+        the template state (what was last rendered, or regenerated from that
+        by error-stats / issue-tracker) has been edited locally: it is reported
+        as drifted and left alone unless force is set. check never writes.
+        """
+        path = self.project_root / target
+        expected = render()
+        current = read_text_if_exists(path)
+        if current == expected:
+            self._record_rendered(target, expected)
+            return 'unchanged'
+        
+        recorded = state['files'].get(target)
+        regenerated = state['regenerated'].get(target)
+        digest = content_digest(current) if current is not None else None
+        if digest is not None and digest == regenerated and content_digest(expected) == recorded:
+            # Generated sections rewritten from the same rendering; nothing to sync
+            return 'unchanged'
+        
+        if current is not None and not force and digest not in (recorded, regenerated):
+            return 'drifted'
+        
+        if not check:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(path, expected)
+            self._record_rendered(target, expected)
+        return 'created' if current is None else 'updated'
+    
+    def _record_rendered(self, target: str, content: str):
+        with self._rendered_lock:
+            self.rendered[target] = content_digest(content)
+    
+    def load_template_state(self) -> Dict:
+        """Hashes and render date recorded by the last scaffold, sync or regeneration"""
+        return load_template_state(self.project_root)
+    
+    def save_template_state(self):
+        """Record what is now on disk for every rendered file"""
+        state = self.load_template_state()
+        state['render_date'] = self.render_date or state['render_date'] or self.get_current_date()
+        state['files'].update(self.rendered)
+        state['files'] = dict(sorted(state['files'].items()))
+        write_text_atomic(self.project_root / TEMPLATE_STATE_FILE, json.dumps(state, indent=2))
+    
+    def sync_templates(self, jobs: Optional[int] = None, force: bool = False,
+                       check: bool = False) -> Dict[str, List[str]]:
+        """Re-render every template and write only files whose content differs
+        
+        Locally edited files are reported as drifted (see write_planned_file).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        state = self.load_template_state()
+        self.render_date = state['render_date'] or self.get_current_date()
+        files = self.plan_template_files() + self.plan_app_files()
+        
+        def sync_file(planned) -> Tuple[str, str]:
+            target, render = planned
+            return target, self.write_planned_file(target, render, state, force, check)
+        
+        result = {'created': [], 'updated': [], 'unchanged': [], 'drifted': []}
+        with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as executor:
+            # map keeps plan order, so the report is deterministic
+            for target, status in executor.map(sync_file, files):
+                result[status].append(target)
+        
+        if not check:
+            self.save_template_state()
+        return result
     
-    def copy_templates(self):
-        """Copy template files"""
-        print(f"\n{Fore.YELLOW}📄 Copying Template Files{Style.RESET_ALL}")
+    def create_directory_structure(self):
+        """Create the directory structure"""
+        print(f"\n{Fore.YELLOW}📁 Creating Directory Structure{Style.RESET_ALL}")
         print("=" * 50)
         
-        templates_dir = self.framework_root / 'templates'
+        for directory in self.plan_directories():
+            dir_path = self.project_root / directory
+            dir_path.mkdir(parents=True, exist_ok=True)
+            print(f"✅ Created: {directory}")
+    
+    def copy_templates(self, state: Dict, force: bool = False):
+        """Render the framework templates into the project"""
+        print(f"\n{Fore.YELLOW}📄 Rendering Template Files{Style.RESET_ALL}")
+        print("=" * 50)
         
-        # Copy core files
-        core_files = templates_dir / 'core-files'
-        if core_files.exists():
-            for file in core_files.glob('*.md'):
-                shutil.copy2(file, self.project_root)
-                print(f"✅ Copied: {file.name}")
-        
-        # Copy documentation templates
-        docs_templates = templates_dir / 'documentation'
-        if docs_templates.exists():
-            for file in docs_templates.glob('*.md'):
-                shutil.copy2(file, self.project_root / 'docs')
-                print(f"✅ Copied: docs/{file.name}")
-        
-        # Copy error management templates
-        error_templates = templates_dir / 'error-management'
-        if error_templates.exists():
-            for file in error_templates.glob('*.md'):
-                shutil.copy2(file, self.project_root / 'error-management')
-                print(f"✅ Copied: error-management/{file.name}")
-        
-        # Copy issue management templates
-        issue_templates = templates_dir / 'issue-management'
-        if issue_templates.exists():
-            for file in issue_templates.glob('*.md'):
-                shutil.copy2(file, self.project_root / 'issues')
-                print(f"✅ Copied: issues/{file.name}")
-    
-    def generate_app_specific_files(self):
+        for target, render in self.plan_template_files():
+            self.print_write_status(target, self.write_planned_file(target, render, state, force), "Rendered")
+    
+    def generate_app_specific_files(self, state: Dict, force: bool = False):
         """Generate application-specific files"""
         print(f"\n{Fore.YELLOW}🏗️  Generating Application-Specific Files{Style.RESET_ALL}")
         print("=" * 50)
         
-        for app in self.config['applications']:
-            app_dir = self.project_root / app['name']
-            
-            # Generate AI_RULES.md for each app
-            self.generate_ai_rules(app, app_dir)
-            
-            # Generate START_TASK.md for each app
-            self.generate_start_task(app, app_dir)
-            
-            # Generate COMPLETE_TASK.md for each app
-            self.generate_complete_task(app, app_dir)
-            
-            # Generate CREATE_ISSUE_DIRECTORIES.md for each app
-            self.generate_issue_directories(app, app_dir)
-            
-            print(f"✅ Generated files for: {app['name']}")
+        for target, render in self.plan_app_files():
+            self.print_write_status(target, self.write_planned_file(target, render, state, force), "Generated")
     
-    def generate_ai_rules(self, app: Dict, app_dir: Path):
-        """Generate AI_RULES.md for an application"""
-        content = f"""# 🤖 AI RULES - {app['name'].title()} Application
-> **{app['type'].title()} Development & Management Rules | {app['framework'].title()} System**
-
-## 🎯 AI INSTRUCTIONS - READ AND FOLLOW THESE RULES
-
-**This file contains CRITICAL rules for AI when working on {app['name']} tasks. These rules MUST be followed exactly.**
-
-## 🔒 CRITICAL SYSTEM RULES - {app['name'].upper()}
-
-### Rule #1: File Creation Priority
-```python
-# MANDATORY: Check for existing files before creating new ones
-def prevent_duplicate_file_creation(new_file_path):
-    existing_similar = find_similar_files(new_file_path)
-    if existing_similar:
-        return "ERROR: Must edit existing file, never create duplicates"
-    return "OK: Safe to create"
-```
-
-### Rule #2: System Validation
-```python
-# MANDATORY: Validate system integrity before any task
-def validate_{app['name']}_system_integrity():
-    critical_files = ['config.py', 'main.py', 'requirements.txt']
-    
-    for critical_file in critical_files:
-        if not exists(critical_file):
-            return f"STOP: Missing critical {app['name']} file: {{critical_file}}"
-    
-    return "{app['name'].upper()}_SYSTEM_VALIDATED: Safe to proceed"
-```
-
-## 📋 {app['name'].upper()} COMPLIANCE CHECKLIST
-
-### Before Any Task
-```bash
-✅ {app['name']} services status verified
-✅ Configuration backups created
-✅ Security settings validated
-✅ Database connectivity verified
-✅ Log rotation configured
-✅ Monitoring alerts active
-```
-
-### After Any Changes
-```bash
-✅ {app['name']} services tested
-✅ Authentication verified
-✅ Functionality confirmed
-✅ Security posture maintained
-✅ Documentation updated
-✅ Backup integrity verified
-```
-
----
-
-**🔄 Last Updated**: {self.get_current_date()} | **{app['name'].title()} Rules**: Active | **Compliance**: Mandatory
-
-**📍 File Location**: `{app_dir}/AI_RULES.md`
-"""
-        
-        with open(app_dir / 'AI_RULES.md', 'w') as f:
-            f.write(content)
+    def print_write_status(self, target: str, status: str, verb: str):
+        """Report what happened to one planned file"""
+        if status == 'drifted':
+            print(f"⚠️  Locally modified, not overwritten: {target}")
+        else:
+            print(f"✅ {verb}: {target}")
     
-    def generate_start_task(self, app: Dict, app_dir: Path):
-        """Generate START_TASK.md for an application"""
-        content = f"""# 🚀 START TASK - {app['name'].title()} Application
-> **AI Auto-Navigation Protocol | {app['framework'].title()} {app['type'].title()} Tasks**
-
-## 🎯 AI INSTRUCTIONS - READ THIS FIRST
-
-**When to use this file**: 
-- Tasks mentioning ONLY "{app['name']}" or "{app['name']} application"
-- {app['type']} development tasks
-- {app['framework']} configuration tasks
-- {app['name']}-only deployment/troubleshooting
-
-## 🧠 AI AUTO-EXECUTION PROTOCOL
-
-### Step 1: Task Analysis & Validation
-```python
-# AI automatically validates {app['name']} task requirements
-def analyze_{app['name']}_task(task_description):
-    {app['name']}_task_patterns = [
-        '{app['name']}', '{app['framework']}', '{app['type']}',
-        'development', 'configuration', 'deployment'
-    ]
-    
-    # Determine if this is truly a {app['name']} task
-    if not any(pattern in task_description.lower() for pattern in {app['name']}_task_patterns):
-        return redirect_to_appropriate_app(task_description)
-    
-    return {{
-        'app': '{app['name']}',
-        'type': '{app['type']}',
-        'framework': '{app['framework']}',
-        'complexity': determine_complexity(task_description)
-    }}
-```
-
-### Step 2: Read {app['name'].title()} Rules (MANDATORY)
-```python
-# AI MUST read {app['name']} rules before proceeding
-def read_{app['name']}_rules():
-    rules_content = read_file("{app_dir}/AI_RULES.md")
-    
-    # Extract critical rules
-    critical_rules = extract_critical_rules(rules_content)
-    
-    return {{
-        'rules': critical_rules,
-        'compliance_check': validate_rules_understanding(critical_rules)
-    }}
-```
-
-### Step 3: Navigate {app['name'].title()} Documentation
-```python
-# AI uses {app['name']} app guide for efficient navigation
-def navigate_{app['name']}_documentation(task_requirements):
-    # Read the main navigation guide
-    app_guide = read_file("{app_dir}/docs/AI_APP_GUIDE.md")
-    
-    # Determine required documentation based on task
-    required_docs = determine_required_{app['name']}_docs(task_requirements)
-    
-    # Read only the necessary documentation
-    documentation = {{}}
-    for doc_type in required_docs:
-        doc_path = get_{app['name']}_doc_path(doc_type)
-        documentation[doc_type] = read_file(doc_path)
-    
-    return documentation
-```
-
-## 📋 AI EXECUTION CHECKLIST
-
-### Pre-Task Checklist
-```bash
-✅ VALIDATE {app['name'].upper()} SYSTEM INTEGRITY
-✅ READ {app['name'].upper()} RULES (mandatory compliance)
-✅ VERIFY {app['name'].upper()} SERVICE STATUS
-✅ LOAD REQUIRED DOCUMENTATION
-✅ SEARCH ERROR HISTORY
-✅ CONFIRM BACKUP REQUIREMENTS
-```
-
-### Post-Task Checklist  
-```bash
-✅ TEST ALL {app['name'].upper()} SERVICES
-✅ VALIDATE FUNCTIONALITY
-✅ VERIFY SECURITY POSTURE
-✅ BACKUP UPDATED CONFIGURATIONS
-✅ UPDATE DOCUMENTATION
-```
-
----
-
-**🚀 {app['name'].upper()} TASK EXECUTION**: Ready for Production
-
-**🔄 Last Updated**: {self.get_current_date()} | **{app['name'].title()} Tasks**: {app['framework']} | **Status**: Active
-
-**📍 File Location**: `{app_dir}/START_TASK.md`
-"""
+    def scaffold(self, jobs: Optional[int] = None, force: bool = False) -> Dict:
+        """Create every planned directory, then write all files on a bounded thread pool
         
-        with open(app_dir / 'START_TASK.md', 'w') as f:
-            f.write(content)
-    
-    def generate_complete_task(self, app: Dict, app_dir: Path):
-        """Generate COMPLETE_TASK.md for an application"""
-        content = f"""# ✅ COMPLETE TASK - {app['name'].title()} Application
-> **AI Auto-Update Protocol | {app['name'].title()} Post-Task Maintenance**
-
-## 🎯 AI INSTRUCTIONS - EXECUTE THIS AFTER {app['name'].upper()} TASKS
-
-**When to use this file**: 
-- After completing {app['name']}-only tasks
-- For automatic {app['name']} documentation updates
-- For {app['name']} error management updates
-- For {app['name']} version control maintenance
-
-## 🤖 AI AUTO-UPDATE PROTOCOL
-
-### Step 1: {app['name'].title()} Task Analysis & Issue Assessment
-```python
-# AI automatically analyzes {app['name']} changes and checks for issues
-def analyze_completed_{app['name']}_task():
-    # Analyze {app['name']} specific changes
-    {app['name']}_changes = {{
-        'configuration': detect_{app['name']}_configuration_changes(),
-        'code': detect_{app['name']}_code_changes(),
-        'dependencies': detect_{app['name']}_dependency_changes(),
-        'documentation': detect_{app['name']}_documentation_changes()
-    }}
-    
-    # Check {app['name']} specific errors
-    {app['name']}_errors = {{
-        'runtime_errors': extract_{app['name']}_runtime_errors(),
-        'configuration_errors': extract_{app['name']}_config_errors(),
-        'dependency_errors': extract_{app['name']}_dependency_errors()
-    }}
-    
-    return {{
-        'app': '{app['name']}',
-        'changes': {app['name']}_changes,
-        'errors': {app['name']}_errors,
-        'services_affected': ['{app['name']}']
-    }}
-```
-
-### Step 2: {app['name'].title()} System Validation
-```python
-# AI validates {app['name']} integrity after task completion
-def validate_{app['name']}_system_post_task():
-    {app['name']}_validation = {{
-        'service_status': test_{app['name']}_service(),
-        'configuration': validate_{app['name']}_config(),
-        'functionality': test_{app['name']}_functionality(),
-        'security': validate_{app['name']}_security()
-    }}
-    
-    # Calculate {app['name']} system health score
-    health_score = calculate_{app['name']}_health_score({app['name']}_validation)
-    
-    if health_score < 95:
-        return {{
-            'status': '{app['name'].upper()}_SYSTEM_DEGRADED',
-            'action': 'ALERT_USER_AND_FIX',
-            'health_score': health_score
-        }}
-    
-    return {{'status': '{app['name'].upper()}_SYSTEM_VALIDATED', 'health_score': health_score}}
-```
-
-### Step 3: {app['name'].title()} Cleanup and Debug Code Management (MANDATORY)
-```python
-# AI automatically cleans up {app['name']} temporary files and debug code
-def cleanup_{app['name']}_and_manage_debug_code({app['name']}_analysis):
-    # Only cleanup if {app['name']} task completed successfully
-    if {app['name']}_analysis.task_completion.status != 'complete':
-        return "{app['name'].upper()}_TASK_INCOMPLETE: Skipping cleanup until task completion"
-    
-    {app['name']}_cleanup_results = {{
-        'temp_files_removed': [],
-        'debug_code_commented': [],
-        'test_files_removed': [],
-        'logs_cleaned': []
-    }}
-    
-    app_path = "{app_dir}"
-    
-    # Clean up {app['name']}-specific temporary files
-    {app['name']}_temp_files = find_{app['name']}_temporary_files(app_path)
-    for temp_file in {app['name']}_temp_files:
-        if is_safe_to_remove(temp_file):
-            remove_file(temp_file)
-            {app['name']}_cleanup_results['temp_files_removed'].append(temp_file)
-    
-    # Comment out debug code in {app['name']} source files
-    {app['name']}_source_files = find_{app['name']}_source_files_with_debug_code(app_path)
-    for source_file in {app['name']}_source_files:
-        commented_lines = comment_{app['name']}_debug_code(source_file)
-        if commented_lines:
-            {app['name']}_cleanup_results['debug_code_commented'].append({{
-                'file': source_file,
-                'lines_commented': commented_lines
-            }})
-    
-    return {app['name']}_cleanup_results
-```
-
-## 📋 {app['name'].upper()} SUCCESS INDICATORS
-
-### {app['name'].title()} Task Completion Checklist
-```bash
-✅ Post-task {app['name']} system validation completed (95%+ health score)
-✅ {app['name'].title()} service functionality tested and working
-✅ NO duplicate files created, existing files edited properly
-✅ {app['name'].title()} rules compliance validated
-✅ {app['name'].title()} documentation updated
-✅ Error management updated (resolved errors documented)
-✅ Issue management updated (incomplete tasks/errors logged)
-✅ Version numbers incremented correctly
-✅ Temporary/test/debug files cleaned up and removed
-✅ Debug code commented out in source files
-✅ System left in clean, production-ready state
-```
-
----
-
-**✅ {app['name'].upper()} COMPLETION STATUS**: Production Ready
-
-**🔄 Last Updated**: {self.get_current_date()} | **Application**: {app['name'].title()} | **Type**: Single App Completion
-
-**📍 File Location**: `{app_dir}/COMPLETE_TASK.md`
-"""
+        Files edited since they were last rendered are left alone unless force is set.
+        """
+        from concurrent.futures import ThreadPoolExecutor
         
-        with open(app_dir / 'COMPLETE_TASK.md', 'w') as f:
-            f.write(content)
-    
-    def generate_issue_directories(self, app: Dict, app_dir: Path):
-        """Generate CREATE_ISSUE_DIRECTORIES.md for an application"""
-        content = f"""# 🏗️ CREATE ISSUE DIRECTORIES - {app['name'].title()} Application
-> **Initialize {app['name'].title()} Issue Management System**
-
-## 🎯 AI INSTRUCTIONS - {app['name'].upper()} ISSUE DIRECTORY CREATION
-
-**Purpose**: Create the complete issue management directory structure specifically for the {app['name']} application.
-
-**When to use**: Before using {app['name']} issue management system or when setting up issue tracking for {app['name']} tasks.
-
-## 🧠 AI {app['name'].upper()} ISSUE DIRECTORY CREATION PROTOCOL
-
-### Step 1: {app['name'].title()} Application Validation
-```python
-# AI validates this is being run for {app['name']} application
-def validate_{app['name']}_application():
-    app_path = "{app_dir}"
-    app_type = "{app['type']}"
-    
-    # Verify {app['name']}-specific files exist
-    required_files = [
-        f"{{app_path}}/AI_RULES.md",
-        f"{{app_path}}/START_TASK.md",
-        f"{{app_path}}/COMPLETE_TASK.md",
-        f"{{app_path}}/docs/AI_APP_GUIDE.md"
-    ]
-    
-    return all(file_exists(f) for f in required_files)
-```
-
-### Step 2: Create {app['name'].title()} Issue Directory Structure
-```python
-# AI creates complete {app['name']} issue management structure
-def create_{app['name']}_issue_directories():
-    app_path = "{app_dir}"
-    
-    # {app['name']}-specific issue directories
-    directories_to_create = [
-        f"{{app_path}}/issues/",
-        f"{{app_path}}/issues/open/",
-        f"{{app_path}}/issues/open/incomplete-tasks/",
-        f"{{app_path}}/issues/open/unresolved-errors/",
-        f"{{app_path}}/issues/open/system-issues/",
-        f"{{app_path}}/issues/closed/",
-        f"{{app_path}}/issues/closed/incomplete-tasks/",
-        f"{{app_path}}/issues/closed/unresolved-errors/",
-        f"{{app_path}}/issues/closed/system-issues/",
-        f"{{app_path}}/issues/version-history/",
-        f"{{app_path}}/issues/ai-session-logs/"
-    ]
-    
-    # Create all directories
-    for directory in directories_to_create:
-        create_directory_if_not_exists(directory)
-```
-
-## 📁 Complete {app['name'].title()} Issue Directory Structure
-
-```bash
-{app_dir}/issues/
-├── ISSUE_TRACKER.md                           # {app['name']} dashboard
-├── open/                                      # Active {app['name']} issues
-│   ├── incomplete-tasks/
-│   │   ├── template.md                        # {app['name']} task template
-│   │   └── [{app['name'].upper()}-TASK-YYYY-MM-DD-###.md]    # Individual {app['name']} tasks
-│   ├── unresolved-errors/
-│   │   ├── template.md                        # {app['name']} error template
-│   │   └── [{app['name'].upper()}-ERROR-YYYY-MM-DD-###.md]   # Individual {app['name']} errors
-│   └── system-issues/
-│       ├── template.md                        # {app['name']} system template
-│       └── [{app['name'].upper()}-SYSTEM-YYYY-MM-DD-###.md]  # Individual system issues
-├── closed/                                    # Resolved {app['name']} issues
-│   ├── incomplete-tasks/                      # Completed {app['name']} tasks
-│   ├── unresolved-errors/                     # Resolved {app['name']} errors
-│   ├── system-issues/                         # Fixed {app['name']} system issues
-│   └── RESOLUTION_ARCHIVE.md                  # {app['name']} resolution archive
-├── version-history/
-│   ├── V1.0.0-{app['name']}-initial-setup.md # {app['name']} version history
-│   └── VERSION.md                             # Current {app['name']} version
-└── ai-session-logs/
-    ├── [YYYY-MM-DD-model-session-###.md]     # {app['name']} AI session logs
-    └── SESSION_INDEX.md                       # {app['name']} session index
-```
-
-## 🚀 {app['name'].title()} Issue Management Commands
-
-### Initialize {app['name'].title()} Issues
-```bash
-# Pattern: "Initialize {app['name']} issues"
-"Initialize issues for: {app_dir}"
-```
-
-### Create {app['name'].title()}-Specific Issue
-```bash  
-# Pattern: "Create [type] issue for {app['name']}: [description]"
-Examples:
-✅ "Create system issue for {app['name']}: Service startup failing"
-✅ "Create error issue for {app['name']}: Database connection timeout"
-✅ "Create task issue for {app['name']}: Configuration update incomplete"
-```
-
----
-
-**🔄 Last Updated**: {self.get_current_date()} | **{app['name'].title()} Issues**: Ready | **Integration**: Complete
-"""
+        state = self.load_template_state()
+        # Render with the recorded date, so a later sync does not see every file as changed
+        self.render_date = state['render_date'] or self.get_current_date()
+        directories = self.plan_directories()
+        files = self.plan_template_files() + self.plan_app_files()
         
-        with open(app_dir / 'CREATE_ISSUE_DIRECTORIES.md', 'w') as f:
-            f.write(content)
+        # Directories first (parents before children), so no file write has to create one
+        for directory in directories:
+            (self.project_root / directory).mkdir(parents=True, exist_ok=True)
+        
+        def write_file(planned) -> str:
+            target, render = planned
+            return self.write_planned_file(target, render, state, force)
+        
+        with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as executor:
+            # list() surfaces the first write error
+            statuses = list(executor.map(write_file, files))
+        
+        self.save_template_state()
+        return {
+            'directories': len(directories),
+            'files': len(files),
+            'written': sum(1 for status in statuses if status in ('created', 'updated')),
+            'drifted': [target for (target, _), status in zip(files, statuses) if status == 'drifted']
+        }
     
     def get_current_date(self) -> str:
         """Get current date in YYYY-MM-DD format"""
@@ -665,7 +400,7 @@ Examples:
         print(f"   {Fore.BLUE}📍 File Location: Project Root (CORRECT){Style.RESET_ALL}")
         return True
     
-    def run(self):
+    def run(self, force: bool = False):
         """Run the complete setup wizard"""
         self.print_banner()
         
@@ -688,11 +423,14 @@ Examples:
             # Create directory structure
             self.create_directory_structure()
             
-            # Copy templates
-            self.copy_templates()
+            # Copy templates (locally edited files are kept unless force is set)
+            state = self.load_template_state()
+            self.render_date = state['render_date'] or self.get_current_date()
+            self.copy_templates(state, force)
             
             # Generate app-specific files
-            self.generate_app_specific_files()
+            self.generate_app_specific_files(state, force)
+            self.save_template_state()
             
             # Save configuration
             config_saved = self.save_configuration()
@@ -701,25 +439,7 @@ Examples:
                 return
 
             # Success message
-            print(f"\n{Fore.GREEN}🎉 Setup Complete!{Style.RESET_ALL}")
-            print("=" * 50)
-            print(f"✅ AI Documentation Framework installed successfully")
-            print(f"✅ Project: {self.config['project']['name']}")
-            print(f"✅ Type: {self.config['project']['type']}")
-            print(f"✅ Applications: {len(self.config['applications'])}")
-            print(f"✅ Error Categories: {len(self.config['error_categories'])}")
-            print(f"✅ Issue Categories: {len(self.config['issue_categories'])}")
-            print(f"✅ Configuration: {self.project_root}/ai-doc-config.json (Project Root)")
-            print(f"✅ Conflict Detection: Available via tools/conflict-detector.py")
-            print(f"✅ Rule Management: MANAGE_RULES.md system ready")
-            print(f"\n📚 Next Steps:")
-            print(f"   1. Review the generated files")
-            print(f"   2. Verify ai-doc-config.json is in project root")
-            print(f"   3. Customize AI_RULES.md for your specific needs")
-            print(f"   4. Start using START_TASK.md for AI tasks")
-            print(f"   5. Run conflict detection: python tools/conflict-detector.py")
-            print(f"   6. Use MANAGE_RULES.md for rule management")
-            print(f"   7. Check USAGE.md for detailed instructions")
+            self.print_summary()
             
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}⚠️  Setup cancelled by user{Style.RESET_ALL}")
@@ -727,25 +447,151 @@ Examples:
         except Exception as e:
             print(f"\n{Fore.RED}❌ Setup failed: {e}{Style.RESET_ALL}")
             sys.exit(1)
-
-@click.command()
+    
+    def load_config_defaults(self):
+        """Fill everything the prompts would ask for from defaults (non-interactive mode)"""
+        if not self.config.get('project', {}).get('name'):
+            raise ValueError("Configuration needs project.name")
+        for app in self.config.get('applications', []):
+            if not app.get('name'):
+                raise ValueError("Every application needs a name")
+            app.setdefault('type', 'fullstack')
+            app.setdefault('framework', 'generic')
+            app.setdefault('description', '')
+        
+        self.config['project'].setdefault('type', 'multi')
+        self.config['project'].setdefault('description', '')
+        self.config['project']['root_path'] = str(self.project_root)
+        self.config.setdefault('applications', [])
+        self.config.setdefault('error_categories', list(DEFAULT_ERROR_CATEGORIES))
+        self.config.setdefault('issue_categories', list(DEFAULT_ISSUE_CATEGORIES))
+        self.config.setdefault('advanced', {
+            'language': 'en',
+            'theme': 'default',
+            'auto_backup': True,
+            'debug_mode': False
+        })
+    
+    def run_from_config(self, jobs: Optional[int] = None, force: bool = False) -> bool:
+        """Scaffold a loaded configuration without any prompts"""
+        import time
+        
+        try:
+            self.load_config_defaults()
+            print(f"{Fore.YELLOW}🏗️  Scaffolding {len(self.config['applications'])} applications{Style.RESET_ALL}")
+            
+            started = time.monotonic()
+            counts = self.scaffold(jobs, force)
+            print(f"✅ Created {counts['directories']} directories and wrote {counts['written']} of "
+                  f"{counts['files']} files in {time.monotonic() - started:.2f}s")
+            for target in counts['drifted']:
+                print(f"⚠️  Locally modified, not overwritten: {target}")
+            if counts['drifted']:
+                print(f"   Review the differences, then re-run with --force to replace them with the template output")
+            
+            if not self.save_configuration():
+                print(f"\n{Fore.RED}❌ Setup failed: Configuration could not be saved{Style.RESET_ALL}")
+                return False
+            
+            self.print_summary()
+            return True
+            
+        except Exception as e:
+            print(f"\n{Fore.RED}❌ Setup failed: {e}{Style.RESET_ALL}")
+            return False
+    
+    def print_summary(self):
+        """Success message and next steps"""
+        print(f"\n{Fore.GREEN}🎉 Setup Complete!{Style.RESET_ALL}")
+        print("=" * 50)
+        print(f"✅ AI Documentation Framework installed successfully")
+        print(f"✅ Project: {self.config['project']['name']}")
+        print(f"✅ Type: {self.config['project']['type']}")
+        print(f"✅ Applications: {len(self.config['applications'])}")
+        print(f"✅ Error Categories: {len(self.config['error_categories'])}")
+        print(f"✅ Issue Categories: {len(self.config['issue_categories'])}")
+        print(f"✅ Configuration: {self.project_root}/ai-doc-config.json (Project Root)")
+        print(f"✅ Conflict Detection: Available via tools/conflict-detector.py")
+        print(f"✅ Rule Management: MANAGE_RULES.md system ready")
+        print(f"\n📚 Next Steps:")
+        print(f"   1. Review the generated files")
+        print(f"   2. Verify ai-doc-config.json is in project root")
+        print(f"   3. Customize AI_RULES.md for your specific needs")
+        print(f"   4. Start using START_TASK.md for AI tasks")
+        print(f"   5. Run conflict detection: python tools/conflict-detector.py")
+        print(f"   6. Use MANAGE_RULES.md for rule management")
+        print(f"   7. Check USAGE.md for detailed instructions")
+
+@click.group(invoke_without_command=True)
 @click.option('--debug', is_flag=True, help='Enable debug mode')
 @click.option('--config', type=click.Path(exists=True), help='Use existing configuration file')
-def main(debug: bool, config: Optional[str]):
+@click.option('--from-config', type=click.Path(exists=True),
+              help='Scaffold everything in this configuration file without prompting')
+@click.option('--jobs', type=int, help='Worker threads (default: CPU count + 4, max 32)')
+@click.option('--force', is_flag=True, help='Also overwrite locally modified files')
+@click.pass_context
+def main(ctx: click.Context, debug: bool, config: Optional[str], from_config: Optional[str], jobs: Optional[int],
+         force: bool):
     """AI Documentation Framework Setup Wizard"""
     
     if debug:
         os.environ['AI_DOC_FRAMEWORK_DEBUG'] = '1'
     
+    ctx.obj = {'jobs': jobs}
+    if ctx.invoked_subcommand is not None:
+        return
+    
     wizard = SetupWizard()
     
-    if config:
+    if config or from_config:
         # Load existing configuration
-        with open(config, 'r') as f:
+        with open(config or from_config, 'r') as f:
             wizard.config = json.load(f)
-        print(f"{Fore.BLUE}📋 Loaded configuration from: {config}{Style.RESET_ALL}")
+        print(f"{Fore.BLUE}📋 Loaded configuration from: {config or from_config}{Style.RESET_ALL}")
     
-    wizard.run()
+    if from_config:
+        sys.exit(0 if wizard.run_from_config(jobs, force) else 1)
+    
+    wizard.run(force)
+
+@main.command('sync-templates')
+@click.option('--project-path', type=click.Path(exists=True, file_okay=False), default='.',
+              help='Project root containing ai-doc-config.json')
+@click.option('--check', is_flag=True, help='Report what would change without writing')
+@click.option('--force', is_flag=True, help='Also overwrite locally modified files')
+@click.pass_context
+def sync_templates_command(ctx: click.Context, project_path: str, check: bool, force: bool):
+    """Re-render templates, writing only files whose content changed"""
+    import time
+    
+    wizard = SetupWizard()
+    wizard.project_root = Path(project_path).resolve()
+    config_file = wizard.project_root / 'ai-doc-config.json'
+    if not config_file.exists():
+        print(f"{Fore.RED}❌ Configuration file not found: {config_file}{Style.RESET_ALL}")
+        sys.exit(1)
+    with open(config_file, 'r') as f:
+        wizard.config = json.load(f)
+    wizard.load_config_defaults()
+    
+    started = time.monotonic()
+    result = wizard.sync_templates(jobs=ctx.obj['jobs'], force=force, check=check)
+    elapsed = time.monotonic() - started
+    
+    verb = "Would write" if check else "Wrote"
+    for target in result['created']:
+        print(f"{'➕' if check else '✅'} {verb}: {target} (new)")
+    for target in result['updated']:
+        print(f"{'🔄' if check else '✅'} {verb}: {target}")
+    for target in result['drifted']:
+        print(f"⚠️  Locally modified, not overwritten: {target}")
+    
+    written = len(result['created']) + len(result['updated'])
+    print(f"\n📊 {written} {'to write' if check else 'written'}, {len(result['unchanged'])} unchanged, "
+          f"{len(result['drifted'])} locally modified ({elapsed:.2f}s)")
+    if result['drifted']:
+        print(f"   Review the differences, then re-run with --force to replace them with the template output")
+    sys.exit(1 if check and (written or result['drifted']) else 0)
 
 if __name__ == '__main__':
     main()
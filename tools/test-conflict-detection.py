@@ -175,9 +175,9 @@ def run_conflict_detection(test_dir):
     os.chdir(test_dir)
     
     try:
-        # Import conflict detector
+        # Import conflict detector (in-process, no subprocess)
         sys.path.insert(0, str(Path(__file__).parent))
-        from conflict_detector import AIDocConflictDetector
+        from ai_doc_framework import AIDocConflictDetector
         
         # Initialize detector
         detector = AIDocConflictDetector(".")
@@ -203,6 +203,15 @@ def run_conflict_detection(test_dir):
                 print(f"      🎯 Applications: {', '.join(conflict.applications)}")
                 print(f"      🛠️  Command: {conflict.manage_rules_command}")
         
+        # Cross-application documentation check
+        cross_report = detector.detect_all_conflicts(docs_only=True, cross_app_docs=True)
+        cross_conflicts = [c for c in cross_report.conflicts if len(c.applications) > 1]
+        print(f"\n🔗 Cross-application doc conflicts: {len(cross_conflicts)}")
+        success = True
+        if not cross_conflicts:
+            print(f"❌ Expected website/api port conflict across docs!")
+            success = False
+        
         # Test different output formats
         print(f"\n📄 Testing output formats...")
         
@@ -226,20 +235,28 @@ def run_conflict_detection(test_dir):
             "API Response Time: root=200ms, api=150ms",
             "Website Port: API.md=8000, DEPLOYMENT.md=8001",
             "Website Timeout: API.md=30s, DEPLOYMENT.md=60s",
-            "Website SSL: API.md=1.2, DEPLOYMENT.md=1.3"
+            "Website SSL: API.md=1.2, DEPLOYMENT.md=1.3",
+            "Cross-app Port (--cross-app-docs): website=8000/8001, api=9000"
         ]
         
         for expected in expected_conflicts:
             print(f"   📋 {expected}")
         
-        if report.total_conflicts >= 6:  # Should find at least 6 major conflicts
+        # Every root/application rule pair above, plus the website doc conflicts
+        rule_conflicts = {(tuple(c.applications), c.category) for c in report.conflicts if c.type == 'rule_conflict'}
+        expected_rule_conflicts = {(('root', 'website'), 'security'), (('root', 'website'), 'performance'),
+                                   (('root', 'api'), 'security'), (('root', 'api'), 'performance')}
+        if report.total_conflicts >= 6 and expected_rule_conflicts <= rule_conflicts:
             print(f"\n✅ CONFLICT DETECTION WORKING CORRECTLY!")
             print(f"   Found {report.total_conflicts} conflicts (expected: 6+)")
         else:
-            print(f"\n⚠️  WARNING: Expected more conflicts!")
+            print(f"\n❌ Expected more conflicts!")
             print(f"   Found {report.total_conflicts} conflicts (expected: 6+)")
+            for missing in sorted(expected_rule_conflicts - rule_conflicts):
+                print(f"   Missing {missing[1]} rule conflict: {' vs '.join(missing[0])}")
+            success = False
             
-        return report.total_conflicts > 0
+        return success
         
     except Exception as e:
         print(f"❌ Error during conflict detection: {e}")
@@ -249,6 +266,340 @@ def run_conflict_detection(test_dir):
     finally:
         os.chdir(original_dir)
 
+def test_fleet_timeout(test_dir):
+    """A project that runs past its deadline is reported as timed out"""
+    print(f"\n⏱️  Testing fleet project timeouts...")
+    
+    sys.path.insert(0, str(Path(__file__).parent))
+    import time
+    from ai_doc_framework import AIDocConflictDetector
+    from ai_doc_framework.conflict_detector import ScanTimeout
+    from ai_doc_framework.fleet import scan_project
+    
+    result = scan_project(test_dir, project_timeout=1e-9)
+    if result.status != 'timeout':
+        print(f"❌ Slow project reported as '{result.status}' instead of 'timeout'")
+        return False
+    print(f"✅ Slow project reported as timeout: {result.error}")
+    
+    # Files already loaded skip _load_file's check; the comparison loops must still stop
+    detector = AIDocConflictDetector(str(test_dir))
+    detector.detect_all_conflicts(drift=True)
+    detector.deadline = time.monotonic() - 1
+    for name, scan in [("documentation", detector._detect_documentation_conflicts),
+                       ("drift", detector._detect_document_drift)]:
+        try:
+            scan()
+        except ScanTimeout:
+            print(f"✅ Cached {name} scan stops at the deadline")
+            continue
+        print(f"❌ Cached {name} scan ignored the deadline")
+        return False
+    
+    return True
+
+def test_scan_caches(test_dir):
+    """Content-keyed caches: fresh state per run, rule matches keyed by content, honest reuse counts"""
+    print(f"\n♻️  Testing scan caches...")
+    
+    sys.path.insert(0, str(Path(__file__).parent))
+    from ai_doc_framework import AIDocConflictDetector
+    
+    workspace = Path(tempfile.mkdtemp(prefix="conflict-cache-test-"))
+    try:
+        project = workspace / "project"
+        shutil.copytree(test_dir, project)
+        website_docs = project / "website" / "docs"
+        shutil.copy(website_docs / "API.md", website_docs / "API-COPY.md")
+        
+        detector = AIDocConflictDetector(str(project))
+        first = detector.detect_all_conflicts(docs_only=True)
+        if detector.scan_stats['scans_reused'] != 1:
+            print(f"❌ Expected one reused scan for one duplicate doc, got {detector.scan_stats['scans_reused']}")
+            return False
+        print(f"✅ Duplicate doc counted once: {detector.scan_stats}")
+        
+        stats = dict(detector.scan_stats)
+        detector.detect_all_conflicts(docs_only=True)
+        if detector.scan_stats != stats:
+            print(f"❌ Statistics carried over between runs: {detector.scan_stats} vs {stats}")
+            return False
+        print(f"✅ Statistics reset per run")
+        
+        (website_docs / "API-COPY.md").unlink()
+        for doc in website_docs.glob("*.md"):
+            doc.write_text("# Notes\n")
+        report = detector.detect_all_conflicts(docs_only=True)
+        if report.total_conflicts >= first.total_conflicts:
+            print(f"❌ Edited docs not re-read: {report.total_conflicts} conflicts")
+            return False
+        print(f"✅ Edited docs re-read on the next run")
+        
+        # Same list object, different content: the cache must not serve the old matches
+        pattern = detector.rule_patterns['performance'][0]
+        rules = [("Timeout", "timeout of 30 seconds")]
+        detector._match_rules(rules, pattern)
+        rules[0] = ("Timeout", "timeout of 60 seconds")
+        if detector._match_rules(rules, pattern)[0][2] != [('60', 'second')]:
+            print(f"❌ Rule matches cached by object identity")
+            return False
+        print(f"✅ Rule matches cached by content")
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+    
+    return True
+
+def test_numeric_outliers():
+    """Outlier matrix across applications, with values normalized to base units"""
+    print(f"\n📈 Testing numeric outlier detection...")
+    
+    sys.path.insert(0, str(Path(__file__).parent))
+    from ai_doc_framework import AIDocConflictDetector
+    
+    # Same values in different units, plus one application far from the median
+    settings = {
+        "alpha": ("60 seconds", "1024MB"),
+        "beta": ("1 minute", "1GB"),
+        "gamma": ("60000 ms", "1024 MB"),
+        "delta": ("600 seconds", "4096MB"),
+    }
+    project = Path(tempfile.mkdtemp(prefix="conflict-outlier-test-"))
+    try:
+        config = {"project": {"name": "Outlier Test", "type": "multi"},
+                  "applications": [{"name": name} for name in settings]}
+        (project / "ai-doc-config.json").write_text(json.dumps(config))
+        for name, (timeout, memory) in settings.items():
+            (project / name).mkdir()
+            (project / name / "AI_RULES.md").write_text(
+                f"# AI RULES - {name}\n\n## Custom Performance Rules\n"
+                f"- **Connection Timeout**: timeout after {timeout}\n"
+                f"- **Memory Limit**: Maximum {memory} per container\n")
+        
+        detector = AIDocConflictDetector(str(project))
+        normalized = [detector._normalize_numeric_value(match, 'time')
+                      for match in [('60', 'second'), ('1', 'minute'), ('60000', 'ms')]]
+        if normalized != [60, 60, 60] or detector._normalize_numeric_value(('1', 'GB'), 'memory') != 1024:
+            print(f"❌ Unit normalization: {normalized}")
+            return False
+        print(f"✅ Units normalized to seconds and megabytes")
+        
+        report = detector.detect_all_conflicts(rules_only=True, numeric_outliers=True)
+        outliers = {c.id: c for c in report.conflicts if c.type == 'numeric_outlier'}
+        expected = {"outlier_timeout_delta", "outlier_memory_limit_delta"}
+        if set(outliers) != expected:
+            print(f"❌ Expected outliers {sorted(expected)}, got {sorted(outliers)}")
+            return False
+        stats = outliers["outlier_timeout_delta"].conflicting_content[-1]["statistics"]
+        if (stats["median"], stats["max"], stats["applications_compared"]) != (60, 600, 4):
+            print(f"❌ Timeout statistics: {stats}")
+            return False
+        if outliers["outlier_memory_limit_delta"].conflicting_content[-1]["statistics"]["median"] != 1024:
+            print(f"❌ Memory statistics: {outliers['outlier_memory_limit_delta'].conflicting_content[-1]}")
+            return False
+        if any(c.type == 'rule_conflict' for c in report.conflicts):
+            print(f"❌ Numeric parameters also compared pairwise")
+            return False
+        print(f"✅ Only the application far from the median reported: {sorted(outliers)}")
+        
+        # Two applications are too few for a median: the pairwise conflict must still be reported
+        for name in ("gamma", "delta"):
+            shutil.rmtree(project / name)
+        (project / "alpha" / "AI_RULES.md").write_text(
+            "# AI RULES - alpha\n\n## Custom Performance Rules\n- **Connection Timeout**: timeout after 30 seconds\n")
+        (project / "beta" / "AI_RULES.md").write_text(
+            "# AI RULES - beta\n\n## Custom Performance Rules\n- **Connection Timeout**: timeout after 300 seconds\n")
+        baseline = AIDocConflictDetector(str(project)).detect_all_conflicts(rules_only=True)
+        report = AIDocConflictDetector(str(project)).detect_all_conflicts(rules_only=True, numeric_outliers=True)
+        if not baseline.conflicts or [c.id for c in report.conflicts] != [c.id for c in baseline.conflicts]:
+            print(f"❌ Two-application timeout conflict lost with --numeric-outliers: "
+                  f"{[c.id for c in report.conflicts]}")
+            return False
+        print(f"✅ Two-application conflict still compared pairwise")
+        
+        # Without numpy every numeric parameter falls back to the pairwise comparison
+        for name, (timeout, memory) in settings.items():
+            (project / name).mkdir(exist_ok=True)
+            (project / name / "AI_RULES.md").write_text(
+                f"# AI RULES - {name}\n\n## Custom Performance Rules\n"
+                f"- **Connection Timeout**: timeout after {timeout}\n")
+        numpy_module = sys.modules.get('numpy')
+        sys.modules['numpy'] = None  # import numpy now raises ImportError
+        try:
+            report = AIDocConflictDetector(str(project)).detect_all_conflicts(rules_only=True, numeric_outliers=True)
+        finally:
+            if numpy_module is None:
+                del sys.modules['numpy']
+            else:
+                sys.modules['numpy'] = numpy_module
+        if not any(c.type == 'rule_conflict' and 'delta' in c.applications for c in report.conflicts):
+            print(f"❌ Numeric rules not compared without numpy: {[c.id for c in report.conflicts]}")
+            return False
+        print(f"✅ Without numpy, numeric rules are compared pairwise")
+    finally:
+        shutil.rmtree(project, ignore_errors=True)
+    
+    return True
+
+STRUCTURED_FIXTURES = {
+    "docker-compose.yml": ("""services:
+  api:
+    image: postgres:16
+    container_name: api-server
+    ports: ["127.0.0.1:8080:80/tcp", "9000"]
+    networks: [backend]
+    volumes: ["pgdata:/var/lib/postgresql/data"]
+    environment:
+      DATABASE_URL: postgres://db
+      API_KEY: secret
+networks:
+  backend: {}
+volumes:
+  pgdata: {}
+""", {'port': {'8080', '9000'}, 'container_name': {'api-server'}, 'network': {'backend'},
+      'volume': {'pgdata'}, 'environment': {'database_url', 'api_key'}, 'database': {'postgres'}}),
+    ".env": ("""# Local settings
+export API_PORT=8000
+DATABASE_URL="mysql://user:password@db/app"
+SECRET=do-not-report
+""", {'environment': {'api_port', 'database_url', 'secret'}, 'port': {'8000'}, 'database': {'mysql'}}),
+    "package.json": ("""{"dependencies": {"pg": "^8", "express": "^4"},
+ "scripts": {"start": "node server.js --port 3000", "dev": "PORT=3001 nodemon"},
+ "config": {"port": 3002}}
+""", {'database': {'postgres'}, 'port': {'3000', '3001', '3002'}}),
+    "settings.json": ("""{"server": {"http_port": 8443, "container_name": "web"}, "db": "sqlite:///app.db"}
+""", {'port': {'8443'}, 'container_name': {'web'}, 'database': {'sqlite'}}),
+    "settings.yaml": ("""server:
+  port: 7000
+---
+database: mariadb
+""", {'port': {'7000'}, 'database': {'mysql'}}),
+}
+
+def test_structured_extractors():
+    """Each built-in extractor against a fixture, plus anchored doc patterns"""
+    print(f"\n🧩 Testing structured config extractors...")
+    
+    sys.path.insert(0, str(Path(__file__).parent))
+    from ai_doc_framework import AIDocConflictDetector
+    from ai_doc_framework.conflict_detector import STRUCTURED_EXTRACTORS, StructuredExtractor, compiled_pattern
+    
+    success = True
+    for filename, (content, expected) in STRUCTURED_FIXTURES.items():
+        extractor = next(e for e in STRUCTURED_EXTRACTORS if e.matches(Path(filename)))
+        values = extractor.extract(content)
+        if values == expected:
+            print(f"✅ {extractor.name} extractor: {filename}")
+        else:
+            print(f"❌ {extractor.name} extractor: {filename} gave {values}")
+            success = False
+            
+    try:
+        StructuredExtractor()
+        print(f"❌ StructuredExtractor is instantiable without extract()")
+        success = False
+    except TypeError:
+        print(f"✅ StructuredExtractor is abstract")
+        
+    # Doc patterns fed into the config-vs-doc check only match key/value syntax
+    patterns = dict(zip(['port', 'container_name', 'network', 'volume', 'environment'],
+                        AIDocConflictDetector(".").rule_patterns['architecture']))
+    samples = [
+        ('environment', "- **Environment Variables**: DATABASE_URL, API_KEY", ['DATABASE_URL']),
+        ('environment', "Set the environment for staging before deploying", []),
+        ('network', "- **Network**: backend-net", ['backend-net']),
+        ('network', "Our network topology is simple", []),
+        ('container_name', "The container is named after the service", []),
+        ('volume', "A large volume of requests", []),
+        ('port', "Report generated in 2024", []),
+        ('port', "PostgreSQL on port 5432", ['5432']),
+    ]
+    for parameter, text, expected in samples:
+        found = compiled_pattern(patterns[parameter]).findall(text)
+        if found != expected:
+            print(f"❌ {parameter} pattern on {text!r}: {found}")
+            success = False
+    if success:
+        print(f"✅ Doc patterns anchored to key syntax")
+        
+    return success
+
+def test_document_drift():
+    """MinHash candidates, drift conflicts and the shared signature cache"""
+    print(f"\n🧬 Testing document drift detection...")
+    
+    sys.path.insert(0, str(Path(__file__).parent))
+    from ai_doc_framework import AIDocConflictDetector
+    from ai_doc_framework.conflict_detector import MinHasher
+    
+    guide = "\n".join(f"- Step {n}: run the deployment check number {n} before release" for n in range(40)) + "\n"
+    drifted = guide.replace("check number 7 ", "check number 7 twice ")
+    unrelated = "\n".join(f"Changelog entry {n} about the billing export" for n in range(40)) + "\n"
+    
+    hasher = MinHasher(threshold=0.8)
+    near = hasher.similarity(hasher.signature(guide), hasher.signature(drifted))
+    far = hasher.similarity(hasher.signature(guide), hasher.signature(unrelated))
+    if not (near >= 0.8 > far):
+        print(f"❌ MinHash similarity: near-duplicate {near:.2f}, unrelated {far:.2f}")
+        return False
+    print(f"✅ MinHash similarity: near-duplicate {near:.2f}, unrelated {far:.2f}")
+    
+    workspace = Path(tempfile.mkdtemp(prefix="conflict-drift-test-"))
+    saved_cache_setting = os.environ.get('AI_DOC_FRAMEWORK_CACHE')
+    os.environ['AI_DOC_FRAMEWORK_CACHE'] = '1'
+    try:
+        project = workspace / "project"
+        docs = {"alpha": {"GUIDE.md": guide, "NOTES.md": unrelated},
+                "beta": {"GUIDE.md": drifted}, "gamma": {"GUIDE.md": guide}}
+        config = {"project": {"name": "Drift Test", "type": "multi"},
+                  "applications": [{"name": name} for name in docs]}
+        project.mkdir()
+        (project / "ai-doc-config.json").write_text(json.dumps(config))
+        for app, files in docs.items():
+            (project / app / "docs").mkdir(parents=True)
+            (project / app / "AI_RULES.md").write_text(f"# AI RULES - {app}\n")
+            for name, content in files.items():
+                (project / app / "docs" / name).write_text(content)
+                
+        cache_file = workspace / "cache" / "minhash-signatures.json"
+        detector = AIDocConflictDetector(str(project))
+        detector.signature_cache_file = cache_file
+        report = detector.detect_all_conflicts(docs_only=True, drift=True)
+        pairs = sorted(tuple(c.applications) for c in report.conflicts if c.type == 'drift')
+        if pairs != [("alpha", "beta"), ("beta", "gamma")]:
+            print(f"❌ Drift pairs: {pairs}")
+            return False
+        print(f"✅ Drifted copies reported, identical copies and unrelated docs not: {pairs}")
+        
+        # Another process saved a signature meanwhile; it must survive this run's save
+        cache = json.loads(cache_file.read_text())
+        cache["other-process"] = [1, 2, 3]
+        cache_file.write_text(json.dumps(cache))
+        detector = AIDocConflictDetector(str(project))
+        detector.signature_cache_file = cache_file
+        detector.detect_all_conflicts(docs_only=True, drift=True)
+        if detector.scan_stats['signatures_reused'] != 4 or "other-process" not in json.loads(cache_file.read_text()):
+            print(f"❌ Signature cache: {detector.scan_stats}, {sorted(json.loads(cache_file.read_text()))}")
+            return False
+        print(f"✅ Signatures reused from the cache, entries saved by other processes kept")
+        
+        detector = AIDocConflictDetector(str(project))
+        detector.signature_cache_file = cache_file
+        detector.signature_cache_limit = 3
+        detector.detect_all_conflicts(docs_only=True, drift=True)
+        kept = json.loads(cache_file.read_text())
+        if len(kept) != 3 or "other-process" in kept or list(cache_file.parent.glob(".minhash-signatures-*")):
+            print(f"❌ Signature cache cap: {sorted(kept)}")
+            return False
+        print(f"✅ Signature cache capped to the most recently used entries")
+    finally:
+        if saved_cache_setting is None:
+            os.environ.pop('AI_DOC_FRAMEWORK_CACHE', None)
+        else:
+            os.environ['AI_DOC_FRAMEWORK_CACHE'] = saved_cache_setting
+        shutil.rmtree(workspace, ignore_errors=True)
+    
+    return True
+
 def test_manage_rules_integration():
     """Test MANAGE_RULES.md commands"""
     print(f"\n🛠️  Testing MANAGE_RULES.md integration...")
@@ -280,12 +631,18 @@ def main():
     print("=" * 60)
     
     test_dir = None
+    success = False
     try:
         # Create test project
         test_dir = create_test_project()
         
         # Run conflict detection
         success = run_conflict_detection(test_dir)
+        success = test_fleet_timeout(test_dir) and success
+        success = test_scan_caches(test_dir) and success
+        success = test_numeric_outliers() and success
+        success = test_structured_extractors() and success
+        success = test_document_drift() and success
         
         # Test MANAGE_RULES integration
         test_manage_rules_integration()
@@ -305,8 +662,10 @@ def main():
             
     except KeyboardInterrupt:
         print(f"\n⚠️  Test cancelled by user")
+        success = False
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
+        success = False
         import traceback
         traceback.print_exc()
     finally:
@@ -315,6 +674,7 @@ def main():
             cleanup_test_project(test_dir)
     
     print(f"\n🏁 Test completed")
+    sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+🧪 Test Error Search
+Builds a project with generated ERROR_TEMPLATE.md entries (project-level and
+per application), then checks ranking, filters, snippets, incremental
+re-indexing and query latency
+
+Usage:
+    python tools/test-error-search.py [--errors 20000]
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+CATEGORIES = ['backend', 'frontend', 'infrastructure', 'security', 'database', 'deployment']
+APPLICATIONS = ['api', 'web', 'worker']
+COMPONENTS = ['auth-service', 'payment-gateway', 'session-store', 'image-resizer', 'search-indexer',
+              'email-sender', 'rate-limiter', 'report-builder', 'cache-layer', 'job-scheduler']
+SYMPTOMS = ['timeout while waiting for response', 'connection refused by upstream', 'null pointer dereference',
+            'out of memory during batch', 'deadlock detected in transaction', 'invalid token signature',
+            'stale cache entry served', 'missing environment variable', 'certificate has expired',
+            'slow query on large table', 'unhandled promise rejection', 'disk quota exceeded']
+FIXES = ['added retry with exponential backoff', 'increased pool size and added health checks',
+         'validated input before processing', 'rotated credentials and pinned versions',
+         'added an index on the lookup column', 'moved work to a background queue']
+
+# Entry with words no generated entry uses, for ranking checks
+NEEDLE = """---
+error_id: "SECURITY-2024-05-01-001"
+category: "security"
+severity: "critical"
+status: "resolved"
+tags: ["jwt","clock-skew"]
+---
+
+# JWT rejected because of clock skew between nodes
+
+## 🐛 Error Description
+Tokens were rejected as not yet valid on freshly started nodes.
+
+## 🔧 Resolution
+Allowed sixty seconds of leeway when validating the nbf claim and enabled chrony on every node.
+"""
+
+def error_entry(rng: random.Random, category: str, sequence: int) -> str:
+    component = rng.choice(COMPONENTS)
+    symptom = rng.choice(SYMPTOMS)
+    return f"""---
+error_id: "{category.upper()}-2024-01-01-{sequence:05d}"
+category: "{category}"
+subcategory: "{component}"
+severity: "{rng.choice(['critical', 'high', 'medium', 'low'])}"
+status: "{rng.choice(['active', 'investigating', 'resolved', 'recurring'])}"
+affected_components: ["{component}"]
+tags: ["{component}", "{symptom.split()[0]}"]
+---
+
+# {component}: {symptom}
+
+## 🐛 Error Description
+The {component} failed with "{symptom}" under load.
+
+## 🔍 Root Cause Analysis
+{rng.choice(SYMPTOMS).capitalize()} in a dependency of {rng.choice(COMPONENTS)}.
+
+## 🔧 Resolution
+{rng.choice(FIXES).capitalize()}.
+
+## 🛡️ Prevention Strategies
+- Alert on {symptom}
+"""
+
+def create_test_project(error_count: int) -> Path:
+    """Project with error_count generated entries spread over categories and applications"""
+    project = Path(tempfile.mkdtemp(prefix="error-search-test-"))
+    print(f"📁 Creating {error_count} error entries in: {project}")
+    config = {"project": {"name": "search-test"}, "applications": [{"name": app} for app in APPLICATIONS]}
+    (project / "ai-doc-config.json").write_text(json.dumps(config, indent=2))
+
+    rng = random.Random(48)
+    (project / "error-management").mkdir()
+    (project / "error-management" / "MASTER_ERROR_INDEX.md").write_text("# Master index\n\nconnection refused\n")
+    for sequence in range(error_count):
+        category = CATEGORIES[sequence % len(CATEGORIES)]
+        if sequence % 4 == 3:
+            directory = project / APPLICATIONS[sequence % len(APPLICATIONS)] / "error-management"
+        else:
+            directory = project / "error-management" / category
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"{category}-{sequence:05d}.md").write_text(error_entry(rng, category, sequence))
+
+    (project / "api" / "error-management" / "jwt-clock-skew.md").write_text(NEEDLE)
+    return project
+
+def run_search_tests(project: Path, error_count: int):
+    from ai_doc_framework.error_search import ErrorSearchIndex
+
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print(f"\n📚 Building the index...")
+    with ErrorSearchIndex(project) as index:
+        started = time.perf_counter()
+        counts = index.refresh()
+        print(f"   {counts['added']} files indexed in {time.perf_counter() - started:.2f}s")
+        check("Every error entry indexed, framework files skipped", counts['added'] == error_count + 1)
+
+        started = time.perf_counter()
+        counts = index.refresh()
+        print(f"   No-op refresh in {(time.perf_counter() - started) * 1000:.0f}ms")
+        check("Unchanged files are not re-read", counts['unchanged'] == error_count + 1 and counts['added'] == 0)
+
+    print(f"\n🔍 Ranking and filters...")
+    with ErrorSearchIndex(project) as index:
+        hits = index.search("tokens rejected clock skew")
+        check("Distinctive entry ranked first", hits and hits[0].error_id == "SECURITY-2024-05-01-001")
+        check("Hit carries front matter and application",
+              hits and (hits[0].severity, hits[0].status, hits[0].app) == ("critical", "resolved", "api"))
+
+        hits = index.search("chrony leeway", section="resolution")
+        check("Section search finds the resolution", hits and hits[0].path.endswith("jwt-clock-skew.md"))
+        check("Snippet comes from the matching section",
+              hits and hits[0].section == "resolution" and "chrony" in hits[0].snippet)
+        check("Terms outside the section do not match",
+              not index.search("chrony leeway", section="description"))
+
+        hits = index.search("connection refused", app="worker", limit=50)
+        check("Application filter", hits and all(hit.app == "worker" for hit in hits))
+        hits = index.search("connection refused", category="database", severity="high", limit=50)
+        check("Metadata filters", hits and all((hit.category, hit.severity) == ("database", "high") for hit in hits))
+        unfiltered = {hit.path: hit.score for hit in index.search("connection refused", limit=100000)}
+        check("Filters keep scores and ignore case",
+              hits and all(unfiltered[hit.path] == hit.score for hit in hits) and
+              [hit.path for hit in hits] == [hit.path for hit in index.search(
+                  "connection refused", category="Database", severity="HIGH", limit=50)])
+        check("Plural and singular forms match",
+              {hit.path for hit in index.search("connections refusal", limit=5)} ==
+              {hit.path for hit in index.search("connection refusal", limit=5)})
+
+        timings = []
+        for query in ["connection refused", "timeout response auth-service", "deadlock transaction",
+                      "certificate expired", "jwt clock skew"]:
+            started = time.perf_counter()
+            index.search(query)
+            timings.append((time.perf_counter() - started) * 1000)
+        for filters in [{'app': "worker"}, {'category': "database", 'severity': "high"}]:
+            started = time.perf_counter()
+            index.search("connection refused", **filters)
+            timings.append((time.perf_counter() - started) * 1000)
+        print(f"   Query latency: {', '.join(f'{ms:.1f}ms' for ms in timings)}")
+
+    print(f"\n🔄 Incremental updates...")
+    edited = project / "error-management" / "backend" / "backend-00000.md"
+    edited.write_text(edited.read_text().replace("under load", "under load; see kerberos ticket renewal"))
+    (project / "error-management" / "frontend" / "frontend-00001.md").unlink()
+    (project / "web" / "error-management" / "new-error.md").write_text(
+        "# Hydration mismatch\n\n## Error Description\nServer and client markup differ after upgrade.\n")
+    with ErrorSearchIndex(project) as index:
+        counts = index.refresh()
+        check("Only changed files re-indexed",
+              (counts['added'], counts['updated'], counts['removed']) == (1, 1, 1))
+        check("Edited content is searchable", [hit.path for hit in index.search("kerberos")] ==
+              ["error-management/backend/backend-00000.md"])
+        check("Deleted entry is gone", not any(hit.path.endswith("frontend-00001.md")
+                                               for hit in index.search("frontend", limit=10000)))
+        check("Entry without front matter is indexed", index.search("hydration mismatch")[0].title == "Hydration mismatch")
+
+    return failures
+
+def main():
+    """Main test function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='🧪 Error search test suite')
+    parser.add_argument('--errors', type=int, default=2000,
+                      help='Generated error entries (default: 2000)')
+    args = parser.parse_args()
+
+    print("🧪 AI Documentation Framework Error Search - Test Suite")
+    print("=" * 60)
+
+    project = None
+    failures = None
+    try:
+        project = create_test_project(args.errors)
+        failures = run_search_tests(project, args.errors)
+
+        print(f"\n📊 TEST SUMMARY:")
+        print(f"=" * 30)
+        if not failures:
+            print(f"✅ All error search tests passed!")
+        else:
+            print(f"❌ {len(failures)} checks failed:")
+            for name in failures:
+                print(f"   - {name}")
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if project and project.exists():
+            shutil.rmtree(project, ignore_errors=True)
+            print(f"🗑️  Cleaned up test project: {project}")
+
+    print(f"\n🏁 Test completed")
+    sys.exit(0 if failures == [] else 1)
+
+if __name__ == "__main__":
+    main()
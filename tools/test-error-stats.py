@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+🧪 Test Error Statistics
+Regenerates MASTER_ERROR_INDEX.md statistics for a project with generated
+error entries and checks the numbers, the in-place rewrite and that an
+unchanged or one-file-changed project re-reads only what changed
+
+Usage:
+    python tools/test-error-stats.py [--errors 20000]
+"""
+
+import sys
+import json
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+CATEGORIES = ['backend', 'frontend', 'database']
+SEVERITIES = ['critical', 'high', 'medium', 'low']
+STATUSES = ['resolved', 'active', 'resolved', 'recurring']
+
+def error_entry(sequence: int) -> str:
+    status = STATUSES[sequence % len(STATUSES)]
+    resolution = ""
+    if status == 'resolved':
+        # Every other resolved entry states hours; the rest only dates (6h apart)
+        resolution = ("resolution_time_hours: 3\n" if sequence % 8 == 0 else
+                      'first_occurrence: "2024-03-01 08:00:00 UTC"\n'
+                      'resolution_date: "2024-03-01 14:00:00 UTC"\n')
+    return f"""---
+error_id: "ERR-{sequence:05d}"
+category: "{CATEGORIES[sequence % len(CATEGORIES)]}"
+subcategory: "component-{sequence % 5}"
+severity: "{SEVERITIES[sequence % len(SEVERITIES)]}"
+status: "{status}"
+{resolution}ai_confidence_score: 0.5
+assignee: "[name]"
+---
+
+# Generated error {sequence}
+
+## 🐛 Error Description
+Body text that the statistics never read: status: "active"
+"""
+
+def create_test_project(error_count: int) -> Path:
+    from jinja2 import Environment, FileSystemLoader
+
+    project = Path(tempfile.mkdtemp(prefix="error-stats-test-"))
+    print(f"📁 Creating {error_count} error entries in: {project}")
+    config = {"project": {"name": "stats-test"}, "applications": [{"name": "api"}],
+              "error_categories": CATEGORIES}
+    (project / "ai-doc-config.json").write_text(json.dumps(config, indent=2))
+
+    environment = Environment(loader=FileSystemLoader(str(TOOLS_DIR.parent / "templates")), keep_trailing_newline=True)
+    master_index = environment.get_template("error-management/MASTER_ERROR_INDEX.md").render(
+        project_name="stats-test", project_type="multi", project_root=str(project),
+        current_date="2024-01-01", applications=[{"name": "api"}])
+    (project / "error-management").mkdir()
+    (project / "error-management" / "MASTER_ERROR_INDEX.md").write_text(master_index)
+
+    for sequence in range(error_count):
+        if sequence % 10 == 9:
+            directory = project / "api" / "error-management"
+        else:
+            directory = project / "error-management" / CATEGORIES[sequence % len(CATEGORIES)]
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"error-{sequence:05d}.md").write_text(error_entry(sequence))
+    return project
+
+def run_stats_tests(project: Path, error_count: int):
+    from ai_doc_framework.error_stats import update_master_index, MASTER_ERROR_INDEX
+
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    index_path = project / MASTER_ERROR_INDEX
+    original = index_path.read_text()
+
+    print(f"\n📈 First regeneration...")
+    started = time.perf_counter()
+    result = update_master_index(project)
+    print(f"   {result['read']} files read in {time.perf_counter() - started:.2f}s")
+    text = index_path.read_text()
+    check("Every error entry counted", result['errors'] == error_count and result['parsed'] == error_count)
+    check(f"Total in overall metrics", f"- **Total Errors Documented**: {error_count}\n" in text)
+    resolved = sum(1 for n in range(error_count) if STATUSES[n % len(STATUSES)] == 'resolved')
+    check("Resolved count and rate", f"- **Errors Resolved**: {resolved}\n" in text and
+          f"- **Resolution Rate**: {resolved / error_count:.0%}\n" in text)
+    api_errors = sum(1 for n in range(error_count) if n % 10 == 9)
+    check("Application breakdown", f"| api | {api_errors} |" in text)
+    check("Severity and status tables", "| Critical |" in text and "| Recurring |" in text)
+    check("Resolution time from hours and from dates", "- **Fastest / Slowest Resolution**: 3.0h / 6.0h" in text)
+    check("Body text is not parsed", "| Active | " + str(sum(1 for n in range(error_count)
+                                                               if STATUSES[n % 4] == 'active')) + " |" in text)
+    before, after = original.split("## 📈 ERROR STATISTICS")[0], original.split("## 🚀 QUICK ERROR RESOLUTION")[1]
+    check("Rest of the file untouched", text.startswith(before) and
+          text.split("## 🚀 QUICK ERROR RESOLUTION")[1].split("## 📊 PERFORMANCE METRICS")[0] ==
+          after.split("## 📊 PERFORMANCE METRICS")[0] and text.endswith(original.split("\n---\n")[-1]))
+
+    print(f"\n♻️  Regeneration with nothing changed...")
+    started = time.perf_counter()
+    result = update_master_index(project)
+    print(f"   {result['cached']} from cache in {time.perf_counter() - started:.2f}s")
+    check("No file re-read", result['read'] == 0 and not result['changed'])
+    check("Output is stable", index_path.read_text() == text)
+
+    print(f"\n➕ Regeneration after one new error...")
+    (project / "error-management" / "backend" / "new-error.md").write_text(error_entry(0))
+    result = update_master_index(project)
+    check("Only the new file read", result['read'] == 1 and result['parsed'] == 1)
+    check("New error counted", f"- **Total Errors Documented**: {error_count + 1}\n" in index_path.read_text())
+
+    touched = project / "error-management" / "backend" / "new-error.md"
+    touched.write_text(touched.read_text())
+    result = update_master_index(project)
+    check("Touched file re-read but not re-parsed", result['read'] == 1 and result['parsed'] == 0)
+
+    touched.unlink()
+    result = update_master_index(project, check=True)
+    check("Check mode reports stale statistics", result['changed'] and result['removed'] == 1)
+    check("Check mode leaves the file alone", f"**Total Errors Documented**: {error_count + 1}\n" in index_path.read_text())
+
+    return failures
+
+def main():
+    """Main test function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='🧪 Error statistics test suite')
+    parser.add_argument('--errors', type=int, default=2000,
+                      help='Generated error entries (default: 2000)')
+    args = parser.parse_args()
+
+    print("🧪 AI Documentation Framework Error Statistics - Test Suite")
+    print("=" * 60)
+
+    project = None
+    failures = None
+    try:
+        project = create_test_project(args.errors)
+        failures = run_stats_tests(project, args.errors)
+
+        print(f"\n📊 TEST SUMMARY:")
+        print(f"=" * 30)
+        if not failures:
+            print(f"✅ All error statistics tests passed!")
+        else:
+            print(f"❌ {len(failures)} checks failed:")
+            for name in failures:
+                print(f"   - {name}")
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if project and project.exists():
+            shutil.rmtree(project, ignore_errors=True)
+            print(f"🗑️  Cleaned up test project: {project}")
+
+    print(f"\n🏁 Test completed")
+    sys.exit(0 if failures == [] else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+🧪 Test Framework Update System
+Offline test of delta updates against a local directory, zip and HTTP mirror
+source, of cached version checks against a local releases API stand-in, and
+of backup restores from intact and tampered backups
+
+Usage:
+    python tools/test-framework-update.py
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+FRAMEWORK_ROOT = TOOLS_DIR.parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+def create_test_project():
+    """Create a temporary project with an installed framework and a newer source"""
+    test_dir = Path(tempfile.mkdtemp(prefix="update-test-"))
+    print(f"📁 Creating test project in: {test_dir}")
+
+    project = test_dir / "project"
+    project.mkdir()
+    ignore = shutil.ignore_patterns('__pycache__', '.git', 'requests.jsonl')
+    shutil.copytree(FRAMEWORK_ROOT, project / "ai-doc-framework", ignore=ignore)
+
+    config = {
+        "project": {"name": "Update Test Project", "type": "single"},
+        "applications": [{"name": "api", "type": "backend"}],
+        "framework_version": "2.0.0"
+    }
+    with open(project / "ai-doc-config.json", 'w') as f:
+        json.dump(config, f, indent=2)
+
+    # New framework release: one file added, one changed, one removed, plus
+    # a docs change outside the update include list
+    source = test_dir / "ai-doc-framework-main"
+    shutil.copytree(project / "ai-doc-framework", source)
+    (source / "VERSION").write_text("2.1.0")
+    (source / "tools" / "new-tool.py").write_text("# Added in 2.1.0\n")
+    with open(source / "CHANGELOG.md", 'a') as f:
+        f.write("\n## 2.1.0\n- Test release\n")
+    (source / "templates" / "core-files" / "CREATE_ISSUE_DIRECTORIES.md").unlink()
+    with open(source / "README.md", 'a') as f:
+        f.write("\nDocs-only change\n")
+
+    # Same release packed as a GitHub-style archive
+    with zipfile.ZipFile(test_dir / "framework.zip", 'w') as zip_ref:
+        for path in sorted(source.rglob("*")):
+            zip_ref.write(path, path.relative_to(test_dir).as_posix())
+
+    print(f"✅ Test project and framework source created")
+    return test_dir
+
+def run_update_tests(test_dir):
+    """Run dry-run, delta update, rollback and failed-validation scenarios"""
+    from ai_doc_framework import FrameworkUpdater
+
+    project = test_dir / "project"
+    framework_dir = project / "ai-doc-framework"
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    # Dry run from the zip computes the delta and changes nothing
+    print(f"\n🔍 Dry run from zip source...")
+    updater = FrameworkUpdater(project_root=str(project))
+    updater.source = str(test_dir / "framework.zip")
+    updater.update(auto=True, dry_run=True)
+    from ai_doc_framework.delta import ZipSource
+    zip_source = ZipSource(test_dir / "framework.zip")
+    delta, _ = updater.compute_framework_delta(zip_source)
+    zip_source.close()
+    check("Delta lists added, changed and removed files",
+          delta.added == ["tools/new-tool.py"] and set(delta.changed) == {"CHANGELOG.md", "VERSION"}
+          and delta.removed == ["templates/core-files/CREATE_ISSUE_DIRECTORIES.md"])
+
+    # A member whose bytes no longer match its CRC is refused while streaming
+    corrupt_zip = test_dir / "corrupt.zip"
+    with zipfile.ZipFile(corrupt_zip, 'w', zipfile.ZIP_STORED) as zip_ref:
+        zip_ref.writestr("VERSION", "2.1.0")
+        zip_ref.writestr("tools/new-tool.py", "# Added in 2.1.0\n")
+    data = corrupt_zip.read_bytes()
+    corrupt_zip.write_bytes(data.replace(b"# Added", b"# Adxed", 1))
+    try:
+        ZipSource(corrupt_zip).manifest()
+        check("Corrupt zip member detected by CRC", False)
+    except zipfile.BadZipFile:
+        check("Corrupt zip member detected by CRC", True)
+
+    # Symlink members may only point inside the tree
+    import stat
+    from ai_doc_framework.delta import FrameworkDelta, DirectorySource, apply_delta
+    for name, link_target in (("relative", "../../outside"), ("absolute", "/etc")):
+        escape_zip = test_dir / f"escape-{name}.zip"
+        with zipfile.ZipFile(escape_zip, 'w') as zip_ref:
+            zip_ref.writestr("VERSION", "2.1.0")
+            link = zipfile.ZipInfo("tools/escape")
+            link.external_attr = (stat.S_IFLNK | 0o777) << 16
+            zip_ref.writestr(link, link_target)
+        try:
+            ZipSource(escape_zip)
+            check(f"Symlink member with {name} target outside the tree refused", False)
+        except zipfile.BadZipFile:
+            check(f"Symlink member with {name} target outside the tree refused", True)
+
+    # Nothing is written through a symlinked directory
+    target_root = test_dir / "symlinked-target"
+    (target_root / "tools").mkdir(parents=True)
+    outside = test_dir / "outside"
+    outside.mkdir()
+    (target_root / "tools" / "nested").symlink_to(outside)
+    try:
+        apply_delta(FrameworkDelta(added=["tools/nested/new-tool.py"]),
+                    DirectorySource(test_dir / "ai-doc-framework-main"), target_root)
+        refused = False
+    except ValueError:
+        refused = True
+    check("Write through a symlinked directory refused", refused and not list(outside.iterdir()))
+    check("Dry run left the framework untouched", (framework_dir / "VERSION").read_text().strip() == "2.0.0")
+
+    # Delta update from the directory source
+    print(f"\n🔄 Delta update from directory source...")
+    readme_inode = (framework_dir / "README.md").stat().st_ino
+    updater = FrameworkUpdater(project_root=str(project))
+    updater.source = str(test_dir / "ai-doc-framework-main")
+    check("Update succeeded", updater.update(auto=True))
+    check("New VERSION active", (framework_dir / "VERSION").read_text().strip() == "2.1.0")
+    check("Added file installed", (framework_dir / "tools" / "new-tool.py").exists())
+    manage_rules = (project / "MANAGE_RULES.md").read_text()
+    check("MANAGE_RULES.md rendered for the configured applications",
+          "{%" not in manage_rules and f"        'api': '{project}/api/AI_RULES.md',\n" in manage_rules)
+    check("Removed file gone",
+          not (framework_dir / "templates" / "core-files" / "CREATE_ISSUE_DIRECTORIES.md").exists())
+    check("Files outside the include list not written", (framework_dir / "README.md").stat().st_ino == readme_inode)
+    check("Previous version kept intact",
+          (project / "ai-doc-framework.previous" / "VERSION").read_text().strip() == "2.0.0"
+          and (project / "ai-doc-framework.previous" / "templates" / "core-files" / "CREATE_ISSUE_DIRECTORIES.md").exists())
+
+    # Swapping back restores the previous tree with a rename
+    print(f"\n⏪ Framework rollback...")
+    check("Rollback succeeded", updater.rollback_framework())
+    check("Previous VERSION active again", (framework_dir / "VERSION").read_text().strip() == "2.0.0")
+
+    # A broken release is rejected before it goes live
+    print(f"\n🚫 Update with a broken source...")
+    (test_dir / "ai-doc-framework-main" / "tools" / "conflict-detector.py").unlink()
+    updater = FrameworkUpdater(project_root=str(project))
+    updater.source = str(test_dir / "ai-doc-framework-main")
+    updater.update(auto=True)
+    check("Live framework untouched after failed validation",
+          (framework_dir / "tools" / "conflict-detector.py").exists()
+          and (framework_dir / "VERSION").read_text().strip() == "2.0.0")
+    check("Staging directory cleaned up", not list(project.glob("ai-doc-framework.staging-*")))
+
+    return failures
+
+def start_mirror(directory):
+    """Serve directory over HTTP on a free local port, counting requests per path"""
+    import threading
+    from functools import partial
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+    requests = {}
+
+    class MirrorHandler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            requests[self.path] = requests.get(self.path, 0) + 1
+            super().do_GET()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(MirrorHandler, directory=str(directory)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests
+
+def run_cache_tests(test_dir):
+    """Update two projects from a local HTTP mirror through one shared artifact cache"""
+    import hashlib
+    from ai_doc_framework import FrameworkUpdater
+    from ai_doc_framework.artifact_cache import ArtifactCache
+
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print(f"\n📥 Updates from a local mirror through the artifact cache...")
+    server, requests = start_mirror(test_dir)
+    url = f"http://127.0.0.1:{server.server_address[1]}/framework.zip"
+    cache_dir = test_dir / "artifact-cache"
+    digest = hashlib.sha256((test_dir / "framework.zip").read_bytes()).hexdigest()
+
+    try:
+        for name in ("mirror-project-a", "mirror-project-b"):
+            project = test_dir / name
+            shutil.copytree(test_dir / "project", project, symlinks=True,
+                            ignore=shutil.ignore_patterns('ai-doc-framework.previous', '.ai-doc-backups'))
+            updater = FrameworkUpdater(project_root=str(project))
+            updater.source = url
+            updater.source_sha256 = digest
+            updater.artifact_cache_dir = str(cache_dir)
+            check(f"{name} updated from mirror", updater.update(auto=True, force=True))
+            check(f"{name} has the mirrored release",
+                  (project / "ai-doc-framework" / "tools" / "new-tool.py").exists())
+
+        check("Mirror downloaded once for both projects", requests.get("/framework.zip") == 1)
+        check("Artifact cached by content hash", (cache_dir / f"{digest}.zip").exists())
+
+        # A corrupt cache entry is evicted and fetched again
+        (cache_dir / f"{digest}.zip").write_bytes(b"corrupt")
+        updater = FrameworkUpdater(project_root=str(test_dir / "mirror-project-a"))
+        updater.source = url
+        updater.artifact_cache_dir = str(cache_dir)
+        check("Corrupt cached artifact replaced", updater.update(auto=True, force=True)
+              and requests.get("/framework.zip") == 2)
+
+        # A wrong checksum is rejected before anything is extracted
+        updater = FrameworkUpdater(project_root=str(test_dir / "mirror-project-b"))
+        updater.source = url
+        updater.source_sha256 = "0" * 64
+        updater.artifact_cache_dir = str(cache_dir)
+        check("Checksum mismatch rejected", not updater.update(auto=True, force=True))
+
+        # A URL alone may move: its cached copy is revalidated, not served forever
+        moving = test_dir / "moving.zip"
+        moving_url = url.replace("/framework.zip", "/moving.zip")
+        with zipfile.ZipFile(moving, 'w') as archive:
+            archive.writestr("VERSION", "2.1.0")
+        cache = ArtifactCache(cache_dir)
+        first = cache.fetch(moving_url)
+        check("Unchanged URL revalidated with a 304",
+              cache.fetch(moving_url) == first and requests.get("/moving.zip") == 2
+              and cache.stats['downloads'] == 1)
+        with zipfile.ZipFile(moving, 'w') as archive:
+            archive.writestr("VERSION", "2.2.0")
+        later = moving.stat().st_mtime + 60
+        os.utime(moving, (later, later))  # Last-Modified has one-second resolution
+        changed = cache.fetch(moving_url)
+        check("Changed URL content downloaded again",
+              changed != first and zipfile.ZipFile(changed).read("VERSION") == b"2.2.0"
+              and cache.stats['downloads'] == 2)
+    finally:
+        server.shutdown()
+
+    return failures
+
+def start_releases_api(tag_name):
+    """Stand-in for the GitHub releases API that honours If-None-Match"""
+    import threading
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    requests = {'total': 0, 'not_modified': 0}
+    etag = f'"{tag_name}"'
+
+    class ReleasesHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests['total'] += 1
+            if self.path.startswith('http://'):
+                # Absolute URL: this server is being used as the HTTP proxy
+                requests['proxied'] = requests.get('proxied', 0) + 1
+            if '/moved/' in self.path:
+                self.send_response(301)
+                self.send_header('Location', self.path.replace('/moved/', '/'))
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            if self.headers.get('If-None-Match') == etag:
+                requests['not_modified'] += 1
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            body = json.dumps({'tag_name': tag_name}).encode()
+            self.send_response(200)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReleasesHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests
+
+def run_version_check_tests(test_dir):
+    """Version reports and update checks share one TTL-cached, conditional request"""
+    from ai_doc_framework import FrameworkUpdater, VersionManager, VersionCheckClient
+
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print(f"\n🛰️  Version checks against a local releases API...")
+    server, requests = start_releases_api("v2.1.0")
+    url = f"http://127.0.0.1:{server.server_address[1]}/repos/zsarir/ai-doc-framework/releases/latest"
+    cache_file = test_dir / "latest-release.json"
+    project = str(test_dir / "project")
+
+    try:
+        client = VersionCheckClient(url=url, cache_file=cache_file)
+        report = VersionManager(project_root=project, version_client=client).generate_version_report('json')
+        check("Version report costs one request", requests['total'] == 1
+              and json.loads(report)["latest_version"] == "2.1.0")
+
+        updater = FrameworkUpdater(project_root=project)
+        updater.version_client = VersionCheckClient(url=url, cache_file=cache_file)
+        updater.current_version = "2.0.0"
+        check("Fresh cache answers the update check without a request",
+              updater.check_for_updates() == (True, "2.1.0") and requests['total'] == 1)
+
+        client = VersionCheckClient(url=url, cache_file=cache_file, ttl=0)
+        check("Stale cache revalidated with If-None-Match",
+              client.latest_version() == "2.1.0" and requests['not_modified'] == 1)
+
+        client = VersionCheckClient(url=url, cache_file=cache_file, ttl=0)
+        check("Background refresh answers from cache immediately", client.latest_version(background=True) == "2.1.0")
+        client.wait_for_refresh(5)
+        check("Background refresh revalidated the cache", requests['total'] == 3)
+
+        client = VersionCheckClient(url=url.replace('/repos/', '/moved/repos/'), cache_file=test_dir / "moved.json")
+        check("Redirects followed", client.latest_version() == "2.1.0" and requests['total'] == 5)
+
+        # A CLI that exits right after answering still lets the refresh land in the cache
+        import subprocess
+        checked_at = json.loads(cache_file.read_text())['checked_at']
+        script = ("import sys; sys.path.insert(0, sys.argv[1]); from ai_doc_framework import VersionCheckClient; "
+                  "VersionCheckClient(url=sys.argv[2], cache_file=sys.argv[3], ttl=0).latest_version(background=True)")
+        subprocess.run([sys.executable, "-c", script, str(TOOLS_DIR), url, str(cache_file)], check=True)
+        check("Background refresh finished before exit", json.loads(cache_file.read_text())['checked_at'] > checked_at)
+
+        proxy = f"http://127.0.0.1:{server.server_address[1]}"
+        saved = {name: os.environ.pop(name, None) for name in ('http_proxy', 'HTTP_PROXY', 'no_proxy', 'NO_PROXY')}
+        os.environ['http_proxy'] = proxy
+        try:
+            client = VersionCheckClient(url="http://releases.invalid/repos/zsarir/ai-doc-framework/releases/latest",
+                                        cache_file=test_dir / "proxied.json")
+            check("HTTP_PROXY honoured", client.latest_version() == "2.1.0" and requests.get('proxied') == 1)
+        finally:
+            del os.environ['http_proxy']
+            os.environ.update({name: value for name, value in saved.items() if value is not None})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    client = VersionCheckClient(url=url, cache_file=cache_file, ttl=0, connect_timeout=1, read_timeout=1)
+    check("Unreachable API falls back to the last known release",
+          client.latest_version() == "2.1.0" and client.stats['errors'] == 1)
+
+    return failures
+
+def write_tampered_archive(archive_path, entries):
+    """Backup archive whose manifest matches its members: path -> file bytes, or str symlink target"""
+    import io
+    import tarfile
+    import hashlib
+    files = {}
+    for path, value in entries.items():
+        if isinstance(value, bytes):
+            files[path] = {"hash": hashlib.sha256(value).hexdigest(), "size": len(value), "mode": 0o644}
+        else:
+            files[path] = {"link": value}
+    manifest = json.dumps({"created": "2024-01-01T00:00:00", "project_root": "/elsewhere",
+                           "roots": sorted({path.split('/')[0] for path in entries}), "files": files}).encode()
+    with tarfile.open(archive_path, 'w:gz') as tar:
+        info = tarfile.TarInfo("AI_DOC_BACKUP_MANIFEST.json")
+        info.size = len(manifest)
+        tar.addfile(info, io.BytesIO(manifest))
+        for path, value in entries.items():
+            info = tarfile.TarInfo(path)
+            if isinstance(value, bytes):
+                info.size = len(value)
+                tar.addfile(info, io.BytesIO(value))
+            else:
+                info.type = tarfile.SYMTYPE
+                info.linkname = value
+                tar.addfile(info)
+
+def run_backup_tests(test_dir):
+    """Backups restore in place, and tampered ones cannot write outside the project"""
+    from ai_doc_framework.backup_archive import BackupArchiveError, restore_backup_archive, write_backup_archive
+
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print(f"\n🗄️  Backup archive restore...")
+    project = test_dir / "backup-project"
+    (project / "tools").mkdir(parents=True)
+    (project / "tools" / "tool.py").write_text("original\n")
+    (project / "tools" / "alias.py").symlink_to("tool.py")
+    archive = test_dir / "backup.tar.gz"
+    write_backup_archive(project, ["tools"], archive)
+    (project / "tools" / "tool.py").write_text("changed\n")
+    (project / "tools" / "alias.py").unlink()
+    stats = restore_backup_archive(archive, project)
+    check("Archive restores files and symlinks", stats['restored'] == 2 and
+          (project / "tools" / "tool.py").read_text() == "original\n" and
+          os.readlink(project / "tools" / "alias.py") == "tool.py")
+
+    outside = test_dir / "backup-outside"
+    outside.mkdir()
+    tampered = {
+        "link to an absolute path": {"tools": str(outside), "tools/x": b"planted\n"},
+        "link out of the project": {"docs/escape": "../../backup-outside", "docs/escape/x": b"planted\n"},
+    }
+    for name, entries in tampered.items():
+        target = test_dir / "tampered-project"
+        shutil.rmtree(target, ignore_errors=True)
+        target.mkdir()
+        write_tampered_archive(test_dir / "tampered.tar.gz", entries)
+        try:
+            restore_backup_archive(test_dir / "tampered.tar.gz", target)
+            refused = False
+        except BackupArchiveError:
+            refused = True
+        check(f"Tampered archive with a {name} refused", refused and not list(outside.iterdir()))
+
+    # A symlinked directory already in the project is not written through either
+    target = test_dir / "tampered-project"
+    shutil.rmtree(target)
+    target.mkdir()
+    (target / "tools").symlink_to(outside)
+    write_tampered_archive(test_dir / "tampered.tar.gz", {"tools/x": b"planted\n"})
+    try:
+        restore_backup_archive(test_dir / "tampered.tar.gz", target)
+        refused = False
+    except BackupArchiveError:
+        refused = True
+    check("Restore through a symlinked directory refused", refused and not list(outside.iterdir()))
+
+    print(f"\n🗃️  Backup store restore...")
+    from ai_doc_framework.backup_store import BackupStore
+    store = BackupStore(test_dir / "backup-store")
+    manifest = store.load_manifest(store.create_backup(project, ["tools"]))
+    stored = manifest["files"]["tools/tool.py"]
+    (project / "tools" / "alias.py").unlink()
+    check("Store restores symlinks", store.restore(manifest, project)['restored'] == 1 and
+          os.readlink(project / "tools" / "alias.py") == "tool.py")
+
+    tampered = {
+        "link to an absolute path": {"tools": {"link": str(outside)}, "tools/x": stored},
+        "link out of the project": {"docs/escape": {"link": "../../backup-outside"}, "docs/escape/x": stored},
+    }
+    for name, files in tampered.items():
+        target = test_dir / "tampered-project"
+        shutil.rmtree(target, ignore_errors=True)
+        target.mkdir()
+        try:
+            store.restore({"roots": sorted({path.split('/')[0] for path in files}), "files": files}, target)
+            refused = False
+        except ValueError:
+            refused = True
+        check(f"Store manifest with a {name} refused", refused and not list(outside.iterdir()))
+
+    target = test_dir / "tampered-project"
+    shutil.rmtree(target)
+    target.mkdir()
+    (target / "tools").symlink_to(outside)
+    try:
+        store.restore({"roots": ["tools"], "files": {"tools/x": stored}}, target)
+        refused = False
+    except ValueError:
+        refused = True
+    check("Store restore through a symlinked directory refused", refused and not list(outside.iterdir()))
+
+    return failures
+
+def cleanup_test_project(test_dir):
+    """Clean up test project"""
+    try:
+        shutil.rmtree(test_dir)
+        print(f"🗑️  Cleaned up test project: {test_dir}")
+    except Exception as e:
+        print(f"⚠️  Warning: Could not clean up {test_dir}: {e}")
+
+def main():
+    """Main test function"""
+    print("🧪 AI Documentation Framework Update - Test Suite")
+    print("=" * 60)
+
+    test_dir = None
+    failures = None
+    try:
+        test_dir = create_test_project()
+        failures = run_update_tests(test_dir)
+        failures += run_cache_tests(test_dir)
+        failures += run_version_check_tests(test_dir)
+        failures += run_backup_tests(test_dir)
+
+        # Summary
+        print(f"\n📊 TEST SUMMARY:")
+        print(f"=" * 30)
+        if not failures:
+            print(f"✅ All update tests passed!")
+        else:
+            print(f"❌ {len(failures)} checks failed:")
+            for name in failures:
+                print(f"   - {name}")
+
+    except KeyboardInterrupt:
+        print(f"\n⚠️  Test cancelled by user")
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if test_dir and test_dir.exists():
+            cleanup_test_project(test_dir)
+
+    print(f"\n🏁 Test completed")
+    sys.exit(0 if failures == [] else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+🧪 Test Issue Tracker
+Builds a project with generated issue files in issues/open and issues/closed
+(project and applications), then checks queries, incremental refresh after
+creating, closing and deleting issues, and ISSUE_TRACKER.md regeneration
+
+Usage:
+    python tools/test-issue-tracker.py [--issues 100000]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+APPLICATIONS = ['api', 'web', 'worker', 'mobile']
+CATEGORIES = ['incomplete-tasks', 'unresolved-errors', 'system-issues', 'performance-issues']
+PRIORITIES = ['critical', 'high', 'medium', 'low']
+
+def issue_file(sequence: int, closed: bool) -> str:
+    closed_line = 'closed_date: "2024-02-01 12:00:00 UTC"\n' if closed else ''
+    return f"""---
+issue_id: "TASK-2024-02-01-{sequence:06d}"
+type: "incomplete-task"
+priority: "{PRIORITIES[sequence % len(PRIORITIES)]}"
+status: "{'closed' if closed else 'open'}"
+created_date: "2024-02-01 00:00:00 UTC"
+{closed_line}---
+
+# 🚧 Incomplete Task: Generated task {sequence}
+
+## 📝 Task Description
+Generated.
+
+## 🏷️ Tags
+generated, batch-{sequence % 3}
+"""
+
+def create_test_project(issue_count: int) -> Path:
+    from jinja2 import Environment, FileSystemLoader
+
+    project = Path(tempfile.mkdtemp(prefix="issue-tracker-test-"))
+    print(f"📁 Creating {issue_count} issue files in: {project}")
+    config = {"project": {"name": "issue-test"}, "applications": [{"name": app} for app in APPLICATIONS],
+              "issue_categories": CATEGORIES[:3]}
+    (project / "ai-doc-config.json").write_text(json.dumps(config, indent=2))
+
+    environment = Environment(loader=FileSystemLoader(str(TOOLS_DIR.parent / "templates")),
+                              trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+    tracker = environment.get_template("issue-management/ISSUE_TRACKER.md").render(
+        project_name="issue-test", project_type="multi", project_root=str(project),
+        current_date="2024-01-01", issue_categories=CATEGORIES[:3])
+    for base in [project] + [project / app for app in APPLICATIONS]:
+        (base / "issues").mkdir(parents=True)
+        (base / "issues" / "ISSUE_TRACKER.md").write_text(tracker)
+
+    for sequence in range(issue_count):
+        closed = sequence % 3 == 0
+        app = APPLICATIONS[sequence % 5] if sequence % 5 < len(APPLICATIONS) else None
+        base = project / app if app else project
+        directory = base / "issues" / ("closed" if closed else "open") / CATEGORIES[sequence % len(CATEGORIES)]
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"issue-{sequence:06d}.md").write_text(issue_file(sequence, closed))
+    return project
+
+def expected_open(issue_count: int, app, category) -> int:
+    return sum(1 for n in range(issue_count) if n % 3 != 0
+               and (APPLICATIONS[n % 5] if n % 5 < len(APPLICATIONS) else None) == app
+               and CATEGORIES[n % len(CATEGORIES)] == category)
+
+def age_tree(project: Path):
+    """Push every mtime back, as if the files were created earlier (racy-listing guard)"""
+    past = time.time() - 60
+    for dirpath, dirnames, filenames in os.walk(project):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+        os.utime(dirpath, (past, past))
+
+def run_tracker_tests(project: Path, issue_count: int):
+    from ai_doc_framework.issue_index import IssueIndex
+
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    age_tree(project)
+
+    print(f"\n🗂️  Building the index...")
+    with IssueIndex(project) as index:
+        started = time.perf_counter()
+        counts = index.refresh()
+        print(f"   {counts['added']} issue files indexed in {time.perf_counter() - started:.2f}s")
+        check("Every issue file indexed", counts['added'] == issue_count)
+
+        started = time.perf_counter()
+        counts = index.refresh()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"   No-op refresh in {elapsed_ms:.0f}ms")
+        check("No-op refresh lists no directory", counts['directories_listed'] == 0)
+
+        started = time.perf_counter()
+        issues = index.query(app="api", category="incomplete-tasks")
+        print(f"   Open issues for api/incomplete-tasks: {len(issues)} in {(time.perf_counter() - started) * 1000:.1f}ms")
+        check("App/category query", len(issues) == expected_open(issue_count, "api", "incomplete-tasks"))
+        check("Query results parsed", issues and issues[0].priority == "critical" and
+              issues[0].title.startswith("Incomplete Task: Generated task") and "generated" in issues[0].tags)
+        check("Project-level issues", len(index.query(project_only=True, category="system-issues")) ==
+              expected_open(issue_count, None, "system-issues"))
+        check("Tag filter", all("batch-1" in issue.tags for issue in index.query(tag="batch-1", limit=20)))
+
+    print(f"\n🔄 Incremental refresh...")
+    api_open = project / "api" / "issues" / "open" / "incomplete-tasks"
+    victim = sorted(api_open.iterdir())[0]
+    closed_dir = project / "api" / "issues" / "closed" / "incomplete-tasks"
+    shutil.move(str(victim), str(closed_dir / victim.name))
+    (api_open / "new-issue.md").write_text(issue_file(999999, False))
+    (project / "issues" / "open" / "incomplete-tasks" / "issue-000004.md").unlink()
+    (project / "web" / "issues" / "open" / "security-issues").mkdir()
+    (project / "web" / "issues" / "open" / "security-issues" / "leak.md").write_text(
+        "---\npriority: critical\n---\n\n# Token leak\n")
+    with IssueIndex(project) as index:
+        counts = index.refresh()
+        print(f"   {counts['directories_listed']} directories listed")
+        check("Only changed directories listed", counts['directories_listed'] <= 6)
+        check("Create, close, delete and new category picked up",
+              (counts['added'], counts['removed']) == (3, 2))
+        check("Closed issue moved", [issue.state for issue in index.query(state=None) if issue.path.endswith(victim.name)
+                                     and issue.app == "api"] == ["closed"])
+        check("New category queryable", [issue.title for issue in index.query(app="web", category="security-issues")]
+              == ["Token leak"])
+
+        # Directories listed moments ago are re-listed once; settle them first
+        age_tree(project)
+        index.refresh()
+        edited = closed_dir / victim.name
+        edited.write_text(edited.read_text().replace('priority: "critical"', 'priority: "low"') + "\n")
+        check("Verify catches in-place edits", index.refresh(verify=True)['updated'] == 1)
+
+        print(f"\n📊 ISSUE_TRACKER.md regeneration...")
+        changed = index.update_trackers(["incomplete-tasks", "unresolved-errors", "system-issues"])
+        check("Project and application trackers updated", len(changed) == 1 + len(APPLICATIONS))
+        tracker = (project / "issues" / "ISSUE_TRACKER.md").read_text()
+        total_open = len(index.query())
+        check("Open count in tracker", f"- **Open Issues**: {total_open}\n" in tracker)
+        check("Per-application table", "### Open Issues by Application" in tracker and "| api |" in tracker)
+        check("Resolution time from dates", "- **Average Resolution Time**: 12.0h" in tracker)
+        check("Template sections kept", "## 🚀 QUICK ACTIONS" in tracker and "### AI Session Stats" in tracker
+              and "- **Total AI Sessions**: 0" in tracker)
+        app_tracker = (project / "api" / "issues" / "ISSUE_TRACKER.md").read_text()
+        check("Application tracker scoped to the application",
+              f"- **Open Issues**: {len(index.query(app='api'))}\n" in app_tracker)
+        check("Regeneration is stable", index.update_trackers(["incomplete-tasks", "unresolved-errors",
+                                                               "system-issues"]) == [])
+        critical_open = len(index.query(priority="critical"))
+
+    # An in-place edit changes no directory mtime; update-tracker must still count it
+    print(f"\n✏️  update-tracker after an in-place edit...")
+    age_tree(project)
+    with IssueIndex(project) as index:
+        index.refresh()
+        edited = project / index.query(priority="critical", limit=1)[0].path
+    edited.write_text(edited.read_text().replace('priority: "critical"', 'priority: "low"'))
+    result = subprocess.run([sys.executable, str(TOOLS_DIR / "issue-tracker.py"), "--project-path", str(project),
+                             "update-tracker"], capture_output=True, text=True)
+    tracker = (project / "issues" / "ISSUE_TRACKER.md").read_text()
+    check("update-tracker counts in-place edits",
+          result.returncode == 0 and f"- **Critical Issues**: {critical_open - 1}\n" in tracker)
+
+    return failures
+
+def main():
+    """Main test function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='🧪 Issue tracker test suite')
+    parser.add_argument('--issues', type=int, default=5000,
+                      help='Generated issue files (default: 5000)')
+    args = parser.parse_args()
+
+    print("🧪 AI Documentation Framework Issue Tracker - Test Suite")
+    print("=" * 60)
+
+    project = None
+    failures = None
+    try:
+        project = create_test_project(args.issues)
+        failures = run_tracker_tests(project, args.issues)
+
+        print(f"\n📊 TEST SUMMARY:")
+        print(f"=" * 30)
+        if not failures:
+            print(f"✅ All issue tracker tests passed!")
+        else:
+            print(f"❌ {len(failures)} checks failed:")
+            for name in failures:
+                print(f"   - {name}")
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if project and project.exists():
+            shutil.rmtree(project, ignore_errors=True)
+            print(f"🗑️  Cleaned up test project: {project}")
+
+    print(f"\n🏁 Test completed")
+    sys.exit(0 if failures == [] else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+🧪 Test Project Migration System
+Offline test of multi-hop migration planning and the single-pass,
+resumable migration of a v1.x project, serial and on a worker pool
+
+Usage:
+    python tools/test-migration.py
+"""
+
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+def create_test_project():
+    """Create a temporary v1.0 project"""
+    test_dir = Path(tempfile.mkdtemp(prefix="migration-test-"))
+    print(f"📁 Creating test project in: {test_dir}")
+
+    project = test_dir / "project"
+    project.mkdir()
+    config = {
+        "project": {"name": "migration-test"},
+        "applications": [{"name": "api", "path": "api"}]
+    }
+    (project / "ai-doc-config.json").write_text(json.dumps(config, indent=2))
+    (project / "AI_RULES.md").write_text("# AI Rules\n\n- Keep it simple\n")
+    (project / "START_TASK.md").write_text("# Start Task\n\n### Step 1: Read the rules\n")
+    (project / "COMPLETE_TASK.md").write_text("# Complete Task\n")
+    (project / "api").mkdir()
+    (project / "api" / "AI_RULES.md").write_text("# API Rules\n")
+    return test_dir
+
+def run_planner_tests(test_dir):
+    """Shortest paths through registered steps and compatible versions"""
+    from ai_doc_framework import VersionManager
+    from ai_doc_framework.migration_plan import MigrationStep, MigrationPlanError, plan_migration
+
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print(f"\n🧭 Migration planning...")
+    manager = VersionManager(project_root=str(test_dir / "project"))
+    check("1.0.0 → 2.0.0 goes through every release",
+          manager.get_migration_path("1.0.0", "2.0.0") == ["1.0.0", "1.1.0", "1.2.0", "2.0.0"])
+    check("1.2.0 → 2.0.0 is a single step", manager.get_migration_path("1.2.0", "2.0.0") == ["1.2.0", "2.0.0"])
+    check("Same version needs no migration", manager.get_migration_path("2.0.0", "2.0.0") == [])
+    check("Unregistered release only stamps the version",
+          manager.plan_migration("2.0.0", "2.1.0").steps == [])
+    # A patch release the graph does not know still runs every 1.x → 2.0 step
+    plan = manager.plan_migration("1.0.0", "2.0.1")
+    check("Unknown target migrates to the highest known version below it",
+          plan.versions == ["1.0.0", "1.1.0", "1.2.0", "2.0.0", "2.0.1"] and len(plan.steps) == 3)
+    check("Resolved target reported", plan.resolved_to == "2.0.0" and
+          plan.resolution_notes() == ["2.0.1 has no registered migration steps; migrating to 2.0.0, then stamping 2.0.1"])
+    plan = manager.plan_migration("1.1.5", "2.0.0")
+    check("Unknown source planned from the highest known version below it",
+          plan.resolved_from == "1.1.0" and [step.to_version for step in plan.steps] == ["1.2.0", "2.0.0"])
+    try:
+        manager.plan_migration("0.9.0", "2.0.0")
+        check("Version below every known one has no path", False)
+    except MigrationPlanError:
+        check("Version below every known one has no path", True)
+    try:
+        manager.plan_migration("2.0.0", "1.0.0")
+        check("Downgrade has no path", False)
+    except MigrationPlanError:
+        check("Downgrade has no path", True)
+
+    # Compatible versions are joined by no-op hops when no step covers them
+    matrix = {"1.0.0": {"compatible_with": ["1.0.0", "1.1.0"]}, "1.1.0": {"compatible_with": ["1.1.0"]}}
+    steps = [MigrationStep("1.1.0", "2.0.0", "major")]
+    plan = plan_migration("1.0.0", "2.0.0", matrix, steps)
+    check("Compatible hop used to reach a registered step",
+          plan.versions == ["1.0.0", "2.0.0"] and [step.description for step in plan.steps] == ["major"])
+
+    return failures
+
+def run_migration_tests(test_dir):
+    """Composed migration touches each file once, resumes after a crash and stays idempotent"""
+    from ai_doc_framework import V1ToV2Migrator, VersionManager
+    from ai_doc_framework import migration_plan
+    from ai_doc_framework.migration_journal import MigrationJournal
+
+    project = test_dir / "project"
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print(f"\n🔍 Dry run...")
+    migrator = V1ToV2Migrator(project_root=str(project))
+    check("Dry run succeeded", migrator.migrate(interactive=False, dry_run=True))
+    check("Dry run wrote nothing", not (project / "VERSION").exists())
+
+    # Interrupt the migration after its first few writes
+    writes = {}
+    original_write = migration_plan.write_text_atomic
+
+    def crashing_write(target, content):
+        if sum(writes.values()) == 3:
+            raise OSError("Simulated crash")
+        counting_write(target, content)
+
+    def counting_write(target, content):
+        relative = target.relative_to(project).as_posix()
+        writes[relative] = writes.get(relative, 0) + 1
+        original_write(target, content)
+
+    print(f"\n💥 Interrupted migration...")
+    migration_plan.write_text_atomic = crashing_write
+    try:
+        check("Interrupted migration reports failure",
+              not V1ToV2Migrator(project_root=str(project)).migrate(interactive=False))
+    finally:
+        migration_plan.write_text_atomic = original_write
+    check("Journal records the finished files", len(MigrationJournal(project).state.files) == 3)
+
+    print(f"\n🔄 Resuming 1.0.0 → 2.0.0...")
+    migration_plan.write_text_atomic = counting_write
+    try:
+        check("Resumed migration succeeded", V1ToV2Migrator(project_root=str(project)).migrate(interactive=False))
+    finally:
+        migration_plan.write_text_atomic = original_write
+
+    check("Backup taken once", len(list((project / ".ai-doc-backups" / "manifests").glob("*.json"))) == 1)
+    check("Each file written exactly once across both runs", writes and set(writes.values()) == {1})
+    check("Journal marked complete", MigrationJournal(project).state.complete)
+
+    config = json.loads((project / "ai-doc-config.json").read_text())
+    check("Every step applied to the configuration",
+          config["framework_version"] == "2.0.0" and "issue_categories" in config and "error_categories" in config)
+    check("New v2.0 files added",
+          all((project / name).exists() for name in ("VERSION", "CHANGELOG.md", "MANAGE_RULES.md")))
+    start_task = (project / "START_TASK.md").read_text()
+    check("Conflict detection step inserted before step 1",
+          start_task.index("Step 0.5") < start_task.index("### Step 1:"))
+    check("Application files migrated", "Conflict Detection Rules" in (project / "api" / "AI_RULES.md").read_text())
+
+    # Re-running the plan only re-stamps the version
+    plan = VersionManager(str(project)).plan_migration("1.0.0", "2.0.0")
+    result = plan.apply(project, dry_run=True)
+    check("Migration is idempotent", result['created'] == [] and result['updated'] == ["ai-doc-config.json"])
+
+    return failures
+
+def run_parallel_tests(test_dir):
+    """Per-application work on a worker pool gives the same, ordered results"""
+    from ai_doc_framework import V1ToV2Migrator
+
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print(f"\n🧵 Parallel migration of 150 applications...")
+    projects = {}
+    for jobs in (1, 8):
+        project = test_dir / f"apps-jobs-{jobs}"
+        project.mkdir()
+        apps = [f"app-{n:03d}" for n in range(150)]
+        config = {"project": {"name": "many-apps"}, "applications": [{"name": app} for app in apps]}
+        (project / "ai-doc-config.json").write_text(json.dumps(config, indent=2))
+        (project / "AI_RULES.md").write_text("# AI Rules\n")
+        for app in apps:
+            (project / app).mkdir()
+            (project / app / "AI_RULES.md").write_text(f"# {app} Rules\n")
+            (project / app / "START_TASK.md").write_text("### Step 1: Start\n")
+
+        migrator = V1ToV2Migrator(project_root=str(project), jobs=jobs)
+        detection = migrator.detect_v1_installation()
+        plan = migrator.plan_migration(detection["version"])
+        applications = [app["name"] for app in detection["applications"]]
+        result = plan.apply(project, applications=applications, jobs=jobs)
+        validation = migrator.validate_migration()
+        projects[jobs] = (detection["applications"], result, validation)
+
+    detection, result, validation = projects[8]
+    check("Detection keeps config order",
+          [app["name"] for app in detection] == [f"app-{n:03d}" for n in range(150)])
+    check("Every application migrated",
+          len([path for path in result["updated"] if path.endswith("/AI_RULES.md")]) == 150)
+    check("Parallel detection matches serial",
+          [{**app, "path": None} for app in detection] == [{**app, "path": None} for app in projects[1][0]])
+    check("Parallel migration results match serial", result == projects[1][1])
+    check("Parallel validation matches serial", validation == projects[1][2])
+
+    return failures
+
+def cleanup_test_project(test_dir):
+    """Clean up test project"""
+    try:
+        shutil.rmtree(test_dir)
+        print(f"🗑️  Cleaned up test project: {test_dir}")
+    except Exception as e:
+        print(f"⚠️  Warning: Could not clean up {test_dir}: {e}")
+
+def main():
+    """Main test function"""
+    print("🧪 AI Documentation Framework Migration - Test Suite")
+    print("=" * 60)
+
+    test_dir = None
+    failures = None
+    try:
+        test_dir = create_test_project()
+        failures = run_planner_tests(test_dir)
+        failures += run_migration_tests(test_dir)
+        failures += run_parallel_tests(test_dir)
+
+        # Summary
+        print(f"\n📊 TEST SUMMARY:")
+        print(f"=" * 30)
+        if not failures:
+            print(f"✅ All migration tests passed!")
+        else:
+            print(f"❌ {len(failures)} checks failed:")
+            for name in failures:
+                print(f"   - {name}")
+
+    except KeyboardInterrupt:
+        print(f"\n⚠️  Test cancelled by user")
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if test_dir and test_dir.exists():
+            cleanup_test_project(test_dir)
+
+    print(f"\n🏁 Test completed")
+    sys.exit(0 if failures == [] else 1)
+
+if __name__ == "__main__":
+    main()
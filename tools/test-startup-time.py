@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+⏱️ Start-up Time Benchmark
+Measures CLI start-up with `python -X importtime` and enforces a time budget
+
+Agents call the tools many times per task, so --help, --version and
+--health-check must stay fast and must never read the project tree.
+
+Usage:
+    python tools/test-startup-time.py [--budget-ms N] [--import-budget-ms N]
+
+Environment:
+    AI_DOC_STARTUP_BUDGET_MS         Wall-clock budget per command (default: 300)
+    AI_DOC_IMPORT_BUDGET_MS          Import-time budget per command (default: 75)
+"""
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple, Any
+
+TOOLS_DIR = Path(__file__).parent
+
+# Commands that must start quickly and never touch the project tree
+FAST_COMMANDS = [
+    ("conflict-detector.py", ["--version"]),
+    ("conflict-detector.py", ["--health-check"]),
+    ("conflict-detector.py", ["--help"]),
+    ("update-framework.py", ["--version"]),
+    ("update-framework.py", ["--help"]),
+    ("migrate-from-v1.py", ["--version"]),
+    ("version-manager.py", ["--help"]),
+]
+
+DEFAULT_BUDGET_MS = float(os.environ.get('AI_DOC_STARTUP_BUDGET_MS', 300))
+DEFAULT_IMPORT_BUDGET_MS = float(os.environ.get('AI_DOC_IMPORT_BUDGET_MS', 75))
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parse `-X importtime` output into (module, depth, self_us, cumulative_us)"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_part, cumulative_us, name = line.split('|', 2)
+        self_us = self_part.replace('import time:', '')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+def measure_startup(tool: str, args: List[str], cwd: Path, runs: int = 3) -> Dict[str, Any]:
+    """Run a tool command and return the best wall time and its import profile"""
+    # The tools import ai_doc_framework, so measure with the bytecode cache
+    # enabled as in a real install (the first run warms it)
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', str(TOOLS_DIR / tool)] + args,
+            capture_output=True, text=True, cwd=cwd, env=env
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+
+        entries = parse_importtime(result.stderr)
+        import_ms = sum(cumulative for _, depth, _, cumulative in entries if depth == 0) / 1000
+        slowest = sorted(
+            ((name, cumulative / 1000) for name, depth, _, cumulative in entries if depth == 0),
+            key=lambda item: item[1], reverse=True
+        )[:5]
+
+        measurement = {
+            "command": f"{tool} {' '.join(args)}",
+            "returncode": result.returncode,
+            "wall_ms": wall_ms,
+            "import_ms": import_ms,
+            "slowest_imports": slowest,
+            "stdout": result.stdout
+        }
+        if best is None or wall_ms < best["wall_ms"]:
+            best = measurement
+    return best
+
+def test_fast_paths_do_not_touch_project() -> bool:
+    """Fast commands must succeed in a directory without ai-doc-config.json"""
+    print(f"\n📁 Checking fast paths never read the project tree...")
+    success = True
+
+    with tempfile.TemporaryDirectory(prefix="startup-test-") as empty_dir:
+        for tool, args in FAST_COMMANDS:
+            result = subprocess.run(
+                [sys.executable, str(TOOLS_DIR / tool)] + args,
+                capture_output=True, text=True, cwd=empty_dir
+            )
+            command = f"{tool} {' '.join(args)}"
+            if result.returncode == 0 and 'Config file not found' not in result.stdout:
+                print(f"✅ {command}")
+            else:
+                print(f"❌ {command} (exit {result.returncode})")
+                success = False
+
+        leftovers = list(Path(empty_dir).iterdir())
+        if leftovers:
+            print(f"❌ Fast paths created files: {[p.name for p in leftovers]}")
+            success = False
+
+    return success
+
+def test_startup_budget(budget_ms: float = DEFAULT_BUDGET_MS,
+                        import_budget_ms: float = DEFAULT_IMPORT_BUDGET_MS) -> bool:
+    """Every fast command must start within the wall-clock and import-time budgets"""
+    print(f"\n⏱️  Start-up budget: {budget_ms:.0f}ms wall, {import_budget_ms:.0f}ms imports")
+    success = True
+
+    with tempfile.TemporaryDirectory(prefix="startup-test-") as empty_dir:
+        for tool, args in FAST_COMMANDS:
+            measurement = measure_startup(tool, args, Path(empty_dir))
+            within_budget = (measurement["wall_ms"] <= budget_ms
+                             and measurement["import_ms"] <= import_budget_ms)
+            icon = "✅" if within_budget else "❌"
+            print(f"{icon} {measurement['command']:<40} "
+                  f"{measurement['wall_ms']:7.1f}ms wall  {measurement['import_ms']:6.1f}ms imports")
+
+            if not within_budget:
+                success = False
+                for name, cumulative_ms in measurement["slowest_imports"]:
+                    print(f"      {cumulative_ms:6.1f}ms  {name}")
+
+    return success
+
+def main():
+    """Main test function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='⏱️ CLI start-up time benchmark')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                      help=f'Wall-clock budget per command (default: {DEFAULT_BUDGET_MS:.0f})')
+    parser.add_argument('--import-budget-ms', type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+                      help=f'Import-time budget per command (default: {DEFAULT_IMPORT_BUDGET_MS:.0f})')
+    args = parser.parse_args()
+
+    print("⏱️  AI Documentation Framework - Start-up Time Benchmark")
+    print("=" * 60)
+
+    results = [
+        test_fast_paths_do_not_touch_project(),
+        test_startup_budget(args.budget_ms, args.import_budget_ms)
+    ]
+
+    print(f"\n📊 TEST SUMMARY:")
+    print(f"=" * 30)
+    if all(results):
+        print(f"✅ All start-up checks passed!")
+        sys.exit(0)
+    else:
+        print(f"❌ Start-up checks failed")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+🧪 Test Template Sync
+Scaffolds a small project with setup-wizard.py, edits files locally, and
+checks that re-running the scaffold or sync-templates leaves edited files
+alone unless --force is given, that --check never writes, that runs on
+later days keep the recorded render date, and that files regenerated by
+error-stats and issue-tracker are not reported as local edits
+
+Usage:
+    python tools/test-template-sync.py
+"""
+
+import sys
+import shutil
+import tempfile
+import importlib.util
+from pathlib import Path
+from typing import Dict
+
+TOOLS_DIR = Path(__file__).resolve().parent
+
+def load_setup_wizard():
+    """Import setup-wizard.py (hyphenated, so not importable by name)"""
+    spec = importlib.util.spec_from_file_location("setup_wizard", TOOLS_DIR / "setup-wizard.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def project_config() -> Dict:
+    return {
+        "project": {"name": "sync-test", "type": "multi"},
+        "applications": [{"name": "api", "type": "backend"}, {"name": "web", "type": "frontend"}]
+    }
+
+def new_wizard(setup_wizard, project_root: Path, today: str = "2024-01-01"):
+    """A wizard for project_root, as a fresh --from-config or sync-templates run on `today` would create it"""
+    wizard = setup_wizard.SetupWizard()
+    wizard.get_current_date = lambda: today
+    wizard.project_root = project_root
+    wizard.config = project_config()
+    wizard.load_config_defaults()
+    return wizard
+
+def run_sync_tests(setup_wizard, project_root: Path):
+    failures = []
+
+    def check(name, condition):
+        print(f"{'✅' if condition else '❌'} {name}")
+        if not condition:
+            failures.append(name)
+
+    print(f"\n🏗️  Scaffolding...")
+    counts = new_wizard(setup_wizard, project_root).scaffold()
+    check("Every planned file written", counts['written'] == counts['files'] and not counts['drifted'])
+    manage_rules = (project_root / "MANAGE_RULES.md").read_text()
+    check("Loop lines keep their indentation",
+          "        'api': ['api', 'generic', 'backend'],\n        'web': ['web', 'generic', 'frontend'],\n" in manage_rules
+          and f"        '{project_root}/web/START_TASK.md',  # web\n" in manage_rules)
+    check("No empty variables rendered", f"{project_root}//" not in
+          (project_root / "docs" / "AI_APP_GUIDE.md").read_text())
+
+    rules = project_root / "api" / "AI_RULES.md"
+    edited = rules.read_text() + "\n- **Local rule**: keep me\n"
+    rules.write_text(edited)
+
+    print(f"\n🔁 Re-scaffolding over a local edit...")
+    counts = new_wizard(setup_wizard, project_root).scaffold()
+    check("Edited file reported as drifted", counts['drifted'] == ["api/AI_RULES.md"])
+    check("Edited file kept", rules.read_text() == edited)
+    check("Nothing else rewritten", counts['written'] == 0)
+
+    counts = new_wizard(setup_wizard, project_root).scaffold(force=True)
+    check("--force replaces the edited file", counts['written'] == 1 and rules.read_text() != edited)
+
+    print(f"\n📅 Runs on later days...")
+    counts = new_wizard(setup_wizard, project_root, today="2024-02-01").scaffold()
+    check("Re-scaffold keeps the recorded date", counts['written'] == 0)
+    result = new_wizard(setup_wizard, project_root, today="2024-03-01").sync_templates()
+    check("Sync after a re-scaffold writes nothing", len(result['unchanged']) == counts['files'])
+    check("Render date unchanged in the state file",
+          '"render_date": "2024-01-01"' in (project_root / setup_wizard.TEMPLATE_STATE_FILE).read_text())
+
+    print(f"\n🔄 sync-templates...")
+    guide = project_root / "docs" / "AI_APP_GUIDE.md"
+    guide.write_text(guide.read_text() + "\nLocal note\n")
+    state_before = (project_root / setup_wizard.TEMPLATE_STATE_FILE).read_text()
+    result = new_wizard(setup_wizard, project_root).sync_templates(check=True)
+    check("--check reports the drifted file", result['drifted'] == ["docs/AI_APP_GUIDE.md"])
+    rules.unlink()
+    result = new_wizard(setup_wizard, project_root).sync_templates(check=True)
+    check("--check reports the missing file", result['created'] == ["api/AI_RULES.md"])
+    check("--check writes nothing", not rules.exists() and
+          (project_root / setup_wizard.TEMPLATE_STATE_FILE).read_text() == state_before)
+
+    result = new_wizard(setup_wizard, project_root).sync_templates()
+    check("Sync recreates the missing file and keeps the edited one",
+          result['created'] == ["api/AI_RULES.md"] and result['drifted'] == ["docs/AI_APP_GUIDE.md"]
+          and guide.read_text().endswith("Local note\n"))
+    result = new_wizard(setup_wizard, project_root).sync_templates(force=True)
+    check("Sync --force replaces the edited file",
+          result['updated'] == ["docs/AI_APP_GUIDE.md"] and not guide.read_text().endswith("Local note\n"))
+
+    print(f"\n📈 Files regenerated by error-stats and issue-tracker...")
+    from ai_doc_framework.error_stats import update_master_index, MASTER_ERROR_INDEX
+    from ai_doc_framework.issue_index import IssueIndex, ISSUE_TRACKER
+    check("error-stats rewrote MASTER_ERROR_INDEX.md", update_master_index(project_root)['changed'])
+    with IssueIndex(project_root) as index:
+        index.refresh()
+        check("issue-tracker rewrote ISSUE_TRACKER.md", index.update_trackers() == [ISSUE_TRACKER])
+    regenerated = {target: (project_root / target).read_text() for target in (MASTER_ERROR_INDEX, ISSUE_TRACKER)}
+    result = new_wizard(setup_wizard, project_root).sync_templates(check=True)
+    check("--check does not report regenerated files", not result['drifted'] and not result['updated'])
+    new_wizard(setup_wizard, project_root).sync_templates()
+    check("Sync keeps the regenerated content",
+          all((project_root / target).read_text() == content for target, content in regenerated.items()))
+
+    index_path = project_root / MASTER_ERROR_INDEX
+    index_path.write_text(index_path.read_text() + "\nLocal note\n")
+    (project_root / "error-management" / "backend").mkdir(parents=True, exist_ok=True)
+    (project_root / "error-management" / "backend" / "new-error.md").write_text(
+        '---\nerror_id: "ERR-1"\ncategory: "backend"\nseverity: "high"\nstatus: "active"\n---\n\n# New error\n')
+    check("error-stats rewrote the edited file", update_master_index(project_root)['changed'])
+    result = new_wizard(setup_wizard, project_root).sync_templates(check=True)
+    check("A local edit stays drifted after regeneration", result['drifted'] == [MASTER_ERROR_INDEX])
+
+    return failures
+
+def main():
+    """Main test function"""
+    print("🧪 AI Documentation Framework Template Sync - Test Suite")
+    print("=" * 60)
+
+    setup_wizard = load_setup_wizard()
+    project_root = Path(tempfile.mkdtemp(prefix="template-sync-test-"))
+    failures = None
+    try:
+        failures = run_sync_tests(setup_wizard, project_root)
+
+        print(f"\n📊 TEST SUMMARY:")
+        print(f"=" * 30)
+        if not failures:
+            print(f"✅ All template sync tests passed!")
+        else:
+            print(f"❌ {len(failures)} checks failed:")
+            for name in failures:
+                print(f"   - {name}")
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        shutil.rmtree(project_root, ignore_errors=True)
+        print(f"🗑️  Cleaned up test project: {project_root}")
+
+    print(f"\n🏁 Test completed")
+    sys.exit(0 if failures == [] else 1)
+
+if __name__ == "__main__":
+    main()